@@ -298,9 +298,19 @@ def main():
 
             # Phase 2.2: Step 3 - Find competitor games
             with st.spinner("🔍 Finding competitor games..."):
-                competitor_data = game_search.find_competitors(game_data, min_competitors=3, max_competitors=10)
+                # Repeat audits reuse the stored competitor set and only refresh stale/new entries
+                competitor_refresh = game_search.refresh_competitors(game_data, min_competitors=3, max_competitors=10)
+                competitor_data = competitor_refresh['competitors']
             num_competitors = len(competitor_data)
 
+            if not competitor_refresh['stats']['full_search']:
+                competitor_diff = competitor_refresh['diff']
+                st.caption(
+                    f"Competitor set refreshed: {len(competitor_diff['added'])} added, "
+                    f"{len(competitor_diff['removed'])} removed, "
+                    f"{len(competitor_diff['changed'])} changed since last audit"
+                )
+
             if num_competitors == 0:
                 progress_bar.progress(40, text="🔍 Expanding competitor search...")
                 with st.spinner("🔍 Expanding competitor search..."):
@@ -361,6 +371,14 @@ def main():
                 # Use enhanced report system: Structured analysis + AI insights
                 from src.report_integration import create_report_with_ai
 
+                # Show the final report section by section as it streams in
+                live_report = st.empty()
+                streamed_sections = []
+
+                def show_section(section):
+                    streamed_sections.append(section)
+                    live_report.markdown(''.join(streamed_sections))
+
                 report_data, report_metadata = create_report_with_ai(
                     game_data,
                     sales_data,
@@ -369,8 +387,10 @@ def main():
                     report_type=report_type,
                     ai_generator=ai_generator,
                     review_stats=review_stats,
-                    capsule_analysis=capsule_analysis
+                    capsule_analysis=capsule_analysis,
+                    on_section=show_section
                 )
+                live_report.empty()
 
                 # Extract audit results from metadata
                 audit_results = report_metadata.get('audit_results')
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+LLM Stage Report - Token, latency and cost summary per LLM stage across runs
+
+Reads the run-level call log written by every LLMGateway call and prints
+p50/p95 latency and time to first token, tokens, retries and cost per stage,
+slowest stages first. Use it to decide which report pass to trim.
+
+Usage:
+    python diagnostics/llm_stage_report.py
+    python diagnostics/llm_stage_report.py --runs 20
+    python diagnostics/llm_stage_report.py --stage enhanced_report --json
+
+Output:
+    - Console table (or JSON with --json)
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.llm_telemetry import DEFAULT_LLM_CALL_LOG, LLMCallLog, summarize_records
+
+
+def _seconds(value) -> str:
+    return f"{value:.2f}s" if value is not None else "-"
+
+
+def print_stage_table(summary, run_count: int):
+    """Print the per-stage summary as a table"""
+    print("=" * 110)
+    print(f"LLM STAGE REPORT ({run_count} runs)")
+    print("=" * 110)
+    print(
+        f"{'Stage':<30}{'Calls':>7}{'Cached':>8}{'p50':>9}{'p95':>9}{'TTFT p50':>10}"
+        f"{'In tok':>10}{'Out tok':>10}{'Retries':>9}{'Cost':>10}"
+    )
+    print("-" * 110)
+    for stage, stats in summary.items():
+        print(
+            f"{stage:<30}{stats['calls']:>7}{stats['cached_responses']:>8}"
+            f"{_seconds(stats['latency_p50']):>9}{_seconds(stats['latency_p95']):>9}"
+            f"{_seconds(stats['first_token_p50']):>10}"
+            f"{stats['input_tokens']:>10,}{stats['output_tokens']:>10,}"
+            f"{stats['retries']:>9}{'$' + format(stats['cost_usd'], '.4f'):>10}"
+        )
+    print("-" * 110)
+    total_cost = sum(stats['cost_usd'] for stats in summary.values())
+    print(f"Total cost: ${total_cost:.4f}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize LLM calls per stage across report runs')
+    parser.add_argument('--log', default=DEFAULT_LLM_CALL_LOG, help='Call log JSONL file')
+    parser.add_argument('--runs', type=int, default=None, help='Only the most recent N runs')
+    parser.add_argument('--stage', default=None, help='Only this stage')
+    parser.add_argument('--json', action='store_true', help='Print JSON instead of a table')
+    args = parser.parse_args()
+
+    records = LLMCallLog(args.log).read(last_runs=args.runs, stage=args.stage)
+    if not records:
+        print(f"No LLM calls recorded in {args.log}")
+        sys.exit(1)
+
+    summary = summarize_records(records)
+    run_count = len({record.get('run_id') for record in records})
+    if args.json:
+        print(json.dumps({'runs': run_count, 'by_stage': summary}, indent=2))
+    else:
+        print_stage_table(summary, run_count)
+
+
+if __name__ == "__main__":
+    main()
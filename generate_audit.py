@@ -10,6 +10,7 @@ Usage:
 
 import argparse
 import sys
+import threading
 import time
 from pathlib import Path
 from datetime import datetime
@@ -21,6 +22,51 @@ sys.path.insert(0, str(Path(__file__).parent))
 from config import Config
 from src.input_processor import InputProcessor, ClientInputs
 from src.simple_data_collector import SimpleDataCollector
+from src.llm_gateway import llm_run
+
+
+class AuditGenerationError(Exception):
+    """An audit could not be generated (the reason has already been printed)"""
+
+
+class ClientPrefixedOutput:
+    """
+    stdout wrapper for batch mode: each line is prefixed with the client whose
+    thread printed it, so concurrently running audits stay readable
+
+    Threads that never called set_client() write through unchanged.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def set_client(self, client_name: str):
+        self._local.prefix = f"[{client_name}] "
+        self._local.partial = ''
+
+    def write(self, text: str) -> int:
+        prefix = getattr(self._local, 'prefix', None)
+        if prefix is None:
+            return self.stream.write(text)
+        *lines, self._local.partial = (self._local.partial + text).split('\n')
+        if lines:
+            with self._lock:
+                self.stream.write(''.join(f"{prefix}{line}\n" for line in lines))
+        return len(text)
+
+    def end_client(self):
+        """Flush this thread's unterminated line and stop prefixing it"""
+        if getattr(self._local, 'partial', ''):
+            self.write('\n')
+        self._local.prefix = None
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
 
 
 def print_banner():
@@ -48,12 +94,16 @@ def setup_test_client():
     return "test-client"
 
 
+@llm_run
 def generate_audit(client_name: str):
     """
     Main audit generation flow.
 
     Args:
         client_name: Name of the client folder in inputs/
+
+    Raises:
+        AuditGenerationError: Inputs failed validation or data collection failed
     """
     start_time = time.time()
 
@@ -83,7 +133,7 @@ def generate_audit(client_name: str):
         print("   - intake_form.json")
         print("   - strategy_notes.txt")
         print("\n   Run with --test flag to create example inputs")
-        sys.exit(1)
+        raise AuditGenerationError(f"Input validation failed: {e}") from e
 
     # ========================================================================
     # PHASE 2: Data Collection
@@ -105,7 +155,7 @@ def generate_audit(client_name: str):
         print(f"\n❌ Data collection failed: {e}\n")
         import traceback
         traceback.print_exc()
-        sys.exit(1)
+        raise AuditGenerationError(f"Data collection failed: {e}") from e
 
     # ========================================================================
     # PHASE 3: Report Generation
@@ -309,6 +359,64 @@ This is a **Phase 1 placeholder report** showing all collected data.
     return report
 
 
+@llm_run
+def generate_audits_batched(client_names):
+    """
+    Generate several clients' audits with all Claude calls sent as batches
+
+    For non-urgent overnight runs: reports run concurrently and their prompts
+    are submitted together through the Message Batches API (half price),
+    each report resuming as its own responses come back. The concurrent
+    reports share the process-wide LLM stats, so the batch is one LLM run.
+    Each report's output lines are prefixed with its client name.
+
+    Args:
+        client_names: Client names (folders in inputs/ directory)
+
+    Returns:
+        Names of the clients whose audit failed
+    """
+    import anthropic
+    from src.llm_batch import AnthropicBatchBackend, run_batched_jobs
+
+    print(f"📦 Batch mode: {len(client_names)} clients\n")
+    backend = AnthropicBatchBackend(anthropic.Anthropic(api_key=Config.ANTHROPIC_API_KEY))
+
+    output = ClientPrefixedOutput(sys.stdout)
+
+    def job(name):
+        output.set_client(name)
+        try:
+            return generate_audit(name)
+        finally:
+            output.end_client()
+
+    sys.stdout = output
+    try:
+        results = run_batched_jobs(
+            {name: (lambda name=name: job(name)) for name in client_names},
+            backend
+        )
+    finally:
+        sys.stdout = output.stream
+
+    failed = [name for name, result in results.items() if isinstance(result, BaseException)]
+    print("=" * 80)
+    print(f"📦 Batch complete: {len(results) - len(failed)}/{len(results)} audits generated")
+    for name in failed:
+        print(f"   ❌ {name}: {results[name]}")
+    print()
+    return failed
+
+
+def _run_or_exit(func, *args):
+    """Run a CLI command, exiting with status 1 if the audit failed"""
+    try:
+        func(*args)
+    except AuditGenerationError:
+        sys.exit(1)
+
+
 def main():
     """Main CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -319,6 +427,7 @@ Examples:
   python generate_audit.py --client my-client-name
   python generate_audit.py --test  # Create and run test client
   python generate_audit.py --create-example my-client  # Create input template
+  python generate_audit.py --batch client-a client-b  # Overnight run via batch API
         """
     )
 
@@ -341,6 +450,14 @@ Examples:
         help='Create example input files for a new client'
     )
 
+    parser.add_argument(
+        '--batch',
+        type=str,
+        nargs='+',
+        metavar='CLIENT_NAME',
+        help='Generate several clients at once through the batch API (slower, half price)'
+    )
+
     args = parser.parse_args()
 
     # Print banner
@@ -364,10 +481,14 @@ Examples:
 
     elif args.test:
         client_name = setup_test_client()
-        generate_audit(client_name)
+        _run_or_exit(generate_audit, client_name)
+
+    elif args.batch:
+        if generate_audits_batched(args.batch):
+            sys.exit(1)
 
     elif args.client:
-        generate_audit(args.client)
+        _run_or_exit(generate_audit, args.client)
 
     else:
         parser.print_help()
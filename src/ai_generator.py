@@ -1,10 +1,49 @@
 import anthropic
-from typing import Dict, List, Any, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Tuple, Optional
 import json
 import requests
 import base64
 import os
+import threading
+import time
 from src.game_analyzer import GameAnalyzer
+from src.logger import get_logger
+from src.stage_graph import Stage, StageGraph, format_timings
+from src.llm_batch import get_active_batch_dispatcher
+from src.llm_gateway import LLMGateway, LLMCacheStats, llm_run
+from src.llm_routing import get_llm_router
+from src.section_stream import iter_markdown_sections
+from src.report_run_store import ReportRunStore
+from src.claim_validator import check_report_claims, metrics_from_report_data
+
+logger = get_logger(__name__)
+
+# Maximum audit passes in flight at once (bounded for API rate limits)
+AUDIT_MAX_CONCURRENCY = int(os.getenv('AUDIT_MAX_CONCURRENCY', 4))
+
+# sales_data fields the report passes read. The shared context lists only
+# these; the full dict also carries game metadata and enrichment signals that
+# no pass uses, and every pass would pay for them as input tokens.
+SHARED_CONTEXT_SALES_FIELDS = (
+    'owners_min', 'owners_max', 'owners_avg', 'owners_display',
+    'estimated_revenue', 'estimated_revenue_raw', 'revenue_range',
+    'revenue_confidence_low', 'revenue_confidence_high',
+    'confidence', 'confidence_level_percent', 'estimation_method', 'signals_used', 'data_source',
+    'reviews_total', 'reviews_positive', 'reviews_negative', 'review_score', 'review_score_raw',
+    'price', 'price_raw',
+)
+
+# Leading report text scanned by specificity enforcement
+SPECIFICITY_WINDOW_CHARS = 8000
+
+# Ensemble fan-out: seconds each provider gets, and answers needed to proceed
+ENSEMBLE_PROVIDER_TIMEOUT = float(os.getenv('ENSEMBLE_PROVIDER_TIMEOUT', 60))
+ENSEMBLE_QUORUM = int(os.getenv('ENSEMBLE_QUORUM', 2))
+ENSEMBLE_MODEL_LABELS = {"claude": "Claude", "gpt4": "GPT-4", "gemini": "Gemini"}
+
+# Check numeric claims locally first; LLM fact/consistency passes run only for ambiguous claims
+LOCAL_CLAIM_VALIDATION = os.getenv('LOCAL_CLAIM_VALIDATION', 'true').lower() == 'true'
 
 # Optional imports for multi-model ensemble
 try:
@@ -22,7 +61,23 @@ except ImportError:
 class AIGenerator:
     """AI-powered report generator using Claude API"""
 
-    def __init__(self, api_key: str, openai_api_key: Optional[str] = None, google_api_key: Optional[str] = None):
+    # Audit graph stages whose outputs are added to audit_results (in this order)
+    AUDIT_RESULT_STAGES = [
+        'fact_check',
+        'consistency_check',
+        'competitor_validation',
+        'specialized_audits',
+        'recommendation_validation',
+        'benchmark_analysis',
+        'scenario_analysis',
+        'ensemble_analysis',
+    ]
+
+    # Passes after the audit graph, in order (re-runnable by name)
+    REPORT_FINAL_STAGES = ['enhanced_report', 'specificity']
+
+    def __init__(self, api_key: str, openai_api_key: Optional[str] = None, google_api_key: Optional[str] = None,
+                 run_store: Optional[ReportRunStore] = None):
         """
         Initialize the AI generator with API keys for multi-model ensemble
 
@@ -30,11 +85,19 @@ class AIGenerator:
             api_key: Anthropic API key (required)
             openai_api_key: OpenAI API key (optional - enables multi-model ensemble)
             google_api_key: Google API key (optional - enables multi-model ensemble)
+            run_store: Where report runs are saved for re-runs (None = .cache/report_runs)
         """
         try:
             # Initialize Anthropic client (required)
             self.client = anthropic.Anthropic(api_key=api_key)
             self.model = "claude-sonnet-4-5-20250929"
+            self.llm = LLMGateway(self.client, stats=LLMCacheStats(), router=get_llm_router())
+            self.run_store = run_store if run_store is not None else ReportRunStore()
+
+            # Ensemble answers that arrive after consensus (see _late_ensemble_recorder)
+            self.late_ensemble_responses: Dict[str, Dict[str, Any]] = {}
+            self._late_responses_lock = threading.Lock()
+            self._late_responses_generation = 0
 
             # Initialize OpenAI client (optional) for multi-model ensemble
             self.openai_client = None
@@ -198,7 +261,8 @@ Return ONLY valid JSON with this structure:
   "summary": "One sentence overall assessment"
 }}"""
 
-            vision_response = self.client.messages.create(
+            vision_response = self.llm.create(
+                'capsule_vision',
                 model=self.model,
                 max_tokens=1500,
                 messages=[{
@@ -287,6 +351,49 @@ Return ONLY valid JSON with this structure:
             Formatted markdown report
         """
 
+        prompt = self._build_post_launch_prompt(game_data, sales_data, competitor_data)
+
+        try:
+            response = self.llm.create(
+                'post_launch_report',
+                model=self.model,
+                max_tokens=16000,
+                temperature=0.7,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ]
+            )
+
+            # Extract the text content from the response
+            report_text = ""
+            for content_block in response.content:
+                if hasattr(content_block, 'text'):
+                    report_text += content_block.text
+
+            if not report_text:
+                raise Exception("Empty response from Claude API")
+
+            return report_text
+
+        except anthropic.AuthenticationError as e:
+            raise Exception(f"Invalid API Key: {str(e)}")
+        except anthropic.RateLimitError as e:
+            raise Exception(f"Rate limit exceeded: {str(e)}. Please try again in a few moments.")
+        except anthropic.APIError as e:
+            raise Exception(f"Anthropic API Error: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Error generating report: {str(e)}")
+
+    def _build_post_launch_prompt(
+        self,
+        game_data: Dict[str, Any],
+        sales_data: Dict[str, Any],
+        competitor_data: List[Dict[str, Any]]
+    ) -> str:
+        """Build the single-pass post-launch report prompt"""
         # Build comprehensive prompt based on Post-Launch Report Template
         prompt = f"""You are an expert game marketing analyst at Publitz, specializing in post-launch game audits.
 
@@ -379,38 +486,7 @@ Based on the Post-Launch Report Template, your report must include:
 - Be analytical, actionable, and focused on driving results
 """
 
-        try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=16000,
-                temperature=0.7,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
-
-            # Extract the text content from the response
-            report_text = ""
-            for content_block in response.content:
-                if hasattr(content_block, 'text'):
-                    report_text += content_block.text
-
-            if not report_text:
-                raise Exception("Empty response from Claude API")
-
-            return report_text
-
-        except anthropic.AuthenticationError as e:
-            raise Exception(f"Invalid API Key: {str(e)}")
-        except anthropic.RateLimitError as e:
-            raise Exception(f"Rate limit exceeded: {str(e)}. Please try again in a few moments.")
-        except anthropic.APIError as e:
-            raise Exception(f"Anthropic API Error: {str(e)}")
-        except Exception as e:
-            raise Exception(f"Error generating report: {str(e)}")
+        return prompt
 
     def generate_pre_launch_report(
         self,
@@ -520,7 +596,8 @@ Based on the Pre-Launch Report Template, your report must include:
 """
 
         try:
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'pre_launch_report',
                 model=self.model,
                 max_tokens=16000,
                 temperature=0.7,
@@ -552,6 +629,7 @@ Based on the Pre-Launch Report Template, your report must include:
         except Exception as e:
             raise Exception(f"Error generating report: {str(e)}")
 
+    @llm_run
     def generate_report_with_audit(
         self,
         game_data: Dict[str, Any],
@@ -562,7 +640,8 @@ Based on the Pre-Launch Report Template, your report must include:
         review_stats: Dict[str, Any] = None,
         capsule_analysis: Dict[str, Any] = None,
         phase2_data: Dict[str, Any] = None,
-        tier_framework: Any = None
+        tier_framework: Any = None,
+        on_section: Optional[Callable[[str], None]] = None
     ) -> Tuple[str, Dict[str, Any]]:
         """
         Generate a report using the ENHANCED 12-PASS AUDIT SYSTEM:
@@ -585,6 +664,18 @@ Based on the Pre-Launch Report Template, your report must include:
         Pass 9: Scenario Analysis → Best/base/worst case 6-month projections
         Pass 10: Multi-Model Ensemble → Claude + GPT-4 + Gemini consensus (optional)
 
+        Passes 1-10 run as a dependency graph (see _build_audit_graph): passes
+        that only need the draft or input data run concurrently, so audit wall
+        time is roughly the critical path. Per-pass wall time is returned in
+        audit_results['stage_timings']. LLM response cache hits and cost saved
+        for this report are returned in audit_results['llm_cache'], including
+        cached vs uncached input tokens under 'prompt_cache'. Tokens, time to
+        first token, latency, retries and cost of every LLM call are returned
+        per stage in audit_results['llm_calls'] (also appended to the run log,
+        see src/llm_telemetry.py). Inputs and every stage output are saved
+        under audit_results['run_id'] so one stage can be re-run with
+        rerun_report_stage.
+
         FINAL GENERATION:
         Pass 11: Enhanced Report → Apply ALL corrections and enhancements (16k tokens, temp 0.7)
         Pass 12: Specificity Enforcement → Eliminate vague recommendations
@@ -602,6 +693,9 @@ Based on the Pre-Launch Report Template, your report must include:
             report_type: "Post-Launch" or "Pre-Launch"
             review_stats: Review statistics
             capsule_analysis: Capsule image analysis
+            on_section: Optional callback; when given, Pass 11 is streamed and
+                each final section (after specificity enforcement and snapshot
+                insertion) is passed to it as soon as it is ready
 
         Returns:
             Tuple of (final_report, audit_results)
@@ -617,81 +711,234 @@ Based on the Pre-Launch Report Template, your report must include:
         genres_formatted = format_list_field(game_data.get('genres'))
         tags_formatted = format_list_field(game_data.get('tags'))
 
-        # Phase 3.1: Generate initial draft (fast)
-        draft_report = self._generate_initial_draft(
-            game_data, sales_data, competitor_data, steamdb_data, report_type, review_stats, capsule_analysis, tier_framework
-        )
+        run_id = self.llm.stats.run_id
 
-        # Phase 3.2: Audit the draft for accuracy issues
-        audit_results = self._audit_report(
-            draft_report, game_data, sales_data, competitor_data, review_stats
+        # Game/sales/competitor context shared verbatim by the report passes,
+        # sent as a cached prompt prefix (built once so it is byte-identical)
+        shared_context = self._build_shared_context(
+            game_data, sales_data, competitor_data, review_stats, capsule_analysis
         )
 
-        # Phase 3.2.5: NEW - Fact-check all numerical claims
-        fact_check_results = self._verify_facts(
-            draft_report, game_data, sales_data, competitor_data
+        # Inputs and every stage output are persisted per run so a single
+        # stage can be re-run later (see rerun_report_stage)
+        inputs = {
+            'game_data': game_data,
+            'sales_data': sales_data,
+            'competitor_data': competitor_data,
+            'steamdb_data': steamdb_data,
+            'report_type': report_type,
+            'review_stats': review_stats,
+            'capsule_analysis': capsule_analysis,
+            'phase2_data': phase2_data,
+            'tier_framework': tier_framework,
+            'shared_context': shared_context,
+        }
+        self.run_store.start_run(run_id, inputs)
+
+        # Phase 3.1-3.2.12: Draft + audit passes as a dependency graph.
+        # Passes that only need the draft/input data run concurrently; only
+        # real dependencies (ensemble needs benchmark + scenario) stay ordered.
+        stage_results, stage_timings = self._build_audit_graph().run(
+            inputs,
+            max_workers=AUDIT_MAX_CONCURRENCY,
+            on_stage_done=lambda name, output: self.run_store.save_stage(run_id, name, output)
         )
-        audit_results['fact_check'] = fact_check_results
+        audit_results = self._collect_audit_results(stage_results, stage_timings, run_id)
 
-        # Phase 3.2.6: NEW - Check internal consistency
-        consistency_results = self._check_consistency(
-            draft_report, game_data, sales_data
+        # Phase 3.3-3.4: Enhanced report, specificity, snapshot and warnings
+        final_report = self._complete_report(
+            inputs, stage_results['draft_report'], audit_results, run_id, on_section=on_section
         )
-        audit_results['consistency_check'] = consistency_results
 
-        # Phase 3.2.7: PHASE 2 - Validate competitors are truly comparable
-        competitor_validation = self._validate_competitors(
-            game_data, sales_data, competitor_data
-        )
-        audit_results['competitor_validation'] = competitor_validation
+        self._attach_llm_accounting(audit_results)
+        return final_report, audit_results
 
-        # Phase 3.2.8: PHASE 2 - Specialized domain audits (run conceptually in parallel)
-        specialized_audits = self._run_specialized_audits(
-            draft_report, game_data, sales_data, competitor_data
-        )
-        audit_results['specialized_audits'] = specialized_audits
+    @llm_run
+    def rerun_report_stage(self, run_id: str, stage: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Re-execute one stage of a saved report run plus everything downstream of it
 
-        # Phase 3.2.9: PHASE 2 - Validate recommendation feasibility
-        recommendation_validation = self._validate_recommendations(
-            draft_report, game_data, sales_data
-        )
-        audit_results['recommendation_validation'] = recommendation_validation
+        Every other stage output is reused from the saved run, so e.g. tweaking
+        the specificity pass costs one LLM call instead of the full chain.
+        Audit graph stages re-run their graph dependents (see
+        StageGraph.dependents) and then the enhanced report and specificity
+        passes; 'enhanced_report' re-runs those two; 'specificity' re-runs
+        only specificity on the saved enhanced report. Stages missing from the
+        saved run (e.g. it crashed midway) are re-run too.
 
-        # Phase 3.2.10: PHASE 3 - Benchmark comparison (percentile ranking)
-        benchmark_analysis = self._analyze_benchmarks(
-            game_data, sales_data, competitor_data, review_stats
-        )
-        audit_results['benchmark_analysis'] = benchmark_analysis
+        The result is saved as a new run whose meta records rerun_of.
 
-        # Phase 3.2.11: PHASE 3 - Scenario analysis (best/base/worst case)
-        scenario_analysis = self._generate_scenarios(
-            game_data, sales_data, review_stats
-        )
-        audit_results['scenario_analysis'] = scenario_analysis
+        Args:
+            run_id: Saved run ID (audit_results['run_id'] of the original report)
+            stage: Audit graph stage name, 'enhanced_report' or 'specificity'
+
+        Returns:
+            Tuple of (final_report, audit_results) for the new run
 
-        # Phase 3.2.12: PHASE 3 - Multi-model ensemble analysis (Claude + GPT-4 + Gemini)
-        ensemble_analysis = self._run_ensemble_analysis(
-            game_data, sales_data, competitor_data, benchmark_analysis, scenario_analysis
+        Raises:
+            ValueError: If the stage name is unknown
+            FileNotFoundError: If the run was not saved
+        """
+        graph = self._build_audit_graph()
+        if stage not in graph.stages and stage not in self.REPORT_FINAL_STAGES:
+            raise ValueError(
+                f"Unknown stage '{stage}'. Expected one of: "
+                f"{', '.join(list(graph.stages) + self.REPORT_FINAL_STAGES)}"
+            )
+
+        saved = self.run_store.load_run(run_id)
+        inputs, saved_stages = saved['inputs'], saved['stages']
+
+        rerun = set([stage] + graph.dependents(stage)) if stage in graph.stages else set()
+        rerun.update(name for name in graph.stages if name not in saved_stages)
+        graph_rerun = [name for name in graph.stages if name in rerun]
+        reused = [name for name in graph.stages if name not in rerun]
+
+        # Specificity alone can start from the saved enhanced report
+        enhanced_report = None
+        if stage == 'specificity' and not graph_rerun:
+            enhanced_report = saved_stages.get('enhanced_report')
+        reran = graph_rerun + (['specificity'] if enhanced_report is not None else self.REPORT_FINAL_STAGES)
+
+        new_run_id = self.llm.stats.run_id
+        logger.info(f"Re-running {', '.join(reran)} from run {run_id} (reusing {len(reused)} stages)")
+
+        self.run_store.start_run(new_run_id, inputs, meta={
+            'rerun_of': run_id, 'rerun_stage': stage, 'reused_stages': reused
+        })
+        for name in reused:
+            self.run_store.save_stage(new_run_id, name, saved_stages[name])
+        if enhanced_report is not None:
+            self.run_store.save_stage(new_run_id, 'enhanced_report', enhanced_report)
+
+        stage_results, stage_timings = graph.run(
+            {**inputs, **{name: saved_stages[name] for name in reused}},
+            max_workers=AUDIT_MAX_CONCURRENCY,
+            stages=graph_rerun,
+            on_stage_done=lambda name, output: self.run_store.save_stage(new_run_id, name, output)
         )
-        audit_results['ensemble_analysis'] = ensemble_analysis
+        audit_results = self._collect_audit_results(stage_results, stage_timings, new_run_id)
+        audit_results['rerun'] = {'rerun_of': run_id, 'stage': stage, 'reran': reran, 'reused': reused}
 
-        # Phase 3.3: Generate enhanced final report with all corrections
-        final_report = self._generate_enhanced_report(
-            game_data, sales_data, competitor_data, steamdb_data,
-            draft_report, audit_results, report_type, review_stats, capsule_analysis, phase2_data, tier_framework
+        final_report = self._complete_report(
+            inputs, stage_results['draft_report'], audit_results, new_run_id,
+            enhanced_report=enhanced_report
         )
 
-        # Phase 3.3.5: NEW - Enforce specificity in recommendations
-        final_report = self._enforce_specificity(final_report, game_data, sales_data)
+        self._attach_llm_accounting(audit_results)
+        return final_report, audit_results
+
+    def _collect_audit_results(
+        self,
+        stage_results: Dict[str, Any],
+        stage_timings: Dict[str, Any],
+        run_id: str
+    ) -> Dict[str, Any]:
+        """Build audit_results from the audit stage plus the AUDIT_RESULT_STAGES outputs"""
+        audit_results = dict(stage_results['audit'])
+        for stage_name in self.AUDIT_RESULT_STAGES:
+            audit_results[stage_name] = stage_results[stage_name]
+        audit_results['stage_timings'] = format_timings(stage_timings)
+        audit_results['run_id'] = run_id
+        return audit_results
+
+    def _complete_report(
+        self,
+        inputs: Dict[str, Any],
+        draft_report: str,
+        audit_results: Dict[str, Any],
+        run_id: str,
+        on_section: Optional[Callable[[str], None]] = None,
+        enhanced_report: Optional[str] = None
+    ) -> str:
+        """
+        Phase 3.3-3.4: enhanced report, specificity enforcement, snapshot and warnings
+
+        Saves the enhanced and final reports to the run store.
 
-        # Phase 3.4: Add executive snapshot and data warnings
-        fallback_warnings = self._detect_fallback_data(sales_data, competitor_data)
+        Args:
+            inputs: Report inputs as saved by generate_report_with_audit
+            draft_report: Draft report text
+            audit_results: Collected audit pass results
+            run_id: Run to save outputs under
+            on_section: Stream the enhanced report, emitting final sections
+            enhanced_report: Saved enhanced report to reuse instead of regenerating
+
+        Returns:
+            Final report
+        """
+        game_data, sales_data = inputs['game_data'], inputs['sales_data']
 
-        # Build and insert executive snapshot section
+        # Phase 3.4 inputs: executive snapshot and data warnings
+        fallback_warnings = self._detect_fallback_data(sales_data, inputs['competitor_data'])
         snapshot_section = self._build_snapshot_section(sales_data, game_data, fallback_warnings)
 
+        enhanced_args = (
+            game_data, sales_data, inputs['competitor_data'], inputs['steamdb_data'],
+            draft_report, audit_results, inputs['report_type'], inputs['review_stats'],
+            inputs['capsule_analysis'], inputs['phase2_data'], inputs['tier_framework'],
+            inputs['shared_context']
+        )
+
+        if on_section is None:
+            if enhanced_report is None:
+                # Phase 3.3: Generate enhanced final report with all corrections
+                enhanced_report = self._generate_enhanced_report(*enhanced_args)
+                self.run_store.save_stage(run_id, 'enhanced_report', enhanced_report)
+
+            # Phase 3.3.5: NEW - Enforce specificity in recommendations
+            final_report = self._enforce_specificity(enhanced_report, game_data, sales_data)
+
+            # Phase 3.4: Insert executive snapshot and data warnings after the title
+            final_report = self._finalize_report_head(final_report, snapshot_section, fallback_warnings)
+        else:
+            enhanced_sections: List[str] = []
+
+            def enhanced_stream() -> Iterator[str]:
+                for section in self._stream_enhanced_report(*enhanced_args):
+                    enhanced_sections.append(section)
+                    yield section
+                self.run_store.save_stage(run_id, 'enhanced_report', ''.join(enhanced_sections))
+
+            # Phase 3.3-3.4 streamed: each section is post-processed and
+            # handed to on_section as soon as it is final
+            final_report = self._stream_final_report(
+                enhanced_stream(), game_data, sales_data, snapshot_section, fallback_warnings, on_section
+            )
+
+        self.run_store.save_stage(run_id, 'final_report', final_report)
+        return final_report
+
+    def _attach_llm_accounting(self, audit_results: Dict[str, Any]):
+        """Add this run's LLM cache stats and per-call telemetry to audit_results"""
+        audit_results['llm_cache'] = self.llm.stats.as_dict()
+        prompt_cache = audit_results['llm_cache']['prompt_cache']
+        logger.info(
+            f"Prompt cache: {prompt_cache['cached_input_tokens']:,} cached / "
+            f"{prompt_cache['uncached_input_tokens']:,} uncached input tokens "
+            f"({prompt_cache['cached_share']} cached)"
+        )
+
+        audit_results['llm_calls'] = self.llm.stats.call_summary()
+        logger.info(
+            f"LLM calls: {audit_results['llm_calls']['calls']} calls, "
+            f"${audit_results['llm_calls']['cost_usd']:.4f} (run {audit_results['llm_calls']['run_id']})"
+        )
+
+    def _finalize_report_head(
+        self,
+        report: str,
+        snapshot_section: str,
+        fallback_warnings: List[str]
+    ) -> str:
+        """
+        Phase 3.4: Insert the executive snapshot and data warnings after the first heading
+
+        Only the text up to the first heading is touched, so this works on a
+        complete report or on its leading sections while the rest streams.
+        """
         # Insert snapshot after first heading
-        lines = final_report.split('\n')
+        lines = report.split('\n')
         insert_index = 0
         for i, line in enumerate(lines):
             if line.strip().startswith('#'):
@@ -703,35 +950,193 @@ Based on the Pre-Launch Report Template, your report must include:
         else:
             lines.insert(0, snapshot_section)
 
-        final_report = '\n'.join(lines)
+        report = '\n'.join(lines)
 
         # Add data quality warnings if needed (serious issues only)
         if fallback_warnings:
-            final_report = self._add_fallback_warnings(final_report, fallback_warnings)
+            report = self._add_fallback_warnings(report, fallback_warnings)
 
-        return final_report, audit_results
+        return report
 
-    def _generate_initial_draft(
+    def _stream_final_report(
+        self,
+        sections: Iterable[str],
+        game_data: Dict[str, Any],
+        sales_data: Dict[str, Any],
+        snapshot_section: str,
+        fallback_warnings: List[str],
+        on_section: Callable[[str], None]
+    ) -> str:
+        """
+        Post-process streamed report sections and emit each once it is final
+
+        Specificity enforcement scans the leading SPECIFICITY_WINDOW_CHARS of
+        the report (as in the non-streaming path), so the leading sections are
+        enforced on a worker thread while later sections keep streaming. The
+        snapshot and warnings go after the first heading, inside that window.
+        Sections past the window are emitted as soon as they complete.
+
+        Returns:
+            The complete final report (''.join of every emitted section)
+        """
+        emitted: List[str] = []
+
+        def emit(text: str):
+            for section in iter_markdown_sections([text]):
+                emitted.append(section)
+                on_section(section)
+
+        window: List[str] = []
+        pending: List[str] = []
+        window_future = None
+        head_emitted = False
+
+        def flush_head():
+            emit(self._finalize_report_head(window_future.result(), snapshot_section, fallback_warnings))
+            for section in pending:
+                emit(section)
+            pending.clear()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for section in sections:
+                if window_future is None:
+                    window.append(section)
+                    if sum(len(part) for part in window) >= SPECIFICITY_WINDOW_CHARS:
+                        window_future = executor.submit(
+                            self._enforce_specificity, ''.join(window), game_data, sales_data
+                        )
+                elif head_emitted:
+                    emit(section)
+                else:
+                    pending.append(section)
+                    if window_future.done():
+                        flush_head()
+                        head_emitted = True
+
+            if not window:
+                return ''
+            if window_future is None:
+                window_future = executor.submit(
+                    self._enforce_specificity, ''.join(window), game_data, sales_data
+                )
+            if not head_emitted:
+                flush_head()
+
+        return ''.join(emitted)
+
+    def stream_post_launch_report(
+        self,
+        game_data: Dict[str, Any],
+        sales_data: Dict[str, Any],
+        competitor_data: List[Dict[str, Any]],
+        steamdb_data: Dict[str, Any] = None
+    ) -> Iterator[str]:
+        """
+        Stream a post-launch audit report section by section
+
+        Same prompt as generate_post_launch_report; each markdown section is
+        yielded as soon as the next one starts.
+
+        Args:
+            game_data: Game information
+            sales_data: Sales and revenue data
+            competitor_data: List of competitor game data
+            steamdb_data: Additional SteamDB data
+
+        Yields:
+            Markdown sections, in order
+        """
+        prompt = self._build_post_launch_prompt(game_data, sales_data, competitor_data)
+
+        try:
+            stream = self.llm.stream(
+                'post_launch_report',
+                model=self.model,
+                max_tokens=16000,
+                temperature=0.7,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ]
+            )
+
+            emitted = False
+            for section in iter_markdown_sections(stream):
+                emitted = True
+                yield section
+
+            if not emitted:
+                raise Exception("Empty response from Claude API")
+
+        except anthropic.AuthenticationError as e:
+            raise Exception(f"Invalid API Key: {str(e)}")
+        except anthropic.RateLimitError as e:
+            raise Exception(f"Rate limit exceeded: {str(e)}. Please try again in a few moments.")
+        except anthropic.APIError as e:
+            raise Exception(f"Anthropic API Error: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Error generating report: {str(e)}")
+
+    def _build_audit_graph(self) -> StageGraph:
+        """
+        Declare the draft and audit passes as named stages with explicit inputs
+
+        Each stage's inputs are passed as keyword arguments, so input names
+        match the pass methods' parameter names. Outputs are keyed by stage
+        name; every stage except 'draft_report' and 'audit' lands in
+        audit_results under the same key.
+
+        Passes that take 'shared_context' send it (and the draft, if they
+        review it) as a cached prompt prefix; see _build_shared_context. The
+        draft stage warms that prefix before the review passes fan out (see
+        _warm_review_prefix).
+        """
+        return StageGraph([
+            Stage('draft_report', self._draft_report_stage,
+                  ['game_data', 'sales_data', 'competitor_data', 'steamdb_data', 'report_type',
+                   'review_stats', 'capsule_analysis', 'tier_framework', 'shared_context']),
+            Stage('audit', self._audit_report,
+                  ['draft_report', 'game_data', 'sales_data', 'competitor_data', 'review_stats',
+                   'shared_context']),
+            Stage('fact_check', self._verify_facts,
+                  ['draft_report', 'game_data', 'sales_data', 'competitor_data', 'shared_context']),
+            Stage('consistency_check', self._check_consistency,
+                  ['draft_report', 'game_data', 'sales_data', 'shared_context', 'competitor_data']),
+            Stage('competitor_validation', self._validate_competitors,
+                  ['game_data', 'sales_data', 'competitor_data']),
+            Stage('specialized_audits', self._run_specialized_audits,
+                  ['draft_report', 'game_data', 'sales_data', 'competitor_data', 'shared_context']),
+            Stage('recommendation_validation', self._validate_recommendations,
+                  ['draft_report', 'game_data', 'sales_data', 'shared_context']),
+            Stage('benchmark_analysis', self._analyze_benchmarks,
+                  ['game_data', 'sales_data', 'competitor_data', 'review_stats']),
+            Stage('scenario_analysis', self._generate_scenarios,
+                  ['game_data', 'sales_data', 'review_stats']),
+            Stage('ensemble_analysis', self._run_ensemble_analysis,
+                  ['game_data', 'sales_data', 'competitor_data', 'benchmark_analysis', 'scenario_analysis']),
+        ])
+
+    def _build_shared_context(
         self,
         game_data: Dict[str, Any],
         sales_data: Dict[str, Any],
         competitor_data: List[Dict[str, Any]],
-        steamdb_data: Dict[str, Any],
-        report_type: str,
         review_stats: Dict[str, Any] = None,
-        capsule_analysis: Dict[str, Any] = None,
-        tier_framework: Any = None
+        capsule_analysis: Dict[str, Any] = None
     ) -> str:
         """
-        Phase 3.1: Generate fast initial draft
+        Build the game/sales/competitor context block shared by the report passes
 
-        Uses 5k tokens, temperature 0.5 for speed
-        Focus on getting basic structure and analysis done quickly
+        The draft, audit, fact-check, consistency, specialized, recommendation
+        and enhanced-report passes all send this block first, as a cached
+        prompt prefix, followed by their own instructions. Provider-side
+        caching only matches byte-identical prefixes, so build it once per
+        report and hand the same string to every pass.
         """
-        # Get success context from analyzer
         analyzer = GameAnalyzer()
         success_analysis = analyzer.analyze_success_level(game_data, sales_data, review_stats)
-        success_context = success_analysis['context_for_ai']
 
         # FIX: Safely format reviews_total (might be string from some data sources)
         reviews_total_raw = sales_data.get('reviews_total', 0)
@@ -740,37 +1145,106 @@ Based on the Pre-Launch Report Template, your report must include:
         except (ValueError, TypeError):
             reviews_total_formatted = "0"
 
-        # FIX: Format genres/tags using helper methods that handle normalized format
-        genres_formatted = self._format_genres(game_data.get('genres', 'N/A'))
-        tags_formatted = self._format_tags(game_data.get('tags', 'N/A'))
+        signals_used = sales_data.get('signals_used', [])
 
-        prompt = f"""You are an expert game marketing analyst at Publitz.
-
-Generate a comprehensive {report_type.upper()} AUDIT REPORT for this game.
+        return f"""**REPORT CONTEXT (source data for every analysis pass):**
 
 **Game Information:**
 - Name: {game_data.get('name', 'N/A')}
+- App ID: {game_data.get('app_id', 'N/A')}
 - Developer: {game_data.get('developer', 'N/A')}
+- Publisher: {game_data.get('publisher', 'N/A')}
 - Release Date: {game_data.get('release_date', 'N/A')}
-- Genre: {genres_formatted}
+- Genre: {self._format_genres(game_data.get('genres', 'N/A'))}
+- Tags: {self._format_tags(game_data.get('tags', 'N/A'))}
 - Price: {game_data.get('price', 'N/A')}
 
 **Sales & Performance Data:**
 - Owners: {sales_data.get('owners_display', 'N/A')}
 - Revenue: {sales_data.get('estimated_revenue', 'N/A')} (Range: {sales_data.get('revenue_range', 'N/A')})
 - Revenue Confidence: {sales_data.get('confidence_level_percent', 'N/A')}% ({sales_data.get('confidence', 'N/A')})
-- Data Signals: {len(sales_data.get('signals_used', []))} sources ({', '.join(sales_data.get('signals_used', [])[:3]) if sales_data.get('signals_used') else 'N/A'}...)
+- Data Signals: {len(signals_used)} sources ({', '.join(signals_used[:3]) if signals_used else 'N/A'}...)
 - Reviews: {reviews_total_formatted} total
 - Review Score: {sales_data.get('review_score', 'N/A')}
 
+**Sales & Performance Figures:**
+{json.dumps({field: sales_data[field] for field in SHARED_CONTEXT_SALES_FIELDS if field in sales_data},
+            indent=2, sort_keys=True, default=str)}
+
 **SUCCESS CONTEXT FOR ANALYSIS:**
-{success_context}
+- Success Score: {success_analysis['success_score']}/100
+- Success Level: {success_analysis['overall_success']}
+
+{success_analysis['context_for_ai']}
 
 **CAPSULE IMAGE ANALYSIS:**
 {self._format_capsule_analysis(capsule_analysis) if capsule_analysis else "Capsule analysis not available"}
 
 **Competitors ({len(competitor_data)} found):**
 {self._format_competitor_data(competitor_data)}
+"""
+
+    def _draft_report_stage(self, shared_context: str = None, **inputs) -> str:
+        """Draft stage: write the draft, then warm the review passes' prompt prefix"""
+        draft_report = self._generate_initial_draft(shared_context=shared_context, **inputs)
+        if shared_context is not None:
+            self._warm_review_prefix(shared_context, draft_report)
+        return draft_report
+
+    def _warm_review_prefix(self, shared_context: str, draft_report: str):
+        """
+        Write the [shared context, draft] prompt-cache prefix before the review passes start
+
+        The review passes start together (AUDIT_MAX_CONCURRENCY at a time), so
+        without a warm prefix every pass in the first wave pays a cache write
+        instead of a read. One short call on their tier ('prefix_warmup' is
+        routed like them) writes it first. Skipped in batch mode, where the
+        extra round trip would hold up the whole fan-out.
+        """
+        if get_active_batch_dispatcher() is not None:
+            return
+        try:
+            self.llm.create(
+                'prefix_warmup',
+                model=self.model,
+                max_tokens=16,
+                messages=[{"role": "user", "content": "Reply with just OK."}],
+                prefix=[shared_context, self._draft_context_block(draft_report)]
+            )
+        except Exception as e:
+            logger.warning(f"Prompt-cache warm-up failed: {e}")
+
+    @staticmethod
+    def _draft_context_block(draft_report: str) -> str:
+        """Wrap the draft as the second cached prefix segment for review passes"""
+        return f"**DRAFT REPORT:**\n{draft_report}"
+
+    def _generate_initial_draft(
+        self,
+        game_data: Dict[str, Any],
+        sales_data: Dict[str, Any],
+        competitor_data: List[Dict[str, Any]],
+        steamdb_data: Dict[str, Any],
+        report_type: str,
+        review_stats: Dict[str, Any] = None,
+        capsule_analysis: Dict[str, Any] = None,
+        tier_framework: Any = None,
+        shared_context: str = None
+    ) -> str:
+        """
+        Phase 3.1: Generate fast initial draft
+
+        Uses 5k tokens, temperature 0.5 for speed
+        Focus on getting basic structure and analysis done quickly
+        """
+        if shared_context is None:
+            shared_context = self._build_shared_context(
+                game_data, sales_data, competitor_data, review_stats, capsule_analysis
+            )
+
+        prompt = f"""You are an expert game marketing analyst at Publitz.
+
+Generate a comprehensive {report_type.upper()} AUDIT REPORT for this game using the REPORT CONTEXT above.
 
 **Report Structure Required:**
 1. Executive Summary
@@ -784,7 +1258,7 @@ Generate a comprehensive {report_type.upper()} AUDIT REPORT for this game.
 9. Key Recommendations (Immediate, Short-term, Long-term)
 
 **IMPORTANT GUIDELINES:**
-- Use the SUCCESS CONTEXT above to calibrate your analysis
+- Use the SUCCESS CONTEXT in the report context to calibrate your analysis
 - For highly successful games, focus on OPTIMIZATION not PROBLEMS
 - Tag effectiveness: High engagement = tags ARE working
 - Apply Boxleiter messaging framework: evaluate clarity and conversion focus of store page copy
@@ -849,11 +1323,13 @@ Apply this same tone and approach throughout the entire report. The strategic fr
 """
 
         try:
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'draft_report',
                 model=self.model,
                 max_tokens=5000,  # Faster draft with less tokens
                 temperature=0.5,   # Lower temperature for consistency
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": prompt}],
+                prefix=[shared_context]
             )
 
             report_text = ""
@@ -872,7 +1348,8 @@ Apply this same tone and approach throughout the entire report. The strategic fr
         game_data: Dict[str, Any],
         sales_data: Dict[str, Any],
         competitor_data: List[Dict[str, Any]],
-        review_stats: Dict[str, Any] = None
+        review_stats: Dict[str, Any] = None,
+        shared_context: str = None
     ) -> Dict[str, Any]:
         """
         Phase 3.2: Audit the draft report for accuracy issues
@@ -889,27 +1366,12 @@ Apply this same tone and approach throughout the entire report. The strategic fr
         analyzer = GameAnalyzer()
         success_analysis = analyzer.analyze_success_level(game_data, sales_data, review_stats)
 
-        # FIX: Format genres using helper method that handles normalized format
-        genres_formatted = self._format_genres(game_data.get('genres', 'N/A'))
+        if shared_context is None:
+            shared_context = self._build_shared_context(game_data, sales_data, competitor_data, review_stats)
 
         audit_prompt = f"""You are a quality auditor for game marketing reports.
 
-Review the following DRAFT REPORT and check for accuracy issues.
-
-**DRAFT REPORT TO AUDIT:**
-{draft_report}
-
-**ACTUAL GAME DATA FOR VERIFICATION:**
-- Game: {game_data.get('name')}
-- Genres: {genres_formatted}
-- Price: {game_data.get('price')}
-- Review Score: {sales_data.get('review_score')} ({sales_data.get('reviews_total')} reviews)
-- Revenue: {sales_data.get('estimated_revenue')} (Confidence: {sales_data.get('revenue_range')})
-- Success Score: {success_analysis['success_score']}/100
-- Success Level: {success_analysis['overall_success']}
-
-**COMPETITORS IN REPORT:**
-{self._format_competitor_data(competitor_data[:5])}
+Review the DRAFT REPORT above and check for accuracy issues. The REPORT CONTEXT above is the actual game data and competitor set to verify against.
 
 **AUDIT CHECKLIST - CHECK FOR THESE COMMON ERRORS:**
 
@@ -949,11 +1411,14 @@ Return ONLY valid JSON, no other text.
 """
 
         try:
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'audit',
                 model=self.model,
                 max_tokens=2000,
                 temperature=0.3,  # Lower temperature for consistent JSON
-                messages=[{"role": "user", "content": audit_prompt}]
+                messages=[{"role": "user", "content": audit_prompt}],
+                prefix=[shared_context, self._draft_context_block(draft_report)],
+                validate=self._is_json_response
             )
 
             audit_text = ""
@@ -1007,7 +1472,8 @@ Return ONLY valid JSON, no other text.
         draft_report: str,
         game_data: Dict[str, Any],
         sales_data: Dict[str, Any],
-        competitor_data: List[Dict[str, Any]]
+        competitor_data: List[Dict[str, Any]],
+        shared_context: str = None
     ) -> Dict[str, Any]:
         """
         Phase 3.2.5: Fact-check numerical claims in the report
@@ -1017,7 +1483,16 @@ Return ONLY valid JSON, no other text.
         - Revenue numbers that don't match source data
         - Review counts that are incorrect
         - Competitor stats that are wrong
+
+        Numeric claims are first checked locally against the source data
+        (see claim_validator). The LLM pass only runs when some claims are
+        ambiguous; local mismatches are merged into its errors_found.
         """
+        local_check = self._local_claim_check(draft_report, game_data, sales_data, competitor_data)
+        if local_check and not local_check['ambiguous_claims']:
+            logger.info("Fact-check resolved locally, skipping LLM pass")
+            return local_check['fact_check']
+
         # Build source data reference
         source_data = {
             "game_name": game_data.get('name'),
@@ -1031,16 +1506,23 @@ Return ONLY valid JSON, no other text.
             "developer": game_data.get('developer'),
         }
 
-        fact_check_prompt = f"""You are a fact-checker for game marketing reports.
+        focus_claims = ""
+        if local_check:
+            focus_claims = f"""
+**CLAIMS TO CHECK FIRST (could not be verified automatically):**
+{json.dumps([claim['sentence'] for claim in local_check['ambiguous_claims']], indent=2)}
+"""
 
-Extract ALL numerical claims from this report and verify them against the source data.
+        if shared_context is None:
+            shared_context = self._build_shared_context(game_data, sales_data, competitor_data)
 
-**REPORT TO FACT-CHECK:**
-{draft_report[:4000]}  # First 4000 chars to stay within limits
+        fact_check_prompt = f"""You are a fact-checker for game marketing reports.
+
+Extract ALL numerical claims from the DRAFT REPORT above and verify them against the source data.
 
 **SOURCE DATA (GROUND TRUTH):**
 {json.dumps(source_data, indent=2)}
-
+{focus_claims}
 **TASK:**
 1. Extract every numerical claim (revenue, reviews, prices, dates, percentages)
 2. Verify each claim against source data
@@ -1069,11 +1551,14 @@ Return ONLY valid JSON, no other text.
 """
 
         try:
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'fact_check',
                 model=self.model,
                 max_tokens=1500,
                 temperature=0.2,  # Very low for factual accuracy
-                messages=[{"role": "user", "content": fact_check_prompt}]
+                messages=[{"role": "user", "content": fact_check_prompt}],
+                prefix=[shared_context, self._draft_context_block(draft_report)],
+                validate=self._is_json_response
             )
 
             response_text = ""
@@ -1092,6 +1577,11 @@ Return ONLY valid JSON, no other text.
                 response_text = response_text[json_start:json_end].strip()
 
             fact_check_results = json.loads(response_text)
+            if local_check:
+                self._merge_local_findings(
+                    fact_check_results, local_check['fact_check']['errors_found'], 'errors_found', 'claim'
+                )
+                fact_check_results['errors_count'] = len(fact_check_results.get('errors_found', []))
             return fact_check_results
 
         except Exception as e:
@@ -1110,7 +1600,9 @@ Return ONLY valid JSON, no other text.
         self,
         draft_report: str,
         game_data: Dict[str, Any],
-        sales_data: Dict[str, Any]
+        sales_data: Dict[str, Any],
+        shared_context: str = None,
+        competitor_data: List[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Phase 3.2.6: Check internal consistency of the report
@@ -1120,18 +1612,22 @@ Return ONLY valid JSON, no other text.
         - Executive summary says "successful" but body says "struggling"
         - Revenue section says $1M but recommendations assume $100K
         - Competitor section contradicts positioning analysis
+
+        Numeric contradictions (the same metric stated with different values
+        in different sections) are found locally; the LLM pass only runs when
+        the local claim check leaves ambiguous claims.
         """
-        consistency_prompt = f"""You are a consistency checker for game marketing reports.
+        local_check = self._local_claim_check(draft_report, game_data, sales_data, competitor_data or [])
+        if local_check and not local_check['ambiguous_claims']:
+            logger.info("Consistency check resolved locally, skipping LLM pass")
+            return local_check['consistency']
 
-Analyze this report for INTERNAL CONTRADICTIONS between sections.
+        if shared_context is None:
+            shared_context = self._build_shared_context(game_data, sales_data, [])
 
-**REPORT TO CHECK:**
-{draft_report[:6000]}  # First 6000 chars
+        consistency_prompt = f"""You are a consistency checker for game marketing reports.
 
-**GAME CONTEXT:**
-- Revenue: {sales_data.get('estimated_revenue')}
-- Reviews: {sales_data.get('reviews_total')} ({sales_data.get('review_score')} score)
-- Price: {game_data.get('price')}
+Analyze the DRAFT REPORT above for INTERNAL CONTRADICTIONS between sections.
 
 **CHECK FOR THESE CONTRADICTIONS:**
 
@@ -1174,11 +1670,14 @@ Return ONLY valid JSON, no other text.
 """
 
         try:
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'consistency_check',
                 model=self.model,
                 max_tokens=1500,
                 temperature=0.2,
-                messages=[{"role": "user", "content": consistency_prompt}]
+                messages=[{"role": "user", "content": consistency_prompt}],
+                prefix=[shared_context, self._draft_context_block(draft_report)],
+                validate=self._is_json_response
             )
 
             response_text = ""
@@ -1197,6 +1696,13 @@ Return ONLY valid JSON, no other text.
                 response_text = response_text[json_start:json_end].strip()
 
             consistency_results = json.loads(response_text)
+            if local_check:
+                local_contradictions = local_check['consistency']['contradictions_found']
+                self._merge_local_findings(
+                    consistency_results, local_contradictions, 'contradictions_found', 'contradiction'
+                )
+                if local_contradictions:
+                    consistency_results['needs_revision'] = True
             return consistency_results
 
         except Exception as e:
@@ -1209,6 +1715,38 @@ Return ONLY valid JSON, no other text.
                 "error": f"Consistency check failed: {str(e)}"
             }
 
+    def _local_claim_check(
+        self,
+        draft_report: str,
+        game_data: Dict[str, Any],
+        sales_data: Dict[str, Any],
+        competitor_data: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Check the draft's numeric claims against source data without an LLM call
+
+        Returns:
+            check_report_claims result, or None if local validation is disabled or fails
+        """
+        if not LOCAL_CLAIM_VALIDATION:
+            return None
+        try:
+            metrics = metrics_from_report_data(game_data, sales_data)
+            competitor_names = [competitor.get('name', '') for competitor in competitor_data or []]
+            return check_report_claims(draft_report, metrics, competitor_names)
+        except Exception as e:
+            logger.warning(f"Local claim check failed, using LLM pass: {e}")
+            return None
+
+    @staticmethod
+    def _merge_local_findings(results: Dict[str, Any], findings: List[Dict[str, Any]], key: str, text_key: str):
+        """Add local findings to an LLM pass result, skipping ones it already reported"""
+        existing = [str(item.get(text_key, '')).lower() for item in results.get(key, [])]
+        for finding in findings:
+            text = finding[text_key].lower()
+            if not any(text in reported for reported in existing):
+                results.setdefault(key, []).append(finding)
+
     def _enforce_specificity(
         self,
         report: str,
@@ -1247,7 +1785,7 @@ Return ONLY valid JSON, no other text.
 Scan this report for VAGUE recommendations and suggest SPECIFIC replacements based on the game's actual data.
 
 **REPORT TO SCAN:**
-{report[:8000]}  # First 8000 chars
+{report[:SPECIFICITY_WINDOW_CHARS]}
 
 **GAME CONTEXT FOR SPECIFICITY:**
 - Game: {game_data.get('name', 'Unknown')}
@@ -1310,7 +1848,8 @@ Return ONLY valid JSON, no other text.
 """
 
         try:
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'specificity',
                 model=self.model,
                 max_tokens=2000,
                 temperature=0.3,
@@ -1453,11 +1992,13 @@ Return ONLY valid JSON, no other text.
 """
 
         try:
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'competitor_validation',
                 model=self.model,
                 max_tokens=1500,
                 temperature=0.2,
-                messages=[{"role": "user", "content": validation_prompt}]
+                messages=[{"role": "user", "content": validation_prompt}],
+                validate=self._is_json_response
             )
 
             response_text = ""
@@ -1493,7 +2034,8 @@ Return ONLY valid JSON, no other text.
         draft_report: str,
         game_data: Dict[str, Any],
         sales_data: Dict[str, Any],
-        competitor_data: List[Dict[str, Any]]
+        competitor_data: List[Dict[str, Any]],
+        shared_context: str = None
     ) -> Dict[str, Any]:
         """
         Phase 3.2.8 (Phase 2): Run specialized domain audits in parallel
@@ -1516,18 +2058,10 @@ Return ONLY valid JSON, no other text.
             "overall_score": 100
         }
 
-        # FIX: Format genres using helper method that handles normalized format
-        genres_formatted = self._format_genres(game_data.get('genres', 'N/A'))
-
-        audit_prompt = f"""You are a panel of specialized game industry auditors reviewing a draft report.
-
-**DRAFT REPORT (excerpt):**
-{draft_report[:5000]}
+        if shared_context is None:
+            shared_context = self._build_shared_context(game_data, sales_data, competitor_data)
 
-**GAME CONTEXT:**
-- Price: {game_data.get('price')}
-- Revenue: {sales_data.get('estimated_revenue')}
-- Genre: {genres_formatted}
+        audit_prompt = f"""You are a panel of specialized game industry auditors reviewing the DRAFT REPORT above.
 
 **YOUR TASK:**
 Review this report from THREE specialist perspectives:
@@ -1575,11 +2109,14 @@ Return ONLY valid JSON, no other text.
 """
 
         try:
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'specialized_audits',
                 model=self.model,
                 max_tokens=1500,
                 temperature=0.3,
-                messages=[{"role": "user", "content": audit_prompt}]
+                messages=[{"role": "user", "content": audit_prompt}],
+                prefix=[shared_context, self._draft_context_block(draft_report)],
+                validate=self._is_json_response
             )
 
             response_text = ""
@@ -1615,7 +2152,8 @@ Return ONLY valid JSON, no other text.
         self,
         draft_report: str,
         game_data: Dict[str, Any],
-        sales_data: Dict[str, Any]
+        sales_data: Dict[str, Any],
+        shared_context: str = None
     ) -> Dict[str, Any]:
         """
         Phase 3.2.9 (Phase 2): Validate recommendation feasibility
@@ -1635,10 +2173,12 @@ Return ONLY valid JSON, no other text.
             "is_indie": "indie" in str(game_data.get('tags', '')).lower() or "indie" in str(game_data.get('developer', '')).lower()
         }
 
+        if shared_context is None:
+            shared_context = self._build_shared_context(game_data, sales_data, [])
+
         validation_prompt = f"""You are a feasibility auditor for game marketing recommendations.
 
-**DRAFT REPORT RECOMMENDATIONS (excerpt):**
-{draft_report[draft_report.find('RECOMMENDATION'):draft_report.find('RECOMMENDATION')+3000] if 'RECOMMENDATION' in draft_report else draft_report[-3000:]}
+Review the recommendations in the DRAFT REPORT above.
 
 **GAME CONSTRAINTS:**
 {json.dumps(constraints, indent=2)}
@@ -1701,11 +2241,14 @@ Return ONLY valid JSON, no other text.
 """
 
         try:
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'recommendation_validation',
                 model=self.model,
                 max_tokens=1500,
                 temperature=0.3,
-                messages=[{"role": "user", "content": validation_prompt}]
+                messages=[{"role": "user", "content": validation_prompt}],
+                prefix=[shared_context, self._draft_context_block(draft_report)],
+                validate=self._is_json_response
             )
 
             response_text = ""
@@ -1831,11 +2374,13 @@ Return ONLY valid JSON, no other text.
 """
 
         try:
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'benchmark_analysis',
                 model=self.model,
                 max_tokens=1500,
                 temperature=0.3,
-                messages=[{"role": "user", "content": benchmark_prompt}]
+                messages=[{"role": "user", "content": benchmark_prompt}],
+                validate=self._is_json_response
             )
 
             response_text = ""
@@ -1964,11 +2509,13 @@ Return ONLY valid JSON, no other text.
 """
 
         try:
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'scenario_analysis',
                 model=self.model,
                 max_tokens=1500,
                 temperature=0.4,  # Slightly higher for creative scenario planning
-                messages=[{"role": "user", "content": scenario_prompt}]
+                messages=[{"role": "user", "content": scenario_prompt}],
+                validate=self._is_json_response
             )
 
             response_text = ""
@@ -2016,6 +2563,9 @@ Return ONLY valid JSON, no other text.
         - Provides weighted synthesis based on model confidence
         - Highlights blind spots that only one model catches
 
+        Providers are queried concurrently; synthesis proceeds as soon as
+        ENSEMBLE_QUORUM of them have answered (see _fan_out_ensemble).
+
         Falls back to Claude-only if other models aren't configured.
         """
         # If ensemble not available, return early with Claude-only flag
@@ -2069,85 +2619,9 @@ Return ONLY valid JSON:
 Be brutally honest. Focus on ACTIONABLE insights, not generic advice.
 """
 
-        model_responses = {}
-
-        # Run Claude analysis
-        try:
-            claude_response = self.client.messages.create(
-                model=self.model,
-                max_tokens=1000,
-                temperature=0.3,
-                messages=[{"role": "user", "content": analysis_prompt}]
-            )
-            response_text = ""
-            for content_block in claude_response.content:
-                if hasattr(content_block, 'text'):
-                    response_text += content_block.text
-
-            # Parse JSON
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-
-            model_responses["claude"] = json.loads(response_text)
-        except Exception as e:
-            model_responses["claude"] = {"error": f"Claude analysis failed: {str(e)}"}
-
-        # Run GPT-4 analysis (if available)
-        if self.openai_client:
-            try:
-                gpt_response = self.openai_client.chat.completions.create(
-                    model=self.openai_model,
-                    messages=[{"role": "user", "content": analysis_prompt}],
-                    max_tokens=1000,
-                    temperature=0.3
-                )
-                response_text = gpt_response.choices[0].message.content
-
-                # Parse JSON
-                if "```json" in response_text:
-                    json_start = response_text.find("```json") + 7
-                    json_end = response_text.find("```", json_start)
-                    response_text = response_text[json_start:json_end].strip()
-                elif "```" in response_text:
-                    json_start = response_text.find("```") + 3
-                    json_end = response_text.find("```", json_start)
-                    response_text = response_text[json_start:json_end].strip()
-
-                model_responses["gpt4"] = json.loads(response_text)
-            except Exception as e:
-                model_responses["gpt4"] = {"error": f"GPT-4 analysis failed: {str(e)}"}
-
-        # Run Gemini analysis (if available)
-        if self.google_client:
-            try:
-                gemini_response = self.google_client.generate_content(
-                    analysis_prompt,
-                    generation_config={
-                        "max_output_tokens": 1000,
-                        "temperature": 0.3
-                    }
-                )
-                response_text = gemini_response.text
-
-                # Parse JSON
-                if "```json" in response_text:
-                    json_start = response_text.find("```json") + 7
-                    json_end = response_text.find("```", json_start)
-                    response_text = response_text[json_start:json_end].strip()
-                elif "```" in response_text:
-                    json_start = response_text.find("```") + 3
-                    json_end = response_text.find("```", json_start)
-                    response_text = response_text[json_start:json_end].strip()
-
-                model_responses["gemini"] = json.loads(response_text)
-            except Exception as e:
-                model_responses["gemini"] = {"error": f"Gemini analysis failed: {str(e)}"}
+        model_responses, fan_out = self._fan_out_ensemble(
+            analysis_prompt, on_late_response=self._late_ensemble_recorder()
+        )
 
         # Synthesize results
         models_used = [m for m in model_responses.keys() if "error" not in model_responses[m]]
@@ -2191,10 +2665,201 @@ Be brutally honest. Focus on ACTIONABLE insights, not generic advice.
             "consensus_insights": consensus_insights,
             "divergent_insights": divergent_insights,
             "synthesis": synthesis,
-            "analysis_quality": "high" if len(models_used) >= 2 else "medium"
+            "analysis_quality": "high" if len(models_used) >= 2 else "medium",
+            **fan_out
         }
 
-    def _generate_enhanced_report(
+    def _ensemble_providers(self) -> Dict[str, Callable[[str], Dict[str, Any]]]:
+        """
+        Configured ensemble providers: model name -> callable(prompt) returning parsed JSON
+
+        Claude is queried through a gateway pinned to the current LLM run, so
+        an answer that arrives after the report returned is recorded against
+        this run rather than the next report's.
+        """
+        llm = self.llm.for_current_run()
+        providers = {"claude": lambda analysis_prompt: self._ensemble_claude(analysis_prompt, llm)}
+        if self.openai_client:
+            providers["gpt4"] = self._ensemble_gpt4
+        if self.google_client:
+            providers["gemini"] = self._ensemble_gemini
+        return providers
+
+    @classmethod
+    def _is_json_response(cls, response: Any) -> bool:
+        """LLMGateway validate hook: the response text parses as JSON"""
+        response_text = "".join(
+            block.text for block in response.content if hasattr(block, 'text')
+        )
+        cls._parse_ensemble_json(response_text)
+        return True
+
+    @staticmethod
+    def _parse_ensemble_json(response_text: str) -> Dict[str, Any]:
+        """Parse a provider's JSON answer, stripping markdown code fences"""
+        if "```json" in response_text:
+            json_start = response_text.find("```json") + 7
+            json_end = response_text.find("```", json_start)
+            response_text = response_text[json_start:json_end].strip()
+        elif "```" in response_text:
+            json_start = response_text.find("```") + 3
+            json_end = response_text.find("```", json_start)
+            response_text = response_text[json_start:json_end].strip()
+        return json.loads(response_text)
+
+    def _ensemble_claude(self, analysis_prompt: str, llm: Optional[LLMGateway] = None) -> Dict[str, Any]:
+        claude_response = (llm or self.llm).create(
+            'ensemble_claude',
+            model=self.model,
+            max_tokens=1000,
+            temperature=0.3,
+            cache=False,  # Sampled fresh alongside the uncached GPT/Gemini opinions
+            messages=[{"role": "user", "content": analysis_prompt}]
+        )
+        response_text = ""
+        for content_block in claude_response.content:
+            if hasattr(content_block, 'text'):
+                response_text += content_block.text
+        return self._parse_ensemble_json(response_text)
+
+    def _ensemble_gpt4(self, analysis_prompt: str) -> Dict[str, Any]:
+        gpt_response = self.openai_client.chat.completions.create(
+            model=self.openai_model,
+            messages=[{"role": "user", "content": analysis_prompt}],
+            max_tokens=1000,
+            temperature=0.3
+        )
+        return self._parse_ensemble_json(gpt_response.choices[0].message.content)
+
+    def _ensemble_gemini(self, analysis_prompt: str) -> Dict[str, Any]:
+        gemini_response = self.google_client.generate_content(
+            analysis_prompt,
+            generation_config={
+                "max_output_tokens": 1000,
+                "temperature": 0.3
+            }
+        )
+        return self._parse_ensemble_json(gemini_response.text)
+
+    def _fan_out_ensemble(
+        self,
+        analysis_prompt: str,
+        quorum: int = None,
+        timeout: float = None,
+        on_late_response: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any]]:
+        """
+        Query every ensemble provider concurrently and return once a quorum has answered
+
+        Providers that have not answered when the quorum is reached (or the
+        timeout expires) are not waited for and are not part of the
+        consensus. Their answers are passed to on_late_response when they
+        eventually arrive; the returned fan_out is a snapshot that is never
+        modified afterwards (it is persisted as part of the stage output).
+
+        Args:
+            analysis_prompt: Prompt sent to every provider
+            quorum: Successful answers needed to proceed (default ENSEMBLE_QUORUM,
+                capped at the number of providers)
+            timeout: Seconds each provider gets (default ENSEMBLE_PROVIDER_TIMEOUT)
+            on_late_response: Optional callback(provider_name, answer), called
+                on the provider's thread for each late answer
+
+        Returns:
+            Tuple of (model_responses, fan_out): model_responses maps each
+            provider that finished in time to its parsed answer or an
+            {"error": ...} entry; fan_out holds quorum, provider_latency_seconds,
+            late_responders and late_responses (late answers that arrived
+            before this returned) for the result
+        """
+        providers = self._ensemble_providers()
+        quorum = min(quorum or ENSEMBLE_QUORUM, len(providers))
+        timeout = timeout if timeout is not None else ENSEMBLE_PROVIDER_TIMEOUT
+
+        model_responses: Dict[str, Dict[str, Any]] = {}
+        latencies: Dict[str, float] = {}
+        late_responses: Dict[str, Dict[str, Any]] = {}
+        start = time.perf_counter()
+
+        def _query(name: str, provider: Callable[[str], Dict[str, Any]]) -> Dict[str, Any]:
+            try:
+                return provider(analysis_prompt)
+            except Exception as e:
+                return {"error": f"{ENSEMBLE_MODEL_LABELS.get(name, name)} analysis failed: {str(e)}"}
+            finally:
+                latencies[name] = round(time.perf_counter() - start, 3)
+
+        executor = ThreadPoolExecutor(max_workers=len(providers))
+        pending = {executor.submit(_query, name, provider): name for name, provider in providers.items()}
+        deadline = start + timeout
+        try:
+            while pending:
+                answered = sum("error" not in response for response in model_responses.values())
+                remaining = deadline - time.perf_counter()
+                if answered >= quorum or remaining <= 0:
+                    break
+                done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    model_responses[pending.pop(future)] = future.result()
+        finally:
+            executor.shutdown(wait=False)
+
+        late_responders = list(pending.values())
+        late_lock = threading.Lock()
+        returned = False
+        for future, name in pending.items():
+            def _record_late(future, name=name):
+                logger.info(f"Ensemble: {name} answered after consensus ({latencies.get(name)}s)")
+                with late_lock:
+                    if not returned:
+                        late_responses[name] = future.result()
+                        return
+                if on_late_response is not None:
+                    on_late_response(name, future.result())
+            future.add_done_callback(_record_late)
+
+        answered = sum("error" not in response for response in model_responses.values())
+        logger.info(
+            f"Ensemble: {answered}/{len(providers)} providers answered in "
+            f"{time.perf_counter() - start:.1f}s (quorum {quorum})"
+            + (f", not waiting for {', '.join(late_responders)}" if late_responders else "")
+        )
+
+        with late_lock:
+            returned = True
+            fan_out = {
+                "quorum": {"required": quorum, "reached": answered >= quorum},
+                "provider_latency_seconds": dict(latencies),
+                "late_responders": late_responders,
+                "late_responses": dict(late_responses),
+            }
+        if on_late_response is not None:
+            for name, response in fan_out["late_responses"].items():
+                on_late_response(name, response)
+        return model_responses, fan_out
+
+    def _late_ensemble_recorder(self) -> Callable[[str, Dict[str, Any]], None]:
+        """
+        Start a fresh late_ensemble_responses record for one ensemble run
+
+        Returns:
+            Hook for _fan_out_ensemble's on_late_response; answers from an
+            earlier run's providers that arrive later are ignored
+        """
+        with self._late_responses_lock:
+            self._late_responses_generation += 1
+            generation = self._late_responses_generation
+            self.late_ensemble_responses = {}
+
+        def record(name: str, response: Dict[str, Any]):
+            with self._late_responses_lock:
+                if self._late_responses_generation == generation:
+                    # Copy on write: readers never see the dict change under them
+                    self.late_ensemble_responses = {**self.late_ensemble_responses, name: response}
+
+        return record
+
+    def _build_enhanced_report_prompt(
         self,
         game_data: Dict[str, Any],
         sales_data: Dict[str, Any],
@@ -2209,21 +2874,14 @@ Be brutally honest. Focus on ACTIONABLE insights, not generic advice.
         tier_framework: Any = None
     ) -> str:
         """
-        Phase 3.3: Generate enhanced final report with ALL corrections applied
+        Build the Phase 3.3 instructions sent after the shared context prefix
 
-        ENHANCED (Phase 1): Now incorporates:
-        - Original audit corrections (competitor, revenue, success recognition)
-        - Fact-check corrections (numerical accuracy)
-        - Consistency corrections (cross-section alignment)
-
-        Uses 16k tokens for full detail
-        Applies ALL corrections from audit + fact-check + consistency checks
-        Uses success context for accurate analysis
+        Folds every audit pass's findings into correction instructions, then
+        appends the full report requirements and the tier framework.
         """
         # Get success context
         analyzer = GameAnalyzer()
         success_analysis = analyzer.analyze_success_level(game_data, sales_data, review_stats)
-        success_context = success_analysis['context_for_ai']
 
         # Build correction instructions from audit + new validation passes
         correction_instructions = ""
@@ -2430,38 +3088,16 @@ IMPORTANT: Synthesize insights from multiple models. When models agree (consensu
         except (ValueError, TypeError):
             reviews_total_formatted = "0"
 
-        prompt = f"""You are an expert game marketing analyst at Publitz creating the FINAL {report_type.upper()} AUDIT REPORT.
+        prompt = f"""You are an expert game marketing analyst at Publitz creating the FINAL {report_type.upper()} AUDIT REPORT from the REPORT CONTEXT above.
 
 {correction_instructions}
 
-**Game Information:**
-- Name: {game_data.get('name', 'N/A')}
-- App ID: {game_data.get('app_id', 'N/A')}
-- Developer: {game_data.get('developer', 'N/A')}
-- Publisher: {game_data.get('publisher', 'N/A')}
-- Release Date: {game_data.get('release_date', 'N/A')}
-- Genre: {game_data.get('genres', 'N/A')}
-- Tags: {game_data.get('tags', 'N/A')}
-- Price: {game_data.get('price', 'N/A')}
-
-**Complete Sales & Performance Data:**
-{json.dumps(sales_data, indent=2)}
-
-**SUCCESS LEVEL ANALYSIS:**
-{success_context}
-
 **BENCHMARK CONTEXT (Phase 3):**
 {json.dumps(benchmark, indent=2) if benchmark and not benchmark.get('error') else "Benchmark analysis not available"}
 
 **SCENARIO PROJECTIONS (Phase 3):**
 {json.dumps(scenarios, indent=2) if scenarios and not scenarios.get('error') else "Scenario analysis not available"}
 
-**CAPSULE IMAGE ANALYSIS:**
-{self._format_capsule_analysis(capsule_analysis) if capsule_analysis else "Capsule analysis not available"}
-
-**Competitor Analysis ({len(competitor_data)} competitors):**
-{self._format_competitor_data(competitor_data)}
-
 **PHASE 2 ENRICHMENT DATA (Community & Influencers):**
 {json.dumps(phase2_data, indent=2) if phase2_data else "Phase 2 data not available"}
 
@@ -3122,12 +3758,53 @@ Here's how the Market Positioning section should sound for this tier:
 **CRITICAL:** The strategic frame "{tier_framework.primary_frame}" must guide ALL your analysis, recommendations, and tone throughout this entire report. Every section should reflect the tone and priorities appropriate for a {tier_framework.tier_name} tier game.
 """
 
+        return prompt
+
+    def _generate_enhanced_report(
+        self,
+        game_data: Dict[str, Any],
+        sales_data: Dict[str, Any],
+        competitor_data: List[Dict[str, Any]],
+        steamdb_data: Dict[str, Any],
+        draft_report: str,
+        audit_results: Dict[str, Any],
+        report_type: str,
+        review_stats: Dict[str, Any] = None,
+        capsule_analysis: Dict[str, Any] = None,
+        phase2_data: Dict[str, Any] = None,
+        tier_framework: Any = None,
+        shared_context: str = None
+    ) -> str:
+        """
+        Phase 3.3: Generate enhanced final report with ALL corrections applied
+
+        ENHANCED (Phase 1): Now incorporates:
+        - Original audit corrections (competitor, revenue, success recognition)
+        - Fact-check corrections (numerical accuracy)
+        - Consistency corrections (cross-section alignment)
+
+        Uses 16k tokens for full detail
+        Applies ALL corrections from audit + fact-check + consistency checks
+        Uses success context for accurate analysis
+        """
+        if shared_context is None:
+            shared_context = self._build_shared_context(
+                game_data, sales_data, competitor_data, review_stats, capsule_analysis
+            )
+
+        prompt = self._build_enhanced_report_prompt(
+            game_data, sales_data, competitor_data, steamdb_data, draft_report, audit_results,
+            report_type, review_stats, capsule_analysis, phase2_data, tier_framework
+        )
+
         try:
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'enhanced_report',
                 model=self.model,
                 max_tokens=15500,  # Reduced from 16000 to allow clean ending
                 temperature=0.7,
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": prompt}],
+                prefix=[shared_context]
             )
 
             report_text = ""
@@ -3152,6 +3829,71 @@ Here's how the Market Positioning section should sound for this tier:
             print(f"Warning: Enhanced report generation failed: {e}")
             return draft_report
 
+    def _stream_enhanced_report(
+        self,
+        game_data: Dict[str, Any],
+        sales_data: Dict[str, Any],
+        competitor_data: List[Dict[str, Any]],
+        steamdb_data: Dict[str, Any],
+        draft_report: str,
+        audit_results: Dict[str, Any],
+        report_type: str,
+        review_stats: Dict[str, Any] = None,
+        capsule_analysis: Dict[str, Any] = None,
+        phase2_data: Dict[str, Any] = None,
+        tier_framework: Any = None,
+        shared_context: str = None
+    ) -> Iterator[str]:
+        """
+        Phase 3.3 (streaming): Yield the enhanced report section by section
+
+        Same prompt and fallbacks as _generate_enhanced_report, but each
+        markdown section is yielded as soon as the next one starts.
+        """
+        if shared_context is None:
+            shared_context = self._build_shared_context(
+                game_data, sales_data, competitor_data, review_stats, capsule_analysis
+            )
+
+        prompt = self._build_enhanced_report_prompt(
+            game_data, sales_data, competitor_data, steamdb_data, draft_report, audit_results,
+            report_type, review_stats, capsule_analysis, phase2_data, tier_framework
+        )
+
+        emitted = False
+        try:
+            stream = self.llm.stream(
+                'enhanced_report',
+                model=self.model,
+                max_tokens=15500,  # Reduced from 16000 to allow clean ending
+                temperature=0.7,
+                messages=[{"role": "user", "content": prompt}],
+                prefix=[shared_context]
+            )
+            for section in iter_markdown_sections(stream):
+                emitted = True
+                yield section
+
+            if stream.first_token_seconds is not None:
+                logger.info(f"Enhanced report first token after {stream.first_token_seconds:.1f}s")
+
+            # Check for truncation
+            if getattr(stream.response, 'stop_reason', None) == "max_tokens":
+                logger.warning("Report generation hit token limit - response may be truncated")
+                yield "\n\n---\n\n*Note: Report generation reached token limit. Consider requesting specific sections separately for full detail.*"
+
+        except Exception as e:
+            if emitted:
+                logger.warning(f"Enhanced report stream interrupted: {e}")
+                yield "\n\n---\n\n*Note: Report generation was interrupted. Later sections may be missing.*"
+                return
+            # Return draft if enhanced generation fails
+            print(f"Warning: Enhanced report generation failed: {e}")
+
+        if not emitted:
+            # Fallback to draft if enhanced generation fails or is empty
+            yield from iter_markdown_sections([draft_report])
+
     def _format_competitor_data(self, competitor_data: List[Dict[str, Any]]) -> str:
         """Format competitor data for the prompt"""
         if not competitor_data:
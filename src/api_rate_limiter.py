@@ -8,6 +8,7 @@ with exponential backoff and retry logic.
 
 import time
 import logging
+import threading
 from functools import wraps
 from typing import Callable, List, Optional
 from collections import deque
@@ -20,6 +21,8 @@ class RateLimiter:
     Rate limiter with sliding window algorithm.
     
     Tracks API call timestamps and enforces rate limits with automatic delays.
+    Thread-safe: one limiter can be shared by concurrent workers hitting the
+    same API.
     """
     
     def __init__(self, calls_per_minute: int = 30, max_retries: int = 4):
@@ -34,6 +37,7 @@ class RateLimiter:
         self.max_retries = max_retries
         self.call_times: deque = deque()  # Timestamps of recent calls
         self.window_size = 60  # 60 seconds
+        self._lock = threading.Lock()
     
     def _clean_old_calls(self):
         """Remove call timestamps older than window_size"""
@@ -57,6 +61,18 @@ class RateLimiter:
                 )
                 time.sleep(wait_time + 0.1)  # Small buffer
                 self._clean_old_calls()
+
+    def acquire(self):
+        """
+        Block until a call is allowed, then record it.
+
+        Usage:
+            steamspy_rate_limiter.acquire()
+            response = requests.get(url)
+        """
+        with self._lock:
+            self._wait_if_needed()
+            self.call_times.append(time.time())
     
     def __call__(self, func: Callable) -> Callable:
         """
@@ -69,8 +85,7 @@ class RateLimiter:
         """
         @wraps(func)
         def wrapper(*args, **kwargs):
-            self._wait_if_needed()
-            self.call_times.append(time.time())
+            self.acquire()
             return func(*args, **kwargs)
         
         return wrapper
@@ -189,6 +204,9 @@ def rate_limited_api_call(
 steamspy_rate_limiter = RateLimiter(calls_per_minute=30)
 steam_api_rate_limiter = RateLimiter(calls_per_minute=100)
 general_api_rate_limiter = RateLimiter(calls_per_minute=60)
+rawg_api_rate_limiter = RateLimiter(calls_per_minute=60)
+hltb_rate_limiter = RateLimiter(calls_per_minute=30)
+steamdb_rate_limiter = RateLimiter(calls_per_minute=30)  # Store page scraping + SteamSpy fallback
 
 
 # Test the rate limiter
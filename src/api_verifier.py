@@ -5,8 +5,9 @@ Tracks API calls during report generation to show clients which data sources
 were successfully used. Provides transparency about data quality and completeness.
 """
 
+import threading
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 from enum import Enum
 
@@ -61,6 +62,7 @@ class APIVerifier:
     def __init__(self):
         self.calls: List[APICallResult] = []
         self.start_time = datetime.now()
+        self._capturing = threading.local()
 
     def record_call(
         self,
@@ -94,8 +96,38 @@ class APIVerifier:
             data_retrieved=data_retrieved or (status == APIStatus.SUCCESS)
         )
         self.calls.append(result)
+        captured = getattr(self._capturing, 'calls', None)
+        if captured is not None:
+            captured.append(result)
         return result
 
+    def capture(self, func: Callable[..., Any], **kwargs) -> Tuple[Any, List[APICallResult]]:
+        """
+        Run func and collect the calls it records on this thread (e.g. to
+        replay them when its cached output is reused in a later report)
+
+        Args:
+            func: Function to run
+            **kwargs: Arguments for func
+
+        Returns:
+            Tuple of (func's result, calls recorded while it ran)
+        """
+        previous = getattr(self._capturing, 'calls', None)
+        calls = self._capturing.calls = []
+        try:
+            return func(**kwargs), calls
+        finally:
+            self._capturing.calls = previous
+            if previous is not None:
+                previous.extend(calls)
+
+    def replay(self, calls: Iterable[APICallResult]):
+        """Record calls captured in an earlier report again (for reused outputs)"""
+        for call in calls:
+            self.record_call(call.api_name, call.endpoint, call.status, call.error_message,
+                             call.response_time_ms, call.data_retrieved)
+
     def record_success(self, api_name: str, endpoint: str, response_time_ms: Optional[float] = None) -> APICallResult:
         """Shorthand to record successful API call"""
         return self.record_call(api_name, endpoint, APIStatus.SUCCESS, response_time_ms=response_time_ms, data_retrieved=True)
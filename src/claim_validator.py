@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Claim Validator - Deterministic check of numeric claims against GameMetrics
+
+Most numbers in a draft report (revenue, review counts, price, owners, review
+percentage) restate data we already hold. This module extracts those claims
+with regexes, checks them against GameMetrics with rounding-aware tolerances,
+and cross-checks that the same metric isn't stated with different values in
+different sections.
+
+Each claim ends up as:
+- verified: matches the source metric (allowing for the displayed rounding)
+- mismatch: clearly about this game's metric and wrong
+- ambiguous: can't be decided locally (metric unknown, unclear subject, or a
+  large dollar amount with no revenue/price wording)
+
+Claims about competitors, targets/benchmarks and recommendation budgets are
+not source-data claims and are skipped. The LLM fact-check and consistency
+passes only need to run when ambiguous claims remain.
+
+Results use the same shape as the LLM passes (verified_facts/errors_found,
+contradictions_found) so downstream code is unchanged.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from src.data_consistency import GameMetrics
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Relative tolerance on top of displayed rounding, per claim kind
+CLAIM_TOLERANCE = {
+    'revenue': 0.05,  # Revenue is an estimate; allow rephrasing of the same figure
+    'price': 0.01,
+    'reviews': 0.01,
+    'owners': 0.10,   # Same 10% tolerance as validate_report_consistency
+    'review_percentage': 0.0,
+}
+
+# Absolute tolerance for review percentages (percentage points)
+PERCENT_POINT_TOLERANCE = 1.0
+
+_SCALES = {'k': 1e3, 'thousand': 1e3, 'm': 1e6, 'million': 1e6, 'b': 1e9, 'billion': 1e9}
+
+_MONEY = re.compile(
+    r'\$\s?(\d[\d,]*(?:\.\d+)?)\s*(k|m|b|thousand|million|billion)?\b', re.IGNORECASE
+)
+_COUNT = re.compile(
+    r'(\d[\d,]*(?:\.\d+)?)\s*(k|m|thousand|million)?(\+)?\s+'
+    r'(?:(?:total|steam|user|player)\s+)?(positive\s+|negative\s+)?(reviews?|owners?|copies)\b',
+    re.IGNORECASE
+)
+_PERCENT = re.compile(r'(\d+(?:\.\d+)?)\s?%')
+
+_REVENUE_WORDS = re.compile(r'\b(revenue|gross(?:ed)?|earn(?:ed|ings)?|lifetime sales|sales of|made)\b', re.IGNORECASE)
+_PRICE_WORDS = re.compile(r'\b(price[ds]?|pricing|costs?|retails?|priced at)\b', re.IGNORECASE)
+_REVIEW_PCT_WORDS = re.compile(r'\b(positive|review score|rating|approval|recommend)', re.IGNORECASE)
+# Budgets, targets and benchmarks are not statements about the source data
+_NOT_A_CLAIM_WORDS = re.compile(
+    r'\b(budget|spend|invest|campaign|ads?|per month|/month|monthly budget|target|goal|reach|aim|'
+    r'achieve|need|typically|average|median|benchmark|threshold|projected|projection|could|would|'
+    r'expect|potential|increase|grow|boost|discount|sale price|bundle|games with)\b',
+    re.IGNORECASE
+)
+_HEADING = re.compile(r'^#{1,6}\s+(.*)')
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+
+@dataclass
+class NumericClaim:
+    """A number in the report that may restate a source metric"""
+    kind: str       # revenue | price | reviews | positive_reviews | negative_reviews | owners | review_percentage
+    text: str       # Matched text, e.g. "$1.2M" or "5,000 reviews"
+    value: float
+    tolerance: float  # Absolute tolerance implied by the displayed rounding
+    sentence: str
+    section: str
+    status: str = 'pending'  # verified | mismatch | ambiguous | skipped
+    expected: Optional[float] = None
+    reason: str = ''
+
+
+def parse_amount(value: Any) -> float:
+    """
+    Parse a number that may be formatted ("$1,234", "$1.2M", "95.5%", 1234)
+
+    Args:
+        value: Number or formatted string
+
+    Returns:
+        Parsed value (0.0 if it can't be parsed)
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not value:
+        return 0.0
+    match = re.search(r'(\d[\d,]*(?:\.\d+)?)\s*(k|m|b|thousand|million|billion)?', str(value), re.IGNORECASE)
+    if not match:
+        return 0.0
+    number = float(match.group(1).replace(',', ''))
+    return number * _SCALES.get((match.group(2) or '').lower(), 1)
+
+
+def metrics_from_report_data(game_data: Dict[str, Any], sales_data: Dict[str, Any]) -> GameMetrics:
+    """
+    Build GameMetrics from the game_data/sales_data dicts used by report generation
+
+    Args:
+        game_data: Game information (price, name, app_id, ...)
+        sales_data: Sales data (estimated_revenue, reviews_total, review_score_raw, owners_avg, ...)
+
+    Returns:
+        GameMetrics (unknown values are 0)
+    """
+    reviews_total = int(parse_amount(sales_data.get('reviews_total')))
+    review_pct = sales_data.get('review_score_raw')
+    if review_pct is None:
+        review_pct = parse_amount(sales_data.get('review_score'))
+    review_pct = float(review_pct) if review_pct and float(review_pct) <= 100 else 0.0
+
+    positive = round(reviews_total * review_pct / 100)
+    return GameMetrics(
+        app_id=str(game_data.get('app_id', '')),
+        game_name=game_data.get('name', 'Unknown'),
+        revenue_gross=parse_amount(sales_data.get('estimated_revenue')),
+        days_since_launch=int(game_data.get('days_since_launch') or 1),
+        review_count_total=reviews_total,
+        review_count_positive=positive,
+        review_count_negative=reviews_total - positive,
+        owner_count=int(parse_amount(sales_data.get('owners_avg') or sales_data.get('owners_display'))),
+        price_usd=parse_amount(game_data.get('price')),
+        release_date=str(game_data.get('release_date', '') or ''),
+        genres=game_data.get('genres') or []
+    )
+
+
+def _rounding_tolerance(digits: str, scale: float) -> float:
+    """Half a unit of the last significant displayed digit ("5,000" -> 500, "$1.2M" -> 50,000)"""
+    digits = digits.replace(',', '')
+    if '.' in digits:
+        decimals = len(digits.split('.')[1])
+        return 0.5 * (10 ** -decimals) * scale
+    stripped = digits.rstrip('0')
+    trailing_zeros = len(digits) - len(stripped) if stripped else 0
+    return 0.5 * (10 ** trailing_zeros) * scale if trailing_zeros else 0.5 * scale
+
+
+def extract_numeric_claims(report_text: str) -> List[NumericClaim]:
+    """
+    Extract revenue, price, review, owner and review-percentage claims
+
+    Args:
+        report_text: Markdown report
+
+    Returns:
+        Claims in report order, each tagged with its sentence and section heading
+    """
+    claims = []
+    section = ''
+    for line in report_text.split('\n'):
+        heading = _HEADING.match(line.strip())
+        if heading:
+            section = heading.group(1).strip()
+            continue
+
+        for sentence in _SENTENCE_SPLIT.split(line):
+            for match in _MONEY.finditer(sentence):
+                scale = _SCALES.get((match.group(2) or '').lower(), 1)
+                value = float(match.group(1).replace(',', '')) * scale
+                if _PRICE_WORDS.search(sentence) and value < 200:
+                    kind = 'price'
+                elif _REVENUE_WORDS.search(sentence):
+                    kind = 'revenue'
+                else:
+                    kind = 'money'
+                claims.append(NumericClaim(kind, match.group(0).strip(), value,
+                                           _rounding_tolerance(match.group(1), scale), sentence, section))
+
+            for match in _COUNT.finditer(sentence):
+                scale = _SCALES.get((match.group(2) or '').lower(), 1)
+                noun = match.group(5).lower()
+                polarity = (match.group(4) or '').strip().lower()
+                if noun.startswith('review'):
+                    kind = f"{polarity}_reviews" if polarity else 'reviews'
+                else:
+                    kind = 'owners'
+                claim = NumericClaim(kind, match.group(0).strip(),
+                                     float(match.group(1).replace(',', '')) * scale,
+                                     _rounding_tolerance(match.group(1), scale), sentence, section)
+                if match.group(3):  # "500+ reviews" is a threshold, not a count
+                    claim.status, claim.reason = 'skipped', 'threshold'
+                claims.append(claim)
+
+            if _REVIEW_PCT_WORDS.search(sentence):
+                for match in _PERCENT.finditer(sentence):
+                    claims.append(NumericClaim('review_percentage', match.group(0), float(match.group(1)),
+                                               _rounding_tolerance(match.group(1), 1), sentence, section))
+    return claims
+
+
+def _expected_values(kind: str, metrics: GameMetrics) -> List[float]:
+    if kind == 'revenue':
+        return [metrics.revenue_gross, metrics.revenue_after_steam_cut, metrics.monthly_revenue]
+    if kind == 'money':
+        return [metrics.revenue_gross, metrics.revenue_after_steam_cut, metrics.monthly_revenue, metrics.price_usd]
+    return [{
+        'price': metrics.price_usd,
+        'reviews': metrics.review_count_total,
+        'positive_reviews': metrics.review_count_positive,
+        'negative_reviews': metrics.review_count_negative,
+        'owners': metrics.owner_count,
+        'review_percentage': metrics.review_percentage,
+    }[kind]]
+
+
+def _matches(claim: NumericClaim, expected: float) -> bool:
+    if claim.kind == 'review_percentage':
+        return abs(claim.value - expected) <= max(PERCENT_POINT_TOLERANCE, claim.tolerance)
+    relative = CLAIM_TOLERANCE.get(claim.kind.split('_')[-1] if claim.kind.endswith('reviews') else claim.kind, 0.05)
+    return abs(claim.value - expected) <= max(claim.tolerance, abs(expected) * relative)
+
+
+def classify_claims(
+    claims: List[NumericClaim],
+    metrics: GameMetrics,
+    competitor_names: Iterable[str] = ()
+) -> List[NumericClaim]:
+    """
+    Mark each claim verified, mismatch, ambiguous or skipped
+
+    Args:
+        claims: Claims from extract_numeric_claims
+        metrics: Source of truth
+        competitor_names: Competitor names (claims about them are skipped)
+
+    Returns:
+        The same claims, classified in place
+    """
+    competitors = [name.lower() for name in competitor_names if name and len(name) > 2]
+    game_name = (metrics.game_name or '').lower()
+
+    for claim in claims:
+        if claim.status == 'skipped':
+            continue
+
+        sentence = claim.sentence.lower()
+        names_competitor = any(name in sentence for name in competitors)
+        names_game = bool(game_name) and game_name in sentence
+        expected = [value for value in _expected_values(claim.kind, metrics) if value]
+
+        if claim.kind == 'money' and (claim.value < 1000 or _NOT_A_CLAIM_WORDS.search(claim.sentence)):
+            claim.status, claim.reason = 'skipped', 'not a source metric'
+        elif names_competitor and not names_game:
+            claim.status, claim.reason = 'skipped', 'competitor claim'
+        elif any(_matches(claim, value) for value in expected):
+            claim.status = 'verified'
+            claim.expected = min(expected, key=lambda value: abs(value - claim.value))
+        elif _NOT_A_CLAIM_WORDS.search(claim.sentence):
+            claim.status, claim.reason = 'skipped', 'target or benchmark'
+        elif not expected:
+            claim.status, claim.reason = 'ambiguous', 'source metric unknown'
+        elif claim.kind == 'money':
+            claim.status, claim.reason = 'ambiguous', 'dollar amount without revenue or price wording'
+        elif names_competitor:
+            claim.status, claim.reason = 'ambiguous', 'sentence compares game and competitor'
+        else:
+            claim.status = 'mismatch'
+            claim.expected = expected[0]
+
+    return claims
+
+
+def _format_value(kind: str, value: float) -> str:
+    if kind in ('revenue', 'money', 'price'):
+        return f"${value:,.2f}" if kind == 'price' else f"${value:,.0f}"
+    if kind == 'review_percentage':
+        return f"{value:.1f}%"
+    return f"{value:,.0f}"
+
+
+def check_report_claims(
+    report_text: str,
+    metrics: GameMetrics,
+    competitor_names: Iterable[str] = ()
+) -> Dict[str, Any]:
+    """
+    Run the local fact-check and numeric consistency check on a report
+
+    Args:
+        report_text: Markdown report (usually the draft)
+        metrics: Source of truth
+        competitor_names: Competitor names (claims about them are skipped)
+
+    Returns:
+        Dictionary with 'fact_check' (LLM fact-check shape, plus
+        ambiguous_claims), 'consistency' (LLM consistency shape) and
+        'ambiguous_claims' (claims only an LLM pass can resolve)
+    """
+    claims = classify_claims(extract_numeric_claims(report_text), metrics, competitor_names)
+
+    verified = [claim for claim in claims if claim.status == 'verified']
+    mismatches = [claim for claim in claims if claim.status == 'mismatch']
+    ambiguous = [
+        {'claim': claim.text, 'kind': claim.kind, 'section': claim.section,
+         'sentence': claim.sentence.strip()[:200], 'reason': claim.reason}
+        for claim in claims if claim.status == 'ambiguous'
+    ]
+    checked = len(verified) + len(mismatches)
+
+    fact_check = {
+        'verified_facts': [
+            {'claim': claim.text, 'source_value': _format_value(claim.kind, claim.expected), 'matches': True}
+            for claim in verified
+        ],
+        'errors_found': [
+            {
+                'claim': claim.text,
+                'source_value': _format_value(claim.kind, claim.expected),
+                'matches': False,
+                'severity': 'high' if claim.kind in ('revenue', 'price') else 'medium',
+                'section': claim.section,
+            }
+            for claim in mismatches
+        ],
+        'unsupported_claims': [],
+        'ambiguous_claims': ambiguous,
+        'accuracy_score': round(len(verified) / checked * 100) if checked else 100,
+        'total_facts_checked': checked,
+        'errors_count': len(mismatches),
+        'method': 'local',
+    }
+
+    contradictions = _numeric_contradictions(verified + mismatches)
+    consistency = {
+        'contradictions_found': contradictions,
+        'consistency_score': max(0, 100 - 15 * len(contradictions)),
+        'needs_revision': bool(contradictions),
+        'revision_notes': (
+            f"{len(contradictions)} metric(s) stated with different values in different sections"
+            if contradictions else "Numeric claims are consistent across sections"
+        ),
+        'method': 'local',
+    }
+
+    logger.info(
+        f"Local claim check: {len(verified)} verified, {len(mismatches)} mismatched, "
+        f"{len(ambiguous)} ambiguous, {len(contradictions)} contradictions"
+    )
+    return {'fact_check': fact_check, 'consistency': consistency, 'ambiguous_claims': ambiguous}
+
+
+def _numeric_contradictions(claims: List[NumericClaim]) -> List[Dict[str, Any]]:
+    """Find the same metric stated with incompatible values in different sections"""
+    contradictions = []
+    by_kind: Dict[Tuple[str, Optional[float]], List[NumericClaim]] = {}
+    for claim in claims:
+        # Claims are grouped by the metric they were matched against
+        by_kind.setdefault((claim.kind, claim.expected), []).append(claim)
+
+    for (kind, _), group in by_kind.items():
+        first = group[0]
+        for other in group[1:]:
+            scale = max(first.tolerance, other.tolerance, abs(first.value) * CLAIM_TOLERANCE.get(kind, 0.05))
+            if abs(first.value - other.value) > scale and first.section != other.section:
+                contradictions.append({
+                    'section_1': first.section or 'Introduction',
+                    'section_2': other.section or 'Introduction',
+                    'contradiction': f"{kind.replace('_', ' ')} stated as {first.text} and as {other.text}",
+                    'severity': 'high' if kind in ('revenue', 'price') else 'medium',
+                })
+                break
+    return contradictions
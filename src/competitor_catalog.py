@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Competitor Catalog - Persisted competitor sets for repeat audits
+
+Monthly post-launch check-ins audit the same client repeatedly. Instead of
+rerunning the full competitor search every time, we persist:
+
+- CandidateCatalog: every app_id discovered through SteamSpy tag/genre
+  listings, with the time it was first seen and the listings it came from
+- CompetitorStore: the chosen competitor set per target app_id, with a
+  feature snapshot of each competitor and when it was fetched
+
+GameSearch.refresh_competitors uses both to re-fetch only stale competitors
+and to score only candidates added to the catalog since the last run.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CATALOG_DIR = Path(".cache") / "catalog"
+
+# Fields compared between runs to report what changed for a competitor
+SNAPSHOT_FEATURES = [
+    'name',
+    'price_raw',
+    'review_count',
+    'review_score_raw',
+    'release_date',
+    'genres',
+    'tags',
+]
+
+
+def _write_json(path: Path, data: Any):
+    """Atomically write JSON (write temp file, then rename)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    tmp_path.replace(path)
+
+
+def feature_snapshot(game: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract the comparable features of a competitor
+
+    Args:
+        game: Game details from GameSearch.get_game_details
+
+    Returns:
+        Dictionary of SNAPSHOT_FEATURES present on the game
+    """
+    return {field: game.get(field) for field in SNAPSHOT_FEATURES if field in game}
+
+
+class CandidateCatalog:
+    """
+    Persisted catalog of candidate app_ids seen in SteamSpy listings
+
+    Each entry records when the app was first seen and which listings
+    (e.g. 'tag:Roguelike', 'genre:Action') returned it.
+    """
+
+    def __init__(self, catalog_dir: Union[str, Path] = DEFAULT_CATALOG_DIR):
+        """
+        Initialize catalog
+
+        Args:
+            catalog_dir: Directory holding candidates.json
+        """
+        self.path = Path(catalog_dir) / "candidates.json"
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+        if self.path.exists():
+            try:
+                with open(self.path, 'r') as f:
+                    self.entries = json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Candidate catalog unreadable, starting fresh: {e}")
+
+    def record(self, source: str, app_ids: Iterable[int]) -> int:
+        """
+        Record app_ids returned by a listing
+
+        Args:
+            source: Listing key (e.g. 'tag:Roguelike')
+            app_ids: App IDs the listing returned
+
+        Returns:
+            Number of app_ids that were new to the catalog
+        """
+        now = time.time()
+        added = 0
+        changed = False
+
+        with self._lock:
+            for app_id in app_ids:
+                entry = self.entries.get(str(app_id))
+                if entry is None:
+                    self.entries[str(app_id)] = {'first_seen': now, 'sources': [source]}
+                    added += 1
+                    changed = True
+                elif source not in entry['sources']:
+                    entry['sources'].append(source)
+                    changed = True
+
+            if changed:
+                try:
+                    _write_json(self.path, self.entries)
+                except OSError as e:
+                    logger.error(f"Candidate catalog write error: {e}")
+
+        if added:
+            logger.debug(f"Catalog: {added} new candidates from {source}")
+        return added
+
+    def added_since(self, timestamp: float, sources: Optional[Iterable[str]] = None) -> List[int]:
+        """
+        Get app_ids first seen after a timestamp
+
+        Args:
+            timestamp: Unix timestamp of the previous run
+            sources: Only include entries from these listings (None = all)
+
+        Returns:
+            App IDs, oldest first
+        """
+        wanted = set(sources) if sources is not None else None
+        matches = [
+            (entry['first_seen'], int(app_id))
+            for app_id, entry in self.entries.items()
+            if entry['first_seen'] > timestamp
+            and (wanted is None or wanted.intersection(entry['sources']))
+        ]
+        return [app_id for _, app_id in sorted(matches)]
+
+
+class CompetitorStore:
+    """
+    Persisted competitor set and feature snapshot per target app_id
+    """
+
+    def __init__(self, catalog_dir: Union[str, Path] = DEFAULT_CATALOG_DIR):
+        """
+        Initialize store
+
+        Args:
+            catalog_dir: Directory holding the competitors/ subdirectory
+        """
+        self.store_dir = Path(catalog_dir) / "competitors"
+
+    def _path(self, app_id: Any) -> Path:
+        return self.store_dir / f"{app_id}.json"
+
+    def load(self, app_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Load the stored competitor set for a target game
+
+        Args:
+            app_id: Target game's app_id
+
+        Returns:
+            Snapshot dict ({'app_id', 'updated_at', 'competitors': [...]}) or None
+        """
+        path = self._path(app_id)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Competitor snapshot for {app_id} unreadable: {e}")
+            return None
+
+    def save(
+        self,
+        app_id: Any,
+        competitors: List[Dict[str, Any]],
+        scores: Dict[Any, int],
+        fetched_at: Dict[Any, float]
+    ) -> Dict[str, Any]:
+        """
+        Store the competitor set for a target game
+
+        Args:
+            app_id: Target game's app_id
+            competitors: Competitor game details, in ranked order
+            scores: Similarity score per competitor app_id
+            fetched_at: Unix timestamp each competitor's data was fetched
+
+        Returns:
+            The stored snapshot
+        """
+        now = time.time()
+        snapshot = {
+            'app_id': app_id,
+            'updated_at': now,
+            'competitors': [
+                {
+                    'app_id': comp.get('app_id'),
+                    'score': scores.get(comp.get('app_id'), 0),
+                    'fetched_at': fetched_at.get(comp.get('app_id'), now),
+                    'features': feature_snapshot(comp),
+                    'data': comp
+                }
+                for comp in competitors
+            ]
+        }
+
+        try:
+            _write_json(self._path(app_id), snapshot)
+            logger.info(f"Stored {len(competitors)} competitors for App ID {app_id}")
+        except (TypeError, OSError) as e:
+            logger.error(f"Competitor snapshot write error for {app_id}: {e}")
+
+        return snapshot
+
+
+def diff_competitor_sets(
+    previous: Optional[Dict[str, Any]],
+    current: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Compare two stored competitor snapshots
+
+    Args:
+        previous: Earlier snapshot (None on first run)
+        current: New snapshot
+
+    Returns:
+        Dictionary with added/removed/changed/unchanged competitors
+    """
+    old = {str(c['app_id']): c for c in (previous or {}).get('competitors', [])}
+    new = {str(c['app_id']): c for c in current.get('competitors', [])}
+
+    def _label(entry: Dict[str, Any]) -> Dict[str, Any]:
+        return {'app_id': entry['app_id'], 'name': entry['features'].get('name', 'Unknown')}
+
+    changed = []
+    unchanged = []
+    for key in [k for k in new if k in old]:
+        before, after = old[key]['features'], new[key]['features']
+        changes = {
+            field: {'before': before.get(field), 'after': after.get(field)}
+            for field in SNAPSHOT_FEATURES
+            if before.get(field) != after.get(field)
+        }
+        score_delta = new[key]['score'] - old[key]['score']
+        if changes or score_delta:
+            changed.append({**_label(new[key]), 'changes': changes, 'score_delta': score_delta})
+        else:
+            unchanged.append(_label(new[key]))
+
+    return {
+        'added': [_label(new[key]) for key in new if key not in old],
+        'removed': [_label(old[key]) for key in old if key not in new],
+        'changed': changed,
+        'unchanged': unchanged,
+    }
@@ -4,13 +4,16 @@ Game Performance Analyzer
 Detects success levels and provides context for AI analysis
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from src.review_trends import language_scale, review_trend
 
 
 class GameAnalyzer:
     """Analyzes game performance to detect success levels"""
 
-    def __init__(self):
+    def __init__(self, review_store=None):
+        self.review_store = review_store  # None = shared ReviewStore
+
         # Success thresholds (IMPROVED: Extended for mega-hits)
         self.REVIEW_THRESHOLDS = {
             'legendary': 200000,   # 200k+ reviews = legendary (Baldur's Gate 3, Hades 2)
@@ -71,6 +74,15 @@ class GameAnalyzer:
         velocity_status = review_stats.get('velocity_status', 'Unknown') if review_stats else 'Unknown'
         recent_reviews = review_stats.get('recent_reviews', 0) if review_stats else 0
 
+        # Daily review rollup: fills in velocity when review_stats is missing
+        trend = review_stats.get('review_trend') if review_stats else None
+        if trend is None:
+            trend = self._get_review_trend(game_data.get('app_id'))
+        if trend and trend['complete'] and not review_stats and review_count > 0:
+            recent_reviews = round(trend['recent_reviews'] * language_scale(trend, review_count))
+            velocity_score = min(1.0, recent_reviews / review_count)
+            velocity_status = self._velocity_status(velocity_score)
+
         # Analyze each dimension
         engagement = self._analyze_engagement(review_count)
         quality = self._analyze_quality(review_score)
@@ -109,7 +121,8 @@ class GameAnalyzer:
             recent_reviews,
             game_data,
             pricing_analysis,
-            tag_analysis
+            tag_analysis,
+            trend
         )
 
         return {
@@ -124,6 +137,7 @@ class GameAnalyzer:
             'velocity_score': velocity_score,
             'velocity_status': velocity_status,
             'recent_reviews': recent_reviews,
+            'review_trend': trend,
             'pricing_analysis': pricing_analysis,
             'tag_analysis': tag_analysis,
             'context_for_ai': ai_context,
@@ -132,6 +146,25 @@ class GameAnalyzer:
             'needs_improvement': success_score < 40
         }
 
+    def _get_review_trend(self, app_id: Any) -> Optional[Dict[str, Any]]:
+        """30-day review trend from the local review store (None if not stored)"""
+        if not app_id:
+            return None
+        try:
+            return review_trend(app_id, window_days=30, store=self.review_store)
+        except Exception:
+            return None
+
+    def _velocity_status(self, velocity_score: float) -> str:
+        """Interpret recent/total review ratio (same bands as SteamDBScraper)"""
+        if velocity_score > 0.05:
+            return "High momentum - actively growing"
+        elif velocity_score > 0.02:
+            return "Moderate momentum"
+        elif velocity_score > 0.01:
+            return "Steady state"
+        return "Declining or established game"
+
     def _analyze_engagement(self, review_count: int) -> Dict[str, str]:
         """Analyze engagement level based on review count"""
         if review_count >= self.REVIEW_THRESHOLDS['legendary']:
@@ -529,7 +562,8 @@ class GameAnalyzer:
         recent_reviews: int = 0,
         game_data: Dict = None,
         pricing_analysis: Dict = None,
-        tag_analysis: Dict = None
+        tag_analysis: Dict = None,
+        review_trend: Dict = None
     ) -> str:
         """Generate context string for AI prompts"""
         context_parts = []
@@ -552,6 +586,26 @@ class GameAnalyzer:
                 f"{'Review rate is declining - may need marketing push or content update.' if velocity_score <= 0.01 else ''}"
             )
 
+        # Review trend context from the daily rollup
+        if review_trend and review_trend.get('complete'):
+            trend_line = (
+                f"📈 Review Trend: {review_trend['trend']} "
+                f"({review_trend['reviews_per_day']:.1f} stored reviews/day over {review_trend['window_days']} days"
+            )
+            if review_trend.get('velocity_change') is not None:
+                trend_line += f", {review_trend['velocity_change']*100:+.0f}% vs previous window"
+            trend_line += ")."
+            if review_trend.get('positive_delta') is not None:
+                trend_line += (
+                    f" Recent sentiment {review_trend['recent_positive_pct']:.0f}% positive "
+                    f"({review_trend['positive_delta']:+.1f} pts vs all-time)."
+                )
+            breaks = review_trend.get('trend_breaks') or []
+            if breaks:
+                latest = breaks[-1]
+                trend_line += f" Latest trend break: review {latest['direction']} in week of {latest['week_start']}."
+            context_parts.append(trend_line)
+
         # Steam Deck readiness context (NEW)
         if game_data and 'steam_deck_compatibility' in game_data:
             deck_data = game_data['steam_deck_compatibility']
@@ -1,5 +1,6 @@
 import requests
 from typing import Dict, List, Any, Optional
+import threading
 import time
 from datetime import datetime
 import re
@@ -15,11 +16,29 @@ from src.exceptions import (
 from src.retry_utils import retry_with_backoff, steam_api_limiter
 from src.cache_manager import get_cache
 from src.async_fetcher import ParallelFetcher, time_function
+from src.tag_vocabulary import get_tag_vocabulary, count_bits
+from src.competitor_catalog import CandidateCatalog, CompetitorStore, diff_competitor_sets
 
 logger = get_logger(__name__)
 cache = get_cache()
 parallel_fetcher = ParallelFetcher(max_workers=5)  # Conservative for API rate limits
 
+# Competitor snapshots older than this are re-fetched on refresh
+COMPETITOR_REFRESH_TTL_HOURS = 24
+
+# appdetails filters for the fields used by similarity scoring and the report
+# (see _format_appdetails; 'basic' carries name and short_description).
+# Requesting only these keeps competitor payloads a small fraction of the full
+# response. Steam ignores multiple appids unless the filter is price_overview
+# alone, so each app is fetched with its own request.
+# Player-mode tags the similarity score checks on every competitor
+PLAYER_MODE_TAGS = ('Singleplayer', 'Multiplayer', 'Co-op', 'Local Co-Op', 'Online Co-Op')
+
+APPDETAILS_FILTERS = (
+    'basic,developers,publishers,price_overview,'
+    'genres,categories,release_date,platforms,metacritic,recommendations'
+)
+
 class GameSearch:
     """Game search and competitor finding using Steam API and SteamSpy"""
 
@@ -30,6 +49,10 @@ class GameSearch:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         self.alternative_source = AlternativeDataSource()
+        self.candidate_catalog = CandidateCatalog()
+        self.competitor_store = CompetitorStore()
+        self.appdetails_stats = {'calls': 0, 'payload_bytes': 0}
+        self._stats_lock = threading.Lock()
 
     def parse_steam_url(self, url: str) -> Optional[int]:
         """
@@ -298,65 +321,7 @@ class GameSearch:
             # Get SteamSpy data for additional info
             spy_data = self.get_steamspy_data(app_id)
 
-            # Calculate review score percentage
-            positive_reviews = spy_data.get('positive', 0)
-            total_reviews = spy_data.get('reviews', 0)
-            review_score_percent = (positive_reviews / total_reviews * 100) if total_reviews > 0 else 0
-
-            # Extract price information
-            price_overview = game_data.get('price_overview', {})
-            price_formatted = price_overview.get('final_formatted', 'Free')
-
-            # FIX: Safely convert price from cents to dollars
-            price_value = price_overview.get('final', 0)
-            if isinstance(price_value, str):
-                try:
-                    price_value = float(price_value)
-                except ValueError:
-                    price_value = 0
-            price_raw = price_value / 100 if price_value else 0  # Convert cents to dollars
-
-            # Analyze Steam Deck readiness
-            categories = [c['description'] for c in game_data.get('categories', [])]
-            platforms = game_data.get('platforms', {})
-            steam_deck_data = self._analyze_steam_deck_readiness(categories, platforms)
-
-            # Build capsule image URLs
-            capsule_images = {
-                'header': f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/header.jpg",
-                'capsule_main': f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/capsule_616x353.jpg",
-                'capsule_small': f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/capsule_231x87.jpg"
-            }
-
-            # Extract relevant information
-            # FIX: Safely extract first element from developer/publisher lists
-            developers = game_data.get('developers', ['Unknown'])
-            developer = developers[0] if (isinstance(developers, list) and developers) else 'Unknown'
-
-            publishers = game_data.get('publishers', ['Unknown'])
-            publisher = publishers[0] if (isinstance(publishers, list) and publishers) else 'Unknown'
-
-            game_details = {
-                'name': game_data.get('name', 'Unknown'),
-                'app_id': app_id,
-                'developer': developer,
-                'publisher': publisher,
-                'release_date': game_data.get('release_date', {}).get('date', 'Unknown'),
-                'genres': [g['description'] for g in game_data.get('genres', [])],
-                'tags': spy_data.get('tags', []),
-                'price': price_formatted,
-                'price_raw': price_raw,  # NEW: Raw price in dollars for comparison
-                'description': game_data.get('short_description', ''),
-                'categories': categories,
-                'platforms': platforms,
-                'metacritic': game_data.get('metacritic', {}),
-                'recommendations': game_data.get('recommendations', {}).get('total', 0),
-                'review_score': f"{review_score_percent:.1f}%" if review_score_percent > 0 else "N/A",  # FIX: Consistent string format
-                'review_score_raw': review_score_percent,  # FIX: Add numeric version for comparisons
-                'review_count': total_reviews,
-                'steam_deck_compatibility': steam_deck_data,  # NEW: Steam Deck readiness analysis
-                'capsule_images': capsule_images  # NEW: Capsule image URLs for vision analysis
-            }
+            game_details = self._format_appdetails(app_id, game_data, spy_data)
 
             # Cache the result (24-hour TTL)
             cache.set('steam_game', app_id, game_details)
@@ -376,6 +341,174 @@ class GameSearch:
                 'price': 'Unknown'
             }
 
+    def get_game_details_bulk(self, app_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Get game details for many competitor candidates (WITH CACHING)
+
+        Unlike get_game_details this skips store-page scraping and asks
+        appdetails only for APPDETAILS_FILTERS fields. Uncached IDs are
+        fetched in parallel, one request each.
+
+        Args:
+            app_ids: Steam app IDs (order is preserved)
+
+        Returns:
+            List of game details dicts for the IDs that could be fetched
+        """
+        if not app_ids:
+            return []
+
+        start_time = time.time()
+        calls_before = self.appdetails_stats['calls']
+        bytes_before = self.appdetails_stats['payload_bytes']
+
+        details = {}
+        missing = []
+        for app_id in app_ids:
+            cached_data = cache.get('steam_game', app_id, ttl_hours=24)
+            if cached_data:
+                details[app_id] = cached_data
+            else:
+                missing.append(int(app_id))
+
+        # 1. Filtered appdetails requests
+        payloads = {}
+        for result in parallel_fetcher.fetch_many(
+            missing,
+            self._fetch_appdetails,
+            desc="Fetching appdetails",
+            rate_limit_delay=0.2
+        ):
+            payloads.update(result)
+
+        # 2. SteamSpy data (tags, reviews) for newly fetched games, then format + cache
+        fetched_ids = [app_id for app_id in missing if payloads.get(app_id)]
+        spy_by_id = dict(parallel_fetcher.fetch_many(
+            fetched_ids,
+            lambda app_id: (app_id, self.get_steamspy_data(app_id)),
+            desc="Fetching SteamSpy data",
+            rate_limit_delay=0.2
+        ))
+        for app_id in fetched_ids:
+            game_details = self._format_appdetails(app_id, payloads[app_id], spy_by_id.get(app_id, {}))
+            cache.set('steam_game', app_id, game_details)
+            details[app_id] = game_details
+
+        logger.info(
+            f"Bulk details: {len(app_ids)} requested, {len(app_ids) - len(missing)} cached, "
+            f"{len(fetched_ids)} fetched in {self.appdetails_stats['calls'] - calls_before} appdetails calls "
+            f"({(self.appdetails_stats['payload_bytes'] - bytes_before) / 1024:.1f} KB) "
+            f"in {time.time() - start_time:.1f}s"
+        )
+
+        return [details[app_id] for app_id in app_ids if app_id in details]
+
+    @steam_api_limiter.limit
+    def _fetch_appdetails(self, app_id: int) -> Dict[int, Dict[str, Any]]:
+        """
+        Fetch the filtered appdetails payload for one app ID
+
+        Args:
+            app_id: Steam app ID
+
+        Returns:
+            Dict of app_id -> appdetails 'data' object (empty if Steam has no data)
+        """
+        response = requests.get(
+            f"{self.steam_api_base}/appdetails",
+            params={'appids': app_id, 'filters': APPDETAILS_FILTERS},
+            headers=self.headers,
+            timeout=10
+        )
+        with self._stats_lock:
+            self.appdetails_stats['calls'] += 1
+            self.appdetails_stats['payload_bytes'] += len(response.content)
+        response.raise_for_status()
+
+        entry = (response.json() or {}).get(str(app_id)) or {}
+        if entry.get('success') and entry.get('data'):
+            return {app_id: entry['data']}
+        return {}
+
+    def _format_appdetails(
+        self,
+        app_id: int,
+        game_data: Dict[str, Any],
+        spy_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Format a Steam appdetails payload (plus SteamSpy data) into our game details structure
+
+        Args:
+            app_id: Steam app ID
+            game_data: The 'data' object from an appdetails response
+            spy_data: Result of get_steamspy_data
+
+        Returns:
+            Dictionary with game details
+        """
+        # Calculate review score percentage
+        positive_reviews = spy_data.get('positive', 0)
+        total_reviews = spy_data.get('reviews', 0)
+        review_score_percent = (positive_reviews / total_reviews * 100) if total_reviews > 0 else 0
+
+        # Extract price information
+        price_overview = game_data.get('price_overview', {})
+        price_formatted = price_overview.get('final_formatted', 'Free')
+
+        # FIX: Safely convert price from cents to dollars
+        price_value = price_overview.get('final', 0)
+        if isinstance(price_value, str):
+            try:
+                price_value = float(price_value)
+            except ValueError:
+                price_value = 0
+        price_raw = price_value / 100 if price_value else 0  # Convert cents to dollars
+
+        # Analyze Steam Deck readiness
+        categories = [c['description'] for c in game_data.get('categories', [])]
+        platforms = game_data.get('platforms', {})
+        steam_deck_data = self._analyze_steam_deck_readiness(categories, platforms)
+
+        # Build capsule image URLs
+        capsule_images = {
+            'header': f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/header.jpg",
+            'capsule_main': f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/capsule_616x353.jpg",
+            'capsule_small': f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/capsule_231x87.jpg"
+        }
+
+        # Extract relevant information
+        # FIX: Safely extract first element from developer/publisher lists
+        developers = game_data.get('developers', ['Unknown'])
+        developer = developers[0] if (isinstance(developers, list) and developers) else 'Unknown'
+
+        publishers = game_data.get('publishers', ['Unknown'])
+        publisher = publishers[0] if (isinstance(publishers, list) and publishers) else 'Unknown'
+
+        game_details = {
+            'name': game_data.get('name', 'Unknown'),
+            'app_id': app_id,
+            'developer': developer,
+            'publisher': publisher,
+            'release_date': game_data.get('release_date', {}).get('date', 'Unknown'),
+            'genres': [g['description'] for g in game_data.get('genres', [])],
+            'tags': spy_data.get('tags', []),
+            'price': price_formatted,
+            'price_raw': price_raw,  # NEW: Raw price in dollars for comparison
+            'description': game_data.get('short_description', ''),
+            'categories': categories,
+            'platforms': platforms,
+            'metacritic': game_data.get('metacritic', {}),
+            'recommendations': game_data.get('recommendations', {}).get('total', 0),
+            'review_score': f"{review_score_percent:.1f}%" if review_score_percent > 0 else "N/A",  # FIX: Consistent string format
+            'review_score_raw': review_score_percent,  # FIX: Add numeric version for comparisons
+            'review_count': total_reviews,
+            'steam_deck_compatibility': steam_deck_data,  # NEW: Steam Deck readiness analysis
+            'capsule_images': capsule_images  # NEW: Capsule image URLs for vision analysis
+        }
+
+        return game_details
+
     def _format_alternative_game_data(self, alt_data: Dict[str, Any], app_id: int) -> Dict[str, Any]:
         """Format alternative source data to match our game details structure"""
         # Build capsule image URLs
@@ -492,74 +625,30 @@ class GameSearch:
             potential_competitors = []
 
             # Strategy 1: Find by primary tag (cast wide net)
-            # FIX: Handle normalized tag format (list of strings or list of dicts)
-            tags = game_data.get('tags', [])
-            if tags:
-                primary_tag = tags[0]
-                if isinstance(primary_tag, dict):
-                    # Normalized format: {'description': 'Tag'}
-                    primary_tag = primary_tag.get('description', '')
-                if primary_tag:
-                    potential_competitors.extend(self._find_by_tag(primary_tag, max_competitors * 3))
+            primary_tag = self._primary_label(game_data.get('tags', []))
+            if primary_tag:
+                potential_competitors.extend(self._find_by_tag(primary_tag, max_competitors * 3))
 
             # Strategy 2: Find by genre
-            # FIX: Handle normalized genre format (list of dicts with 'description' key)
-            genres = game_data.get('genres', [])
-            if genres:
-                primary_genre = genres[0]
-                if isinstance(primary_genre, dict):
-                    # Normalized format: {'description': 'Action'}
-                    primary_genre = primary_genre.get('description', '')
-                if primary_genre:
-                    potential_competitors.extend(self._find_by_genre(primary_genre, max_competitors * 3))
+            primary_genre = self._primary_label(game_data.get('genres', []))
+            if primary_genre:
+                potential_competitors.extend(self._find_by_genre(primary_genre, max_competitors * 3))
 
             # Strategy 3: Broader search if needed
             if len(potential_competitors) < max_competitors * 2:
                 potential_competitors.extend(self._find_by_broad_category(game_data, max_competitors * 2))
 
-            # Remove duplicates
-            seen = set()
-            unique_competitors = []
-            original_app_id = game_data.get('app_id')
-
-            for comp in potential_competitors:
-                comp_id = comp.get('app_id')
-                if comp_id not in seen and comp_id != original_app_id:
-                    seen.add(comp_id)
-                    unique_competitors.append(comp)
-
-            # Score each competitor for relevance
-            scored_competitors = []
-            for comp in unique_competitors:
-                score = self._calculate_similarity_score(game_data, comp)
-                # IMPROVED: Higher threshold (50) + require at least 1 genre match
-                # FIX: Handle normalized genre format
-                game_genres_raw = game_data.get('genres', [])
-                game_genres = set()
-                for g in game_genres_raw:
-                    if isinstance(g, dict):
-                        game_genres.add(g.get('description', ''))
-                    else:
-                        game_genres.add(str(g))
-
-                comp_genres_raw = comp.get('genres', [])
-                comp_genres = set()
-                for g in comp_genres_raw:
-                    if isinstance(g, dict):
-                        comp_genres.add(g.get('description', ''))
-                    else:
-                        comp_genres.add(str(g))
-
-                has_genre_match = len(game_genres & comp_genres) > 0
-
-                if score >= 50 and has_genre_match:  # Stricter filtering
-                    scored_competitors.append((score, comp))
-
-            # Sort by score (highest first)
-            scored_competitors.sort(reverse=True, key=lambda x: x[0])
-
-            # Extract top competitors
-            result = [comp for score, comp in scored_competitors[:max_competitors]]
+            scored_competitors = self._rank_competitors(game_data, potential_competitors, max_competitors)
+            result = [comp for score, comp in scored_competitors]
+
+            # Persist the set so repeat audits can refresh incrementally
+            if result and game_data.get('app_id'):
+                self.competitor_store.save(
+                    game_data['app_id'],
+                    result,
+                    {comp.get('app_id'): score for score, comp in scored_competitors},
+                    {}
+                )
 
             # FAILSAFE: If we still have zero or too few competitors, generate fallback
             if len(result) < min_competitors:
@@ -573,6 +662,193 @@ class GameSearch:
             # FAILSAFE: Return fallback competitors even on error
             return self._generate_fallback_competitors(game_data, min_competitors)
 
+    def refresh_competitors(
+        self,
+        game_data: Dict[str, Any],
+        min_competitors: int = 3,
+        max_competitors: int = 10,
+        ttl_hours: int = COMPETITOR_REFRESH_TTL_HOURS
+    ) -> Dict[str, Any]:
+        """
+        Refresh a previously stored competitor set (repeat audits)
+
+        Instead of rerunning find_competitors from scratch:
+        - Competitors whose stored data is older than ttl_hours are re-fetched
+        - Fresh competitors are reused from the stored snapshot
+        - New candidates are only looked for among catalog entries added
+          since the last run (from the game's primary tag/genre listings)
+
+        Falls back to a full find_competitors when no snapshot exists.
+
+        Args:
+            game_data: The main game's data
+            min_competitors: Minimum number of competitors to return
+            max_competitors: Maximum number of competitors to return
+            ttl_hours: Age after which a stored competitor is re-fetched
+
+        Returns:
+            Dictionary with 'competitors' (list of game data, sorted by
+            relevance), 'diff' (added/removed/changed/unchanged) and 'stats'
+        """
+        app_id = game_data.get('app_id')
+        previous = self.competitor_store.load(app_id) if app_id else None
+
+        if previous is None:
+            logger.info(f"No stored competitors for App ID {app_id}, running full search")
+            competitors = self.find_competitors(game_data, min_competitors, max_competitors)
+            current = self.competitor_store.load(app_id) if app_id else None
+            return {
+                'competitors': competitors,
+                'diff': diff_competitor_sets(None, current or {}),
+                'stats': {'full_search': True, 'refetched': 0, 'reused': 0, 'new_candidates': 0}
+            }
+
+        now = time.time()
+        ttl_seconds = ttl_hours * 3600
+        fetched_at = {}
+        candidates = []
+
+        # 1. Reuse fresh competitors, collect stale ones for re-fetch
+        stale_ids = []
+        for entry in previous.get('competitors', []):
+            if now - entry.get('fetched_at', 0) > ttl_seconds:
+                stale_ids.append(entry['app_id'])
+            else:
+                candidates.append(entry['data'])
+                fetched_at[entry['app_id']] = entry['fetched_at']
+
+        for stale_id in stale_ids:
+            cache.invalidate('steam_game', stale_id)
+        refetched = self.get_game_details_bulk(stale_ids)
+        for comp in refetched:
+            fetched_at[comp.get('app_id')] = now
+        candidates.extend(refetched)
+
+        # Keep stored data for stale competitors that failed to re-fetch
+        refetched_ids = {str(comp.get('app_id')) for comp in refetched}
+        for entry in previous.get('competitors', []):
+            if entry['app_id'] in stale_ids and str(entry['app_id']) not in refetched_ids:
+                candidates.append(entry['data'])
+                fetched_at[entry['app_id']] = entry.get('fetched_at', 0)
+
+        # 2. Only score catalog entries added since the last run
+        sources = []
+        primary_tag = self._primary_label(game_data.get('tags', []))
+        if primary_tag:
+            self._list_candidates('tag', primary_tag, max_competitors * 3)
+            sources.append(f"tag:{primary_tag}")
+        primary_genre = self._primary_label(game_data.get('genres', []))
+        if primary_genre:
+            self._list_candidates('genre', primary_genre, max_competitors * 3)
+            sources.append(f"genre:{primary_genre}")
+
+        known_ids = {str(comp.get('app_id')) for comp in candidates} | {str(app_id)}
+        new_ids = [
+            new_id for new_id in self.candidate_catalog.added_since(previous['updated_at'], sources)
+            if str(new_id) not in known_ids
+        ]
+        new_competitors = self.get_game_details_bulk(new_ids)
+        for comp in new_competitors:
+            fetched_at[comp.get('app_id')] = now
+        candidates.extend(new_competitors)
+
+        # 3. Re-rank everything against the (possibly updated) target game
+        scored_competitors = self._rank_competitors(game_data, candidates, max_competitors)
+        result = [comp for score, comp in scored_competitors]
+        current = self.competitor_store.save(
+            app_id,
+            result,
+            {comp.get('app_id'): score for score, comp in scored_competitors},
+            fetched_at
+        )
+        diff = diff_competitor_sets(previous, current)
+
+        logger.info(
+            f"Competitor refresh for App ID {app_id}: {len(refetched)} re-fetched, "
+            f"{len(candidates) - len(refetched) - len(new_competitors)} reused, "
+            f"{len(new_competitors)} new candidates; "
+            f"+{len(diff['added'])} -{len(diff['removed'])} ~{len(diff['changed'])}"
+        )
+
+        if len(result) < min_competitors:
+            fallback = self._generate_fallback_competitors(game_data, min_competitors)
+            result.extend(fallback[:min_competitors - len(result)])
+
+        return {
+            'competitors': result[:max_competitors],
+            'diff': diff,
+            'stats': {
+                'full_search': False,
+                'refetched': len(refetched),
+                'reused': len(candidates) - len(refetched) - len(new_competitors),
+                'new_candidates': len(new_competitors)
+            }
+        }
+
+    def _primary_label(self, values: List[Any]) -> str:
+        """
+        Get the first tag/genre name from a list
+
+        Handles normalized format (list of strings or list of dicts with 'description' key)
+        """
+        if not values:
+            return ''
+        primary = values[0]
+        if isinstance(primary, dict):
+            primary = primary.get('description', '')
+        return primary or ''
+
+    def _rank_competitors(
+        self,
+        game_data: Dict[str, Any],
+        potential_competitors: List[Dict[str, Any]],
+        max_competitors: int
+    ) -> List[tuple]:
+        """
+        Deduplicate, score and filter potential competitors
+
+        Args:
+            game_data: The main game's data
+            potential_competitors: Candidate game details (may contain duplicates)
+            max_competitors: Maximum number to keep
+
+        Returns:
+            List of (score, competitor) tuples, highest score first
+        """
+        # Remove duplicates
+        seen = set()
+        unique_competitors = []
+        original_app_id = game_data.get('app_id')
+
+        for comp in potential_competitors:
+            comp_id = comp.get('app_id')
+            if comp_id not in seen and comp_id != original_app_id:
+                seen.add(comp_id)
+                unique_competitors.append(comp)
+
+        # Score each competitor for relevance. Only the game's own names are
+        # added to the vocabulary: a competitor tag it doesn't know can't match
+        scored_competitors = []
+        vocabulary = get_tag_vocabulary()
+        vocabulary.intern_many([
+            *game_data.get('genres', []), *game_data.get('tags', []), *game_data.get('categories', []),
+            *PLAYER_MODE_TAGS
+        ])
+        game_genres = vocabulary.mask(game_data.get('genres', []))
+        for comp in unique_competitors:
+            score = self._calculate_similarity_score(game_data, comp)
+            # IMPROVED: Higher threshold (50) + require at least 1 genre match
+            # Genres compared by shared vocabulary ID (handles dict/str formats and aliases)
+            has_genre_match = (game_genres & vocabulary.mask(comp.get('genres', []))) != 0
+
+            if score >= 50 and has_genre_match:  # Stricter filtering
+                scored_competitors.append((score, comp))
+
+        # Sort by score (highest first)
+        scored_competitors.sort(reverse=True, key=lambda x: x[0])
+
+        return scored_competitors[:max_competitors]
+
     def _calculate_similarity_score(self, game_data: Dict[str, Any], competitor: Dict[str, Any]) -> int:
         """
         Calculate similarity score between game and potential competitor
@@ -588,38 +864,24 @@ class GameSearch:
         """
         score = 0
 
-        # Extract data - FIX: Handle normalized format for genres/tags
-        # Genres: normalize [{'description': 'Action'}] or ['Action'] → {'Action'}
-        game_genres_raw = game_data.get('genres', [])
-        game_genres = set()
-        for g in game_genres_raw:
-            if isinstance(g, dict):
-                game_genres.add(g.get('description', ''))
-            else:
-                game_genres.add(str(g))
-
-        comp_genres_raw = competitor.get('genres', [])
-        comp_genres = set()
-        for g in comp_genres_raw:
-            if isinstance(g, dict):
-                comp_genres.add(g.get('description', ''))
-            else:
-                comp_genres.add(str(g))
-
-        # Tags: normalize to set of strings
-        game_tags = set(str(t) for t in game_data.get('tags', []))
-        comp_tags = set(str(t) for t in competitor.get('tags', []))
+        # Extract data as vocabulary bitmasks - handles [{'description': 'Action'}] or
+        # ['Action'] formats and spelling aliases ('Rogue-like' == 'Roguelike')
+        vocabulary = get_tag_vocabulary()
+        game_genres = vocabulary.mask(game_data.get('genres', []))
+        comp_genres = vocabulary.mask(competitor.get('genres', []))
+        game_tags = vocabulary.mask(game_data.get('tags', []))
+        comp_tags = vocabulary.mask(competitor.get('tags', []))
         game_price = game_data.get('price_raw', 0) if 'price_raw' in game_data else 0
         comp_price = competitor.get('price_raw', 0) if 'price_raw' in competitor else 0
-        game_categories = set(game_data.get('categories', []))
-        comp_categories = set(competitor.get('categories', []))
+        game_categories = vocabulary.mask(game_data.get('categories', []))
+        comp_categories = vocabulary.mask(competitor.get('categories', []))
 
         # 1. Genre matching (most important - 40 points per match)
-        genre_matches = len(game_genres & comp_genres)
+        genre_matches = count_bits(game_genres & comp_genres)
         score += genre_matches * 40
 
         # 2. Tag matching (5 points per match, cap at 50 points)
-        tag_matches = len(game_tags & comp_tags)
+        tag_matches = count_bits(game_tags & comp_tags)
         score += min(tag_matches * 5, 50)
 
         # 3. Price similarity (20 points if within 30% range)
@@ -660,17 +922,20 @@ class GameSearch:
             score -= 50
 
         # 7. PENALTY: Multiplayer vs Single-player mismatch (-30 points)
-        game_is_singleplayer = 'Single-player' in game_categories or 'Singleplayer' in game_tags
-        comp_is_multiplayer = 'Multiplayer' in comp_categories or 'Multiplayer' in comp_tags or 'Co-op' in comp_tags
+        singleplayer = vocabulary.mask(['Singleplayer'])
+        multiplayer = vocabulary.mask(['Multiplayer'])
+        coop = vocabulary.mask(['Co-op'])
+        game_is_singleplayer = bool((game_categories | game_tags) & singleplayer)
+        comp_is_multiplayer = bool((comp_categories | comp_tags) & (multiplayer | coop))
 
         # If game is clearly single-player focused and competitor is multiplayer-focused
-        if game_is_singleplayer and comp_is_multiplayer and not ('Multiplayer' in game_categories):
+        if game_is_singleplayer and comp_is_multiplayer and not (game_categories & multiplayer):
             score -= 30
 
         # 8. BONUS: Similar player count tags
-        coop_tags = {'Co-op', 'Local Co-Op', 'Online Co-Op', 'Multiplayer'}
-        game_has_coop = len(game_tags & coop_tags) > 0
-        comp_has_coop = len(comp_tags & coop_tags) > 0
+        coop_tags = vocabulary.mask(['Co-op', 'Local Co-Op', 'Online Co-Op', 'Multiplayer'])
+        game_has_coop = (game_tags & coop_tags) != 0
+        comp_has_coop = (comp_tags & coop_tags) != 0
         if game_has_coop == comp_has_coop:
             score += 10
 
@@ -706,16 +971,9 @@ class GameSearch:
             all_games = response.json()
 
             # Filter games by similar characteristics
-            # FIX: Handle normalized format for tags and genres
-            game_tags = set(str(t) for t in game_data.get('tags', []))
-
-            game_genres_raw = game_data.get('genres', [])
-            game_genres = set()
-            for g in game_genres_raw:
-                if isinstance(g, dict):
-                    game_genres.add(g.get('description', ''))
-                else:
-                    game_genres.add(str(g))
+            vocabulary = get_tag_vocabulary()
+            vocabulary.intern_many(game_data.get('tags', []))
+            game_tags = vocabulary.mask(game_data.get('tags', []))
 
             for app_id, spy_data in list(all_games.items())[:200]:  # Check top 200 games
                 if len(competitors) >= min_competitors * 2:
@@ -725,14 +983,14 @@ class GameSearch:
                 # FIX: Handle tags as both dict and list
                 tags_raw = spy_data.get('tags', [])
                 if isinstance(tags_raw, dict):
-                    game_spy_tags = set(tags_raw.keys())
+                    game_spy_tags = vocabulary.mask(tags_raw.keys())
                 elif isinstance(tags_raw, list):
-                    game_spy_tags = set(tags_raw)
+                    game_spy_tags = vocabulary.mask(tags_raw)
                 else:
-                    game_spy_tags = set()
+                    game_spy_tags = 0
 
                 # Calculate similarity - require meaningful overlap
-                tag_overlap = len(game_tags & game_spy_tags)
+                tag_overlap = count_bits(game_tags & game_spy_tags)
 
                 # IMPROVED: Require at least 3 tag matches to filter out generic matches
                 if tag_overlap >= 3:  # Meaningful tag overlap only
@@ -750,28 +1008,47 @@ class GameSearch:
             logger.error(f"Error in broad competitor search: {e}", exc_info=True)
             return self._generate_fallback_competitors(game_data, min_competitors)
 
-    def _find_by_tag(self, tag: str, limit: int) -> List[Dict[str, Any]]:
-        """Find games by tag using SteamSpy (PARALLEL FETCHING)"""
+    def _list_candidates(self, request: str, value: str, limit: int) -> List[int]:
+        """
+        List candidate app_ids from a SteamSpy tag/genre listing
+
+        Every listed app_id is recorded in the candidate catalog so later
+        refreshes can tell which candidates are new.
+
+        Args:
+            request: SteamSpy request type ('tag' or 'genre')
+            value: Tag or genre name
+            limit: Maximum app_ids to return
+
+        Returns:
+            List of app_ids (empty on error)
+        """
         try:
             response = requests.get(
                 self.steamspy_api_base,
-                params={'request': 'tag', 'tag': tag},
+                params={'request': request, request: value},
                 headers=self.headers,
                 timeout=10
             )
             response.raise_for_status()
-            tagged_games = response.json()
+            listed_games = response.json()
+
+            app_ids = [int(app_id) for app_id in list(listed_games.keys())[:limit]]
+            self.candidate_catalog.record(f"{request}:{value}", app_ids)
+            return app_ids
 
+        except Exception as e:
+            logger.warning(f"Error listing SteamSpy {request} '{value}': {e}")
+            return []
+
+    def _find_by_tag(self, tag: str, limit: int) -> List[Dict[str, Any]]:
+        """Find games by tag using SteamSpy (BULK FETCHING)"""
+        try:
             # Get app_ids to fetch
-            app_ids = [int(app_id) for app_id in list(tagged_games.keys())[:limit]]
-
-            # Fetch in parallel (much faster than sequential)
-            competitors = parallel_fetcher.fetch_many(
-                app_ids,
-                self.get_game_details,
-                desc=f"Fetching games by tag '{tag}'",
-                rate_limit_delay=0.2
-            )
+            app_ids = self._list_candidates('tag', tag, limit)
+
+            # Bulk fetch (batched, filtered appdetails)
+            competitors = self.get_game_details_bulk(app_ids)
 
             return competitors
 
@@ -780,27 +1057,13 @@ class GameSearch:
             return []
 
     def _find_by_genre(self, genre: str, limit: int) -> List[Dict[str, Any]]:
-        """Find games by genre using SteamSpy (PARALLEL FETCHING)"""
+        """Find games by genre using SteamSpy (BULK FETCHING)"""
         try:
-            response = requests.get(
-                self.steamspy_api_base,
-                params={'request': 'genre', 'genre': genre},
-                headers=self.headers,
-                timeout=10
-            )
-            response.raise_for_status()
-            genre_games = response.json()
-
             # Get app_ids to fetch
-            app_ids = [int(app_id) for app_id in list(genre_games.keys())[:limit]]
-
-            # Fetch in parallel (much faster than sequential)
-            competitors = parallel_fetcher.fetch_many(
-                app_ids,
-                self.get_game_details,
-                desc=f"Fetching games by genre '{genre}'",
-                rate_limit_delay=0.2
-            )
+            app_ids = self._list_candidates('genre', genre, limit)
+
+            # Bulk fetch (batched, filtered appdetails)
+            competitors = self.get_game_details_bulk(app_ids)
 
             return competitors
 
@@ -809,7 +1072,7 @@ class GameSearch:
             return []
 
     def _find_by_broad_category(self, game_data: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
-        """Find games using broad category search (PARALLEL FETCHING)"""
+        """Find games using broad category search (BULK FETCHING)"""
         try:
             # Get popular games and filter by similarity
             response = requests.get(
@@ -824,13 +1087,8 @@ class GameSearch:
             # Get app_ids to fetch (take first 50, will filter down later)
             app_ids = [int(app_id) for app_id in list(all_games.keys())[:min(50, limit * 3)]]
 
-            # Fetch in parallel
-            competitors = parallel_fetcher.fetch_many(
-                app_ids,
-                self.get_game_details,
-                desc="Fetching games from broad category",
-                rate_limit_delay=0.2
-            )
+            # Bulk fetch (batched, filtered appdetails)
+            competitors = self.get_game_details_bulk(app_ids)
 
             return competitors[:limit]
 
@@ -14,6 +14,8 @@ from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass
 import logging
 
+from src.tag_vocabulary import get_tag_vocabulary
+
 logger = logging.getLogger(__name__)
 
 
@@ -184,7 +186,7 @@ def detect_generic_subreddits(subreddits: List[str]) -> DetectionResult:
         level = "good"
 
     # Identify specific (non-generic) examples
-    specific_examples = list(found_set - generic_set)[:3]
+    specific_examples = [sub for sub in dict.fromkeys(normalized) if sub not in generic_set][:3]
 
     reasoning = f"{overlap_ratio*100:.0f}% of subreddits ({len(overlap)}/{len(found_set)}) are generic gaming communities"
 
@@ -375,10 +377,16 @@ def detect_generic_tags(tags: List[str]) -> DetectionResult:
             improvements="Add more specific tags that describe your game's unique mechanics or theme"
         )
 
-    # Normalize tags
+    # Normalize tags to shared vocabulary IDs (case/alias-insensitive),
+    # keeping the first spelling seen for each ID for display
+    vocabulary = get_tag_vocabulary()
     normalized = [tag.strip() for tag in tags]
-    found_set = set(normalized)
-    generic_set = GENERIC_TAGS
+    found = {}
+    for tag, tag_id in zip(normalized, vocabulary.intern_many(normalized)):
+        if tag_id is not None:
+            found.setdefault(tag_id, tag)
+    found_set = set(found)
+    generic_set = vocabulary.ids(GENERIC_TAGS)
 
     overlap = found_set & generic_set
     overlap_ratio = len(overlap) / len(found_set) if found_set else 0
@@ -392,7 +400,7 @@ def detect_generic_tags(tags: List[str]) -> DetectionResult:
         penalty = 0
         is_generic = False
 
-    specific_examples = list(found_set - generic_set)[:3]
+    specific_examples = [found[tag_id] for tag_id in found if tag_id not in generic_set][:3]
 
     reasoning = f"{overlap_ratio*100:.0f}% of tags ({len(overlap)}/{len(found_set)}) are generic"
     improvements = "Add niche-specific tags like game mechanics, themes, or subgenres"
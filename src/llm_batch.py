@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+LLM Batch - Submit gateway calls through the provider batch API
+
+Overnight multi-report runs don't need interactive latency. In batch mode every
+LLMGateway call (drafts, audit passes, review sentiment, complaint
+categorization, ...) is queued instead of sent. A dispatcher thread collects
+the queued requests from all reports running in the process, submits them as
+one Message Batch, polls until it ends, and hands each response back to the
+report thread waiting on it, so each pipeline resumes as soon as its own
+responses arrive. Batch requests are billed at half the interactive price.
+
+Usage:
+    with batch_mode(AnthropicBatchBackend(client)):
+        run_in_parallel(...)  # Every gateway call in the process is batched
+
+    results = run_batched_jobs({'client-a': job_a, 'client-b': job_b}, backend)
+
+LocalBatchBackend executes batches with plain messages.create calls, for tests
+and dry runs.
+"""
+
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from src.exceptions import AIGenerationError
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Requests per submitted batch (API limit is 100,000)
+BATCH_MAX_REQUESTS = int(os.getenv('LLM_BATCH_MAX_REQUESTS', 1000))
+
+# How long to keep collecting requests after the first one is queued
+BATCH_COLLECT_SECONDS = float(os.getenv('LLM_BATCH_COLLECT_SECONDS', 10))
+
+# Interval between batch status checks
+BATCH_POLL_SECONDS = float(os.getenv('LLM_BATCH_POLL_SECONDS', 30))
+
+# Batch requests cost 50% of the interactive price
+BATCH_PRICE_MULTIPLIER = 0.5
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one request in a batch"""
+    custom_id: str
+    message: Any = None  # anthropic Message when the request succeeded
+    error: Optional[str] = None
+
+
+class AnthropicBatchBackend:
+    """Anthropic Message Batches API"""
+
+    def __init__(self, client: Any):
+        """
+        Initialize backend
+
+        Args:
+            client: anthropic.Anthropic client
+        """
+        self.client = client
+
+    def submit(self, requests: List[Tuple[str, Dict[str, Any]]]) -> str:
+        """
+        Submit a batch
+
+        Args:
+            requests: (custom_id, messages.create params) pairs
+
+        Returns:
+            Batch ID
+        """
+        batch = self.client.messages.batches.create(
+            requests=[{'custom_id': custom_id, 'params': params} for custom_id, params in requests]
+        )
+        return batch.id
+
+    def is_done(self, batch_id: str) -> bool:
+        """Check whether a batch has finished processing"""
+        return self.client.messages.batches.retrieve(batch_id).processing_status == 'ended'
+
+    def results(self, batch_id: str) -> Iterator[BatchResult]:
+        """
+        Read the results of a finished batch
+
+        Args:
+            batch_id: Batch ID
+
+        Yields:
+            BatchResult per request (in any order)
+        """
+        for entry in self.client.messages.batches.results(batch_id):
+            result = entry.result
+            if result.type == 'succeeded':
+                yield BatchResult(entry.custom_id, message=result.message)
+            else:
+                detail = getattr(result, 'error', None)
+                yield BatchResult(entry.custom_id, error=f"{result.type}: {detail}" if detail else result.type)
+
+
+class LocalBatchBackend:
+    """
+    Stand-in backend that runs each batch with messages.create
+
+    Used by tests and dry runs; batches finish on the first status check.
+    """
+
+    def __init__(self, client: Any):
+        """
+        Initialize backend
+
+        Args:
+            client: anthropic.Anthropic (or compatible) client
+        """
+        self.client = client
+        self.batches: Dict[str, List[BatchResult]] = {}
+        self.submitted: List[List[str]] = []  # custom_ids per submitted batch
+        self._ids = itertools.count(1)
+
+    def submit(self, requests: List[Tuple[str, Dict[str, Any]]]) -> str:
+        batch_id = f"local_batch_{next(self._ids)}"
+        self.submitted.append([custom_id for custom_id, _ in requests])
+
+        results = []
+        for custom_id, params in requests:
+            try:
+                results.append(BatchResult(custom_id, message=self.client.messages.create(**params)))
+            except Exception as e:
+                results.append(BatchResult(custom_id, error=f"errored: {e}"))
+        self.batches[batch_id] = results
+        return batch_id
+
+    def is_done(self, batch_id: str) -> bool:
+        return batch_id in self.batches
+
+    def results(self, batch_id: str) -> Iterator[BatchResult]:
+        return iter(self.batches.pop(batch_id))
+
+
+class BatchDispatcher:
+    """
+    Collects requests from many threads into batches and resolves them as they end
+
+    submit() returns a Future immediately; the calling report thread blocks on
+    it while other reports keep queueing. A single background thread flushes
+    the queue into a batch once it is full or BATCH_COLLECT_SECONDS after the
+    first request arrived, and polls in-flight batches.
+    """
+
+    def __init__(
+        self,
+        backend: Any,
+        max_batch_size: int = BATCH_MAX_REQUESTS,
+        collect_seconds: float = BATCH_COLLECT_SECONDS,
+        poll_seconds: float = BATCH_POLL_SECONDS
+    ):
+        """
+        Initialize dispatcher
+
+        Args:
+            backend: AnthropicBatchBackend or LocalBatchBackend
+            max_batch_size: Requests per submitted batch
+            collect_seconds: Collection window after the first queued request
+            poll_seconds: Interval between status checks of in-flight batches
+        """
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.collect_seconds = collect_seconds
+        self.poll_seconds = poll_seconds
+
+        self._cond = threading.Condition()
+        self._queue: List[Tuple[str, Dict[str, Any], Future]] = []
+        self._queue_started = 0.0
+        self._inflight: Dict[str, Dict[str, Future]] = {}  # batch_id -> custom_id -> future
+        self._ids = itertools.count(1)
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self.batches_submitted = 0
+        self.requests_submitted = 0
+
+    def submit(self, stage: str, request: Dict[str, Any]) -> Future:
+        """
+        Queue a messages.create request
+
+        Args:
+            stage: Pipeline stage name (prefix of the batch custom_id)
+            request: messages.create parameters
+
+        Returns:
+            Future resolving to the anthropic Message
+
+        Raises:
+            RuntimeError: If the dispatcher has been closed
+        """
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BatchDispatcher is closed")
+            if not self._queue:
+                self._queue_started = time.monotonic()
+            # custom_id must match ^[a-zA-Z0-9_-]{1,64}$
+            custom_id = f"{stage[:48]}-{next(self._ids)}"
+            self._queue.append((custom_id, request, future))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='llm-batch-dispatcher', daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def close(self, wait: bool = True):
+        """
+        Flush queued requests and stop once every in-flight batch has ended
+
+        Args:
+            wait: Block until the dispatcher thread exits
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if wait and self._thread is not None:
+            self._thread.join()
+
+    def _take_batch(self) -> List[Tuple[str, Dict[str, Any], Future]]:
+        """Pop the next batch if it is full, its window elapsed, or we are closing (lock held)"""
+        if not self._queue:
+            return []
+        window_elapsed = time.monotonic() - self._queue_started >= self.collect_seconds
+        if not (self._closed or window_elapsed or len(self._queue) >= self.max_batch_size):
+            return []
+
+        batch = self._queue[:self.max_batch_size]
+        del self._queue[:self.max_batch_size]
+        self._queue_started = time.monotonic()
+        return batch
+
+    def _run(self):
+        next_poll = 0.0
+        while True:
+            with self._cond:
+                batch = self._take_batch()
+                if not batch:
+                    if self._closed and not self._queue and not self._inflight:
+                        return
+                    now = time.monotonic()
+                    deadlines = []
+                    if self._queue:
+                        deadlines.append(self._queue_started + self.collect_seconds)
+                    if self._inflight:
+                        deadlines.append(next_poll)
+                    if not deadlines or min(deadlines) > now:
+                        self._cond.wait(timeout=min(deadlines) - now if deadlines else None)
+                        continue
+
+            if batch:
+                self._submit(batch)
+                next_poll = time.monotonic() + self.poll_seconds
+            elif time.monotonic() >= next_poll:
+                self._poll()
+                next_poll = time.monotonic() + self.poll_seconds
+
+    def _submit(self, batch: List[Tuple[str, Dict[str, Any], Future]]):
+        try:
+            batch_id = self.backend.submit([(custom_id, request) for custom_id, request, _ in batch])
+        except Exception as e:
+            logger.error(f"Batch submission failed ({len(batch)} requests): {e}")
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        self._inflight[batch_id] = {custom_id: future for custom_id, _, future in batch}
+        self.batches_submitted += 1
+        self.requests_submitted += len(batch)
+        logger.info(f"Submitted batch {batch_id} with {len(batch)} requests")
+
+    def _poll(self):
+        for batch_id in list(self._inflight):
+            try:
+                if not self.backend.is_done(batch_id):
+                    continue
+            except Exception as e:
+                logger.warning(f"Batch {batch_id} status check failed: {e}")
+                continue
+
+            futures = self._inflight.pop(batch_id)
+            try:
+                for result in self.backend.results(batch_id):
+                    future = futures.pop(result.custom_id, None)
+                    if future is None:
+                        continue
+                    if result.error:
+                        future.set_exception(AIGenerationError(
+                            f"Batch request {result.custom_id} failed: {result.error}",
+                            provider="Claude Batch"
+                        ))
+                    else:
+                        future.set_result(result.message)
+            except Exception as e:
+                logger.error(f"Reading results of batch {batch_id} failed: {e}")
+
+            for custom_id, future in futures.items():
+                future.set_exception(AIGenerationError(
+                    f"Batch {batch_id} ended without a result for {custom_id}",
+                    provider="Claude Batch"
+                ))
+            logger.info(f"Batch {batch_id} ended")
+
+
+# Dispatcher used by every LLMGateway while batch mode is active
+_active_batch_dispatcher = None
+
+
+def get_active_batch_dispatcher() -> Optional[BatchDispatcher]:
+    """
+    Get the dispatcher gateways should queue into
+
+    Returns:
+        Active BatchDispatcher, or None when calls go to the API directly
+    """
+    return _active_batch_dispatcher
+
+
+@contextmanager
+def batch_mode(backend: Any, **dispatcher_kwargs):
+    """
+    Route every gateway call in the process through the batch API
+
+    Args:
+        backend: AnthropicBatchBackend or LocalBatchBackend
+        **dispatcher_kwargs: Passed to BatchDispatcher
+
+    Yields:
+        The active BatchDispatcher
+    """
+    global _active_batch_dispatcher
+    dispatcher = BatchDispatcher(backend, **dispatcher_kwargs)
+    previous = _active_batch_dispatcher
+    _active_batch_dispatcher = dispatcher
+    try:
+        yield dispatcher
+    finally:
+        _active_batch_dispatcher = previous
+        dispatcher.close()
+
+
+def run_batched_jobs(
+    jobs: Dict[str, Callable[[], Any]],
+    backend: Any,
+    max_workers: Optional[int] = None,
+    **dispatcher_kwargs
+) -> Dict[str, Any]:
+    """
+    Run independent report pipelines concurrently in batch mode
+
+    Each job runs on its own thread and blocks only on its own responses, so
+    prompts from all reports share batches and every report resumes as soon
+    as its results arrive.
+
+    Args:
+        jobs: {name: zero-argument callable running one report}
+        backend: AnthropicBatchBackend or LocalBatchBackend
+        max_workers: Reports in flight at once (None = all of them)
+        **dispatcher_kwargs: Passed to BatchDispatcher
+
+    Returns:
+        {name: job return value, or the exception it raised}
+    """
+    results: Dict[str, Any] = {}
+    with batch_mode(backend, **dispatcher_kwargs) as dispatcher:
+        with ThreadPoolExecutor(max_workers=max_workers or max(len(jobs), 1)) as executor:
+            futures = {name: executor.submit(job) for name, job in jobs.items()}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except BaseException as e:
+                    logger.error(f"Batched job {name} failed: {e}")
+                    results[name] = e
+
+    logger.info(
+        f"Batch run: {len(jobs)} jobs, {dispatcher.requests_submitted} requests "
+        f"in {dispatcher.batches_submitted} batches"
+    )
+    return results
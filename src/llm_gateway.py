@@ -0,0 +1,889 @@
+#!/usr/bin/env python3
+"""
+LLM Gateway - Shared entry point for Claude calls with a response cache
+
+Reruns often send byte-identical prompts (e.g. regenerating a report after
+fixing only the PDF template). Every analyzer routes its messages.create calls
+through an LLMGateway, which keys each request on a hash of
+(model, system prompt, messages, temperature, max_tokens and any other
+messages.create parameters) and serves repeats from a persistent cache under
+.cache/llm/.
+
+Features:
+- Content-addressed keys (identical request = identical key, on any machine)
+- Per-stage TTLs (LLM_STAGE_TTL_HOURS)
+- Opt-out for stochastic passes (cache=False or LLM_CACHE_SKIP_STAGES)
+- Hit/miss and tokens/cost-saved accounting shared across gateways
+- Streaming (LLMGateway.stream) with the same caching and accounting
+- Provider-side prompt caching: shared context passed as prefix= segments is
+  sent first and marked with cache_control, and cached vs uncached input
+  tokens are counted per stage
+- Batch mode: while src.llm_batch.batch_mode is active, calls are queued into
+  provider batches at half price (cache hits still return immediately)
+- Per-call telemetry: every call emits an LLMCallRecord (tokens, time to first
+  token, latency, retries, cost) to the stats and the run-level JSONL log;
+  report entry points are wrapped in llm_run so each report gets its own
+  run_id
+- Stage routing: src.llm_routing picks each stage's model tier and max_tokens
+  (config/llm_routing.yaml), and truncated or invalid responses are retried
+  on a larger budget/model
+"""
+
+import copy
+import functools
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
+from src.llm_batch import BATCH_PRICE_MULTIPLIER, get_active_batch_dispatcher
+from src.llm_routing import LLMRouter, StageRoute
+from src.llm_telemetry import LLMCallLog, LLMCallRecord, get_llm_call_log, summarize_records
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_LLM_CACHE_DIR = Path(".cache") / "llm"
+
+# Default TTL for cached responses. Prompts embed all of their input data, so a
+# cached response only goes stale when the model behind the alias changes.
+DEFAULT_LLM_TTL_HOURS = int(os.getenv('LLM_CACHE_TTL_HOURS', 168))
+
+# Per-stage TTL overrides (hours)
+LLM_STAGE_TTL_HOURS = {
+    'capsule_vision': 720,
+    'asset_vision': 720,
+    'review_sentiment': 24,
+    'negative_review_categorize': 72,
+}
+
+# Stages that always go to the API (comma-separated env override)
+LLM_CACHE_SKIP_STAGES = {
+    stage.strip() for stage in os.getenv('LLM_CACHE_SKIP_STAGES', '').split(',') if stage.strip()
+}
+
+LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'true').lower() not in ('0', 'false', 'no')
+
+# USD per million tokens (input, output), matched by model-name prefix
+MODEL_PRICING = {
+    'claude-opus-4': (15.00, 75.00),
+    'claude-sonnet-4': (3.00, 15.00),
+    'claude-3-7-sonnet': (3.00, 15.00),
+    'claude-3-5-sonnet': (3.00, 15.00),
+    'claude-haiku-4': (1.00, 5.00),
+    'claude-3-5-haiku': (0.80, 4.00),
+}
+DEFAULT_PRICING = (3.00, 15.00)
+
+# Prompt-cache pricing relative to the base input price
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.10
+
+# Anthropic allows at most 4 cache_control breakpoints per request
+MAX_CACHE_BREAKPOINTS = 4
+
+# Call records kept in memory per stats object (the JSONL log keeps everything)
+MAX_CALL_RECORDS = 1000
+
+
+def estimate_cost(
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0
+) -> float:
+    """
+    Estimate the USD cost of a call
+
+    Args:
+        model: Model name
+        input_tokens: Uncached prompt tokens
+        output_tokens: Completion tokens
+        cache_read_tokens: Prompt tokens read from the provider prompt cache
+        cache_write_tokens: Prompt tokens written to the provider prompt cache
+
+    Returns:
+        Estimated cost in USD
+    """
+    input_price, output_price = next(
+        (prices for prefix, prices in MODEL_PRICING.items() if model.startswith(prefix)),
+        DEFAULT_PRICING
+    )
+    prompt_units = (
+        input_tokens
+        + cache_read_tokens * CACHE_READ_MULTIPLIER
+        + cache_write_tokens * CACHE_WRITE_MULTIPLIER
+    )
+    return (prompt_units * input_price + output_tokens * output_price) / 1_000_000
+
+
+def usage_tokens(usage: Any) -> Dict[str, int]:
+    """
+    Read token counts from an API usage object (missing fields count as 0)
+
+    Args:
+        usage: anthropic Usage, CachedUsage or None
+
+    Returns:
+        Dictionary with input/output/cache_read/cache_creation token counts
+    """
+    return {
+        name: getattr(usage, name, 0) or 0
+        for name in ('input_tokens', 'output_tokens',
+                     'cache_read_input_tokens', 'cache_creation_input_tokens')
+    }
+
+
+def with_cached_prefix(
+    prefix: List[str],
+    messages: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Prepend shared context segments to the first user message as cacheable blocks
+
+    Segments are sent in order before the per-pass instructions, each ending a
+    cache_control breakpoint, so every pass that shares the same leading
+    segments reuses the provider's cached prefix.
+
+    Args:
+        prefix: Context segments, most widely shared first
+        messages: Messages whose first entry is the user turn
+
+    Returns:
+        New messages list (input is not modified)
+
+    Raises:
+        ValueError: If there are more segments than cache breakpoints
+    """
+    if len(prefix) > MAX_CACHE_BREAKPOINTS:
+        raise ValueError(f"At most {MAX_CACHE_BREAKPOINTS} prefix segments can be cached")
+
+    first = messages[0]
+    content = first['content']
+    if isinstance(content, str):
+        content = [{'type': 'text', 'text': content}]
+
+    blocks = [
+        {'type': 'text', 'text': segment, 'cache_control': {'type': 'ephemeral'}}
+        for segment in prefix
+    ]
+    return [{**first, 'content': blocks + list(content)}] + list(messages[1:])
+
+
+def request_key(
+    model: str,
+    messages: List[Dict[str, Any]],
+    max_tokens: int,
+    temperature: Optional[float] = None,
+    system: Optional[Union[str, List[Dict[str, Any]]]] = None,
+    extra: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Content-address a request
+
+    Args:
+        model: Model name
+        messages: Messages list as sent to the API
+        max_tokens: Completion limit
+        temperature: Sampling temperature (None = API default)
+        system: System prompt (string or content blocks)
+        extra: Other messages.create parameters (stop_sequences, tools,
+            metadata, ...)
+
+    Returns:
+        SHA-256 hex digest of the canonical request
+    """
+    request = {
+        'model': model,
+        'system': system,
+        'messages': messages,
+        'temperature': temperature,
+        'max_tokens': max_tokens,
+    }
+    if extra:
+        request['extra'] = extra  # Keys of plain requests stay unchanged
+    canonical = json.dumps(
+        request,
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class CachedTextBlock:
+    """Text content block rebuilt from the cache"""
+    text: str
+    type: str = 'text'
+
+
+@dataclass
+class CachedUsage:
+    """Token usage of the original (uncached) call"""
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+
+
+@dataclass
+class CachedResponse:
+    """
+    Cached stand-in for an anthropic Message
+
+    Exposes the attributes callers read: content, stop_reason, usage, model.
+    """
+    content: List[CachedTextBlock]
+    stop_reason: Optional[str]
+    model: str
+    usage: CachedUsage = field(default_factory=CachedUsage)
+    cached: bool = True
+
+
+class LLMCacheStats:
+    """
+    Thread-safe counters, broken down by stage
+
+    Tracks response-cache hits/misses and savings, prompt-cache token counts
+    and API wall time for calls that reached the provider, and the
+    LLMCallRecord of every call. reset() starts a new run_id; run_scope()
+    does so once per report. Recording methods take the run_id the call
+    belongs to and ignore calls from an earlier run (e.g. a provider that
+    answers after the next report started).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._run_depth = 0
+        self.reset()
+
+    def reset(self):
+        """Zero all counters"""
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.tokens_saved = 0
+        self.cost_saved = 0.0
+        self.cost_spent = 0.0
+        self.input_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+        self.api_seconds = 0.0
+        self.by_stage: Dict[str, Dict[str, Any]] = {}
+        self.calls: Deque[LLMCallRecord] = deque(maxlen=MAX_CALL_RECORDS)
+        self.run_id = uuid.uuid4().hex[:12]
+
+    @contextmanager
+    def run_scope(self) -> Iterator[str]:
+        """
+        Count everything inside the block as one run
+
+        The outermost scope resets the counters and starts a new run_id;
+        scopes opened inside it (an analyzer entry point called by the
+        orchestrator, the reports of a batch job) join that run.
+
+        Yields:
+            The run's run_id
+        """
+        with self._lock:
+            if not self._run_depth:
+                self.reset()
+            self._run_depth += 1
+        try:
+            yield self.run_id
+        finally:
+            with self._lock:
+                self._run_depth -= 1
+
+    def _stage(self, stage: str) -> Dict[str, Any]:
+        return self.by_stage.setdefault(stage, {
+            'hits': 0, 'misses': 0, 'bypassed': 0,
+            'input_tokens': 0, 'cache_read_tokens': 0, 'cache_write_tokens': 0,
+            'api_seconds': 0.0,
+        })
+
+    def record_hit(self, stage: str, tokens: int, cost: float, run_id: Optional[str] = None):
+        with self._lock:
+            if run_id is not None and run_id != self.run_id:
+                return
+            self.hits += 1
+            self.tokens_saved += tokens
+            self.cost_saved += cost
+            self._stage(stage)['hits'] += 1
+
+    def record_miss(
+        self,
+        stage: str,
+        model: str,
+        usage: Any,
+        seconds: float,
+        bypassed: bool = False,
+        price_multiplier: float = 1.0,
+        run_id: Optional[str] = None
+    ):
+        tokens = usage_tokens(usage)
+        with self._lock:
+            if run_id is not None and run_id != self.run_id:
+                return
+            counts = self._stage(stage)
+            if bypassed:
+                self.bypassed += 1
+                counts['bypassed'] += 1
+            else:
+                self.misses += 1
+                counts['misses'] += 1
+            self.cost_spent += estimate_cost(
+                model, tokens['input_tokens'], tokens['output_tokens'],
+                tokens['cache_read_input_tokens'], tokens['cache_creation_input_tokens']
+            ) * price_multiplier
+            self.input_tokens += tokens['input_tokens']
+            self.cache_read_tokens += tokens['cache_read_input_tokens']
+            self.cache_write_tokens += tokens['cache_creation_input_tokens']
+            self.api_seconds += seconds
+            counts['input_tokens'] += tokens['input_tokens']
+            counts['cache_read_tokens'] += tokens['cache_read_input_tokens']
+            counts['cache_write_tokens'] += tokens['cache_creation_input_tokens']
+            counts['api_seconds'] = round(counts['api_seconds'] + seconds, 3)
+
+    def record_call(self, record: LLMCallRecord):
+        with self._lock:
+            if record.run_id == self.run_id:
+                self.calls.append(record)
+
+    def call_summary(self) -> Dict[str, Any]:
+        """
+        Get per-call telemetry for this run
+
+        Returns:
+            Dictionary with run_id, totals, per-stage aggregates
+            (see summarize_records) and the individual call records
+        """
+        with self._lock:
+            calls = list(self.calls)
+        return {
+            'run_id': self.run_id,
+            'calls': len(calls),
+            'input_tokens': sum(call.input_tokens for call in calls),
+            'output_tokens': sum(call.output_tokens for call in calls),
+            'cached_input_tokens': sum(call.cache_read_tokens for call in calls),
+            'cost_usd': round(sum(call.cost_usd for call in calls), 4),
+            'by_stage': summarize_records(calls),
+            'records': [asdict(call) for call in calls],
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Get counters as a JSON-friendly dictionary
+
+        Returns:
+            Dictionary with totals, hit rate, prompt-cache token counts and
+            per-stage counts
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            prompt_tokens = self.input_tokens + self.cache_read_tokens + self.cache_write_tokens
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'bypassed': self.bypassed,
+                'hit_rate': f"{(self.hits / lookups * 100) if lookups else 0:.1f}%",
+                'tokens_saved': self.tokens_saved,
+                'cost_saved_usd': round(self.cost_saved, 4),
+                'cost_spent_usd': round(self.cost_spent, 4),
+                'prompt_cache': {
+                    'uncached_input_tokens': self.input_tokens,
+                    'cached_input_tokens': self.cache_read_tokens,
+                    'cache_write_tokens': self.cache_write_tokens,
+                    'cached_share': f"{(self.cache_read_tokens / prompt_tokens * 100) if prompt_tokens else 0:.1f}%",
+                    'api_seconds': round(self.api_seconds, 3),
+                },
+                'by_stage': {stage: dict(counts) for stage, counts in self.by_stage.items()},
+            }
+
+
+class LLMGateway:
+    """
+    Wraps an Anthropic client's messages.create with a persistent response cache
+
+    Usage:
+        llm = LLMGateway(anthropic.Anthropic(api_key=key), router=get_llm_router())
+        response = llm.create('audit', model=model, max_tokens=2000,
+                              temperature=0.3, messages=[...],
+                              prefix=[shared_context, draft_block])
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        cache_dir: Union[str, Path] = DEFAULT_LLM_CACHE_DIR,
+        stats: Optional[LLMCacheStats] = None,
+        enabled: bool = LLM_CACHE_ENABLED,
+        batch: Any = None,
+        call_log: Optional[LLMCallLog] = None,
+        router: Optional[LLMRouter] = None
+    ):
+        """
+        Initialize gateway
+
+        Args:
+            client: anthropic.Anthropic (or compatible) client
+            cache_dir: Directory for cached responses
+            stats: Counters to record into (None = process-wide counters)
+            enabled: Set False to send every call to the API
+            batch: BatchDispatcher to queue calls into (None = the one
+                activated by batch_mode, if any)
+            call_log: Run-level JSONL log for call records (None = process-wide log)
+            router: Per-stage model/budget routing, usually get_llm_router()
+                (None = use the model and max_tokens given to each call)
+        """
+        self.client = client
+        self.cache_dir = Path(cache_dir)
+        self.stats = stats if stats is not None else get_llm_cache_stats()
+        self.enabled = enabled
+        self.batch = batch
+        self.call_log = call_log if call_log is not None else get_llm_call_log()
+        self.router = router
+        self.run_id: Optional[str] = None  # Pinned run (see for_current_run)
+
+    def for_current_run(self) -> 'LLMGateway':
+        """
+        Copy of this gateway whose calls always belong to the stats' current run
+
+        For calls that may finish after the run moved on (e.g. an ensemble
+        provider answering after the report returned): they are logged under
+        the run that started them and left out of the next run's counters.
+
+        Returns:
+            LLMGateway sharing this gateway's client, cache, stats and log
+        """
+        pinned = copy.copy(self)
+        pinned.run_id = self.stats.run_id
+        return pinned
+
+    def _run_id(self) -> str:
+        return self.run_id or self.stats.run_id
+
+    def _route(self, stage: str, model: str, max_tokens: int, use_learned: bool = True) -> StageRoute:
+        if self.router is None:
+            return StageRoute(stage, '', model, max_tokens)
+        return self.router.route(stage, model, max_tokens, use_learned)
+
+    @staticmethod
+    def _response_problem(response: Any, validate: Optional[Callable[[Any], bool]]) -> Optional[str]:
+        """Why a response should be retried on a larger route (None if it's fine)"""
+        if getattr(response, 'stop_reason', None) == 'max_tokens':
+            return 'truncated'
+        if validate is not None:
+            try:
+                if not validate(response):
+                    return 'failed validation'
+            except Exception as e:
+                return f"failed validation ({e})"
+        return None
+
+    def _batch_dispatcher(self) -> Any:
+        return self.batch if self.batch is not None else get_active_batch_dispatcher()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _load(self, key: str, ttl_hours: int) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+            age = time.time() - entry['timestamp']
+            if age > ttl_hours * 3600:
+                logger.debug(f"LLM cache EXPIRED: {key[:12]} (age: {age/3600:.1f}h)")
+                path.unlink()
+                return None
+            return entry
+        except (json.JSONDecodeError, KeyError, OSError) as e:
+            logger.warning(f"LLM cache read error for {key[:12]}: {e}")
+            if path.exists():
+                path.unlink()
+            return None
+
+    def _store(self, key: str, stage: str, response: Any):
+        text_blocks = [
+            {'type': 'text', 'text': block.text}
+            for block in response.content if hasattr(block, 'text')
+        ]
+        usage = getattr(response, 'usage', None)
+        entry = {
+            'timestamp': time.time(),
+            'stage': stage,
+            'model': getattr(response, 'model', ''),
+            'stop_reason': getattr(response, 'stop_reason', None),
+            'content': text_blocks,
+            'usage': usage_tokens(usage),
+        }
+
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(entry, f)
+            tmp_path.replace(path)
+        except (TypeError, OSError) as e:
+            logger.error(f"LLM cache write error for {key[:12]}: {e}")
+
+    def _prepare(
+        self,
+        stage: str,
+        route: StageRoute,
+        ceiling: StageRoute,
+        messages: List[Dict[str, Any]],
+        temperature: Optional[float],
+        system: Optional[Union[str, List[Dict[str, Any]]]],
+        prefix: Optional[List[str]],
+        cache: bool,
+        kwargs: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Build the API request for a route and its cache key (None when caching is off)
+
+        The key covers the model and max_tokens of the stage's ceiling route
+        (the routed model at the configured budget), so a changed tier model
+        or ceiling misses, while learned budgets and fallbacks don't
+        invalidate it.
+        """
+        if prefix:
+            messages = with_cached_prefix(prefix, messages)
+
+        request = {'model': route.model, 'messages': messages, 'max_tokens': route.max_tokens}
+        if temperature is not None:
+            request['temperature'] = temperature
+        if system is not None:
+            request['system'] = system
+        request.update(kwargs)
+
+        use_cache = self.enabled and cache and stage not in LLM_CACHE_SKIP_STAGES
+        key = request_key(
+            ceiling.model, messages, ceiling.max_tokens, temperature, system, kwargs
+        ) if use_cache else None
+        return request, key
+
+    def _lookup(self, stage: str, model: str, key: str, ttl_hours: Optional[int]) -> Optional[CachedResponse]:
+        """Serve a cached response, recording the hit"""
+        start = time.perf_counter()
+        ttl = ttl_hours if ttl_hours is not None else LLM_STAGE_TTL_HOURS.get(stage, DEFAULT_LLM_TTL_HOURS)
+        entry = self._load(key, ttl)
+        if entry is None:
+            return None
+
+        usage = CachedUsage(**entry['usage'])
+        run_id = self._run_id()
+        self.stats.record_hit(
+            stage,
+            usage.input_tokens + usage.output_tokens
+            + usage.cache_read_input_tokens + usage.cache_creation_input_tokens,
+            estimate_cost(
+                model, usage.input_tokens, usage.output_tokens,
+                usage.cache_read_input_tokens, usage.cache_creation_input_tokens
+            ),
+            run_id=run_id
+        )
+        logger.info(f"LLM cache HIT: {stage} ({key[:12]})")
+        seconds = round(time.perf_counter() - start, 3)
+        self._emit(LLMCallRecord(
+            run_id=run_id, stage=stage, model=model,
+            first_token_seconds=seconds, latency_seconds=seconds,
+            response_cached=True, stop_reason=entry.get('stop_reason')
+        ))
+        return CachedResponse(
+            content=[CachedTextBlock(block['text']) for block in entry['content']],
+            stop_reason=entry.get('stop_reason'),
+            model=entry.get('model') or model,
+            usage=usage
+        )
+
+    def _finish(self, stage: str, key: Optional[str], response: Any):
+        """Store a fresh response unless caching is off or it was truncated"""
+        # Truncated responses get a fresh attempt next run instead of being pinned
+        if key and getattr(response, 'stop_reason', None) != 'max_tokens':
+            self._store(key, stage, response)
+
+    def create(
+        self,
+        stage: str,
+        *,
+        model: str,
+        messages: List[Dict[str, Any]],
+        max_tokens: int,
+        temperature: Optional[float] = None,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
+        prefix: Optional[List[str]] = None,
+        cache: bool = True,
+        ttl_hours: Optional[int] = None,
+        validate: Optional[Callable[[Any], bool]] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Send a messages.create request, serving identical repeats from cache
+
+        The router may replace model and max_tokens for the stage. A truncated
+        response, or one that validate rejects, is retried on the router's
+        fallback route until one succeeds or there's nowhere left to go.
+
+        Args:
+            stage: Pipeline stage name (selects TTL and labels the stats)
+            model: Model name
+            messages: Messages list
+            max_tokens: Completion limit
+            temperature: Sampling temperature (None = API default)
+            system: System prompt
+            prefix: Shared context segments sent before messages and marked
+                for provider-side prompt caching (see with_cached_prefix)
+            cache: Set False for stochastic passes that must sample fresh
+            ttl_hours: Override the stage TTL
+            validate: Returns False (or raises) for an unusable response,
+                e.g. unparseable JSON
+            **kwargs: Passed through to messages.create
+
+        Returns:
+            anthropic Message on a miss, CachedResponse on a hit
+        """
+        route = self._route(stage, model, max_tokens)
+        ceiling = self._route(stage, model, max_tokens, use_learned=False)
+        retry = False
+        while True:
+            request, key = self._prepare(
+                stage, route, ceiling, messages, temperature, system, prefix, cache, kwargs
+            )
+            fresh = False
+            # Retries share the first attempt's key, so only the first looks it up
+            response = self._lookup(stage, route.model, key, ttl_hours) if key and not retry else None
+            if response is None:
+                response = self._call(stage, request, bypassed=key is None)
+                fresh = True
+
+            problem = self._response_problem(response, validate)
+            if problem is None:
+                if fresh:
+                    self._finish(stage, key, response)
+                return response
+
+            escalated = self.router.fallback(route) if self.router is not None else None
+            if escalated is None:
+                return response
+            logger.warning(
+                f"LLM {stage}: response {problem} on {route.model} ({route.max_tokens} tokens), "
+                f"retrying on {escalated.model} ({escalated.max_tokens} tokens)"
+            )
+            route = escalated
+            retry = True
+
+    def stream(
+        self,
+        stage: str,
+        *,
+        model: str,
+        messages: List[Dict[str, Any]],
+        max_tokens: int,
+        temperature: Optional[float] = None,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
+        prefix: Optional[List[str]] = None,
+        cache: bool = True,
+        ttl_hours: Optional[int] = None,
+        **kwargs
+    ) -> 'LLMStream':
+        """
+        Stream a messages request as text deltas, with the same caching as create()
+
+        A cache hit replays the stored text as a single delta. In batch mode
+        the full response is awaited and delivered as a single delta.
+        The router picks the model as in create(), with the stage's ceiling
+        max_tokens rather than a learned budget: a truncated stream isn't
+        retried (its text has already been delivered).
+
+        Args:
+            Same as create()
+
+        Returns:
+            LLMStream: iterate for text deltas; .response holds the final
+            message once iteration completes
+        """
+        route = self._route(stage, model, max_tokens, use_learned=False)
+        request, key = self._prepare(
+            stage, route, route, messages, temperature, system, prefix, cache, kwargs
+        )
+        cached = self._lookup(stage, route.model, key, ttl_hours) if key else None
+        return LLMStream(self, stage, request, key, cached)
+
+    def _call(self, stage: str, request: Dict[str, Any], bypassed: bool = False) -> Any:
+        """Send a request to the API (or the active batch) and record its usage"""
+        dispatcher = self._batch_dispatcher()
+        retries = 0
+        start = time.perf_counter()
+        if dispatcher is not None:
+            response = dispatcher.submit(stage, request).result()
+        elif hasattr(self.client.messages, 'with_raw_response'):
+            # Raw response exposes how many SDK retries the call needed
+            raw = self.client.messages.with_raw_response.create(**request)
+            response = raw.parse()
+            retries = getattr(raw, 'retries_taken', 0)
+        else:
+            response = self.client.messages.create(**request)
+        seconds = time.perf_counter() - start
+
+        self._record(
+            stage, request, response, seconds, bypassed,
+            batched=dispatcher is not None, first_token_seconds=seconds, retries=retries
+        )
+        return response
+
+    def _emit(self, record: LLMCallRecord):
+        """Attach a call record to the stats and append it to the run log"""
+        self.stats.record_call(record)
+        self.call_log.write(record)
+
+    def _record(
+        self,
+        stage: str,
+        request: Dict[str, Any],
+        response: Any,
+        seconds: float,
+        bypassed: bool,
+        batched: bool = False,
+        first_token_seconds: Optional[float] = None,
+        retries: Optional[int] = 0
+    ):
+        usage = getattr(response, 'usage', None)
+        price_multiplier = BATCH_PRICE_MULTIPLIER if batched else 1.0
+        run_id = self._run_id()
+        self.stats.record_miss(
+            stage, request['model'], usage, seconds, bypassed=bypassed,
+            price_multiplier=price_multiplier, run_id=run_id
+        )
+
+        tokens = usage_tokens(usage)
+        self._emit(LLMCallRecord(
+            run_id=run_id,
+            stage=stage,
+            model=request['model'],
+            input_tokens=tokens['input_tokens'],
+            output_tokens=tokens['output_tokens'],
+            cache_read_tokens=tokens['cache_read_input_tokens'],
+            cache_write_tokens=tokens['cache_creation_input_tokens'],
+            first_token_seconds=round(first_token_seconds, 3) if first_token_seconds is not None else None,
+            latency_seconds=round(seconds, 3),
+            retries=retries,
+            cost_usd=round(estimate_cost(
+                request['model'], tokens['input_tokens'], tokens['output_tokens'],
+                tokens['cache_read_input_tokens'], tokens['cache_creation_input_tokens']
+            ) * price_multiplier, 6),
+            batched=batched,
+            stop_reason=getattr(response, 'stop_reason', None)
+        ))
+        if tokens['cache_read_input_tokens'] or tokens['cache_creation_input_tokens']:
+            logger.debug(
+                f"Prompt cache {stage}: {tokens['cache_read_input_tokens']} read, "
+                f"{tokens['cache_creation_input_tokens']} written, "
+                f"{tokens['input_tokens']} uncached"
+            )
+
+
+class LLMStream:
+    """
+    Iterable of text deltas from LLMGateway.stream
+
+    After iteration: .response is the final message (anthropic Message or
+    CachedResponse) and .first_token_seconds the time to the first delta.
+    """
+
+    def __init__(
+        self,
+        gateway: LLMGateway,
+        stage: str,
+        request: Dict[str, Any],
+        key: Optional[str],
+        cached: Optional[CachedResponse]
+    ):
+        self.gateway = gateway
+        self.stage = stage
+        self.request = request
+        self.key = key
+        self.response = cached
+        self.first_token_seconds: Optional[float] = None
+
+    def __iter__(self) -> Iterator[str]:
+        if self.response is not None:
+            self.first_token_seconds = 0.0
+            text = ''.join(block.text for block in self.response.content)
+            if text:
+                yield text
+            return
+
+        if self.gateway._batch_dispatcher() is not None:
+            # Batch API has no streaming; deliver the whole response at once
+            start = time.perf_counter()
+            self.response = self.gateway._call(self.stage, self.request, bypassed=self.key is None)
+            self.gateway._finish(self.stage, self.key, self.response)
+            self.first_token_seconds = time.perf_counter() - start
+            text = ''.join(block.text for block in self.response.content if hasattr(block, 'text'))
+            if text:
+                yield text
+            return
+
+        start = time.perf_counter()
+        with self.gateway.client.messages.stream(**self.request) as stream:
+            for text in stream.text_stream:
+                if self.first_token_seconds is None:
+                    self.first_token_seconds = time.perf_counter() - start
+                yield text
+            self.response = stream.get_final_message()
+
+        self.gateway._record(
+            self.stage, self.request, self.response,
+            time.perf_counter() - start, bypassed=self.key is None,
+            first_token_seconds=self.first_token_seconds,
+            retries=None  # The streaming helper doesn't report SDK retries
+        )
+        self.gateway._finish(self.stage, self.key, self.response)
+
+
+# Global counters shared by every gateway in the process
+_global_llm_stats = None
+
+
+def llm_run(func: Callable) -> Callable:
+    """
+    Decorator running a report entry point in its own LLM run (see LLMCacheStats.run_scope)
+
+    Methods of objects with a gateway (self.llm) use its stats; functions
+    and objects without one use the process-wide stats.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        llm = getattr(args[0], 'llm', None) if args else None
+        stats = llm.stats if isinstance(llm, LLMGateway) else get_llm_cache_stats()
+        with stats.run_scope():
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def get_llm_cache_stats() -> LLMCacheStats:
+    """
+    Get process-wide LLM cache counters (singleton pattern)
+
+    Returns:
+        Global LLMCacheStats instance
+    """
+    global _global_llm_stats
+    if _global_llm_stats is None:
+        _global_llm_stats = LLMCacheStats()
+    return _global_llm_stats
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+LLM Routing - Per-stage model tier and output budget from config
+
+config/llm_routing.yaml assigns each LLM stage a model tier (fast model for
+structural JSON checks, writer model for customer-facing prose) and a
+max_tokens ceiling. LLMGateway asks the router for the (model, max_tokens) of
+every call:
+
+- Budgets are learned from the run-level call log (logs/llm_calls.jsonl):
+  once a stage has enough samples, its budget is the p95 of observed output
+  tokens plus headroom, capped at the configured ceiling
+- A truncated response (stop_reason == 'max_tokens') or a response that fails
+  the caller's validation (e.g. unparseable JSON) is retried with the full
+  ceiling, then on the tier's fallback model
+
+Stages not in the config keep the model and max_tokens given in code.
+"""
+
+import math
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+from src.llm_telemetry import LLMCallLog, get_llm_call_log, percentile
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_LLM_ROUTING_CONFIG = Path(__file__).parent.parent / 'config' / 'llm_routing.yaml'
+
+LLM_ROUTING_ENABLED = os.getenv('LLM_ROUTING_ENABLED', 'true').lower() not in ('0', 'false', 'no')
+
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+
+@dataclass
+class ModelTier:
+    """A model and where to escalate when it truncates or fails validation"""
+    name: str
+    model: str
+    max_output_tokens: int
+    fallback: Optional[str] = None
+
+
+@dataclass
+class StageRoute:
+    """Resolved routing for one call"""
+    stage: str
+    tier: str
+    model: str
+    max_tokens: int
+    learned: bool = False  # max_tokens came from observed output lengths
+
+
+class LLMRouter:
+    """
+    Resolves model and max_tokens per stage
+
+    Usage:
+        router = LLMRouter()
+        route = router.route('fact_check', model, 1500)
+        escalated = router.fallback(route)  # None when there's nowhere to go
+    """
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        config_path: Union[str, Path] = DEFAULT_LLM_ROUTING_CONFIG,
+        call_log: Optional[LLMCallLog] = None
+    ):
+        """
+        Initialize router
+
+        Args:
+            config: Routing config dict (None = load config_path)
+            config_path: YAML routing config
+            call_log: Call log to learn budgets from (None = process-wide log)
+        """
+        self.config = config if config is not None else self._load_config(Path(config_path))
+        self.call_log = call_log if call_log is not None else get_llm_call_log()
+        self.tiers = {
+            name: ModelTier(
+                name=name,
+                model=tier['model'],
+                max_output_tokens=int(tier.get('max_output_tokens', 64000)),
+                fallback=tier.get('fallback')
+            )
+            for name, tier in (self.config.get('tiers') or {}).items()
+        }
+        self.stages = self.config.get('stages') or {}
+        self.learning = self.config.get('learned_budgets') or {}
+        self._learned: Optional[Dict[str, int]] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _load_config(path: Path) -> Dict[str, Any]:
+        if not YAML_AVAILABLE:
+            logger.warning("PyYAML not installed - LLM routing disabled")
+            return {}
+        try:
+            with open(path, 'r') as f:
+                return yaml.safe_load(f) or {}
+        except (OSError, yaml.YAMLError) as e:
+            logger.warning(f"Could not load LLM routing config {path}: {e}")
+            return {}
+
+    def learned_budgets(self) -> Dict[str, int]:
+        """
+        Output budgets learned from the call log (computed once per router)
+
+        Returns:
+            {stage: max_tokens} for stages with enough samples
+        """
+        with self._lock:
+            if self._learned is None:
+                self._learned = self._learn_budgets()
+            return self._learned
+
+    def _learn_budgets(self) -> Dict[str, int]:
+        if not self.learning.get('enabled', True):
+            return {}
+
+        pct = float(self.learning.get('percentile', 95))
+        headroom = float(self.learning.get('headroom', 1.3))
+        min_samples = int(self.learning.get('min_samples', 20))
+        min_tokens = int(self.learning.get('min_tokens', 512))
+
+        samples: Dict[str, list] = {}
+        for record in self.call_log.read(last_runs=self.learning.get('recent_runs')):
+            if record.get('response_cached') or record.get('stage') not in self.stages:
+                continue
+            if record.get('stop_reason') == 'max_tokens':
+                continue  # Truncated: output_tokens is the budget it hit, not what it needed
+            samples.setdefault(record['stage'], []).append(record.get('output_tokens', 0))
+
+        budgets = {}
+        for stage, outputs in samples.items():
+            if len(outputs) < min_samples:
+                continue
+            budget = int(math.ceil(percentile(outputs, pct) * headroom / 100.0)) * 100
+            budgets[stage] = max(min_tokens, budget)
+        if budgets:
+            logger.info(f"Learned LLM output budgets: {budgets}")
+        return budgets
+
+    def route(self, stage: str, model: str, max_tokens: int, use_learned: bool = True) -> StageRoute:
+        """
+        Resolve model and max_tokens for a call
+
+        Args:
+            stage: Pipeline stage name
+            model: Model requested in code
+            max_tokens: Budget requested in code
+            use_learned: Use the learned budget when below the ceiling
+                (False = ceiling, e.g. for streams that can't be retried)
+
+        Returns:
+            StageRoute (the requested values for stages not in the config)
+        """
+        entry = self.stages.get(stage)
+        tier = self.tiers.get(entry.get('tier')) if entry else None
+        if tier is None:
+            return StageRoute(stage, '', model, max_tokens)
+
+        ceiling = min(int(entry.get('max_tokens', max_tokens)), tier.max_output_tokens)
+        learned = self.learned_budgets().get(stage) if use_learned else None
+        if learned is not None and learned < ceiling:
+            return StageRoute(stage, tier.name, tier.model, learned, learned=True)
+        return StageRoute(stage, tier.name, tier.model, ceiling)
+
+    def fallback(self, route: StageRoute) -> Optional[StageRoute]:
+        """
+        Next route after a truncated or invalid response
+
+        A learned budget first falls back to the stage ceiling; otherwise the
+        tier's fallback model is used with the ceiling.
+
+        Args:
+            route: Route that produced the bad response
+
+        Returns:
+            Escalated StageRoute, or None if there's nowhere to escalate
+        """
+        tier = self.tiers.get(route.tier)
+        if tier is None:
+            return None
+        ceiling = int(self.stages[route.stage].get('max_tokens', route.max_tokens))
+
+        if route.learned and route.max_tokens < ceiling:
+            return StageRoute(route.stage, tier.name, tier.model, min(ceiling, tier.max_output_tokens))
+
+        next_tier = self.tiers.get(tier.fallback) if tier.fallback else None
+        if next_tier is not None:
+            return StageRoute(route.stage, next_tier.name, next_tier.model,
+                              min(ceiling, next_tier.max_output_tokens))
+        return None
+
+
+# Global router shared by every gateway in the process
+_global_llm_router = None
+
+
+def get_llm_router() -> Optional[LLMRouter]:
+    """
+    Get the process-wide router (singleton pattern)
+
+    Returns:
+        Global LLMRouter, or None when LLM_ROUTING_ENABLED is off
+    """
+    global _global_llm_router
+    if not LLM_ROUTING_ENABLED:
+        return None
+    if _global_llm_router is None:
+        _global_llm_router = LLMRouter()
+    return _global_llm_router
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+LLM Telemetry - Per-call token, latency and cost records for every LLM stage
+
+Every LLMGateway call emits an LLMCallRecord (stage, model, billed tokens,
+time to first token, total latency, retries, cost). Records are kept on the
+report's LLMCacheStats for audit_results and appended to a run-level JSONL
+log (logs/llm_calls.jsonl) so stage costs can be compared across runs:
+
+    python diagnostics/llm_stage_report.py --runs 20
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Run-level JSONL log of every LLM call (set LLM_CALL_LOG='' to disable)
+DEFAULT_LLM_CALL_LOG = os.getenv('LLM_CALL_LOG', str(Path("logs") / "llm_calls.jsonl"))
+
+
+@dataclass
+class LLMCallRecord:
+    """One gateway call"""
+    run_id: str
+    stage: str
+    model: str
+    input_tokens: int = 0        # Uncached prompt tokens billed
+    output_tokens: int = 0
+    cache_read_tokens: int = 0   # Prompt tokens served from the provider prompt cache
+    cache_write_tokens: int = 0
+    first_token_seconds: Optional[float] = None  # Equals latency for non-streamed calls
+    latency_seconds: float = 0.0
+    retries: Optional[int] = 0   # SDK retries before success (None = not reported)
+    cost_usd: float = 0.0
+    response_cached: bool = False  # Served from the .cache/llm response cache
+    batched: bool = False
+    stop_reason: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """
+    Linear-interpolated percentile
+
+    Args:
+        values: Samples (any order)
+        pct: Percentile in [0, 100]
+
+    Returns:
+        Percentile value, or None for no samples
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize_records(records: Iterable[Union[LLMCallRecord, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Aggregate call records per stage
+
+    Args:
+        records: LLMCallRecord objects or their dict form (JSONL lines)
+
+    Returns:
+        {stage: {calls, cached_responses, input/output/cached tokens, cost_usd,
+        retries, latency p50/p95, first-token p50/p95}} sorted by total latency
+    """
+    by_stage: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        entry = asdict(record) if isinstance(record, LLMCallRecord) else record
+        by_stage.setdefault(entry['stage'], []).append(entry)
+
+    def _round(value: Optional[float]) -> Optional[float]:
+        return round(value, 3) if value is not None else None
+
+    summary = {}
+    for stage, entries in by_stage.items():
+        latencies = [entry['latency_seconds'] for entry in entries if not entry.get('response_cached')]
+        first_tokens = [
+            entry['first_token_seconds'] for entry in entries
+            if entry.get('first_token_seconds') is not None and not entry.get('response_cached')
+        ]
+        summary[stage] = {
+            'calls': len(entries),
+            'cached_responses': sum(1 for entry in entries if entry.get('response_cached')),
+            'input_tokens': sum(entry.get('input_tokens', 0) for entry in entries),
+            'output_tokens': sum(entry.get('output_tokens', 0) for entry in entries),
+            'cached_input_tokens': sum(entry.get('cache_read_tokens', 0) for entry in entries),
+            'cost_usd': round(sum(entry.get('cost_usd', 0.0) for entry in entries), 4),
+            'retries': sum(entry.get('retries') or 0 for entry in entries),
+            'latency_p50': _round(percentile(latencies, 50)),
+            'latency_p95': _round(percentile(latencies, 95)),
+            'first_token_p50': _round(percentile(first_tokens, 50)),
+            'first_token_p95': _round(percentile(first_tokens, 95)),
+            'total_seconds': round(sum(latencies), 3),
+        }
+
+    return dict(sorted(summary.items(), key=lambda item: item[1]['total_seconds'], reverse=True))
+
+
+class LLMCallLog:
+    """Thread-safe append-only JSONL log of call records"""
+
+    def __init__(self, path: Optional[Union[str, Path]] = DEFAULT_LLM_CALL_LOG):
+        """
+        Initialize log
+
+        Args:
+            path: JSONL file (None or '' disables writing)
+        """
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+
+    def write(self, record: LLMCallRecord):
+        """Append a record"""
+        if self.path is None:
+            return
+        line = json.dumps(asdict(record), default=str)
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, 'a') as f:
+                    f.write(line + '\n')
+            except OSError as e:
+                logger.warning(f"LLM call log write error: {e}")
+
+    def read(self, last_runs: Optional[int] = None, stage: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Read records back
+
+        Args:
+            last_runs: Only the most recent N runs (None = all)
+            stage: Only this stage
+
+        Returns:
+            Record dicts in log order (unparseable lines are skipped)
+        """
+        if self.path is None or not self.path.exists():
+            return []
+
+        records = []
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+
+        if last_runs:
+            run_ids = list(dict.fromkeys(record.get('run_id') for record in records))
+            keep = set(run_ids[-last_runs:])
+            records = [record for record in records if record.get('run_id') in keep]
+        if stage:
+            records = [record for record in records if record.get('stage') == stage]
+        return records
+
+
+# Global call log shared by every gateway in the process
+_global_llm_call_log = None
+
+
+def get_llm_call_log() -> LLMCallLog:
+    """
+    Get the process-wide run log (singleton pattern)
+
+    Returns:
+        Global LLMCallLog instance
+    """
+    global _global_llm_call_log
+    if _global_llm_call_log is None:
+        _global_llm_call_log = LLMCallLog()
+    return _global_llm_call_log
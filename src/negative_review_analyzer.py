@@ -11,14 +11,24 @@ Instead of generic advice, provides:
 """
 
 import logging
-import requests
 import time
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 import anthropic
 import json
 
+from src.cache_manager import CacheManager
+from src.llm_gateway import LLMGateway, llm_run
+from src.llm_routing import get_llm_router
+from src.review_sampler import REVIEW_SAMPLE_POOL, sample_reviews
+from src.review_store import get_review_store, review_sample_fingerprint
+from src.review_themes import COMPLAINT_CATEGORIES, ReviewThemeClassifier
+
 logger = logging.getLogger(__name__)
+cache = CacheManager()
+
+# Hours a complaint categorization is reused for the same review sample
+COMPLAINT_CACHE_TTL_HOURS = 72
 
 
 @dataclass
@@ -60,10 +70,12 @@ class NegativeReviewAnalyzer:
     specific fix-it recommendations with salvageability assessment.
     """
 
-    def __init__(self, claude_api_key: str):
-        """Initialize with Claude API for analysis"""
+    def __init__(self, claude_api_key: str, review_store=None):
+        """Initialize with Claude API for analysis (and a ReviewStore; None = shared store)"""
         self.client = anthropic.Anthropic(api_key=claude_api_key)
         self.model = "claude-sonnet-4-20250514"
+        self.llm = LLMGateway(self.client, router=get_llm_router())
+        self.review_store = review_store if review_store is not None else get_review_store()
 
     def fetch_negative_reviews(
         self,
@@ -72,12 +84,13 @@ class NegativeReviewAnalyzer:
         language: str = 'english'
     ) -> List[Dict[str, Any]]:
         """
-        Fetch negative reviews from Steam API.
+        Fetch negative reviews from the local review store (synced from Steam API).
 
         Prioritizes:
         - Most helpful (voted helpful by community)
         - Recent (posted in last 6 months)
         - Detailed (longer reviews with substance)
+        - Coverage (near-duplicates removed, sampled across complaint clusters)
 
         Args:
             app_id: Steam app ID
@@ -89,90 +102,63 @@ class NegativeReviewAnalyzer:
         """
         logger.info(f"Fetching negative reviews for app_id {app_id}")
 
-        reviews = []
-        cursor = "*"
-        max_requests = 5  # Limit API calls
-
         try:
-            for _ in range(max_requests):
-                # Steam reviews API endpoint
-                url = "https://store.steampowered.com/appreviews/" + str(app_id)
-                params = {
-                    'json': 1,
-                    'filter': 'recent',  # Recent reviews
-                    'language': language,
-                    'review_type': 'negative',  # Only negative reviews
-                    'purchase_type': 'all',
-                    'num_per_page': 100,
-                    'cursor': cursor
-                }
-
-                response = requests.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-
-                if not data.get('success'):
-                    logger.warning(f"Steam API returned success=false for app_id {app_id}")
-                    break
-
-                batch_reviews = data.get('reviews', [])
-                if not batch_reviews:
-                    break
-
-                # Filter for helpful and detailed reviews
-                for review in batch_reviews:
-                    # Extract review data
-                    review_text = review.get('review', '')
-                    votes_helpful = review.get('votes_up', 0)
-                    votes_total = review.get('votes_up', 0) + review.get('votes_funny', 0)
-
-                    # Skip very short reviews (likely not detailed enough)
-                    if len(review_text) < 50:
-                        continue
-
-                    # Add helpful reviews
-                    reviews.append({
-                        'text': review_text,
-                        'votes_helpful': votes_helpful,
-                        'votes_total': votes_total,
-                        'timestamp': review.get('timestamp_created', 0),
-                        'playtime_forever': review.get('author', {}).get('playtime_forever', 0),
-                        'playtime_at_review': review.get('author', {}).get('playtime_at_review', 0),
-                        'helpful_score': votes_helpful if votes_total == 0 else votes_helpful / max(votes_total, 1)
-                    })
-
-                # Check if we have enough
-                if len(reviews) >= count:
-                    break
-
-                # Get next cursor
-                cursor = data.get('cursor')
-                if not cursor:
-                    break
-
-                # Rate limiting
-                time.sleep(0.5)
-
-            # Sort by helpfulness and recency
-            reviews.sort(key=lambda r: (r['votes_helpful'], r['timestamp']), reverse=True)
-
-            # Return top N
-            result = reviews[:count]
-            logger.info(f"Fetched {len(result)} negative reviews for app_id {app_id}")
+            self.review_store.sync(app_id, language)
 
+            # Pool: most helpful detailed reviews from the last 6 months, topped up with older ones
+            six_months_ago = int(time.time() - 180 * 86400)
+            pool = self.review_store.reviews(
+                app_id, voted_up=False, language=language, min_length=50, order='helpful',
+                limit=REVIEW_SAMPLE_POOL, since_timestamp=six_months_ago
+            )
+            if len(pool) < REVIEW_SAMPLE_POOL:
+                pool += self.review_store.reviews(
+                    app_id, voted_up=False, language=language, min_length=50, order='helpful',
+                    limit=REVIEW_SAMPLE_POOL - len(pool), until_timestamp=six_months_ago
+                )
+
+            # Near-duplicates dropped, every complaint cluster represented
+            rows = sample_reviews(pool, count)
+
+            result = []
+            for row in rows:
+                votes_helpful = row['votes_up']
+                votes_total = row['votes_up'] + row['votes_funny']
+                result.append({
+                    'recommendation_id': row['recommendation_id'],
+                    'text': row['review'],
+                    'votes_helpful': votes_helpful,
+                    'votes_total': votes_total,
+                    'timestamp': row['timestamp_created'],
+                    'playtime_forever': row['playtime_forever'],
+                    'playtime_at_review': row['playtime_at_review'],
+                    'helpful_score': votes_helpful if votes_total == 0 else votes_helpful / max(votes_total, 1)
+                })
+
+            logger.info(f"Fetched {len(result)} negative reviews for app_id {app_id}")
             return result
 
         except Exception as e:
             logger.error(f"Error fetching negative reviews: {e}")
             return []
 
+    @llm_run
     def categorize_complaints(
         self,
         reviews: List[Dict[str, Any]],
-        game_name: str
+        game_name: str,
+        app_id: Optional[str] = None,
+        language: str = 'english'
     ) -> Dict[str, Any]:
         """
-        Use Claude to categorize complaints from negative reviews.
+        Categorize complaints from negative reviews.
+
+        Category counts and percentages come from the local theme classifier
+        over every stored negative review of the app (or over `reviews` when
+        the store has none). Quote candidates are ranked within `reviews` (the
+        deduplicated, cluster-stratified sample from fetch_negative_reviews),
+        so every complaint cluster can be quoted; Claude picks quotes and
+        writes the root-cause, severity and fixability analysis from them.
 
         Categories:
         - Critical Issues (game-breaking): crashes, performance, save corruption
@@ -182,82 +168,67 @@ class NegativeReviewAnalyzer:
         - Subjective Preferences (accept/ignore): art style, genre preference
 
         Args:
-            reviews: List of review dictionaries
+            reviews: List of review dictionaries (quote candidates)
             game_name: Name of the game for context
+            app_id: Steam app ID whose stored negatives to classify (None = reviews only)
+            language: Review language of the stored corpus
 
         Returns:
             Dictionary with categorized complaints and analysis
         """
-        logger.info(f"Categorizing {len(reviews)} negative reviews using Claude")
-
         if not reviews:
             return {'error': 'No reviews to analyze'}
 
-        # Build review text for analysis (use top 50 most helpful)
-        review_texts = []
-        for i, review in enumerate(reviews[:50], 1):
-            playtime_hours = review['playtime_forever'] / 60 if review['playtime_forever'] > 0 else 0
-            review_texts.append(
-                f"Review {i} ({playtime_hours:.1f} hours played, {review['votes_helpful']} helpful votes):\n{review['text']}\n"
-            )
-
-        reviews_combined = "\n---\n".join(review_texts)
+        corpus = reviews
+        if app_id is not None:
+            corpus = self.review_store.reviews(app_id, voted_up=False, language=language) or reviews
+        texts = [review.get('text', review.get('review', '')) for review in corpus]
+        sample = [review.get('text', review.get('review', '')) for review in reviews]
+        logger.info(f"Categorizing {len(texts)} negative reviews locally, quotes via Claude")
+
+        # Same corpus and sample (in any order, from any process) reuse the categorization
+        identity = reviews if corpus is reviews else {'corpus': corpus, 'sample': reviews}
+        cache_key = f"{game_name}_{review_sample_fingerprint(identity)}"
+        cached = cache.get('complaint_analysis', cache_key, ttl_hours=COMPLAINT_CACHE_TTL_HOURS)
+        if cached:
+            logger.info("Using cached complaint categorization")
+            return cached
+
+        stats = ReviewThemeClassifier(COMPLAINT_CATEGORIES).classify(texts, candidates_from=sample)
+        candidates = {
+            category: [text[:300] for text in data['candidates']]
+            for category, data in stats.items() if data['candidates']
+        }
+        category_counts = {
+            category: f"{data['count']} reviews ({data['percentage']}%)" for category, data in stats.items()
+        }
 
         # Claude analysis prompt
         prompt = f"""You are analyzing negative Steam reviews for the game "{game_name}" to extract actionable insights for the developers.
 
-NEGATIVE REVIEWS TO ANALYZE:
-{reviews_combined}
-
-TASK: Categorize all complaints into these 5 categories:
-
-1. **CRITICAL ISSUES** (game-breaking problems):
-   - Crashes, freezes, won't launch
-   - Severe performance problems (unplayable FPS)
-   - Save file corruption or loss
-   - Unplayable on advertised platforms
-   - Major bugs that prevent progression
-
-2. **DESIGN PROBLEMS** (fundamental gameplay issues):
-   - Boring/repetitive gameplay loop
-   - Unfair or poorly balanced difficulty
-   - Poor progression pacing
-   - Lack of content or replayability
-   - Core mechanics not fun
-
-3. **POLISH ISSUES** (fixable quality problems):
-   - UI/UX problems (confusing menus, bad controls)
-   - Missing tutorial or poor onboarding
-   - Balance issues (weapons, enemies, economy)
-   - Missing quality-of-life features
-   - Minor bugs or glitches
-
-4. **EXPECTATION MISMATCHES** (communication problems):
-   - Price too high for amount of content
-   - Misleading marketing or store page
-   - Genre confusion (not what players expected)
-   - Promised features missing or incomplete
-   - Early Access concerns
-
-5. **SUBJECTIVE PREFERENCES** (accept/ignore):
-   - Art style or graphics preferences
-   - Genre not their taste
-   - Personal preferences (story, themes)
-   - "Not for me" type feedback
+{len(texts)} negative reviews were already classified into 5 complaint categories (a review can mention several):
+{json.dumps(category_counts, indent=2)}
+
+Categories:
+1. **CRITICAL ISSUES** (game-breaking): crashes, won't launch, unplayable performance, save loss, progression-blocking bugs
+2. **DESIGN PROBLEMS** (fundamental): boring/repetitive loop, unfair difficulty, poor pacing, lack of content
+3. **POLISH ISSUES** (fixable): UI/UX, controls, tutorial, balance, missing QoL, minor bugs
+4. **EXPECTATION MISMATCHES** (communication): price vs content, misleading marketing, Early Access concerns
+5. **SUBJECTIVE PREFERENCES** (accept/ignore): art style, genre taste, "not for me"
+
+MOST REPRESENTATIVE REVIEWS PER CATEGORY:
+{json.dumps(candidates, indent=2)}
 
 For EACH category, provide:
-- Percentage of negative reviews mentioning this category
-- Count of reviews
-- 2-3 representative quotes (exact text from reviews)
+- 2-3 representative quotes (exact text from the reviews above)
 - Root cause analysis (why is this happening?)
 - Severity rating (critical/moderate/minor)
 - Fixability assessment (fixable/requires_resources/fundamental)
+- Top specific complaints
 
 OUTPUT FORMAT (JSON):
 {{
   "critical_issues": {{
-    "percentage": 45,
-    "count": 23,
     "severity": "critical",
     "fixability": "fixable",
     "quotes": ["exact quote 1", "exact quote 2"],
@@ -276,7 +247,8 @@ IMPORTANT: Be brutally honest. Don't sugarcoat fundamental problems. Developers
 Return ONLY valid JSON."""
 
         try:
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'negative_review_categorize',
                 model=self.model,
                 max_tokens=4000,
                 temperature=0.3,  # Lower temperature for consistent categorization
@@ -302,6 +274,17 @@ Return ONLY valid JSON."""
 
             categorization = json.loads(response_text)
 
+            # Counts and percentages are the full-corpus statistics, not the model's
+            for category, data in stats.items():
+                entry = categorization.setdefault(category, {})
+                if not isinstance(entry, dict):
+                    entry = categorization[category] = {}
+                entry['count'] = data['count']
+                entry['percentage'] = data['percentage']
+                entry.setdefault('quotes', [text[:200] for text in data['candidates'][:2]])
+            categorization['reviews_classified'] = len(texts)
+            cache.set('complaint_analysis', cache_key, categorization)
+
             logger.info("Successfully categorized complaints")
             return categorization
 
@@ -309,6 +292,7 @@ Return ONLY valid JSON."""
             logger.error(f"Error categorizing complaints: {e}")
             return {'error': str(e)}
 
+    @llm_run
     def generate_fix_it_recommendations(
         self,
         categorization: Dict[str, Any],
@@ -389,7 +373,8 @@ IMPORTANT:
 Generate the full fix-it plan in markdown format."""
 
         try:
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'negative_review_fix_plan',
                 model=self.model,
                 max_tokens=6000,
                 temperature=0.5,
@@ -409,6 +394,7 @@ Generate the full fix-it plan in markdown format."""
             logger.error(f"Error generating recommendations: {e}")
             return f"## Error\n\nFailed to generate recommendations: {str(e)}"
 
+    @llm_run
     def assess_salvageability(
         self,
         categorization: Dict[str, Any],
@@ -542,7 +528,8 @@ Choose PIVOT if:
 Generate the assessment in markdown format. Be honest and direct - developers need truth to make hard decisions."""
 
         try:
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'negative_review_salvageability',
                 model=self.model,
                 max_tokens=4000,
                 temperature=0.4,
@@ -562,6 +549,7 @@ Generate the assessment in markdown format. Be honest and direct - developers ne
             logger.error(f"Error assessing salvageability: {e}")
             return f"## Error\n\nFailed to generate assessment: {str(e)}"
 
+    @llm_run
     def generate_full_analysis(
         self,
         app_id: str,
@@ -590,7 +578,7 @@ Generate the assessment in markdown format. Be honest and direct - developers ne
             return f"## Negative Review Analysis\n\n**Error**: Could not fetch negative reviews for app_id {app_id}. The game may not have enough negative reviews, or the Steam API is unavailable."
 
         # Step 2: Categorize complaints
-        categorization = self.categorize_complaints(reviews, game_name)
+        categorization = self.categorize_complaints(reviews, game_name, app_id=app_id)
 
         if 'error' in categorization:
             return f"## Negative Review Analysis\n\n**Error**: {categorization['error']}"
@@ -605,7 +593,7 @@ Generate the assessment in markdown format. Be honest and direct - developers ne
         report = f"""# Negative Review Analysis: {game_name}
 
 **Current Review Score**: {current_review_score:.1f}% positive
-**Reviews Analyzed**: {len(reviews)} negative reviews
+**Reviews Analyzed**: {categorization.get('reviews_classified', len(reviews))} negative reviews
 **Analysis Date**: {time.strftime('%Y-%m-%d')}
 
 ---
@@ -643,7 +631,7 @@ Generate the assessment in markdown format. Be honest and direct - developers ne
 
 ---
 
-*This analysis is based on {len(reviews)} negative reviews. For games with very few reviews, results may not be representative.*
+*This analysis is based on {categorization.get('reviews_classified', len(reviews))} negative reviews. For games with very few reviews, results may not be representative.*
 """
 
         return report
@@ -8,6 +8,7 @@ from typing import Dict, List, Any, Optional
 from abc import ABC, abstractmethod
 from datetime import datetime
 from src.logger import get_logger
+from src.stage_graph import input_fingerprint
 
 logger = get_logger(__name__)
 
@@ -23,6 +24,8 @@ class ReportSection(ABC):
         self.recommendations = []
         self.benchmarks = {}
         self.analyzed = False
+        self._markdown: Optional[str] = None
+        self.input_fingerprint: Optional[str] = None  # Set by ReportBuilder (standard sections)
 
     @abstractmethod
     def analyze(self) -> Dict[str, Any]:
@@ -51,12 +54,24 @@ class ReportSection(ABC):
         """
         pass
 
-    def get_score(self) -> int:
-        """Get section score (0-100)"""
+    def ensure_analyzed(self) -> None:
+        """Run analyze() once, on first access to the section's score or markdown"""
         if not self.analyzed:
             self.analyze()
+            self.analyzed = True
+
+    def get_score(self) -> int:
+        """Get section score (0-100)"""
+        self.ensure_analyzed()
         return self.score
 
+    def get_markdown(self) -> str:
+        """Get section markdown (generated on first access, then cached)"""
+        if self._markdown is None:
+            self.ensure_analyzed()
+            self._markdown = self.generate_markdown()
+        return self._markdown
+
     def get_rating(self) -> str:
         """Get rating label based on score"""
         if self.score >= 80:
@@ -2471,6 +2486,43 @@ class CustomDashboardSection(ReportSection):
         return markdown
 
 
+# Standard sections in report order: (name, class, input keys, game_data
+# keys). Market viability, funnel, visibility and growth lead
+# (decision-making and hard projections); the tracking dashboard comes last.
+# game_data keys list the fields the section and its analyzer read, so an
+# intake-form edit only recomputes the sections that read the edited field
+# (None = reads all of game_data).
+SECTION_REGISTRY = [
+    ("Market Viability", MarketViabilitySection, ['game_data', 'competitors', 'sales_data'],
+     ('genres', 'movies', 'price', 'price_overview', 'recommendations', 'release_date', 'screenshots',
+      'short_description')),
+    ("Conversion Funnel", ConversionFunnelSection, ['game_data', 'sales_data', 'capsule_analysis'],
+     ('genres', 'price', 'reviews_total', 'tags')),
+    ("Visibility Forecast", VisibilityForecastSection, ['game_data', 'sales_data', 'capsule_analysis'],
+     ('app_id', 'genres', 'tags')),
+    ("Growth Strategy", GrowthStrategySection, ['game_data', 'sales_data', 'target_launch_date'],
+     ('genres', 'tags')),
+    ("Tag Insights", TagInsightsSection, ['game_data', 'sales_data'], ('genres', 'tags')),
+    ("Review Vulnerability & Risk Assessment", ReviewVulnerabilitySection,
+     ['game_data', 'sales_data', 'competitor_data'], ('genres', 'price', 'tags')),
+    ("Competitors", CompetitorSection, ['competitors', 'game_data'],
+     ('movies', 'price_overview', 'review_count', 'screenshots')),
+    ("Store Page", StorePageSection, ['game_data', 'competitors'],
+     ('detailed_description', 'genres', 'movies', 'name', 'screenshots', 'short_description',
+      'supported_languages', 'tags')),
+    ("Pricing", PricingSection, ['game_data', 'sales_data', 'competitors'], ()),
+    ("Marketing", MarketingSection, ['game_data', 'report_type'], ()),
+    ("A/B Testing Recommendations", ABTestingSection, ['game_data', 'sales_data', 'competitor_data'],
+     ('genres', 'name', 'price', 'tags')),
+    ("Community Health Scoring", CommunityHealthSection, ['game_data', 'community_data'], ()),
+    ("Regional Pricing Optimization", RegionalPricingSection, ['game_data'], ('price',)),
+    ("Custom Tracking Dashboard", CustomDashboardSection, ['game_data', 'sales_data', 'competitor_data'],
+     ('name',)),
+]
+
+SECTION_NAMES = [name for name, _, _, _ in SECTION_REGISTRY]
+
+
 class ReportBuilder:
     """Orchestrates report generation from multiple sections"""
 
@@ -2485,6 +2537,10 @@ class ReportBuilder:
         self.executive_summary: Optional[ExecutiveSummarySection] = None
         self.overall_score = 0
 
+        # Outcome of the last refresh_sections()/rebuild()
+        self.reused_sections: List[str] = []
+        self.recomputed_sections: List[str] = []
+
         logger.info(f"ReportBuilder initialized for {game_data.get('name', 'Unknown Game')}")
 
     def add_section(self, section: ReportSection):
@@ -2492,123 +2548,195 @@ class ReportBuilder:
         self.sections.append(section)
         logger.debug(f"Added section: {section.section_name}")
 
-    def build_sections(self):
-        """Build all standard sections"""
-        logger.info("Building report sections")
-
-        # Create market viability section FIRST (most important for decision-making)
-        viability_section = MarketViabilitySection("Market Viability", {
+    def _section_inputs(self) -> Dict[str, Any]:
+        """Every input a standard section may take, keyed as in SECTION_REGISTRY"""
+        return {
             'game_data': self.game_data,
+            'sales_data': self.sales_data,
             'competitors': self.competitor_data,
-            'sales_data': self.sales_data
-        })
-        self.add_section(viability_section)
+            'competitor_data': self.competitor_data,
+            'capsule_analysis': getattr(self, 'capsule_analysis', None),
+            'report_type': self.report_type,
+            'target_launch_date': None,  # Can be passed from app if known
+            'community_data': None,  # Will use defaults
+        }
 
-        # Create conversion funnel section SECOND (hard data for projections)
-        funnel_section = ConversionFunnelSection("Conversion Funnel", {
-            'game_data': self.game_data,
-            'sales_data': self.sales_data,
-            'capsule_analysis': getattr(self, 'capsule_analysis', None)
-        })
-        self.add_section(funnel_section)
+    def _section_fingerprints(self) -> Dict[str, str]:
+        """
+        Fingerprint of each standard section's input slice (each input hashed once)
 
-        # Create visibility forecast section THIRD (algorithm predictions)
-        visibility_section = VisibilityForecastSection("Visibility Forecast", {
+        game_data contributes only the section's game_data keys (all of it when None).
+        """
+        input_fingerprints = {key: input_fingerprint(value) for key, value in self._section_inputs().items()}
+        fingerprints = {}
+        for name, _, keys, game_data_keys in SECTION_REGISTRY:
+            slice_ = {key: input_fingerprints[key] for key in keys}
+            if 'game_data' in keys and game_data_keys is not None:
+                slice_['game_data'] = input_fingerprint({key: self.game_data.get(key) for key in game_data_keys})
+            fingerprints[name] = input_fingerprint(slice_)
+        return fingerprints
+
+    def _create_section(self, name: str, inputs: Dict[str, Any], fingerprint: str) -> ReportSection:
+        """Construct a standard section (not analyzed yet) from its registry entry"""
+        for section_name, section_class, keys, _ in SECTION_REGISTRY:
+            if section_name == name:
+                section = section_class(name, {key: inputs[key] for key in keys})
+                section.input_fingerprint = fingerprint
+                return section
+        raise ValueError(f"Unknown report section: {name}")
+
+    def _create_executive_summary(self):
+        """(Re)create the executive summary unless it already covers the same sections and inputs"""
+        fingerprint = input_fingerprint({
             'game_data': self.game_data,
-            'sales_data': self.sales_data,
-            'capsule_analysis': getattr(self, 'capsule_analysis', None)
+            'report_type': self.report_type,
+            'sections': [(section.section_name, section.input_fingerprint) for section in self.sections],
         })
-        self.add_section(visibility_section)
+        if self.executive_summary is not None and self.executive_summary.input_fingerprint == fingerprint:
+            self.executive_summary.all_sections = self.sections
+            return
 
-        # Create growth strategy section FOURTH (launch timing, creators, tactics)
-        growth_section = GrowthStrategySection("Growth Strategy", {
+        self.executive_summary = ExecutiveSummarySection({
             'game_data': self.game_data,
-            'sales_data': self.sales_data,
-            'target_launch_date': None  # Can be passed from app if known
-        })
-        self.add_section(growth_section)
+            'report_type': self.report_type
+        }, all_sections=self.sections)
+        self.executive_summary.input_fingerprint = fingerprint
 
-        # Create tag insights section FIFTH (tag effectiveness with impression estimates)
-        tag_section = TagInsightsSection("Tag Insights", {
-            'game_data': self.game_data,
-            'sales_data': self.sales_data
-        })
-        self.add_section(tag_section)
+    def build_sections(self, names: Optional[List[str]] = None):
+        """
+        Build standard sections (all, or only the named ones)
 
-        # Create review vulnerability section SIXTH (risk assessment from competitor reviews)
-        vulnerability_section = ReviewVulnerabilitySection("Review Vulnerability & Risk Assessment", {
-            'game_data': self.game_data,
-            'sales_data': self.sales_data,
-            'competitor_data': self.competitor_data
-        })
-        self.add_section(vulnerability_section)
+        Sections are cheap to construct; each analyzer runs on first access
+        to the section's score or markdown, so sections that are never read
+        never call their analyzer. Calling again with more names adds the
+        missing sections in report order.
 
-        # Create standard sections
-        competitor_section = CompetitorSection("Competitors", {
-            'competitors': self.competitor_data,
-            'game_data': self.game_data
-        })
-        self.add_section(competitor_section)
+        Args:
+            names: Section names from SECTION_NAMES (None = every section)
 
-        store_section = StorePageSection("Store Page", {
-            'game_data': self.game_data,
-            'competitors': self.competitor_data
-        })
-        self.add_section(store_section)
+        Raises:
+            ValueError: If a name is not a standard section
+        """
+        if names is not None:
+            unknown = set(names) - set(SECTION_NAMES)
+            if unknown:
+                raise ValueError(f"Unknown report sections: {sorted(unknown)}")
+        wanted = SECTION_NAMES if names is None else set(names)
+        logger.info("Building report sections")
 
-        pricing_section = PricingSection("Pricing", {
-            'game_data': self.game_data,
-            'sales_data': self.sales_data,
-            'competitors': self.competitor_data
-        })
-        self.add_section(pricing_section)
+        built = {section.section_name: section for section in self.sections}
+        inputs = self._section_inputs()
+        fingerprints = self._section_fingerprints()
+        standard = []
+        for name in SECTION_NAMES:
+            if name in built:
+                standard.append(built.pop(name))
+            elif name in wanted:
+                standard.append(self._create_section(name, inputs, fingerprints[name]))
+                logger.debug(f"Added section: {name}")
+        # Custom sections (add_section) stay ahead of the standard ones
+        self.sections = list(built.values()) + standard
 
-        marketing_section = MarketingSection("Marketing", {
-            'game_data': self.game_data,
-            'report_type': self.report_type
-        })
-        self.add_section(marketing_section)
+        # Create executive summary (references other sections)
+        self._create_executive_summary()
 
-        # Create A/B testing section (optimization recommendations)
-        ab_testing_section = ABTestingSection("A/B Testing Recommendations", {
-            'game_data': self.game_data,
-            'sales_data': self.sales_data,
-            'competitor_data': self.competitor_data
-        })
-        self.add_section(ab_testing_section)
+        logger.info(f"Built {len(self.sections)} sections + executive summary")
 
-        # Create community health section (Discord/Reddit analysis)
-        community_section = CommunityHealthSection("Community Health Scoring", {
-            'game_data': self.game_data,
-            'community_data': None  # Will use defaults
-        })
-        self.add_section(community_section)
+    def refresh_sections(self):
+        """
+        Re-fingerprint every built standard section after the inputs changed
+
+        Sections whose input slice is unchanged are kept with their analysis
+        and cached markdown; the others are replaced with fresh (unanalyzed)
+        sections. Custom sections (add_section) are always kept. The
+        executive summary is recreated only if a section or its own inputs
+        changed. Names end up in self.reused_sections and
+        self.recomputed_sections.
+        """
+        inputs = self._section_inputs()
+        fingerprints = self._section_fingerprints()
+        self.reused_sections, self.recomputed_sections = [], []
+
+        for index, section in enumerate(self.sections):
+            name = section.section_name
+            if name not in fingerprints or section.input_fingerprint == fingerprints[name]:
+                self.reused_sections.append(name)
+            else:
+                self.sections[index] = self._create_section(name, inputs, fingerprints[name])
+                self.recomputed_sections.append(name)
 
-        # Create regional pricing section (multi-market optimization)
-        regional_pricing_section = RegionalPricingSection("Regional Pricing Optimization", {
-            'game_data': self.game_data
-        })
-        self.add_section(regional_pricing_section)
+        self._create_executive_summary()
 
-        # Create custom dashboard section LAST (tracking tools)
-        dashboard_section = CustomDashboardSection("Custom Tracking Dashboard", {
-            'game_data': self.game_data,
-            'sales_data': self.sales_data,
-            'competitor_data': self.competitor_data
-        })
-        self.add_section(dashboard_section)
+        logger.info(
+            f"Refreshed sections: {len(self.recomputed_sections)} changed, {len(self.reused_sections)} reused"
+            + (f" (changed: {', '.join(self.recomputed_sections)})" if self.recomputed_sections else "")
+        )
 
-        # Create executive summary (references other sections)
-        self.executive_summary = ExecutiveSummarySection({
-            'game_data': self.game_data,
-            'report_type': self.report_type
-        }, all_sections=self.sections)
+    def rebuild(self, game_data: Optional[Dict[str, Any]] = None, sales_data: Optional[Dict[str, Any]] = None,
+                competitor_data: Optional[List[Dict[str, Any]]] = None, report_type: Optional[str] = None,
+                sections: Optional[List[str]] = None) -> str:
+        """
+        Regenerate the report after an edit, recomputing only affected sections
 
-        logger.info(f"Built {len(self.sections)} sections + executive summary")
+        Pass the inputs that were replaced (e.g. refreshed sales data); inputs
+        edited in place are picked up too, since every section's input slice
+        is re-fingerprinted. Unchanged sections reuse their analysis and
+        markdown (see refresh_sections).
 
-    def calculate_overall_score(self) -> int:
-        """Calculate weighted overall score"""
-        if not self.sections:
+        Args:
+            game_data: New game data (None = keep current)
+            sales_data: New sales data (None = keep current)
+            competitor_data: New competitor list (None = keep current)
+            report_type: New report type (None = keep current)
+            sections: Only build and render these sections (None = all)
+
+        Returns:
+            Complete markdown report
+        """
+        if game_data is not None:
+            self.game_data = game_data
+        if sales_data is not None:
+            self.sales_data = sales_data
+        if competitor_data is not None:
+            self.competitor_data = competitor_data
+        if report_type is not None:
+            self.report_type = report_type
+
+        if self.sections:
+            self.refresh_sections()
+        return self.build(sections)
+
+    def get_section(self, name: str) -> ReportSection:
+        """
+        Get a section by name, building it if needed (not analyzed yet)
+
+        Args:
+            name: Section name (standard or added with add_section)
+
+        Returns:
+            The section
+        """
+        for section in self.sections:
+            if section.section_name == name:
+                return section
+        self.build_sections([name])
+        return self.get_section(name)
+
+    def _selected(self, names: Optional[List[str]]) -> List[ReportSection]:
+        """Built sections in report order, limited to names if given"""
+        if names is None:
+            return self.sections
+        return [section for section in self.sections if section.section_name in names]
+
+    def calculate_overall_score(self, names: Optional[List[str]] = None) -> int:
+        """
+        Calculate weighted overall score
+
+        Args:
+            names: Only score these sections (None = every built section)
+        """
+        sections = self._selected(names)
+        if not sections:
             return 0
 
         # Weights for different sections
@@ -2622,7 +2750,7 @@ class ReportBuilder:
         weighted_score = 0
         total_weight = 0
 
-        for section in self.sections:
+        for section in sections:
             weight = weights.get(section.section_name, 0.1)
             weighted_score += section.get_score() * weight
             total_weight += weight
@@ -2632,32 +2760,37 @@ class ReportBuilder:
 
         return self.overall_score
 
-    def build(self) -> str:
+    def build(self, sections: Optional[List[str]] = None) -> str:
         """
         Generate complete report
 
+        Args:
+            sections: Only build and render these sections (None = all)
+
         Returns:
             Complete markdown report
         """
         logger.info("Building complete report")
 
-        # Build all sections if not already built
-        if not self.sections:
+        # Build requested sections (all if none were built yet)
+        if sections is not None:
+            self.build_sections(sections)
+        elif not self.sections:
             self.build_sections()
 
         # Calculate overall score
-        self.calculate_overall_score()
+        self.calculate_overall_score(sections)
 
         # Build report markdown
         report_parts = []
 
         # Add executive summary first
         if self.executive_summary:
-            report_parts.append(self.executive_summary.generate_markdown())
+            report_parts.append(self.executive_summary.get_markdown())
 
         # Add all other sections
-        for section in self.sections:
-            report_parts.append(section.generate_markdown())
+        for section in self._selected(sections):
+            report_parts.append(section.get_markdown())
 
         # Add footer
         report_parts.append(self._generate_footer())
@@ -2720,14 +2853,23 @@ For questions or support: support@publitz.com
 Data accuracy is dependent on third-party API availability and may contain estimates where actual data is unavailable.*
 """
 
-    def get_structured_data(self) -> Dict[str, Any]:
+    def get_structured_data(self, sections: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get structured report data for exports
 
+        Only scores are computed: analyzers run for the listed sections, and
+        no markdown is generated.
+
+        Args:
+            sections: Only include these sections (None = all)
+
         Returns:
             Complete report data as dictionary
         """
-        if not self.sections:
+        if sections is not None:
+            self.build_sections(sections)
+            self.calculate_overall_score(sections)
+        elif not self.sections:
             self.build_sections()
             self.calculate_overall_score()
 
@@ -2743,8 +2885,9 @@ Data accuracy is dependent on third-party API availability and may contain estim
                     'rating': section.get_rating(),
                     'analyzed': section.analyzed
                 }
-                for section in self.sections
-            ]
+                for section in self._selected(sections)
+            ],
+            'reused_sections': self.reused_sections
         }
 
 
@@ -17,6 +17,8 @@ from anthropic import Anthropic
 from pathlib import Path
 
 from config import Config
+from src.llm_gateway import LLMGateway, llm_run
+from src.llm_routing import get_llm_router
 
 
 class ReportGenerator:
@@ -40,6 +42,7 @@ class ReportGenerator:
 
         self.client = Anthropic(api_key=self.api_key)
         self.model = Config.CLAUDE_MODEL
+        self.llm = LLMGateway(self.client, router=get_llm_router())
 
         # Load master prompt template
         self.prompt_template = self._load_prompt_template()
@@ -157,7 +160,8 @@ Provide specific feedback."""
 
         try:
             # Call Claude Vision API
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'asset_vision',
                 model=self.model,
                 max_tokens=1000,
                 messages=[
@@ -269,6 +273,7 @@ Provide specific feedback."""
             # Return embedded default prompt if template file doesn't exist
             return self._get_default_prompt()
 
+    @llm_run
     def generate_full_report(
         self,
         data: Dict[str, Any],
@@ -302,7 +307,8 @@ Provide specific feedback."""
 
         # Call Claude API
         try:
-            response = self.client.messages.create(
+            response = self.llm.create(
+                'audit_report',
                 model=self.model,
                 max_tokens=Config.CLAUDE_MAX_TOKENS,
                 temperature=Config.CLAUDE_TEMPERATURE,
@@ -4,7 +4,7 @@ Report Integration - Combines Enhanced Structured Reports with AI Analysis
 Bridges the new modular report system with existing AI generation
 """
 
-from typing import Dict, List, Any, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import re
 from src.logger import get_logger
 from src.report_builder import ReportBuilder, CommunitySection, InfluencerSection, GlobalReachSection
@@ -454,7 +454,8 @@ def create_report_with_ai(game_data: Dict[str, Any],
                          report_type: str,
                          ai_generator,
                          review_stats: Dict[str, Any] = None,
-                         capsule_analysis: str = None) -> Tuple[str, Dict[str, Any]]:
+                         capsule_analysis: str = None,
+                         on_section: Optional[Callable[[str], None]] = None) -> Tuple[str, Dict[str, Any]]:
     """
     Generate complete report: Structured analysis + AI strategic insights
 
@@ -469,6 +470,8 @@ def create_report_with_ai(game_data: Dict[str, Any],
         ai_generator: AIGenerator instance for strategic analysis
         review_stats: Optional review statistics
         capsule_analysis: Optional capsule image analysis
+        on_section: Optional callback receiving each AI report section as it
+            finishes streaming (see AIGenerator.generate_report_with_audit)
 
     Returns:
         Tuple of (markdown_report, structured_data)
@@ -513,7 +516,8 @@ def create_report_with_ai(game_data: Dict[str, Any],
         review_stats,
         capsule_analysis,
         phase2_data=phase2_data,  # Pass phase2_data to AI generator
-        tier_framework=tier_framework  # NEW: Pass tier framework for adaptive analysis
+        tier_framework=tier_framework,  # NEW: Pass tier framework for adaptive analysis
+        on_section=on_section
     )
 
     # GENERATE DYNAMIC SECTIONS: Executive Summary, Confidence Scorecard, Quick Start
@@ -14,18 +14,23 @@ Usage:
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import threading
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 import re
 
 from src.executive_summary_generator import generate_executive_summary
 from src.roi_calculator import ROICalculator
 from src.comparable_games_analyzer import ComparableGamesAnalyzer
 from src.negative_review_analyzer import NegativeReviewAnalyzer
+from src.review_store import get_review_store
 from src.game_search import GameSearch
 from src.game_analyzer import GameAnalyzer
-from src.api_verifier import APIVerifier, APIStatus
+from src.api_verifier import APICallResult, APIVerifier, APIStatus
+from src.llm_gateway import llm_run
+from src.stage_graph import Stage, StageGraph, format_timings, input_fingerprint
 from src.revenue_based_scoring import (
     classify_revenue_tier,
     apply_revenue_modifier,
@@ -64,6 +69,11 @@ from src.community_analyzer import (
 
 logger = logging.getLogger(__name__)
 
+# Report components generated at once (several wait on Steam or Claude)
+REPORT_COMPONENT_WORKERS = int(os.getenv('REPORT_COMPONENT_WORKERS', 6))
+
+ALL_TIERS = (1, 2, 3, 4)
+
 
 @dataclass
 class ReportMetadata:
@@ -112,6 +122,79 @@ class ReportComponents:
     methodology: Optional[str] = None
 
 
+@dataclass
+class ComponentSpec:
+    """Registry entry for a report component or a derived input shared by several"""
+    name: str    # ReportComponents field (or derived input name)
+    method: str  # ReportOrchestrator method, called with one keyword argument per input
+    inputs: List[str] = field(default_factory=list)  # game_data, tier, score or other entries
+    tiers: Tuple[int, ...] = ALL_TIERS  # Performance tiers that include it
+    condition: Optional[Callable[[Dict[str, Any]], bool]] = None  # Extra check on game_data
+    game_data_keys: Optional[Tuple[str, ...]] = None  # game_data fields it reads (None = all)
+    reads_reviews: bool = False  # Reads the review store (its sync state is part of the input)
+
+
+def _has_review_problems(game_data: Dict[str, Any]) -> bool:
+    return game_data.get('review_score', 100) < 80
+
+
+# Every report component with its inputs and tier eligibility. Entries run
+# concurrently on a pool as soon as their inputs exist; derived inputs are
+# computed once and passed to each component that declares them.
+# game_data_keys lists the fields a component reads, so an edit to one field
+# only regenerates the components that read it (see _component_fingerprints);
+# components that hand game_data to other modules leave it as None.
+# reads_reviews marks components whose output depends on the stored reviews.
+COMPONENT_REGISTRY = [
+    # Derived inputs
+    ComponentSpec('base_score', '_calculate_overall_score', ['game_data']),
+    ComponentSpec('top_actions', '_get_report_actions', ['game_data', 'tier']),
+
+    # Universal components (all tiers)
+    ComponentSpec('executive_summary', '_generate_executive_summary', ['game_data', 'tier', 'score'],
+                  game_data_keys=('review_count', 'review_score', 'revenue', 'genres')),
+    ComponentSpec('confidence_scorecard', '_generate_confidence_scorecard', ['game_data'],
+                  game_data_keys=('review_count', 'owners', 'sales_data', 'genres')),
+    ComponentSpec('quick_start', '_generate_quick_start', ['game_data', 'tier', 'top_actions'],
+                  game_data_keys=()),
+    ComponentSpec('key_metrics_dashboard', '_generate_key_metrics_dashboard', ['game_data', 'score'],
+                  game_data_keys=('review_score', 'review_count', 'owners', 'revenue', 'price')),
+    ComponentSpec('market_positioning', '_generate_market_positioning', ['game_data', 'tier'],
+                  game_data_keys=('review_score', 'owners')),
+    ComponentSpec('comparable_games', '_generate_comparable_games', ['game_data', 'base_score'],
+                  game_data_keys=('app_id', 'name', 'genres', 'price', 'release_date', 'owners',
+                                  'review_count', 'review_score', 'revenue')),
+    ComponentSpec('revenue_performance', '_generate_revenue_performance', ['game_data'],
+                  game_data_keys=('revenue', 'owners', 'price')),
+    ComponentSpec('strategic_recommendations', '_generate_strategic_recommendations', ['game_data', 'tier'],
+                  game_data_keys=()),
+    ComponentSpec('action_plan_30_day', '_generate_action_plan_with_roi', ['game_data', 'tier', 'top_actions'],
+                  game_data_keys=('revenue', 'price', 'owners', 'review_score')),
+    ComponentSpec('community_reach', '_generate_community_reach', ['game_data']),
+    ComponentSpec('methodology', '_generate_methodology'),
+
+    # Crisis/Struggling tiers: Focus on fixing problems
+    ComponentSpec('negative_review_analysis', '_generate_negative_review_analysis', ['game_data'],
+                  tiers=(1, 2), condition=_has_review_problems, game_data_keys=('app_id', 'name'),
+                  reads_reviews=True),
+    ComponentSpec('salvageability_assessment', '_generate_salvageability_assessment',
+                  ['game_data', 'negative_review_analysis'], tiers=(1, 2), condition=_has_review_problems,
+                  game_data_keys=('app_id', 'name', 'review_score'), reads_reviews=True),
+
+    # Solid/Exceptional tiers: Focus on growth
+    ComponentSpec('market_expansion', '_generate_market_expansion', ['game_data'], tiers=(3, 4),
+                  game_data_keys=()),
+    ComponentSpec('dlc_analysis', '_generate_dlc_analysis', ['game_data'], tiers=(3, 4),
+                  game_data_keys=('owners', 'review_score')),
+    ComponentSpec('detailed_competitive', '_generate_detailed_competitive', ['game_data'], tiers=(3, 4),
+                  game_data_keys=()),
+    ComponentSpec('regional_breakdowns', '_generate_regional_breakdowns', ['game_data'], tiers=(3, 4),
+                  game_data_keys=()),
+    ComponentSpec('store_optimization', '_generate_store_optimization', ['game_data'], tiers=(3, 4),
+                  game_data_keys=()),
+]
+
+
 class ReportOrchestrator:
     """
     Master orchestrator for complete tiered report generation.
@@ -120,7 +203,7 @@ class ReportOrchestrator:
     appropriate tiers based on game performance.
     """
 
-    def __init__(self, hourly_rate: float = 50.0, claude_api_key: Optional[str] = None):
+    def __init__(self, hourly_rate: float = 50.0, claude_api_key: Optional[str] = None, review_store=None):
         """
         Initialize orchestrator with all component generators.
 
@@ -128,32 +211,49 @@ class ReportOrchestrator:
             hourly_rate: Developer hourly rate for ROI calculations
             claude_api_key: Optional Claude API key for negative review analysis.
                           If not provided, will try to load from environment.
+            review_store: ReviewStore shared by the review-backed components (None = shared store)
         """
-        import os
-
+        self.review_store = review_store if review_store is not None else get_review_store()
         self.roi_calculator = ROICalculator(hourly_rate=hourly_rate)
         self.comparable_analyzer = ComparableGamesAnalyzer()
 
         # Initialize negative analyzer with API key
         api_key = claude_api_key or os.getenv('ANTHROPIC_API_KEY')
         if api_key:
-            self.negative_analyzer = NegativeReviewAnalyzer(claude_api_key=api_key)
+            self.negative_analyzer = NegativeReviewAnalyzer(claude_api_key=api_key, review_store=self.review_store)
         else:
             logger.warning("No Claude API key provided - negative review analysis will be unavailable")
             self.negative_analyzer = None
 
         self.game_search = GameSearch()
-        self.game_analyzer = GameAnalyzer()
+        self.game_analyzer = GameAnalyzer(review_store=self.review_store)
 
         # Initialize API verifier for tracking data sources
         self.api_verifier = APIVerifier()
 
+        # Per-report memo of comparable-game lookups (price analysis and the
+        # comparable games component share one fetch) and component timings
+        self._comparables_memo: Dict[Tuple, List[Any]] = {}
+        self._memo_lock = threading.Lock()
+        self.component_timings: Dict[str, float] = {}
+
+        # Last output of each component keyed by its input fingerprint, with
+        # the API calls it recorded; kept across reports so a re-run after an
+        # edit only regenerates the components whose inputs changed
+        self._component_cache: Dict[str, Tuple[str, Any, List[APICallResult]]] = {}
+        self.reused_components: List[str] = []
+
         logger.info("Report orchestrator initialized")
 
-    def generate_complete_report(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
+    @llm_run
+    def generate_complete_report(self, game_data: Dict[str, Any], reuse_components: bool = True) -> Dict[str, Any]:
         """
         Assemble complete tiered report based on game performance.
 
+        Re-running after an edit (e.g. one intake-form field or refreshed
+        pricing) regenerates only the components whose inputs changed; the
+        names of reused components are returned in 'reused_components'.
+
         Args:
             game_data: Dict containing all game metrics including:
                 - app_id: Steam app ID
@@ -166,6 +266,9 @@ class ReportOrchestrator:
                 - genres: List of genre tags
                 - release_date: Launch date
                 - sales_data: Optional sales data dict
+            reuse_components: Reuse unchanged components from the previous
+                report (False = regenerate everything, e.g. to refetch
+                comparable games and reviews)
 
         Returns:
             Dict with three report versions and metadata:
@@ -180,8 +283,16 @@ class ReportOrchestrator:
         """
         logger.info(f"Generating complete report for {game_data.get('name', 'Unknown')}")
 
-        # Reset API verifier for this report
+        # Reset API verifier and derived-input memo for this report
         self.api_verifier.reset()
+        self._comparables_memo = {}
+        if not reuse_components:
+            self._component_cache = {}
+
+        # Start review ingestion now so it overlaps the rest of data collection;
+        # the review analyzers later read the synced store
+        if game_data.get('app_id'):
+            self.review_store.prefetch(game_data['app_id'])
 
         # Track data sources used in game_data input
         self._track_input_data_sources(game_data)
@@ -221,13 +332,9 @@ class ReportOrchestrator:
                     app_id = str(game_data.get('app_id', ''))
                     genres = game_data.get('genres', [])
                     if app_id and genres:
-                        comparables = self.comparable_analyzer.find_comparable_games(
-                            target_game_id=app_id,
-                            genre_tags=genres,
-                            price=data_metrics.price_usd,
-                            launch_date=data_metrics.release_date,
-                            owner_count=data_metrics.owner_count,
-                            limit=10
+                        comparables = self._find_comparable_games(
+                            app_id, genres, data_metrics.price_usd,
+                            data_metrics.release_date, data_metrics.owner_count
                         )
                         if comparables:
                             comparable_prices = [g.price for g in comparables if g.price > 0]
@@ -447,7 +554,9 @@ class ReportOrchestrator:
             'tier_3_deepdive': tier_3_report,
             'metadata': metadata,
             'components': components,
-            'api_status': api_status
+            'api_status': api_status,
+            'component_timings': self.component_timings,
+            'reused_components': self.reused_components
         }
 
     def _calculate_overall_score(self, game_data: Dict[str, Any]) -> float:
@@ -542,74 +651,132 @@ class ReportOrchestrator:
         - Detailed competitive analysis
         - Regional breakdowns
         - Store optimization
+
+        Eligibility and inputs come from COMPONENT_REGISTRY. Independent
+        components run concurrently (network/LLM components overlap the CPU
+        ones); per-component durations are kept in self.component_timings.
+        Components whose input fingerprint matches the previous run reuse
+        its output (listed in self.reused_components) and are not re-run;
+        the API calls they recorded then are recorded again for api_status.
         """
         logger.info("Generating report components...")
 
-        # Universal components (all tiers)
-        exec_summary = self._generate_executive_summary(game_data, tier, score)
-        confidence_scorecard = self._generate_confidence_scorecard(game_data)
-        quick_start = self._generate_quick_start(game_data, tier)
-        key_metrics = self._generate_key_metrics_dashboard(game_data, score)
-        market_positioning = self._generate_market_positioning(game_data, tier)
-        comparable_games = self._generate_comparable_games(game_data)
-        revenue_performance = self._generate_revenue_performance(game_data)
-        strategic_recs = self._generate_strategic_recommendations(game_data, tier)
-        action_plan = self._generate_action_plan_with_roi(game_data, tier)
-
-        # Community reach analysis (all tiers) - with generic detection
-        community_reach = self._generate_community_reach(game_data)
-
-        # Tier-specific components
-        negative_review_analysis = None
-        salvageability_assessment = None
-        market_expansion = None
-        dlc_analysis = None
-        detailed_competitive = None
-        regional_breakdowns = None
-        store_optimization = None
-
-        # Crisis/Struggling tiers: Focus on fixing problems
-        if tier <= 2:
-            review_score = game_data.get('review_score', 100)
-            if review_score < 80:
-                logger.info("Generating negative review analysis (struggling game)")
-                negative_review_analysis = self._generate_negative_review_analysis(game_data)
-                salvageability_assessment = self._generate_salvageability_assessment(
-                    game_data, negative_review_analysis
-                )
+        eligible = [
+            spec for spec in COMPONENT_REGISTRY
+            if tier in spec.tiers and (spec.condition is None or spec.condition(game_data))
+        ]
+        reads_reviews = any(spec.reads_reviews for spec in eligible)
+        context = {'game_data': game_data, 'tier': tier, 'score': score}
+        # Only wait for the review sync when a review-backed output could be reused
+        review_state = self._review_state(game_data, sync=any(
+            spec.reads_reviews and spec.name in self._component_cache for spec in eligible
+        )) if reads_reviews else None
+        fingerprints = self._component_fingerprints(eligible, context, review_state)
+        self.reused_components = [
+            spec.name for spec in eligible
+            if self._component_cache.get(spec.name, (None,))[0] == fingerprints[spec.name]
+        ]
+        for name in self.reused_components:
+            context[name] = self._component_cache[name][1]
+            self.api_verifier.replay(self._component_cache[name][2])
+
+        api_calls: Dict[str, List[APICallResult]] = {}
+        graph = StageGraph([Stage(spec.name, self._component_runner(spec, api_calls), spec.inputs)
+                            for spec in eligible])
+        results, timings = graph.run(context, max_workers=REPORT_COMPONENT_WORKERS)
+
+        if reads_reviews:
+            # Key review-backed outputs on the reviews they actually read
+            fingerprints = self._component_fingerprints(eligible, context, self._review_state(game_data))
+        for spec in eligible:
+            calls = api_calls[spec.name] if spec.name in api_calls else self._component_cache[spec.name][2]
+            self._component_cache[spec.name] = (fingerprints[spec.name], results[spec.name], calls)
+
+        if self.reused_components:
+            logger.info(f"Reused {len(self.reused_components)} of {len(eligible)} unchanged components")
+        self.component_timings = format_timings(timings)
+        slowest = sorted(self.component_timings.items(), key=lambda item: item[1], reverse=True)[:3]
+        logger.info("Slowest components: " + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in slowest))
+
+        return ReportComponents(**{
+            component.name: results[component.name]
+            for component in fields(ReportComponents) if component.name in results
+        })
+
+    def _component_runner(
+        self,
+        spec: ComponentSpec,
+        api_calls: Dict[str, List[APICallResult]]
+    ) -> Callable[..., Any]:
+        """Wrap a component's method to collect the API calls it records into api_calls"""
+        method = getattr(self, spec.method)
+
+        def run(**inputs):
+            output, api_calls[spec.name] = self.api_verifier.capture(method, **inputs)
+            return output
+        return run
+
+    def _review_state(self, game_data: Dict[str, Any], sync: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Summarize the stored reviews of the game (what review-backed components read)
 
-        # Solid/Exceptional tiers: Focus on growth
-        if tier >= 3:
-            logger.info("Generating growth components (solid/exceptional game)")
-            market_expansion = self._generate_market_expansion(game_data)
-            dlc_analysis = self._generate_dlc_analysis(game_data)
-            detailed_competitive = self._generate_detailed_competitive(game_data)
-            regional_breakdowns = self._generate_regional_breakdowns(game_data)
-            store_optimization = self._generate_store_optimization(game_data)
-
-        # Methodology (always included in Tier 3)
-        methodology = self._generate_methodology()
-
-        return ReportComponents(
-            executive_summary=exec_summary,
-            confidence_scorecard=confidence_scorecard,
-            quick_start=quick_start,
-            key_metrics_dashboard=key_metrics,
-            market_positioning=market_positioning,
-            comparable_games=comparable_games,
-            revenue_performance=revenue_performance,
-            strategic_recommendations=strategic_recs,
-            action_plan_30_day=action_plan,
-            community_reach=community_reach,
-            negative_review_analysis=negative_review_analysis,
-            salvageability_assessment=salvageability_assessment,
-            market_expansion=market_expansion,
-            dlc_analysis=dlc_analysis,
-            detailed_competitive=detailed_competitive,
-            regional_breakdowns=regional_breakdowns,
-            store_optimization=store_optimization,
-            methodology=methodology
-        )
+        Args:
+            game_data: Game data with app_id
+            sync: Sync the store first (waits for the report's prefetch)
+
+        Returns:
+            Newest review timestamp and review count (None if never synced)
+        """
+        if not game_data.get('app_id'):
+            return None
+        try:
+            if sync:
+                self.review_store.sync(game_data['app_id'])
+            state = self.review_store.sync_state(game_data['app_id'])
+        except Exception as e:
+            logger.warning(f"Could not read review sync state: {e}")
+            return None
+        return state and {key: state.get(key) for key in ('newest_timestamp', 'total_reviews')}
+
+    def _component_fingerprints(
+        self,
+        specs: List[ComponentSpec],
+        context: Dict[str, Any],
+        review_state: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, str]:
+        """
+        Fingerprint each component's input slice
+
+        game_data contributes only the spec's game_data_keys (all of it when
+        None); upstream components contribute their own fingerprints, so a
+        change propagates to everything downstream of it. Components that
+        read reviews also contribute the review store's sync state.
+
+        Args:
+            specs: Eligible registry entries (upstream entries first)
+            context: game_data, tier and score
+            review_state: Sync state of the game's stored reviews (see _review_state)
+
+        Returns:
+            Fingerprint per component name
+        """
+        game_data = context['game_data']
+        whole_game_data = input_fingerprint(game_data)
+        fingerprints: Dict[str, str] = {}
+        for spec in specs:
+            slice_ = {'method': spec.method}
+            for key in spec.inputs:
+                if key in fingerprints:
+                    slice_[key] = fingerprints[key]
+                elif key == 'game_data':
+                    slice_[key] = (whole_game_data if spec.game_data_keys is None
+                                   else {name: game_data.get(name) for name in spec.game_data_keys})
+                else:
+                    slice_[key] = context[key]
+            if spec.reads_reviews:
+                slice_['reviews'] = review_state
+            fingerprints[spec.name] = input_fingerprint(slice_)
+        return fingerprints
 
     def _assemble_executive_brief(
         self,
@@ -835,13 +1002,18 @@ class ReportOrchestrator:
 
         return md
 
-    def _generate_quick_start(self, game_data: Dict[str, Any], tier: int) -> str:
+    def _generate_quick_start(
+        self,
+        game_data: Dict[str, Any],
+        tier: int,
+        top_actions: Optional[List[Dict[str, Any]]] = None
+    ) -> str:
         """Generate Quick Start section with top 3 actions"""
         md = "## Quick Start: Top 3 Actions\n\n"
         md += "*Start here if you only have 30 minutes.*\n\n"
 
         # Generate top ROI actions
-        actions = self._get_top_actions_for_tier(game_data, tier)
+        actions = top_actions if top_actions is not None else self._get_top_actions_for_tier(game_data, tier)
 
         for i, action in enumerate(actions[:3], 1):
             md += f"### {i}. {action['name']}\n\n"
@@ -910,7 +1082,7 @@ class ReportOrchestrator:
 
         return md
 
-    def _generate_comparable_games(self, game_data: Dict[str, Any]) -> str:
+    def _generate_comparable_games(self, game_data: Dict[str, Any], base_score: Optional[float] = None) -> str:
         """Generate comparable games analysis"""
         try:
             # Use the comparable games analyzer
@@ -930,14 +1102,7 @@ class ReportOrchestrator:
 
             # Track API call attempt
             try:
-                comparable_games = self.comparable_analyzer.find_comparable_games(
-                    target_game_id=app_id,
-                    genre_tags=genres,
-                    price=price,
-                    launch_date=release_date,
-                    owner_count=owners,
-                    limit=10
-                )
+                comparable_games = self._find_comparable_games(app_id, genres, price, release_date, owners)
 
                 if comparable_games:
                     self.api_verifier.record_success(
@@ -968,7 +1133,7 @@ class ReportOrchestrator:
             md += "|------|-------|---------|--------------|---------------------|\n"
 
             # Add target game
-            target_score = self._calculate_overall_score(game_data)
+            target_score = base_score if base_score is not None else self._calculate_overall_score(game_data)
             md += f"| **{game_data.get('name', 'Your Game')}** | **{target_score:.0f}/100** | "
             md += f"**{game_data.get('review_count', 0):,} ({game_data.get('review_score', 0):.0f}%)** | "
             md += f"**${game_data.get('revenue', 0):,.0f}** | Your baseline |\n"
@@ -1050,13 +1215,18 @@ class ReportOrchestrator:
 
         return md
 
-    def _generate_action_plan_with_roi(self, game_data: Dict[str, Any], tier: int) -> str:
+    def _generate_action_plan_with_roi(
+        self,
+        game_data: Dict[str, Any],
+        tier: int,
+        top_actions: Optional[List[Dict[str, Any]]] = None
+    ) -> str:
         """Generate 30-day action plan with ROI calculations"""
         md = "## 30-Day Action Plan with ROI\n\n"
         md += "*Prioritized by ROI and quick wins*\n\n"
 
         # Get tier-appropriate actions
-        actions = self._get_top_actions_for_tier(game_data, tier, limit=7)
+        actions = top_actions if top_actions is not None else self._get_report_actions(game_data, tier)
 
         # Generate ROI calculations
         roi_calcs = []
@@ -1144,7 +1314,7 @@ class ReportOrchestrator:
 
             # Track Claude API call for categorization
             try:
-                categorization = self.negative_analyzer.categorize_complaints(reviews, game_name)
+                categorization = self.negative_analyzer.categorize_complaints(reviews, game_name, app_id=app_id)
 
                 self.api_verifier.record_success(
                     "Claude API",
@@ -1173,11 +1343,11 @@ class ReportOrchestrator:
     def _generate_salvageability_assessment(
         self,
         game_data: Dict[str, Any],
-        negative_analysis: Optional[str]
+        negative_review_analysis: Optional[str]
     ) -> str:
         """Generate salvageability assessment for struggling games"""
         try:
-            if not negative_analysis or negative_analysis.startswith("*"):
+            if not negative_review_analysis or negative_review_analysis.startswith("*"):
                 return "*Salvageability assessment unavailable*"
 
             if not self.negative_analyzer:
@@ -1191,10 +1361,11 @@ class ReportOrchestrator:
             game_name = game_data.get('name', 'Unknown')
             review_score = game_data.get('review_score', 0)
 
-            # Fetch negative reviews again (could cache this)
+            # Same sample from the local review store (no new Steam pages); the
+            # categorization is served from the complaint cache
             # Note: This is already tracked in _generate_negative_review_analysis
             reviews = self.negative_analyzer.fetch_negative_reviews(app_id, count=100)
-            categorization = self.negative_analyzer.categorize_complaints(reviews, game_name)
+            categorization = self.negative_analyzer.categorize_complaints(reviews, game_name, app_id=app_id)
 
             # Track Claude API call for salvageability assessment
             try:
@@ -1382,6 +1553,38 @@ class ReportOrchestrator:
     # HELPER METHODS
     # ========================================================================
 
+    def _find_comparable_games(
+        self,
+        app_id: str,
+        genres: List[str],
+        price: float,
+        launch_date: Any,
+        owners: int
+    ) -> List[Any]:
+        """
+        Comparable games for this report, fetched once per distinct query
+
+        Price analysis and the comparable games component ask for the same
+        list; the first lookup is memoized until the next report. Failed
+        lookups raise and are not memoized.
+        """
+        key = (str(app_id), tuple(genres), float(price or 0), str(launch_date), int(owners or 0))
+        with self._memo_lock:
+            if key not in self._comparables_memo:
+                self._comparables_memo[key] = self.comparable_analyzer.find_comparable_games(
+                    target_game_id=app_id,
+                    genre_tags=genres,
+                    price=price,
+                    launch_date=launch_date,
+                    owner_count=owners,
+                    limit=10
+                )
+            return self._comparables_memo[key]
+
+    def _get_report_actions(self, game_data: Dict[str, Any], tier: int) -> List[Dict[str, Any]]:
+        """Tier actions shared by the quick start (top 3) and the action plan"""
+        return self._get_top_actions_for_tier(game_data, tier, limit=7)
+
     def _get_top_actions_for_tier(
         self,
         game_data: Dict[str, Any],
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Report Run Store - Persisted inputs and stage outputs of each report run
+
+generate_report_with_audit saves its inputs and every stage output (draft,
+each audit pass, enhanced report, final report) under
+.cache/report_runs/<run_id>/ as they complete. AIGenerator.rerun_report_stage
+loads a run and re-executes only one named stage and its downstream
+dependents, reusing everything else, so iterating on one pass takes one or
+two LLM calls instead of the full chain.
+
+Layout:
+    .cache/report_runs/<run_id>/run.json           run_id, created, meta
+    .cache/report_runs/<run_id>/inputs.json        generate_report_with_audit inputs
+    .cache/report_runs/<run_id>/stages/<name>.json stage output
+
+Values are stored as JSON; dataclass values (e.g. the tier StrategicFramework)
+are tagged with their class and rebuilt on load.
+"""
+
+import dataclasses
+import importlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_REPORT_RUN_DIR = Path(".cache") / "report_runs"
+
+# Most recent runs kept on disk
+REPORT_RUN_KEEP = int(os.getenv('REPORT_RUN_KEEP', 50))
+
+_DATACLASS_TAG = '__dataclass__'
+
+
+def _encode(value: Any) -> Any:
+    """json.dumps default: tag dataclasses, stringify anything else unknown"""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        cls = type(value)
+        return {
+            _DATACLASS_TAG: f"{cls.__module__}.{cls.__qualname__}",
+            'fields': {f.name: getattr(value, f.name) for f in dataclasses.fields(value)},
+        }
+    return str(value)
+
+
+def _decode(obj: Dict[str, Any]) -> Any:
+    """json.load object_hook: rebuild tagged dataclasses"""
+    if _DATACLASS_TAG in obj and set(obj) == {_DATACLASS_TAG, 'fields'}:
+        module_name, _, class_name = obj[_DATACLASS_TAG].rpartition('.')
+        try:
+            cls = getattr(importlib.import_module(module_name), class_name)
+            return cls(**obj['fields'])
+        except (ImportError, AttributeError, TypeError) as e:
+            logger.warning(f"Could not rebuild {obj[_DATACLASS_TAG]}: {e}")
+            return obj['fields']
+    return obj
+
+
+class ReportRunStore:
+    """
+    Directory of persisted report runs
+
+    Usage:
+        store = ReportRunStore()
+        store.start_run(run_id, inputs)
+        store.save_stage(run_id, 'draft_report', draft)
+        run = store.load_run(run_id)  # {'run_id', 'meta', 'inputs', 'stages'}
+    """
+
+    def __init__(self, base_dir: Union[str, Path] = DEFAULT_REPORT_RUN_DIR, keep: int = REPORT_RUN_KEEP):
+        """
+        Initialize store
+
+        Args:
+            base_dir: Directory holding one subdirectory per run
+            keep: Number of most recent runs kept (older runs are pruned)
+        """
+        self.base_dir = Path(base_dir)
+        self.keep = keep
+
+    def _run_dir(self, run_id: str) -> Path:
+        return self.base_dir / run_id
+
+    def _write(self, path: Path, payload: Dict[str, Any]):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(payload, f, default=_encode)
+        tmp_path.replace(path)
+
+    def _read(self, path: Path) -> Dict[str, Any]:
+        with open(path, 'r') as f:
+            return json.load(f, object_hook=_decode)
+
+    def start_run(self, run_id: str, inputs: Dict[str, Any], meta: Optional[Dict[str, Any]] = None):
+        """
+        Create a run and save its inputs
+
+        Args:
+            run_id: Run identifier
+            inputs: Report inputs (game_data, sales_data, ...)
+            meta: Extra run metadata (e.g. rerun_of)
+        """
+        try:
+            self._write(self._run_dir(run_id) / 'run.json',
+                        {'run_id': run_id, 'created': time.time(), 'meta': meta or {}})
+            self._write(self._run_dir(run_id) / 'inputs.json', inputs)
+            self._prune()
+        except (TypeError, ValueError, OSError) as e:
+            logger.warning(f"Report run {run_id}: could not save inputs: {e}")
+
+    def save_stage(self, run_id: str, stage: str, output: Any):
+        """
+        Save one stage output (failures are logged, never raised)
+
+        Args:
+            run_id: Run identifier
+            stage: Stage name
+            output: Stage output
+        """
+        try:
+            self._write(self._run_dir(run_id) / 'stages' / f"{stage}.json",
+                        {'stage': stage, 'saved': time.time(), 'output': output})
+        except (TypeError, ValueError, OSError) as e:
+            logger.warning(f"Report run {run_id}: could not save stage {stage}: {e}")
+
+    def load_run(self, run_id: str) -> Dict[str, Any]:
+        """
+        Load a run
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            Dictionary with run_id, meta, inputs and stages ({name: output})
+
+        Raises:
+            FileNotFoundError: If the run or its inputs were not saved
+        """
+        run_dir = self._run_dir(run_id)
+        if not (run_dir / 'inputs.json').exists():
+            raise FileNotFoundError(f"No saved report run: {run_id}")
+
+        info = self._read(run_dir / 'run.json')
+        stages = {}
+        for path in sorted((run_dir / 'stages').glob('*.json')):
+            entry = self._read(path)
+            stages[entry['stage']] = entry['output']
+
+        return {
+            'run_id': run_id,
+            'meta': info.get('meta', {}),
+            'inputs': self._read(run_dir / 'inputs.json'),
+            'stages': stages,
+        }
+
+    def list_runs(self) -> List[Dict[str, Any]]:
+        """
+        List saved runs
+
+        Returns:
+            run.json contents, newest first
+        """
+        runs = []
+        if not self.base_dir.exists():
+            return runs
+        for path in self.base_dir.glob('*/run.json'):
+            try:
+                runs.append(self._read(path))
+            except (json.JSONDecodeError, OSError):
+                continue
+        return sorted(runs, key=lambda run: run.get('created', 0), reverse=True)
+
+    def latest_run_id(self) -> Optional[str]:
+        """Get the most recent run ID (None if there are no runs)"""
+        runs = self.list_runs()
+        return runs[0]['run_id'] if runs else None
+
+    def _prune(self):
+        for run in self.list_runs()[self.keep:]:
+            shutil.rmtree(self._run_dir(run['run_id']), ignore_errors=True)
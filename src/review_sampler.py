@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Review Sampler - Near-duplicate removal and cluster-stratified review samples
+
+Review samples used to be "the first N recent reviews of 50+ characters", so
+copy-paste reviews and near-identical complaints filled the prompt budget
+while rarer topics were missed. The sampler builds a sample that covers the
+pool instead:
+
+1. Dedupe: 64-bit SimHash over review words; reviews within a small Hamming
+   distance of an already kept (more helpful) review are dropped. Band
+   bucketing keeps this near-linear.
+2. Cluster: hashed TF-IDF vectors (no numpy needed) grouped with a few rounds
+   of seeded spherical k-means.
+3. Stratify: every cluster gets at least one review, the rest is split by
+   cluster size; inside a cluster the most helpful, longest-played reviews win.
+
+Usage:
+    pool = store.reviews(app_id, voted_up=False, min_length=50, limit=REVIEW_SAMPLE_POOL)
+    sample = sample_reviews(pool, 100)
+"""
+
+import hashlib
+import math
+import os
+import random
+import re
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Reviews loaded from the store before deduping and sampling
+REVIEW_SAMPLE_POOL = int(os.getenv('REVIEW_SAMPLE_POOL', 1000))
+
+# Reviews whose SimHashes differ in at most this many bits are near-duplicates
+# (one-word edits of a short review land around 3-8 bits, unrelated reviews 19+)
+SIMHASH_MAX_DISTANCE = 10
+
+SIMHASH_BITS = 64
+_SIMHASH_BANDS = SIMHASH_MAX_DISTANCE + 1  # Pigeonhole: near-duplicates share a band
+_BAND_BITS = SIMHASH_BITS // _SIMHASH_BANDS
+
+# Hashed vector dimensions and centroid terms kept per cluster
+_VECTOR_DIMENSIONS = 4096
+_CENTROID_TERMS = 64
+_KMEANS_ROUNDS = 6
+
+_WORD = re.compile(r"[a-z0-9']+")
+_STOPWORDS = frozenset(
+    "the and for but not you this that with was are have has had its it's i'm game games just "
+    "all can get from they them one out what when there would about been more very really".split()
+)
+
+
+def _words(text: str) -> List[str]:
+    return _WORD.findall((text or '').lower())
+
+
+def _hash64(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def simhash(text: str, shingle: int = 1) -> int:
+    """
+    64-bit SimHash of a text over words (or word shingles)
+
+    Args:
+        text: Review text
+        shingle: Words per feature (texts shorter than a shingle use their words)
+
+    Returns:
+        Fingerprint; similar texts differ in few bits
+    """
+    words = _words(text)
+    shingles = [' '.join(words[i:i + shingle]) for i in range(len(words) - shingle + 1)] or words
+    weights = [0] * SIMHASH_BITS
+    for token, count in Counter(shingles).items():
+        value = _hash64(token)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def review_weight(review: Dict[str, Any]) -> float:
+    """Helpful votes and playtime at review (store columns), log-damped"""
+    votes = review.get('votes_up', review.get('votes_helpful', 0)) or 0
+    playtime_hours = (review.get('playtime_at_review') or review.get('playtime_forever') or 0) / 60
+    return (1 + math.log1p(votes)) * (1 + math.log1p(playtime_hours))
+
+
+def dedupe_reviews(
+    reviews: Iterable[Dict[str, Any]],
+    text_key: str = 'review',
+    max_distance: int = SIMHASH_MAX_DISTANCE,
+    weight: Callable[[Dict[str, Any]], float] = review_weight
+) -> List[Dict[str, Any]]:
+    """
+    Drop near-duplicate reviews, keeping the highest-weight copy
+
+    Args:
+        reviews: Review dictionaries
+        text_key: Key holding the review text
+        max_distance: SimHash bits two reviews may differ in and still be duplicates
+        weight: Which copy to keep (highest wins)
+
+    Returns:
+        Distinct reviews, highest weight first
+    """
+    band_mask = (1 << _BAND_BITS) - 1
+    buckets: Dict[tuple, List[int]] = defaultdict(list)
+    kept, kept_hashes = [], []
+
+    for review in sorted(reviews, key=weight, reverse=True):
+        fingerprint = simhash(review.get(text_key, ''))
+        bands = [(band, fingerprint >> (band * _BAND_BITS) & band_mask) for band in range(_SIMHASH_BANDS)]
+        if any(
+            bin(fingerprint ^ kept_hashes[index]).count('1') <= max_distance
+            for key in bands for index in buckets[key]
+        ):
+            continue
+        for key in bands:
+            buckets[key].append(len(kept))
+        kept.append(review)
+        kept_hashes.append(fingerprint)
+    return kept
+
+
+def _vectors(texts: List[str]) -> List[Dict[int, float]]:
+    """L2-normalized hashed TF-IDF vectors"""
+    counts = [
+        Counter(_hash64(word) % _VECTOR_DIMENSIONS for word in _words(text)
+                if len(word) > 2 and word not in _STOPWORDS)
+        for text in texts
+    ]
+    document_frequency = Counter(term for terms in counts for term in terms)
+    total = len(texts)
+    vectors = []
+    for terms in counts:
+        vector = {term: (1 + math.log(count)) * math.log((1 + total) / (1 + document_frequency[term]))
+                  for term, count in terms.items()}
+        norm = math.sqrt(sum(value * value for value in vector.values())) or 1.0
+        vectors.append({term: value / norm for term, value in vector.items()})
+    return vectors
+
+
+def _dot(vector: Dict[int, float], centroid: Dict[int, float]) -> float:
+    return sum(value * centroid.get(term, 0.0) for term, value in vector.items())
+
+
+def _nearest(vectors: List[Dict[int, float]], centroids: List[Dict[int, float]]) -> List[int]:
+    """Most similar centroid per vector, via a term -> centroid posting index"""
+    postings: Dict[int, List[tuple]] = defaultdict(list)
+    for index, centroid in enumerate(centroids):
+        for term, value in centroid.items():
+            postings[term].append((index, value))
+
+    nearest = []
+    for vector in vectors:
+        scores: Dict[int, float] = defaultdict(float)
+        for term, value in vector.items():
+            for index, weight in postings.get(term, ()):
+                scores[index] += value * weight
+        nearest.append(max(sorted(scores), key=scores.get) if scores else 0)
+    return nearest
+
+
+def _centroid(members: List[Dict[int, float]]) -> Dict[int, float]:
+    total: Dict[int, float] = defaultdict(float)
+    for vector in members:
+        for term, value in vector.items():
+            total[term] += value
+    top = sorted(total.items(), key=lambda item: item[1], reverse=True)[:_CENTROID_TERMS]
+    norm = math.sqrt(sum(value * value for _, value in top)) or 1.0
+    return {term: value / norm for term, value in top}
+
+
+def cluster_reviews(texts: List[str], clusters: int, seed: int = 0) -> List[int]:
+    """
+    Group texts with spherical k-means over hashed TF-IDF vectors
+
+    Args:
+        texts: Review texts
+        clusters: Number of clusters (capped at len(texts))
+        seed: Seed for the k-means++ initialization (same input, same clusters)
+
+    Returns:
+        Cluster index per text
+    """
+    vectors = _vectors(texts)
+    clusters = max(1, min(clusters, len(vectors)))
+    if clusters == 1:
+        return [0] * len(vectors)
+
+    # k-means++ initialization: spread seeds across dissimilar reviews
+    rng = random.Random(seed)
+    centroids = [vectors[rng.randrange(len(vectors))]]
+    distance = [1.0 - _dot(vector, centroids[0]) for vector in vectors]
+    while len(centroids) < clusters:
+        total = sum(distance)
+        if total <= 0:
+            break
+        target, index = rng.uniform(0, total), 0
+        while index < len(distance) - 1 and target > distance[index]:
+            target -= distance[index]
+            index += 1
+        centroids.append(vectors[index])
+        distance = [min(old, 1.0 - _dot(vector, vectors[index])) for old, vector in zip(distance, vectors)]
+
+    assignment = None
+    for _ in range(_KMEANS_ROUNDS):
+        updated = _nearest(vectors, centroids)
+        if updated == assignment:
+            break
+        assignment = updated
+        members = defaultdict(list)
+        for vector, cluster in zip(vectors, assignment):
+            members[cluster].append(vector)
+        centroids = [_centroid(members[c]) if members[c] else centroids[c] for c in range(len(centroids))]
+    return assignment
+
+
+def sample_reviews(
+    reviews: Iterable[Dict[str, Any]],
+    size: int,
+    text_key: str = 'review',
+    clusters: Optional[int] = None,
+    weight: Callable[[Dict[str, Any]], float] = review_weight
+) -> List[Dict[str, Any]]:
+    """
+    Deduped, cluster-stratified sample of reviews
+
+    Args:
+        reviews: Review pool (e.g. ReviewStore.reviews rows)
+        size: Reviews to return
+        text_key: Key holding the review text
+        clusters: Number of clusters (None = about sqrt of the pool, at most size // 2)
+        weight: Preference inside a cluster (helpful votes and playtime by default)
+
+    Returns:
+        Up to size reviews covering every cluster, highest weight first
+    """
+    distinct = dedupe_reviews(reviews, text_key=text_key, weight=weight)
+    if len(distinct) <= size:
+        return distinct
+
+    if clusters is None:
+        clusters = min(max(1, size // 2), int(math.sqrt(len(distinct))))
+    assignment = cluster_reviews([review.get(text_key, '') for review in distinct], clusters)
+
+    members: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    for review, cluster in zip(distinct, assignment):
+        members[cluster].append(review)  # Already highest weight first
+
+    # One review per cluster, the remainder proportional to cluster size (largest remainder)
+    quota = {cluster: 1 for cluster in members}
+    remaining = size - len(quota)
+    if remaining > 0:
+        shares = {cluster: remaining * len(group) / len(distinct) for cluster, group in members.items()}
+        for cluster, share in shares.items():
+            quota[cluster] += int(share)
+        leftover = size - sum(quota.values())
+        for cluster in sorted(shares, key=lambda c: shares[c] - int(shares[c]), reverse=True)[:leftover]:
+            quota[cluster] += 1
+
+    sample, spill = [], []
+    for cluster, group in members.items():
+        sample.extend(group[:quota[cluster]])
+        spill.extend(group[quota[cluster]:])
+    # Clusters smaller than their quota leave room for the next-best reviews
+    sample.extend(sorted(spill, key=weight, reverse=True)[:size - len(sample)])
+    return sorted(sample[:size], key=weight, reverse=True)
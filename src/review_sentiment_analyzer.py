@@ -2,18 +2,23 @@
 """
 Review Sentiment Analyzer - Samples and analyzes actual Steam reviews
 
-Replaces estimated sentiment percentages with real data from Steam reviews
-analyzed using Claude API for accurate theme categorization.
+Replaces estimated sentiment percentages with real data from Steam reviews.
+Themes are counted locally over every stored review (src/review_themes.py);
+Claude API picks representative quotes.
 """
 
-import requests
 import random
 import json
 import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from src.logger import get_logger
 from src.cache_manager import CacheManager
+from src.llm_gateway import LLMGateway, llm_run
+from src.llm_routing import get_llm_router
+from src.review_sampler import REVIEW_SAMPLE_POOL, sample_reviews
+from src.review_store import get_review_store, review_sample_fingerprint
+from src.review_themes import NEGATIVE_THEMES, POSITIVE_THEMES, ReviewThemeClassifier
 
 logger = get_logger(__name__)
 cache = CacheManager()
@@ -22,14 +27,16 @@ cache = CacheManager()
 class ReviewSentimentAnalyzer:
     """Analyzes Steam review sentiment using Claude API"""
 
-    def __init__(self, anthropic_api_key: Optional[str] = None):
+    def __init__(self, anthropic_api_key: Optional[str] = None, review_store=None):
         """
         Initialize analyzer with API credentials
 
         Args:
             anthropic_api_key: Anthropic API key (reads from env if not provided)
+            review_store: ReviewStore to sample from (None = shared store)
         """
         self.api_key = anthropic_api_key or os.getenv('ANTHROPIC_API_KEY')
+        self.review_store = review_store if review_store is not None else get_review_store()
         if not self.api_key:
             logger.warning("No Anthropic API key found - sentiment analysis will be limited")
 
@@ -42,6 +49,8 @@ class ReviewSentimentAnalyzer:
         """
         Fetch random sample of Steam reviews
 
+        Syncs new reviews into the local review store, then samples from it.
+
         Args:
             app_id: Steam app ID
             sample_size: Total reviews to fetch (split between positive/negative)
@@ -52,18 +61,11 @@ class ReviewSentimentAnalyzer:
         """
         logger.info(f"Fetching {sample_size} Steam reviews for app {app_id}")
 
-        # Check cache first (24-hour freshness)
-        cache_key = f"{app_id}_{sample_size}_{language}"
-        cached_reviews = cache.get('review_samples', cache_key, ttl_hours=24)
-        if cached_reviews:
-            logger.info("Using cached review samples")
-            return cached_reviews
-
         reviews = {'positive': [], 'negative': []}
 
         try:
-            # Steam Review API endpoint
-            base_url = "https://store.steampowered.com/appreviews/"
+            # One incremental sync serves both review types
+            self.review_store.sync(app_id, language)
 
             # Fetch positive reviews (sample_size/2)
             positive_count = sample_size // 2
@@ -81,9 +83,6 @@ class ReviewSentimentAnalyzer:
 
             logger.info(f"Fetched {len(positive_reviews)} positive, {len(negative_reviews)} negative reviews")
 
-            # Cache results
-            cache.set('review_samples', cache_key, reviews)
-
             return reviews
 
         except Exception as e:
@@ -98,7 +97,7 @@ class ReviewSentimentAnalyzer:
         language: str
     ) -> List[str]:
         """
-        Fetch reviews of specific type (positive/negative)
+        Sample stored reviews of specific type (positive/negative)
 
         Args:
             app_id: Steam app ID
@@ -107,151 +106,92 @@ class ReviewSentimentAnalyzer:
             language: Language filter
 
         Returns:
-            List of review texts
+            List of review texts: near-duplicates removed, stratified across
+            topic clusters, most helpful first
         """
-        reviews = []
-        cursor = '*'
-        attempts = 0
-        max_attempts = 5
-
-        while len(reviews) < count and attempts < max_attempts:
-            try:
-                url = f"https://store.steampowered.com/appreviews/{app_id}"
-                params = {
-                    'json': 1,
-                    'filter': 'recent',
-                    'language': language,
-                    'review_type': review_type,
-                    'purchase_type': 'all',
-                    'num_per_page': 100,
-                    'cursor': cursor
-                }
-
-                response = requests.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-
-                if not data.get('success'):
-                    logger.warning(f"Steam API returned success=false for {review_type} reviews")
-                    break
-
-                review_list = data.get('reviews', [])
-                if not review_list:
-                    break
-
-                # Extract review text
-                for review in review_list:
-                    if len(reviews) >= count:
-                        break
-
-                    review_text = review.get('review', '').strip()
-                    # Filter out very short reviews (less than 50 chars)
-                    if len(review_text) >= 50:
-                        reviews.append(review_text)
-
-                # Get next cursor for pagination
-                cursor = data.get('cursor')
-                if not cursor or cursor == '*':
-                    break
-
-                attempts += 1
-
-            except Exception as e:
-                logger.error(f"Error fetching {review_type} reviews (attempt {attempts}): {e}")
-                attempts += 1
-                continue
-
-        return reviews
-
+        pool = self.review_store.reviews(
+            app_id,
+            voted_up=review_type == 'positive',
+            language=language,
+            min_length=50,  # Filter out very short reviews
+            limit=REVIEW_SAMPLE_POOL
+        )
+        return [row['review'] for row in sample_reviews(pool, count)]
+
+    @llm_run
     def analyze_review_sentiment(
         self,
-        reviews: Dict[str, List[str]]
+        reviews: Dict[str, List[str]],
+        app_id: Optional[int] = None,
+        language: str = 'english'
     ) -> Dict[str, Any]:
         """
-        Analyze review sentiment using Claude API
+        Analyze review sentiment: local theme statistics, Claude-picked quotes
+
+        Theme counts and percentages come from ReviewThemeClassifier over every
+        stored review of the app (or over `reviews` when the store has none).
+        Quote candidates are ranked within `reviews` (the stratified samples
+        from fetch_steam_reviews); Claude only sees the top candidates per
+        theme and picks the representative quotes.
 
         Args:
-            reviews: Dict with 'positive' and 'negative' review lists
+            reviews: Dict with 'positive' and 'negative' review lists (quote candidates)
+            app_id: Steam app ID whose stored corpus to classify (None = sample only)
+            language: Review language of the stored corpus
 
         Returns:
             Structured sentiment analysis data
         """
-        if not self.api_key:
-            logger.warning("No API key - returning fallback sentiment data")
+        corpus, fingerprint = self._review_corpus(reviews, app_id, language)
+        if not corpus['positive'] and not corpus['negative']:
+            if not self.api_key:
+                logger.warning("No API key - returning fallback sentiment data")
             return self._get_fallback_sentiment()
 
-        logger.info("Analyzing review sentiment with Claude API")
-
-        # Check cache first (24-hour freshness)
-        cache_key = f"sentiment_{hash(str(reviews))}"
+        # Check cache first (24-hour freshness); the key is stable across processes
+        cache_key = f"sentiment_{fingerprint}"
         cached_sentiment = cache.get('sentiment_analysis', cache_key, ttl_hours=24)
         if cached_sentiment:
             logger.info("Using cached sentiment analysis")
             return cached_sentiment
 
-        try:
-            import anthropic
+        sentiment_data, candidates = self._classify_themes(corpus, reviews)
 
-            client = anthropic.Anthropic(api_key=self.api_key)
+        if not self.api_key:
+            logger.warning("No API key - using locally ranked quotes")
+            self._apply_quotes(sentiment_data, candidates, {})
+            return sentiment_data
 
-            # Prepare review samples for analysis (limit to prevent token overflow)
-            positive_sample = reviews.get('positive', [])[:100]
-            negative_sample = reviews.get('negative', [])[:100]
+        logger.info("Selecting representative review quotes with Claude API")
 
-            prompt = f"""Analyze these Steam game reviews and categorize sentiment into themes.
+        try:
+            import anthropic
 
-POSITIVE REVIEWS ({len(positive_sample)} samples):
-{json.dumps(positive_sample[:50], indent=2)}
+            llm = LLMGateway(anthropic.Anthropic(api_key=self.api_key), router=get_llm_router())
 
-NEGATIVE REVIEWS ({len(negative_sample)} samples):
-{json.dumps(negative_sample[:50], indent=2)}
+            prompt = f"""These Steam reviews were already classified into themes. For each theme, pick the 2-3 most representative SHORT quotes (max 100 chars each, exact wording from the candidates; trim to the relevant sentence).
 
-For POSITIVE reviews, categorize into these themes:
-- Gameplay Loop (combat, progression, core mechanics)
-- Narrative/Characters (story, dialogue, worldbuilding, writing)
-- Art & Audio (visuals, graphics, music, voice acting, atmosphere)
-- Progression Systems (meta-progression, unlocks, upgrades, builds)
-- Replayability (variety, build diversity, randomization, longevity)
-- Polish & Technical (performance, optimization, QOL features, UI/UX)
+THEME STATISTICS ({sentiment_data['sample_size']['positive']} positive, {sentiment_data['sample_size']['negative']} negative reviews):
+{json.dumps(self._theme_counts(sentiment_data), indent=2)}
 
-For NEGATIVE reviews, categorize into these themes:
-- Technical Issues (bugs, crashes, performance, compatibility)
-- Difficulty Balance (too hard, too easy, frustrating mechanics)
-- Content Volume (not enough content, repetitive, lacks variety)
-- Price Sensitivity (too expensive, not worth price, better alternatives)
-- Comparison Issues (worse than predecessor, doesn't match competitors)
-- Design Choices (controversial mechanics, unwanted changes, missing features)
+QUOTE CANDIDATES PER THEME:
+{json.dumps(candidates, indent=2)}
 
 Return a JSON object with this EXACT structure:
 {{
-    "positive_themes": {{
-        "gameplay_loop": {{"count": X, "percentage": Y, "example_quotes": ["quote1", "quote2"]}},
-        "narrative_characters": {{"count": X, "percentage": Y, "example_quotes": ["quote1", "quote2"]}},
-        "art_audio": {{"count": X, "percentage": Y, "example_quotes": ["quote1", "quote2"]}},
-        "progression_systems": {{"count": X, "percentage": Y, "example_quotes": ["quote1", "quote2"]}},
-        "replayability": {{"count": X, "percentage": Y, "example_quotes": ["quote1", "quote2"]}},
-        "polish_technical": {{"count": X, "percentage": Y, "example_quotes": ["quote1", "quote2"]}}
-    }},
-    "negative_themes": {{
-        "technical_issues": {{"count": X, "percentage": Y, "example_quotes": ["quote1", "quote2"]}},
-        "difficulty_balance": {{"count": X, "percentage": Y, "example_quotes": ["quote1", "quote2"]}},
-        "content_volume": {{"count": X, "percentage": Y, "example_quotes": ["quote1", "quote2"]}},
-        "price_sensitivity": {{"count": X, "percentage": Y, "example_quotes": ["quote1", "quote2"]}},
-        "comparison_issues": {{"count": X, "percentage": Y, "example_quotes": ["quote1", "quote2"]}},
-        "design_choices": {{"count": X, "percentage": Y, "example_quotes": ["quote1", "quote2"]}}
-    }},
-    "sample_size": {{"positive": {len(positive_sample)}, "negative": {len(negative_sample)}}},
-    "confidence": "high"
+    "positive_themes": {{"<theme>": ["quote1", "quote2"], ...}},
+    "negative_themes": {{"<theme>": ["quote1", "quote2"], ...}},
+    "summary": "2-3 sentences on what players love and what they complain about"
 }}
 
-Percentage should be % of reviews in that sentiment category that mention this theme.
-Include 2-3 SHORT representative quotes (max 100 chars each) per theme.
+Skip candidates that don't actually speak to the theme; return an empty list when none do.
 Only return the JSON object, no other text."""
 
-            response = client.messages.create(
+            response = llm.create(
+                'review_sentiment',
                 model="claude-3-5-sonnet-20241022",
-                max_tokens=4000,
-                temperature=0.3,  # Lower temperature for more consistent categorization
+                max_tokens=2000,
+                temperature=0.3,  # Lower temperature for more consistent quote selection
                 messages=[{"role": "user", "content": prompt}]
             )
 
@@ -266,11 +206,10 @@ Only return the JSON object, no other text."""
                     response_text = response_text[4:]
                 response_text = response_text.strip()
 
-            sentiment_data = json.loads(response_text)
-
-            # Add metadata
-            sentiment_data['analyzed_at'] = datetime.now().isoformat()
-            sentiment_data['total_reviews'] = len(positive_sample) + len(negative_sample)
+            selection = json.loads(response_text)
+            self._apply_quotes(sentiment_data, candidates, selection)
+            if selection.get('summary'):
+                sentiment_data['summary'] = selection['summary']
 
             # Cache results
             cache.set('sentiment_analysis', cache_key, sentiment_data)
@@ -279,9 +218,89 @@ Only return the JSON object, no other text."""
             return sentiment_data
 
         except Exception as e:
-            logger.error(f"Error analyzing sentiment with Claude API: {e}")
+            logger.error(f"Error selecting quotes with Claude API: {e}")
             logger.exception("Full traceback:")
-            return self._get_fallback_sentiment()
+            self._apply_quotes(sentiment_data, candidates, {})
+            return sentiment_data
+
+    def _review_corpus(
+        self,
+        reviews: Dict[str, List[str]],
+        app_id: Optional[int],
+        language: str
+    ) -> Tuple[Dict[str, List[str]], str]:
+        """
+        Review texts to classify and their fingerprint
+
+        Returns:
+            ({'positive': texts, 'negative': texts}, fingerprint of corpus and
+            sample) - the full stored corpus when available, else the given sample
+        """
+        sample = {key: list(reviews.get(key, [])) for key in ('positive', 'negative')}
+        if app_id is not None and self.review_store.count(app_id, language=language):
+            rows = {
+                key: self.review_store.reviews(app_id, voted_up=key == 'positive', language=language)
+                for key in ('positive', 'negative')
+            }
+            corpus = {key: [row['review'] for row in key_rows] for key, key_rows in rows.items()}
+            return corpus, review_sample_fingerprint(dict(rows, **{f'sample_{key}': sample[key] for key in sample}))
+
+        return sample, review_sample_fingerprint(sample)
+
+    @staticmethod
+    def _classify_themes(
+        corpus: Dict[str, List[str]],
+        sample: Optional[Dict[str, List[str]]] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Theme statistics over the whole corpus, quote candidates from the sample (None = corpus)
+
+        Returns:
+            (sentiment_data without quotes, {'positive_themes'/'negative_themes': {theme: candidates}})
+        """
+        sentiment_data = {'sample_size': {}, 'method': 'local_themes'}
+        candidates = {}
+        for key, themes in (('positive', POSITIVE_THEMES), ('negative', NEGATIVE_THEMES)):
+            stats = ReviewThemeClassifier(themes).classify(
+                corpus[key], candidates_from=(sample or {}).get(key) or None
+            )
+            sentiment_data[f'{key}_themes'] = {
+                theme: {'count': data['count'], 'percentage': data['percentage'], 'example_quotes': []}
+                for theme, data in stats.items()
+            }
+            candidates[f'{key}_themes'] = {
+                theme: [text[:300] for text in data['candidates']]
+                for theme, data in stats.items() if data['candidates']
+            }
+            sentiment_data['sample_size'][key] = len(corpus[key])
+
+        total = len(corpus['positive']) + len(corpus['negative'])
+        sentiment_data['confidence'] = 'high' if total >= 100 else 'medium'
+        sentiment_data['analyzed_at'] = datetime.now().isoformat()
+        sentiment_data['total_reviews'] = total
+        return sentiment_data, candidates
+
+    @staticmethod
+    def _theme_counts(sentiment_data: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+        """Compact {group: {theme: 'count (pct%)'}} view for the prompt"""
+        return {
+            group: {theme: f"{data['count']} ({data['percentage']}%)" for theme, data in sentiment_data[group].items()}
+            for group in ('positive_themes', 'negative_themes')
+        }
+
+    @staticmethod
+    def _apply_quotes(
+        sentiment_data: Dict[str, Any],
+        candidates: Dict[str, Any],
+        selection: Dict[str, Any]
+    ) -> None:
+        """Fill example_quotes from Claude's selection, else the top local candidates"""
+        for group in ('positive_themes', 'negative_themes'):
+            for theme, data in sentiment_data[group].items():
+                quotes = (selection.get(group) or {}).get(theme)
+                if not isinstance(quotes, list):
+                    quotes = [text[:100] for text in candidates[group].get(theme, [])[:2]]
+                data['example_quotes'] = [str(quote)[:100] for quote in quotes[:3]]
 
     def _get_fallback_sentiment(self) -> Dict[str, Any]:
         """Return fallback sentiment data when API unavailable"""
@@ -334,10 +353,17 @@ Only return the JSON object, no other text."""
             'low': '❌ Low'
         }.get(confidence, '❌ Low')
 
+        if sentiment_data.get('method') == 'local_themes':
+            methodology = (f"Classified all {sample_size.get('positive', 0) + sample_size.get('negative', 0)} "
+                           "stored reviews by theme keywords; representative quotes selected with Claude API")
+        else:
+            methodology = (f"Analyzed {sample_size.get('positive', 0) + sample_size.get('negative', 0)} "
+                           "randomly sampled reviews using Claude API")
+
         markdown = f"""
 ## Review Sentiment Analysis (Sample-Based)
 
-**Analysis Methodology**: Analyzed {sample_size.get('positive', 0) + sample_size.get('negative', 0)} randomly sampled reviews using Claude API
+**Analysis Methodology**: {methodology}
 **Data Confidence**: {confidence_badge} (based on actual review text analysis)
 **Sample Date**: {analyzed_at[:10]}
 **Sample Composition**: {sample_size.get('positive', 0)} positive, {sample_size.get('negative', 0)} negative reviews
@@ -441,8 +467,8 @@ def get_review_sentiment_analysis(
     # Fetch reviews
     reviews = analyzer.fetch_steam_reviews(app_id, sample_size)
 
-    # Analyze sentiment
-    sentiment_data = analyzer.analyze_review_sentiment(reviews)
+    # Analyze sentiment (theme statistics over every stored review)
+    sentiment_data = analyzer.analyze_review_sentiment(reviews, app_id=app_id)
 
     # Generate markdown
     markdown = analyzer.generate_sentiment_markdown(
@@ -0,0 +1,869 @@
+#!/usr/bin/env python3
+"""
+Review Store - Local per-app corpus of Steam reviews with incremental sync
+
+ReviewSentimentAnalyzer and NegativeReviewAnalyzer used to re-page Steam's
+appreviews endpoint from cursor='*' on every run, each keeping only the
+review text. The store keeps every review with its full metadata in one
+SQLite database per app under .cache/reviews/, keyed on recommendation_id:
+
+- sync() pages newest-first (filter=recent, review_type=all) and stops at the
+  newest review already stored, so repeat runs fetch only new reviews. When
+  the page budget runs out before reaching stored history, the cursor is kept
+  and the next sync continues backfilling from it, concurrently with the
+  new-review pages. When it runs out before reaching the newest stored review,
+  the gap's cursor is kept and closed before the newest mark moves forward.
+  One sync serves both review types and every analyzer; prefetch() starts it
+  in the background at the start of a report.
+- reviews()/count() query local data: an FTS5 index over review text plus
+  indexed voted_up, playtime, language, timestamp and helpful-vote columns
+  answer filtered searches over 100k-review games in milliseconds;
+  count_matches() counts several FTS expressions in one grouped query
+- ingest() syncs a bounded number of recent reviews for many apps at once
+  (e.g. competitors), concurrently under the shared rate limiter
+- daily() reads a per-day rollup (count, positive, median playtime, language
+  mix) refreshed for the touched days on every insert; src/review_trends.py
+  derives velocity and trend signals from it
+
+Usage:
+    store = get_review_store()
+    store.sync(app_id)
+    negatives = store.reviews(app_id, voted_up=False, min_length=50, limit=100)
+    crashes = store.reviews(app_id, voted_up=False, match=fts_any(['crash']),
+                            min_playtime_hours=2, since_days=90)
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import statistics
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+import requests
+from src.api_rate_limiter import steam_api_rate_limiter
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_REVIEW_STORE_DIR = Path(".cache") / "reviews"
+
+STEAM_REVIEWS_URL = "https://store.steampowered.com/appreviews/{app_id}"
+
+# Pages of 100 reviews fetched per sync (new reviews first, then backfill)
+REVIEW_SYNC_MAX_PAGES = int(os.getenv('REVIEW_SYNC_MAX_PAGES', 10))
+
+# A sync within this many hours of the previous one is skipped
+REVIEW_SYNC_INTERVAL_HOURS = float(os.getenv('REVIEW_SYNC_INTERVAL_HOURS', 6))
+
+# Background threads for prefetches (backfill chains get a pool of the same size)
+REVIEW_INGEST_WORKERS = int(os.getenv('REVIEW_INGEST_WORKERS', 4))
+
+# Pages of 100 reviews per app in a batched ingest (e.g. all competitors)
+REVIEW_BATCH_MAX_PAGES = int(os.getenv('REVIEW_BATCH_MAX_PAGES', 2))
+
+# Review columns kept besides the raw JSON
+REVIEW_COLUMNS = [
+    'recommendation_id', 'language', 'review', 'voted_up', 'votes_up', 'votes_funny',
+    'weighted_vote_score', 'comment_count', 'steam_purchase', 'received_for_free',
+    'written_during_early_access', 'timestamp_created', 'timestamp_updated',
+    'author_steamid', 'playtime_forever', 'playtime_at_review', 'playtime_last_two_weeks',
+    'num_games_owned', 'num_reviews',
+]
+
+# Separate pools: a prefetched sync blocks on its backfill chain
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=REVIEW_INGEST_WORKERS, thread_name_prefix='review-prefetch')
+_BACKFILL_EXECUTOR = ThreadPoolExecutor(max_workers=REVIEW_INGEST_WORKERS, thread_name_prefix='review-backfill')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    recommendation_id TEXT PRIMARY KEY,
+    language TEXT,
+    review TEXT,
+    voted_up INTEGER,
+    votes_up INTEGER,
+    votes_funny INTEGER,
+    weighted_vote_score REAL,
+    comment_count INTEGER,
+    steam_purchase INTEGER,
+    received_for_free INTEGER,
+    written_during_early_access INTEGER,
+    timestamp_created INTEGER,
+    timestamp_updated INTEGER,
+    author_steamid TEXT,
+    playtime_forever INTEGER,
+    playtime_at_review INTEGER,
+    playtime_last_two_weeks INTEGER,
+    num_games_owned INTEGER,
+    num_reviews INTEGER,
+    raw TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_reviews_created ON reviews (timestamp_created);
+CREATE INDEX IF NOT EXISTS idx_reviews_voted_created ON reviews (voted_up, timestamp_created);
+CREATE INDEX IF NOT EXISTS idx_reviews_playtime ON reviews (playtime_at_review);
+CREATE INDEX IF NOT EXISTS idx_reviews_language ON reviews (language);
+CREATE INDEX IF NOT EXISTS idx_reviews_votes ON reviews (votes_up);
+CREATE VIRTUAL TABLE IF NOT EXISTS reviews_fts USING fts5(
+    review, content='reviews', content_rowid='rowid', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS reviews_fts_insert AFTER INSERT ON reviews BEGIN
+    INSERT INTO reviews_fts (rowid, review) VALUES (new.rowid, new.review);
+END;
+CREATE TRIGGER IF NOT EXISTS reviews_fts_delete AFTER DELETE ON reviews BEGIN
+    INSERT INTO reviews_fts (reviews_fts, rowid, review) VALUES ('delete', old.rowid, old.review);
+END;
+CREATE TRIGGER IF NOT EXISTS reviews_fts_update AFTER UPDATE OF review ON reviews BEGIN
+    INSERT INTO reviews_fts (reviews_fts, rowid, review) VALUES ('delete', old.rowid, old.review);
+    INSERT INTO reviews_fts (rowid, review) VALUES (new.rowid, new.review);
+END;
+CREATE TABLE IF NOT EXISTS sync_state (
+    language TEXT PRIMARY KEY,
+    newest_timestamp INTEGER,
+    backfill_cursor TEXT,
+    last_sync REAL,
+    total_reviews INTEGER,
+    gap_cursor TEXT,
+    gap_newest INTEGER
+);
+CREATE TABLE IF NOT EXISTS review_daily (
+    day TEXT PRIMARY KEY,
+    reviews INTEGER,
+    positive INTEGER,
+    median_playtime INTEGER,
+    languages TEXT
+);
+"""
+
+# sync_state columns added after the first release: (name, type)
+_SYNC_STATE_MIGRATIONS = [('gap_cursor', 'TEXT'), ('gap_newest', 'INTEGER')]
+
+# Daily rollup rows are keyed on the UTC day a review was created
+_DAY_SECONDS = 86400
+
+# reviews() orderings
+_ORDER_BY = {
+    'recent': 'timestamp_created DESC',
+    'helpful': 'votes_up DESC, timestamp_created DESC',
+    'oldest': 'timestamp_created ASC',
+}
+
+
+def fts_any(terms: Iterable[str]) -> str:
+    """
+    Build an FTS5 query matching any of the given words or phrases
+
+    Args:
+        terms: Keywords or phrases (e.g. ['crash', 'save file'])
+
+    Returns:
+        MATCH expression, e.g. '"crash" OR "save file"'
+    """
+    quoted = ['"' + term.replace('"', '""') + '"' for term in terms if term and term.strip()]
+    return ' OR '.join(quoted)
+
+
+def review_sample_fingerprint(reviews: Union[Dict[str, List[Any]], List[Any]]) -> str:
+    """
+    Stable, order-independent fingerprint of a review sample
+
+    Unlike hash(), the result is the same in every process and on every
+    machine, so analyses of the same sample can be cached and shared.
+
+    Args:
+        reviews: List of reviews, or {bucket: list} (e.g. 'positive'/'negative').
+            Reviews are dicts with a recommendation_id, or review texts
+            (identified by their whitespace-normalized text)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    def _identity(review: Any) -> str:
+        if isinstance(review, dict):
+            if review.get('recommendation_id'):
+                return f"id:{review['recommendation_id']}"
+            review = review.get('text') or review.get('review') or ''
+        text = re.sub(r'\s+', ' ', str(review)).strip()
+        return 'text:' + hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    buckets = reviews if isinstance(reviews, dict) else {'reviews': reviews}
+    canonical = {bucket: sorted(_identity(review) for review in items or []) for bucket, items in buckets.items()}
+    return hashlib.sha256(json.dumps(canonical, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def review_row(review: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten one appreviews review into store columns
+
+    Args:
+        review: Review object from the appreviews endpoint
+
+    Returns:
+        Dictionary of REVIEW_COLUMNS plus 'raw' (the original JSON)
+    """
+    author = review.get('author') or {}
+    return {
+        'recommendation_id': str(review.get('recommendationid')),
+        'language': review.get('language'),
+        'review': (review.get('review') or '').strip(),
+        'voted_up': int(bool(review.get('voted_up'))),
+        'votes_up': int(review.get('votes_up') or 0),
+        'votes_funny': int(review.get('votes_funny') or 0),
+        'weighted_vote_score': float(review.get('weighted_vote_score') or 0),
+        'comment_count': int(review.get('comment_count') or 0),
+        'steam_purchase': int(bool(review.get('steam_purchase'))),
+        'received_for_free': int(bool(review.get('received_for_free'))),
+        'written_during_early_access': int(bool(review.get('written_during_early_access'))),
+        'timestamp_created': int(review.get('timestamp_created') or 0),
+        'timestamp_updated': int(review.get('timestamp_updated') or 0),
+        'author_steamid': author.get('steamid'),
+        'playtime_forever': int(author.get('playtime_forever') or 0),
+        'playtime_at_review': int(author.get('playtime_at_review') or 0),
+        'playtime_last_two_weeks': int(author.get('playtime_last_two_weeks') or 0),
+        'num_games_owned': int(author.get('num_games_owned') or 0),
+        'num_reviews': int(author.get('num_reviews') or 0),
+        'raw': json.dumps(review),
+    }
+
+
+class _PageBudget:
+    """
+    Page budget shared by the new-review and backfill chains of one sync
+
+    Until the priority (new-review) chain releases it, `reserved` pages can
+    only be taken by that chain; the backfill chain waits for them.
+    """
+
+    def __init__(self, pages: int, reserved: int = 0):
+        self.remaining = pages
+        self.reserved = reserved
+        self._condition = threading.Condition()
+
+    def take(self, priority: bool = True) -> bool:
+        with self._condition:
+            if priority:
+                self.reserved = max(0, self.reserved - 1)
+            else:
+                self._condition.wait_for(lambda: self.reserved == 0 or self.remaining > self.reserved)
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+    def release(self):
+        """Priority chain finished: the backfill chain may use the rest"""
+        with self._condition:
+            self.reserved = 0
+            self._condition.notify_all()
+
+
+class ReviewStore:
+    """
+    One SQLite review database per app, synced incrementally from Steam
+    """
+
+    def __init__(
+        self,
+        store_dir: Union[str, Path] = DEFAULT_REVIEW_STORE_DIR,
+        session: Any = None,
+        max_pages: int = REVIEW_SYNC_MAX_PAGES,
+        sync_interval_hours: float = REVIEW_SYNC_INTERVAL_HOURS
+    ):
+        """
+        Initialize store
+
+        Args:
+            store_dir: Directory holding <app_id>.sqlite files
+            session: requests.Session-compatible object (None = requests module)
+            max_pages: Pages fetched per sync
+            sync_interval_hours: Skip syncs more recent than this
+        """
+        self.store_dir = Path(store_dir)
+        self.session = session if session is not None else requests
+        self.max_pages = max_pages
+        self.sync_interval_hours = sync_interval_hours
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._prefetches: Dict[Tuple[str, str], Future] = {}
+
+    def path(self, app_id: Any) -> Path:
+        """SQLite file for an app"""
+        return self.store_dir / f"{app_id}.sqlite"
+
+    def _app_lock(self, app_id: Any) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(str(app_id), threading.Lock())
+
+    def connect(self, app_id: Any) -> sqlite3.Connection:
+        """
+        Open an app's database (creating the schema if needed)
+
+        Args:
+            app_id: Steam app ID
+
+        Returns:
+            sqlite3 connection with Row factory; close it when done
+        """
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path(app_id), timeout=30)
+        conn.row_factory = sqlite3.Row
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        conn.executescript(_SCHEMA)
+        if 'sync_state' in tables:
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(sync_state)')}
+            for column, kind in _SYNC_STATE_MIGRATIONS:
+                if column not in columns:
+                    conn.execute(f'ALTER TABLE sync_state ADD COLUMN {column} {kind}')
+        if 'reviews' in tables and 'reviews_fts' not in tables:
+            # Index reviews stored before the text index existed
+            conn.execute("INSERT INTO reviews_fts (reviews_fts) VALUES ('rebuild')")
+            conn.commit()
+        if 'reviews' in tables and 'review_daily' not in tables:
+            # Roll up reviews stored before the daily table existed
+            self._refresh_daily(conn)
+            conn.commit()
+        return conn
+
+    def _fetch_page(self, app_id: Any, language: str, cursor: str) -> Dict[str, Any]:
+        steam_api_rate_limiter.acquire()
+        response = self.session.get(
+            STEAM_REVIEWS_URL.format(app_id=app_id),
+            params={
+                'json': 1,
+                'filter': 'recent',
+                'language': language,
+                'review_type': 'all',
+                'purchase_type': 'all',
+                'num_per_page': 100,
+                'cursor': cursor,
+            },
+            timeout=10
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def sync_state(self, app_id: Any, language: str = 'english') -> Optional[Dict[str, Any]]:
+        """
+        Get the sync state for an app and language
+
+        Returns:
+            Dictionary with newest_timestamp, backfill_cursor, last_sync,
+            total_reviews, gap_cursor and gap_newest (None if never synced)
+        """
+        if not self.path(app_id).exists():
+            return None
+        with closing(self.connect(app_id)) as conn:
+            row = conn.execute('SELECT * FROM sync_state WHERE language = ?', (language,)).fetchone()
+        return dict(row) if row else None
+
+    def sync(
+        self,
+        app_id: Any,
+        language: str = 'english',
+        force: bool = False,
+        max_pages: Optional[int] = None
+    ) -> int:
+        """
+        Fetch reviews newer than the newest stored one, and continue backfilling
+
+        The new-review and backfill cursor chains are independent, so they
+        page concurrently and share the page budget (new reviews get first
+        claim on half of it). Network errors end a chain early; whatever was
+        fetched is kept. If the budget runs out before the new reviews reach
+        the stored ones, newest_timestamp stays put and the gap is paged from
+        its cursor on the next sync before any newer reviews. If a prefetch
+        of the same app is in flight, sync waits for it first (and then
+        usually finds the store fresh).
+
+        Args:
+            app_id: Steam app ID
+            language: Steam language filter ('all' for every language)
+            force: Sync even if the last sync was within sync_interval_hours
+            max_pages: Page budget for this sync (None = store's max_pages)
+
+        Returns:
+            Number of reviews added
+        """
+        with self._locks_guard:
+            prefetch = self._prefetches.get((str(app_id), language))
+        if prefetch is not None:
+            prefetch.result()
+        return self._sync(app_id, language, force, max_pages)
+
+    def _sync(self, app_id: Any, language: str, force: bool, max_pages: Optional[int]) -> int:
+        max_pages = self.max_pages if max_pages is None else max_pages
+        with self._app_lock(app_id), closing(self.connect(app_id)) as conn:
+            state = conn.execute('SELECT * FROM sync_state WHERE language = ?', (language,)).fetchone()
+            state = dict(state) if state else {}
+            if (not force and state.get('last_sync')
+                    and time.time() - state['last_sync'] < self.sync_interval_hours * 3600):
+                logger.debug(f"Review store {app_id}: synced recently, skipping")
+                return 0
+
+            known_newest = state.get('newest_timestamp') or 0
+            backfill_cursor = state.get('backfill_cursor')
+            total_reviews = state.get('total_reviews')
+            gap_cursor, gap_newest = state.get('gap_cursor'), state.get('gap_newest')
+
+            budget = _PageBudget(max_pages, reserved=(max_pages + 1) // 2)
+            backfill = None
+            if known_newest and backfill_cursor:
+                # Older history pages in the background while new reviews are fetched
+                backfill = _BACKFILL_EXECUTOR.submit(
+                    self._page, app_id, language, backfill_cursor, budget, priority=False
+                )
+            rows, pages = [], 0
+            try:
+                if gap_cursor:
+                    # Close the gap left by an earlier sync before moving the mark
+                    gap = self._page(app_id, language, gap_cursor, budget, stop_at=known_newest)
+                    rows, pages = gap['rows'], gap['pages']
+                    if gap['reached_stop'] or gap['cursor'] is None:
+                        known_newest, gap_cursor, gap_newest = gap_newest, None, None
+                    else:
+                        gap_cursor = gap['cursor']
+                new = None if gap_cursor else self._page(app_id, language, '*', budget, stop_at=known_newest)
+            finally:
+                budget.release()
+            backfill = backfill.result() if backfill is not None else None
+
+            newest = known_newest
+            if new is not None:
+                if new['summary'].get('total_reviews') is not None:
+                    total_reviews = new['summary']['total_reviews']
+                fetched_newest = max([known_newest] + [row['timestamp_created'] for row in new['rows']])
+                if not known_newest:
+                    backfill_cursor = new['cursor']  # First sync: resume here next time
+                    newest = fetched_newest
+                elif new['reached_stop'] or new['cursor'] is None:
+                    newest = fetched_newest
+                else:
+                    # Keep the mark; the reviews between it and this page are fetched next time
+                    logger.warning(f"Review store {app_id}: page budget ran out before reaching stored reviews")
+                    gap_cursor, gap_newest = new['cursor'], fetched_newest
+                rows, pages = rows + new['rows'], pages + new['pages']
+            if gap_cursor:
+                logger.info(f"Review store {app_id}: reviews newer than {known_newest} still incomplete")
+
+            if backfill is not None:
+                backfill_cursor = backfill['cursor']
+                rows += backfill['rows']
+                pages += backfill['pages']
+            added = self._insert(conn, rows)
+
+            conn.execute(
+                'INSERT OR REPLACE INTO sync_state (language, newest_timestamp, backfill_cursor, last_sync, '
+                'total_reviews, gap_cursor, gap_newest) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (language, newest, backfill_cursor, time.time(), total_reviews, gap_cursor, gap_newest)
+            )
+            conn.commit()
+
+        logger.info(f"Review store {app_id}: {added} new reviews ({pages} pages)")
+        return added
+
+    def prefetch(self, app_id: Any, language: str = 'english', max_pages: Optional[int] = None) -> Future:
+        """
+        Start a sync in the background (e.g. at the start of a report)
+
+        Concurrent prefetches of the same app share one sync, and analyzers
+        calling sync() meanwhile wait for it and then skip their own.
+
+        Args:
+            app_id: Steam app ID
+            language: Steam language filter
+            max_pages: Page budget (None = store's max_pages)
+
+        Returns:
+            Future resolving to the number of reviews added
+        """
+        key = (str(app_id), language)
+        with self._locks_guard:
+            future = self._prefetches.get(key)
+            if future is None or future.done():
+                future = self._prefetches[key] = _PREFETCH_EXECUTOR.submit(
+                    self._safe_sync, app_id, language, max_pages
+                )
+        return future
+
+    def ingest(
+        self,
+        app_ids: Iterable[Any],
+        language: str = 'english',
+        max_pages: int = REVIEW_BATCH_MAX_PAGES
+    ) -> Dict[str, int]:
+        """
+        Batched ingest: sync the most recent reviews of many apps concurrently
+
+        Each app is a bounded prefetch on the shared ingest pool, so all apps
+        page at once under the shared Steam rate limiter; apps synced within
+        sync_interval_hours are skipped and in-flight prefetches are joined.
+
+        Args:
+            app_ids: Steam app IDs (e.g. every competitor of a report)
+            language: Steam language filter
+            max_pages: Pages of 100 reviews per app
+
+        Returns:
+            {app_id: reviews added}
+        """
+        futures = {
+            str(app_id): self.prefetch(app_id, language, max_pages)
+            for app_id in dict.fromkeys(app_ids) if app_id
+        }
+        added = {app_id: future.result() for app_id, future in futures.items()}
+        logger.info(f"Review store: ingested {sum(added.values())} reviews for {len(added)} apps")
+        return added
+
+    def _safe_sync(self, app_id: Any, language: str, max_pages: Optional[int] = None) -> int:
+        try:
+            return self._sync(app_id, language, False, max_pages)
+        except Exception as e:
+            logger.warning(f"Review store {app_id}: background sync failed: {e}")
+            return 0
+
+    def _page(
+        self,
+        app_id: Any,
+        language: str,
+        cursor: str,
+        budget: '_PageBudget',
+        stop_at: int = 0,
+        priority: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Page newest-first from a cursor, collecting every review
+
+        Args:
+            budget: Page budget shared with a concurrent chain
+            stop_at: Stop after the page containing a review created at or
+                before this timestamp (0 = don't stop early)
+            priority: Whether this chain may use the budget reserved for new reviews
+
+        Returns:
+            Dictionary with rows, pages, cursor (where to resume, None if
+            history is exhausted), reached_stop, summary
+        """
+        result = {'rows': [], 'pages': 0, 'cursor': cursor, 'reached_stop': False, 'summary': {}}
+        while budget.take(priority):
+            try:
+                data = self._fetch_page(app_id, language, cursor)
+            except Exception as e:
+                logger.warning(f"Review store {app_id}: sync stopped: {e}")
+                break
+            result['pages'] += 1
+            if not data.get('success'):
+                break
+            if result['pages'] == 1:
+                result['summary'] = data.get('query_summary', {})
+
+            rows = [review_row(review) for review in data.get('reviews', [])]
+            result['rows'] += rows
+
+            next_cursor = data.get('cursor')
+            if not rows or not next_cursor or next_cursor == cursor:
+                result['cursor'] = None  # Reached the oldest review
+                break
+            cursor = result['cursor'] = next_cursor
+            if stop_at and any(row['timestamp_created'] <= stop_at for row in rows):
+                result['reached_stop'] = True
+                break
+        return result
+
+    def _insert(self, conn: sqlite3.Connection, rows: Iterable[Dict[str, Any]]) -> int:
+        """Insert or update reviews; returns how many were new"""
+        columns = REVIEW_COLUMNS + ['raw']
+        rows = list(rows)
+        before = conn.execute('SELECT COUNT(*) FROM reviews').fetchone()[0]
+        # Upsert (not REPLACE) so the text index update trigger fires
+        conn.executemany(
+            f"INSERT INTO reviews ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT (recommendation_id) DO UPDATE SET "
+            f"{', '.join(f'{column} = excluded.{column}' for column in columns[1:])}",
+            [[row[column] for column in columns] for row in rows]
+        )
+        timestamps = [row['timestamp_created'] for row in rows if row['timestamp_created']]
+        if timestamps:
+            self._refresh_daily(conn, timestamps)
+        return conn.execute('SELECT COUNT(*) FROM reviews').fetchone()[0] - before
+
+    @staticmethod
+    def _refresh_daily(conn: sqlite3.Connection, timestamps: Optional[Iterable[int]] = None) -> None:
+        """
+        Recompute the daily rollup for the UTC days containing the given timestamps (None = all days)
+
+        Consecutive touched days are refreshed as one range, so a page of
+        recent reviews plus one old edited review re-reads two short spans
+        rather than everything in between.
+        """
+        sql = ("SELECT strftime('%Y-%m-%d', timestamp_created, 'unixepoch') AS day, voted_up, "
+               "playtime_at_review, language FROM reviews")
+        ranges: List[List[int]] = []
+        if timestamps is not None:
+            for start in sorted({timestamp - timestamp % _DAY_SECONDS for timestamp in timestamps}):
+                if ranges and ranges[-1][1] == start:
+                    ranges[-1][1] = start + _DAY_SECONDS
+                else:
+                    ranges.append([start, start + _DAY_SECONDS])
+            sql += ' WHERE ' + ' OR '.join(['(timestamp_created >= ? AND timestamp_created < ?)'] * len(ranges))
+            conn.executemany(
+                "DELETE FROM review_daily WHERE day >= strftime('%Y-%m-%d', ?, 'unixepoch') "
+                "AND day < strftime('%Y-%m-%d', ?, 'unixepoch')", ranges
+            )
+        else:
+            conn.execute('DELETE FROM review_daily')
+        params = [bound for day_range in ranges for bound in day_range]
+
+        days: Dict[str, Dict[str, Any]] = {}
+        for day, voted_up, playtime, language in conn.execute(sql + ' ORDER BY timestamp_created', params):
+            entry = days.setdefault(day, {'reviews': 0, 'positive': 0, 'playtimes': [], 'languages': {}})
+            entry['reviews'] += 1
+            entry['positive'] += 1 if voted_up else 0
+            entry['playtimes'].append(playtime or 0)
+            entry['languages'][language] = entry['languages'].get(language, 0) + 1
+
+        conn.executemany(
+            'INSERT INTO review_daily (day, reviews, positive, median_playtime, languages) VALUES (?, ?, ?, ?, ?)',
+            [
+                (day, entry['reviews'], entry['positive'], int(statistics.median(entry['playtimes'])),
+                 json.dumps(entry['languages'], sort_keys=True))
+                for day, entry in days.items()
+            ]
+        )
+
+    @staticmethod
+    def _where(
+        voted_up: Optional[bool] = None,
+        language: Optional[str] = None,
+        min_length: int = 0,
+        match: Optional[str] = None,
+        min_playtime_hours: Optional[float] = None,
+        max_playtime_hours: Optional[float] = None,
+        since_days: Optional[float] = None,
+        since_timestamp: Optional[int] = None,
+        until_timestamp: Optional[int] = None,
+        min_votes_up: Optional[int] = None
+    ) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause shared by reviews() and count()"""
+        clauses, params = [], []
+        if voted_up is not None:
+            clauses.append('voted_up = ?')
+            params.append(int(voted_up))
+        if language and language != 'all':
+            clauses.append('language = ?')
+            params.append(language)
+        if min_length:
+            clauses.append('length(review) >= ?')
+            params.append(min_length)
+        if match:
+            clauses.append('rowid IN (SELECT rowid FROM reviews_fts WHERE reviews_fts MATCH ?)')
+            params.append(match)
+        # Steam reports playtime in minutes
+        if min_playtime_hours is not None:
+            clauses.append('playtime_at_review >= ?')
+            params.append(int(min_playtime_hours * 60))
+        if max_playtime_hours is not None:
+            clauses.append('playtime_at_review <= ?')
+            params.append(int(max_playtime_hours * 60))
+        if since_days is not None:
+            since_timestamp = max(since_timestamp or 0, int(time.time() - since_days * 86400))
+        if since_timestamp is not None:
+            clauses.append('timestamp_created >= ?')
+            params.append(int(since_timestamp))
+        if until_timestamp is not None:
+            clauses.append('timestamp_created < ?')
+            params.append(int(until_timestamp))
+        if min_votes_up is not None:
+            clauses.append('votes_up >= ?')
+            params.append(int(min_votes_up))
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def reviews(
+        self,
+        app_id: Any,
+        voted_up: Optional[bool] = None,
+        language: Optional[str] = None,
+        min_length: int = 0,
+        order: str = 'recent',
+        limit: Optional[int] = None,
+        **filters
+    ) -> List[Dict[str, Any]]:
+        """
+        Query stored reviews
+
+        Args:
+            app_id: Steam app ID
+            voted_up: True for positive, False for negative, None for both
+            language: Only this language (None = any)
+            min_length: Minimum review text length
+            order: 'recent', 'helpful' or 'oldest'
+            limit: Maximum reviews returned (None = all)
+            **filters: match (FTS5 expression, see fts_any),
+                min_playtime_hours / max_playtime_hours (at review time),
+                since_days, since_timestamp, until_timestamp, min_votes_up
+
+        Returns:
+            Review rows (REVIEW_COLUMNS) as dictionaries
+        """
+        if not self.path(app_id).exists():
+            return []
+
+        where, params = self._where(voted_up, language, min_length, **filters)
+        sql = f"SELECT {', '.join(REVIEW_COLUMNS)} FROM reviews{where} ORDER BY {_ORDER_BY[order]}"
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(int(limit))
+
+        with closing(self.connect(app_id)) as conn:
+            return [dict(row) for row in conn.execute(sql, params)]
+
+    def daily(
+        self,
+        app_id: Any,
+        since_timestamp: Optional[int] = None,
+        until_timestamp: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Daily review rollup (precomputed as reviews are stored)
+
+        Args:
+            app_id: Steam app ID
+            since_timestamp: First day to include (the UTC day containing it)
+            until_timestamp: Days before the one containing this timestamp
+
+        Returns:
+            Rows ordered by day: day ('YYYY-MM-DD', UTC), reviews, positive,
+            median_playtime (minutes at review), languages ({language: count})
+        """
+        if not self.path(app_id).exists():
+            return []
+
+        clauses, params = [], []
+        if since_timestamp is not None:
+            clauses.append("day >= strftime('%Y-%m-%d', ?, 'unixepoch')")
+            params.append(int(since_timestamp))
+        if until_timestamp is not None:
+            clauses.append("day < strftime('%Y-%m-%d', ?, 'unixepoch')")
+            params.append(int(until_timestamp))
+        where = (' WHERE ' + ' AND '.join(clauses)) if clauses else ''
+
+        with closing(self.connect(app_id)) as conn:
+            rows = [dict(row) for row in conn.execute(f'SELECT * FROM review_daily{where} ORDER BY day', params)]
+        for row in rows:
+            row['languages'] = json.loads(row['languages'] or '{}')
+        return rows
+
+    def coverage(self, app_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Time span the stored reviews cover completely
+
+        Returns:
+            Dictionary with since (oldest covered timestamp; 0 once the full
+            history is stored), until (last sync time), languages (synced
+            language filters), total_reviews (Steam's total for the widest
+            synced filter) and gap_open (reviews between the newest stored
+            mark and later pages are still missing; since is then above the
+            gap), or None if the app was never synced
+        """
+        if not self.path(app_id).exists():
+            return None
+        with closing(self.connect(app_id)) as conn:
+            states = [dict(row) for row in conn.execute('SELECT * FROM sync_state')]
+            oldest = conn.execute('SELECT MIN(timestamp_created) FROM reviews').fetchone()[0]
+            above_gaps = [
+                conn.execute('SELECT MIN(timestamp_created) FROM reviews WHERE timestamp_created > ?',
+                             (state['newest_timestamp'] or 0,)).fetchone()[0]
+                for state in states if state['gap_cursor']
+            ]
+        if not states or oldest is None:
+            return None
+        complete = all(state['backfill_cursor'] is None for state in states)
+        since = 0 if complete else oldest
+        return {
+            'since': max([since] + [timestamp for timestamp in above_gaps if timestamp is not None]),
+            'gap_open': bool(above_gaps),
+            'until': min(state['last_sync'] or 0 for state in states),
+            'languages': sorted(state['language'] for state in states),
+            'total_reviews': max(state['total_reviews'] or 0 for state in states),
+        }
+
+    def count(
+        self,
+        app_id: Any,
+        voted_up: Optional[bool] = None,
+        language: Optional[str] = None,
+        min_length: int = 0,
+        **filters
+    ) -> int:
+        """
+        Number of stored reviews matching the same filters as reviews()
+
+        Returns:
+            Matching review count (0 if the app has no store)
+        """
+        if not self.path(app_id).exists():
+            return 0
+        where, params = self._where(voted_up, language, min_length, **filters)
+        with closing(self.connect(app_id)) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM reviews{where}", params).fetchone()[0]
+
+    def count_matches(
+        self,
+        app_id: Any,
+        matches: Dict[str, str],
+        voted_up: Optional[bool] = None,
+        language: Optional[str] = None,
+        min_length: int = 0,
+        **filters
+    ) -> Dict[str, int]:
+        """
+        Number of stored reviews matching each of several FTS5 expressions
+
+        All expressions are counted in one grouped query (e.g. every risk
+        theme of a competitor) rather than one count() per expression.
+
+        Args:
+            app_id: Steam app ID
+            matches: {key: FTS5 expression} (see fts_any)
+            voted_up, language, min_length, **filters: Same as reviews()
+
+        Returns:
+            {key: matching review count} (all 0 if the app has no store)
+        """
+        counts = {key: 0 for key in matches}
+        patterns = [(key, expression) for key, expression in matches.items() if expression]
+        if not patterns or not self.path(app_id).exists():
+            return counts
+
+        where, params = self._where(voted_up, language, min_length, **filters)
+        sql = (
+            f"WITH patterns (key, expression) AS (VALUES {', '.join('(?, ?)' for _ in patterns)}) "
+            "SELECT patterns.key, COUNT(*) FROM patterns "
+            "JOIN reviews_fts ON reviews_fts MATCH patterns.expression "
+            f"AND reviews_fts.rowid IN (SELECT rowid FROM reviews{where}) "
+            "GROUP BY patterns.key"
+        )
+        with closing(self.connect(app_id)) as conn:
+            rows = conn.execute(sql, [value for pattern in patterns for value in pattern] + params)
+            counts.update({key: count for key, count in rows})
+        return counts
+
+
+# Global review store shared by the analyzers
+_global_review_store = None
+
+
+def get_review_store() -> ReviewStore:
+    """
+    Get the process-wide review store (singleton pattern)
+
+    Returns:
+        Global ReviewStore instance
+    """
+    global _global_review_store
+    if _global_review_store is None:
+        _global_review_store = ReviewStore()
+    return _global_review_store
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Review Themes - Local keyword/TF-IDF theme classifier for review corpora
+
+ReviewSentimentAnalyzer and NegativeReviewAnalyzer used to send 50-100 raw
+reviews per call and ask Claude to count themes, so the statistics covered a
+small sample and most prompt tokens went on counting. The classifier runs on
+CPU over every stored review instead:
+
+- Each theme has a keyword lexicon (whole words/phrases, or prefixes ending in
+  '*'); a review mentions a theme when any of its keywords occur. Counts and
+  percentages are over the full corpus.
+- Matched terms are weighted by TF-IDF across the corpus, and the reviews that
+  score highest for a theme become its quote candidates. Only those candidates
+  go to the LLM (near-duplicates removed), which picks representative quotes
+  and summarizes.
+
+Usage:
+    classifier = ReviewThemeClassifier(NEGATIVE_THEMES)
+    stats = classifier.classify(texts)
+    stats['technical_issues']  # {'count', 'percentage', 'candidates'}
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+from src.review_sampler import dedupe_reviews
+
+# Positive review themes (ReviewSentimentAnalyzer)
+POSITIVE_THEMES = {
+    'gameplay_loop': [
+        'gameplay', 'combat', 'mechanic*', 'fun', 'addict*', 'core loop', 'gameplay loop', 'satisfying',
+        'responsive', 'controls', 'boss*', 'fights',
+    ],
+    'narrative_characters': [
+        'story', 'stories', 'narrative', 'character*', 'dialog*', 'writing', 'written', 'lore', 'plot',
+        'worldbuilding', 'world building', 'voice lines',
+    ],
+    'art_audio': [
+        'art', 'artstyle', 'art style', 'visual*', 'graphic*', 'beautiful', 'gorgeous', 'music', 'soundtrack*',
+        'sound design', 'audio', 'voice acting', 'atmospher*', 'animation*',
+    ],
+    'progression_systems': [
+        'progression', 'unlock*', 'upgrade*', 'builds', 'build variety', 'skill tree*', 'level up', 'meta',
+        'perks', 'talents', 'loadout*',
+    ],
+    'replayability': [
+        'replay*', 'variety', 'every run', 'each run', 'runs', 'endless', 'random*', 'procedural*',
+        'hundreds of hours', 'coming back', 'keeps me coming back',
+    ],
+    'polish_technical': [
+        'polish*', 'smooth*', 'optimi*', 'runs well', 'runs great', 'no bugs', 'bug free', 'bug-free',
+        'stable', 'quality of life', 'qol', 'ui', 'interface',
+    ],
+}
+
+# Negative review themes (ReviewSentimentAnalyzer)
+NEGATIVE_THEMES = {
+    'technical_issues': [
+        'bug*', 'crash*', 'performance', 'fps', 'framerate', 'frame rate', 'freez*', 'stutter*', 'lag*',
+        'glitch*', 'compatib*', 'black screen', 'unplayable',
+    ],
+    'difficulty_balance': [
+        'difficult*', 'too hard', 'too easy', 'unfair', 'frustrat*', 'balanc*', 'punishing', 'rng',
+        'overtuned', 'cheap deaths', 'grindy',
+    ],
+    'content_volume': [
+        'content', 'too short', 'short', 'repetitive', 'repeat*', 'lack of variety', 'no variety', 'grind*',
+        'empty', 'beat it in', 'finished it in',
+    ],
+    'price_sensitivity': [
+        'pric*', 'expensive', 'overpriced', 'not worth', 'worth it', 'refund*', 'on sale',
+        'full price', 'money',
+    ],
+    'comparison_issues': [
+        'predecessor', 'first game', 'the original', 'sequel', 'compared to', 'worse than', 'better than',
+        'prefer the', 'previous game', 'previous games',
+    ],
+    'design_choices': [
+        'design*', 'decision*', 'removed', 'missing', 'forced', 'why did', 'why is', 'why does',
+        'mechanic*', 'feature*', 'change*',
+    ],
+}
+
+# Complaint categories (NegativeReviewAnalyzer)
+COMPLAINT_CATEGORIES = {
+    'critical_issues': [
+        'crash*', 'freez*', "won't launch", 'wont launch', "doesn't launch", "doesn't start",
+        "won't start", 'black screen', 'fps', 'stutter*', 'performance', 'unplayable', 'save corrupt*',
+        'corrupted', 'lost my save', 'lost progress', 'progress lost', 'game breaking', 'game-breaking',
+        'softlock*', 'soft lock*',
+    ],
+    'design_problems': [
+        'boring', 'repetitive', 'grind*', 'tedious', 'unfair', 'too hard', 'too difficult', 'pacing',
+        'shallow', 'not fun', 'dull', 'no content', 'lack of content', 'gameplay loop', 'core loop',
+    ],
+    'polish_issues': [
+        'ui', 'menu*', 'controls', 'clunky', 'tutorial*', 'onboarding', 'balanc*', 'quality of life',
+        'qol', 'glitch*', 'keybind*', 'rebind*', 'camera', 'inventory', 'minor bug*', 'typo*',
+    ],
+    'expectation_mismatches': [
+        'price*', 'overpriced', 'expensive', 'refund*', 'not worth', 'misleading', 'trailer*',
+        'store page', 'early access', 'promised', 'abandoned', 'roadmap', 'false advertising',
+        'not what i expected',
+    ],
+    'subjective_preferences': [
+        'art style', 'artstyle', 'not for me', 'not my thing', 'not my cup of tea', 'my taste', 'genre',
+        'personal preference', 'just not', "didn't click", 'never liked',
+    ],
+}
+
+# Quote candidates should read as quotes: skip one-liners and essays
+QUOTE_MIN_CHARS = 40
+QUOTE_MAX_CHARS = 600
+
+
+def _keyword_pattern(keywords: Iterable[str]) -> re.Pattern:
+    """Alternation over keywords; a trailing '*' matches any word ending"""
+    parts = []
+    for keyword in sorted(keywords, key=len, reverse=True):
+        prefix = keyword.endswith('*')
+        escaped = r'\s+'.join(re.escape(word) for word in keyword.rstrip('*').lower().split())
+        parts.append(escaped + (r"[\w'-]*" if prefix else ''))
+    return re.compile(r'(?<![\w])(?:' + '|'.join(parts) + r')(?![\w])', re.IGNORECASE)
+
+
+class ReviewThemeClassifier:
+    """
+    Counts theme mentions over a review corpus and ranks quote candidates
+
+    Usage:
+        stats = ReviewThemeClassifier(COMPLAINT_CATEGORIES).classify(texts)
+    """
+
+    def __init__(self, themes: Dict[str, List[str]]):
+        """
+        Initialize classifier
+
+        Args:
+            themes: {theme_key: keyword list} (see POSITIVE_THEMES)
+        """
+        self.themes = themes
+        self.patterns = {theme: _keyword_pattern(keywords) for theme, keywords in themes.items()}
+
+    def matches(self, text: str) -> Dict[str, Counter]:
+        """
+        Theme keyword hits in one review
+
+        Args:
+            text: Review text
+
+        Returns:
+            {theme: Counter of matched terms} for themes the review mentions
+        """
+        hits = {}
+        for theme, pattern in self.patterns.items():
+            terms = Counter(' '.join(match.lower().split()) for match in pattern.findall(text or ''))
+            if terms:
+                hits[theme] = terms
+        return hits
+
+    def classify(
+        self,
+        texts: Iterable[str],
+        candidates_per_theme: int = 5,
+        candidates_from: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Classify every review in a corpus
+
+        Args:
+            texts: Review texts (the whole corpus, not a sample)
+            candidates_per_theme: Quote candidates kept per theme
+            candidates_from: Reviews to rank quote candidates from, e.g. a
+                stratified sample_reviews() sample (None = the corpus)
+
+        Returns:
+            {theme: {'count', 'percentage', 'candidates'}} - count and
+            percentage cover the corpus, candidates are the highest-TF-IDF
+            reviews for the theme (weighted by corpus term frequencies)
+        """
+        texts = [text for text in texts if text]
+        hits = [self.matches(text) for text in texts]
+        counts = Counter(theme for review_hits in hits for theme in review_hits)
+        if candidates_from is None:
+            pool, pool_hits = texts, hits
+        else:
+            pool = [text for text in candidates_from if text]
+            pool_hits = [self.matches(text) for text in pool]
+
+        # Document frequency of each matched term across the corpus
+        document_frequency = Counter()
+        for review_hits in hits:
+            document_frequency.update({term for terms in review_hits.values() for term in terms})
+        total = len(texts)
+
+        scored: Dict[str, List] = {theme: [] for theme in self.themes}
+        for text, review_hits in zip(pool, pool_hits):
+            length_norm = math.sqrt(max(len(text.split()), 1))
+            for theme, terms in review_hits.items():
+                score = sum(
+                    count * math.log((1 + total) / (1 + document_frequency[term])) + count
+                    for term, count in terms.items()
+                ) / length_norm
+                scored[theme].append((score, text))
+
+        stats = {}
+        for theme, reviews in scored.items():
+            quotable = [item for item in reviews if QUOTE_MIN_CHARS <= len(item[1]) <= QUOTE_MAX_CHARS] or reviews
+            quotable.sort(key=lambda item: item[0], reverse=True)
+            # Copy-paste reviews score identically; keep one of each
+            distinct = dedupe_reviews(
+                [{'review': text, 'score': score} for score, text in quotable[:candidates_per_theme * 4]],
+                weight=lambda review: review['score']
+            )
+            stats[theme] = {
+                'count': counts[theme],
+                'percentage': round(100.0 * counts[theme] / total, 1) if total else 0,
+                'candidates': [review['review'].strip() for review in distinct[:candidates_per_theme]],
+            }
+        return stats
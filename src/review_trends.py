@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Review Trends - Velocity, recent-vs-overall deltas and trend breaks
+
+Review velocity used to be estimated from two summary numbers (total reviews
+and Steam's 30-day "recent" count). With the review store's daily rollup
+(ReviewStore.daily) any window is a cheap scan of at most a few thousand
+precomputed rows:
+
+- velocity: reviews per day in the window vs the window before it
+- recent vs overall: positive ratio and median playtime in the window vs all
+  stored reviews
+- trend breaks: weeks whose review count jumps or drops sharply against the
+  preceding weeks (launches, updates, sales, review bombs)
+
+Windows the store doesn't fully cover (backfill still running, stale sync)
+are reported with complete=False so callers can fall back to their estimates.
+
+Usage:
+    trend = review_trend(app_id, window_days=30)
+    if trend and trend['complete']:
+        velocity = trend['reviews_per_day'] * language_scale(trend, reviews_total)
+"""
+
+import calendar
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+from src.review_store import ReviewStore, get_review_store
+
+# A window counts as current if the store synced within this many hours
+TREND_MAX_STALENESS_HOURS = 48
+
+# Weekly review count change (either direction) flagged as a trend break
+TREND_BREAK_RATIO = 3.0
+TREND_BREAK_MIN_REVIEWS = 10
+
+# Velocity change that moves the trend off 'stable'
+TREND_CHANGE_THRESHOLD = 0.25
+
+_DAY = 86400
+
+
+def _day_start(day: str) -> int:
+    """UTC timestamp of a rollup day"""
+    return calendar.timegm(time.strptime(day, '%Y-%m-%d'))
+
+
+def _totals(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate rollup rows: review count, positive %, median playtime, language mix"""
+    reviews = sum(row['reviews'] for row in rows)
+    positive = sum(row['positive'] for row in rows)
+    languages: Dict[str, int] = {}
+    for row in rows:
+        for language, count in row['languages'].items():
+            languages[language] = languages.get(language, 0) + count
+    # Median of daily medians, weighted by review count
+    playtimes = sorted((row['median_playtime'], row['reviews']) for row in rows if row['reviews'])
+    median_playtime, seen = 0, 0
+    for playtime, count in playtimes:
+        seen += count
+        if seen * 2 >= reviews:
+            median_playtime = playtime
+            break
+    return {
+        'reviews': reviews,
+        'positive_pct': round(100.0 * positive / reviews, 1) if reviews else None,
+        'median_playtime_hours': round(median_playtime / 60.0, 1),
+        'languages': dict(sorted(languages.items(), key=lambda item: item[1], reverse=True)),
+    }
+
+
+def _trend_breaks(rows: List[Dict[str, Any]], end: float, since: float) -> List[Dict[str, Any]]:
+    """
+    Weeks whose review count is TREND_BREAK_RATIO x above/below the median of
+    the 4 weeks before (only weeks fully inside the stored history)
+    """
+    weekly: Dict[int, int] = {}
+    for row in rows:
+        weeks_ago = int((end - _day_start(row['day'])) // (7 * _DAY))
+        weekly[weeks_ago] = weekly.get(weeks_ago, 0) + row['reviews']
+    covered = [weeks_ago for weeks_ago in weekly if end - (weeks_ago + 1) * 7 * _DAY >= since]
+    if not covered:
+        return []
+
+    breaks = []
+    oldest = max(covered)
+    for weeks_ago in range(oldest - 4, -1, -1):
+        count = weekly.get(weeks_ago, 0)
+        baseline = statistics.median(weekly.get(weeks_ago + k, 0) for k in range(1, 5))
+        if max(count, baseline) < TREND_BREAK_MIN_REVIEWS:
+            continue
+        if count >= TREND_BREAK_RATIO * max(baseline, 1) or count * TREND_BREAK_RATIO <= baseline:
+            breaks.append({
+                'week_start': time.strftime('%Y-%m-%d', time.gmtime(end - (weeks_ago + 1) * 7 * _DAY)),
+                'reviews': count,
+                'baseline': baseline,
+                'direction': 'spike' if count > baseline else 'drop',
+            })
+    return breaks
+
+
+def review_trend(
+    app_id: Any,
+    window_days: int = 30,
+    store: Optional[ReviewStore] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Review velocity and sentiment trend from the daily rollup
+
+    Args:
+        app_id: Steam app ID
+        window_days: Recent window in whole days before the last sync day
+            (compared with the window before it)
+        store: ReviewStore (None = shared store)
+
+    Returns:
+        Dictionary with recent_reviews, reviews_per_day,
+        previous_reviews_per_day (None unless the store covers that window
+        too), velocity_change, trend ('increasing'/'stable'/'declining'),
+        recent/overall positive_pct and positive_delta, median playtime,
+        language mix, trend_breaks and complete (the store covers the recent
+        window without an open gap and synced recently); None if nothing is
+        stored
+    """
+    store = store if store is not None else get_review_store()
+    coverage = store.coverage(app_id)
+    if coverage is None:
+        return None
+
+    # Whole UTC days before the day of the last sync (today is still partial)
+    end = coverage['until'] // _DAY * _DAY
+    rows = [row for row in store.daily(app_id) if _day_start(row['day']) < end]
+    if not rows:
+        return None
+    recent_start = end - window_days * _DAY
+    previous_start = recent_start - window_days * _DAY
+    recent_rows = [row for row in rows if _day_start(row['day']) >= recent_start]
+    previous_rows = [row for row in rows if previous_start <= _day_start(row['day']) < recent_start]
+
+    recent, previous, overall = _totals(recent_rows), _totals(previous_rows), _totals(rows)
+    reviews_per_day = recent['reviews'] / window_days
+    previous_per_day = previous['reviews'] / window_days if coverage['since'] <= previous_start else None
+    velocity_change = (reviews_per_day - previous_per_day) / previous_per_day if previous_per_day else None
+
+    if velocity_change is None:
+        trend = 'stable'
+    elif velocity_change > TREND_CHANGE_THRESHOLD:
+        trend = 'increasing'
+    elif velocity_change < -TREND_CHANGE_THRESHOLD:
+        trend = 'declining'
+    else:
+        trend = 'stable'
+
+    positive_delta = None
+    if recent['positive_pct'] is not None and overall['positive_pct'] is not None:
+        positive_delta = round(recent['positive_pct'] - overall['positive_pct'], 1)
+
+    return {
+        'window_days': window_days,
+        'recent_reviews': recent['reviews'],
+        'reviews_per_day': round(reviews_per_day, 2),
+        'previous_reviews_per_day': round(previous_per_day, 2) if previous_per_day is not None else None,
+        'velocity_change': round(velocity_change, 3) if velocity_change is not None else None,
+        'trend': trend,
+        'recent_positive_pct': recent['positive_pct'],
+        'overall_positive_pct': overall['positive_pct'],
+        'positive_delta': positive_delta,
+        'recent_median_playtime_hours': recent['median_playtime_hours'],
+        'overall_median_playtime_hours': overall['median_playtime_hours'],
+        'recent_languages': recent['languages'],
+        'stored_reviews': overall['reviews'],
+        'languages_synced': coverage['languages'],
+        'steam_total_reviews': coverage['total_reviews'],
+        'trend_breaks': _trend_breaks(rows, end, coverage['since']),
+        'complete': (coverage['since'] <= recent_start and not coverage['gap_open']
+                     and time.time() - coverage['until'] <= TREND_MAX_STALENESS_HOURS * 3600),
+    }
+
+
+def language_scale(trend: Dict[str, Any], reviews_total: int) -> float:
+    """
+    Factor from synced-language review counts to all-language counts
+
+    The store usually syncs one language (e.g. english); Steam's total for
+    that filter against the all-language total gives the share.
+
+    Args:
+        trend: review_trend() result
+        reviews_total: All-language review total (e.g. SteamSpy)
+
+    Returns:
+        Multiplier for counts and velocities (1.0 when unknown or already all languages)
+    """
+    synced_total = trend.get('steam_total_reviews') or 0
+    if 'all' in trend.get('languages_synced', []) or not synced_total or not reviews_total:
+        return 1.0
+    return max(1.0, reviews_total / synced_total)
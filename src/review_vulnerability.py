@@ -7,6 +7,10 @@ and predict which risks apply to your game.
 
 from typing import Dict, Any, List, Tuple
 import re
+from src.logger import get_logger
+from src.review_store import fts_any, get_review_store
+
+logger = get_logger(__name__)
 
 
 class ReviewVulnerabilityAnalyzer:
@@ -90,9 +94,17 @@ class ReviewVulnerabilityAnalyzer:
         'puzzle': ['content_length', 'difficulty', 'repetitive'],
     }
 
-    def __init__(self):
-        """Initialize the vulnerability analyzer"""
-        pass
+    def __init__(self, review_store=None, ingest_reviews: bool = True):
+        """
+        Initialize the vulnerability analyzer
+
+        Args:
+            review_store: ReviewStore with competitor review text (None = shared store)
+            ingest_reviews: Fetch recent competitor reviews into the store
+                before analyzing (False = use only what is already stored)
+        """
+        self.review_store = review_store if review_store is not None else get_review_store()
+        self.ingest_reviews = ingest_reviews
 
     def analyze_vulnerabilities(
         self,
@@ -145,13 +157,39 @@ class ReviewVulnerabilityAnalyzer:
         self,
         competitor_data: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
-        """Analyze competitor reviews to find common complaint themes"""
+        """
+        Analyze competitor reviews to find common complaint themes
+
+        Recent reviews of all competitors are ingested into the local review
+        store in one batch, then each competitor's stored negative reviews are
+        counted per theme on the FTS index in one grouped query (share of
+        negatives mentioning each theme). Competitors without review text fall
+        back to heuristics from game characteristics.
+        """
         theme_counts = {theme: 0 for theme in self.RISK_THEMES.keys()}
+        text_counts = {theme: 0 for theme in self.RISK_THEMES.keys()}
+        text_weights = {theme: 0.0 for theme in self.RISK_THEMES.keys()}
         total_negative_reviews = 0
+        reviews_analyzed = 0
+        competitors_with_text = 0
+
+        competitors = competitor_data[:20]  # Top 20 competitors
+        self._ingest_competitor_reviews([comp.get('app_id') for comp in competitors])
 
-        for comp in competitor_data[:20]:  # Top 20 competitors
+        for comp in competitors:
             review_score = comp.get('review_score', 0)
 
+            text_themes = self._competitor_review_themes(comp.get('app_id'))
+            if text_themes is not None:
+                negatives, matches = text_themes
+                total_negative_reviews += 1
+                competitors_with_text += 1
+                reviews_analyzed += negatives
+                for theme, count in matches.items():
+                    text_counts[theme] += count
+                    text_weights[theme] += count / negatives
+                continue
+
             # Focus on games with negative reviews (< 70% positive)
             if review_score < 70:
                 total_negative_reviews += 1
@@ -193,10 +231,11 @@ class ReviewVulnerabilityAnalyzer:
         theme_prevalence = {}
         for theme, count in theme_counts.items():
             if total_negative_reviews > 0:
-                percentage = (count / total_negative_reviews) * 100
+                # Heuristic hits count 1 per competitor; review text counts its share of negatives
+                percentage = ((count + text_weights[theme]) / total_negative_reviews) * 100
                 if percentage > 10:  # Only include themes that appear in >10% of negative reviews
                     theme_prevalence[theme] = {
-                        'count': count,
+                        'count': count + text_counts[theme],
                         'percentage': round(percentage, 1),
                         'severity': self.RISK_THEMES[theme]['severity'],
                         'description': self.RISK_THEMES[theme]['description']
@@ -204,9 +243,52 @@ class ReviewVulnerabilityAnalyzer:
 
         return {
             'total_negative_reviews_analyzed': total_negative_reviews,
+            'review_texts_analyzed': reviews_analyzed,
+            'competitors_with_review_text': competitors_with_text,
             'common_themes': theme_prevalence
         }
 
+    def _ingest_competitor_reviews(self, app_ids: List[Any]):
+        """
+        Fetch recent competitor reviews into the review store in one batch
+
+        Args:
+            app_ids: Competitor Steam app IDs (falsy entries are skipped)
+        """
+        app_ids = [app_id for app_id in app_ids if app_id]
+        if not app_ids or not self.ingest_reviews:
+            return
+        try:
+            self.review_store.ingest(app_ids)
+        except Exception as e:
+            logger.warning(f"Competitor review ingest failed: {e}")
+
+    def _competitor_review_themes(self, app_id: Any) -> Any:
+        """
+        Count stored negative reviews mentioning each risk theme
+
+        Args:
+            app_id: Competitor Steam app ID
+
+        Returns:
+            (negative review count, {theme: matching reviews}), or None if the
+            competitor has no stored negative reviews
+        """
+        if not app_id:
+            return None
+        try:
+            negatives = self.review_store.count(app_id, voted_up=False)
+            if not negatives:
+                return None
+            matches = self.review_store.count_matches(
+                app_id,
+                {theme: fts_any(info['keywords']) for theme, info in self.RISK_THEMES.items()},
+                voted_up=False
+            )
+        except Exception:
+            return None
+        return negatives, matches
+
     def _predict_game_risks(
         self,
         genres: str,
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Section Stream - Split streamed markdown into sections as they complete
+
+Long report generations arrive as a stream of small text deltas. A section is
+complete as soon as the next top-level heading ('#' or '##') starts, so the
+splitter can hand finished sections to the UI and post-processors while the
+rest of the report is still being generated.
+
+Splitting is lossless: ''.join(sections) == the streamed text.
+"""
+
+import re
+from typing import Iterable, Iterator, List
+
+# Headings that start a new section (level 1-2); deeper headings stay inside
+SECTION_HEADING = re.compile(r'^#{1,2}(?!#)\s')
+
+_FENCE = re.compile(r'^\s*(```|~~~)')
+
+
+class MarkdownSectionSplitter:
+    """
+    Incremental markdown section splitter
+
+    Usage:
+        splitter = MarkdownSectionSplitter()
+        for delta in text_stream:
+            for section in splitter.feed(delta):
+                show(section)
+        for section in splitter.close():
+            show(section)
+    """
+
+    def __init__(self):
+        self._partial_line = ''
+        self._section_lines: List[str] = []
+        self._in_fence = False
+
+    def feed(self, text: str) -> List[str]:
+        """
+        Add streamed text
+
+        Args:
+            text: Next chunk of the stream
+
+        Returns:
+            Sections completed by this chunk (possibly empty)
+        """
+        completed = []
+        lines = (self._partial_line + text).split('\n')
+        self._partial_line = lines.pop()
+
+        for line in lines:
+            section = self._add_line(line + '\n')
+            if section:
+                completed.append(section)
+        return completed
+
+    def close(self) -> List[str]:
+        """
+        Flush the final section at end of stream
+
+        Returns:
+            Remaining sections (the last section, plus one completed by a
+            trailing unterminated heading line, if any)
+        """
+        completed = []
+        if self._partial_line:
+            section = self._add_line(self._partial_line)
+            self._partial_line = ''
+            if section:
+                completed.append(section)
+
+        if self._section_lines:
+            completed.append(''.join(self._section_lines))
+            self._section_lines = []
+        return completed
+
+    def _add_line(self, line: str) -> str:
+        """Append a line, returning the previous section if this line starts a new one"""
+        finished = ''
+        if _FENCE.match(line):
+            self._in_fence = not self._in_fence
+        elif not self._in_fence and SECTION_HEADING.match(line) and self._section_lines:
+            finished = ''.join(self._section_lines)
+            self._section_lines = []
+
+        self._section_lines.append(line)
+        return finished
+
+
+def iter_markdown_sections(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Yield markdown sections from a stream of text chunks as each completes
+
+    Args:
+        chunks: Streamed text deltas
+
+    Yields:
+        Complete sections, in order
+    """
+    splitter = MarkdownSectionSplitter()
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+    yield from splitter.close()
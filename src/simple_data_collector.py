@@ -11,6 +11,7 @@ Uses existing Steam API integrations but simplified flow:
 import requests
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
@@ -19,8 +20,18 @@ from bs4 import BeautifulSoup
 from src.game_search import GameSearch
 from src.steamdb_scraper import SteamDBScraper
 from src.api_clients import create_api_clients
+from src.api_rate_limiter import (
+    RateLimiter,
+    steamspy_rate_limiter,
+    steamdb_rate_limiter,
+    rawg_api_rate_limiter,
+    hltb_rate_limiter
+)
 from config import Config
 
+# Concurrent requests while enriching competitors (per-API rate limiters still apply)
+COMPETITOR_FETCH_WORKERS = 8
+
 
 class SimpleDataCollector:
     """Simplified data collection for audit generation"""
@@ -150,59 +161,121 @@ class SimpleDataCollector:
         return game_data
 
     def _fetch_competitors(self, competitor_names: List[str]) -> List[Dict[str, Any]]:
-        """Fetch data for all competitors"""
-        competitors = []
+        """
+        Fetch data for all competitors (CONCURRENT PIPELINE)
+
+        Per competitor, sources form a small dependency graph:
+        - search only needs the name -> starts immediately
+        - RAWG and HLTB (by name) start once search finds the game, so
+          competitors missing from Steam cost no further lookups
+        - SteamDB sales and SteamSpy need the app_id -> start with them
+
+        All competitors run at once on a shared pool; each source goes through
+        its shared rate limiter instead of a fixed sleep (GameSearch limits its
+        own Steam requests, so search is submitted directly). Results are
+        assembled in input order with the same content as a sequential fetch.
+        """
+        if not competitor_names:
+            return []
 
-        for i, comp_name in enumerate(competitor_names, 1):
-            print(f"  [{i}/{len(competitor_names)}] {comp_name}...")
+        use_rawg = 'rawg' in self.api_clients
 
-            try:
-                # Search for competitor by name
-                comp_data = self.game_search.search_game(comp_name)
-
-                if comp_data:
-                    # Get additional data
-                    app_id = comp_data.get('app_id')
-                    if app_id:
-                        try:
-                            sales_data = self.steamdb_scraper.get_sales_data(str(app_id))
-                            comp_data['sales_data'] = sales_data
-                        except:
-                            comp_data['sales_data'] = {}
-
-                        # NEW: Get SteamSpy data for competitor
-                        try:
-                            steamspy_client = self.api_clients['steamspy']
-                            steamspy_data = steamspy_client.get_game_data(str(app_id))
-                            comp_data['steamspy'] = steamspy_data
-                        except:
-                            comp_data['steamspy'] = {'found': False}
-
-                    # NEW: Get RAWG data for competitor (Metacritic)
-                    if 'rawg' in self.api_clients:
-                        try:
-                            rawg_client = self.api_clients['rawg']
-                            rawg_data = rawg_client.search_game(comp_name)
-                            comp_data['rawg'] = rawg_data if rawg_data else {'found': False}
-                        except:
-                            comp_data['rawg'] = {'found': False}
-
-                    # Get HLTB data
-                    comp_data['playtime'] = self._fetch_howlongtobeat(comp_name)
-
-                    competitors.append(comp_data)
-                    print("    ✅ Loaded with enhanced data")
-                else:
+        with ThreadPoolExecutor(max_workers=COMPETITOR_FETCH_WORKERS) as executor:
+            # Stage 1: Steam search for every competitor
+            searches = {
+                executor.submit(self.game_search.search_game, name): i
+                for i, name in enumerate(competitor_names)
+            }
+
+            # Stage 2: remaining lookups as soon as each search finds its game
+            search_results = [None] * len(competitor_names)
+            search_errors = [None] * len(competitor_names)
+            rawg_futures = [None] * len(competitor_names)
+            hltb_futures = [None] * len(competitor_names)
+            sales_futures = [None] * len(competitor_names)
+            steamspy_futures = [None] * len(competitor_names)
+
+            for future in as_completed(searches):
+                i = searches[future]
+                try:
+                    comp_data = future.result()
+                except Exception as e:
+                    search_errors[i] = e
+                    continue
+
+                search_results[i] = comp_data
+                if not comp_data:
+                    continue
+
+                name = competitor_names[i]
+                if use_rawg:
+                    rawg_futures[i] = executor.submit(self._fetch_competitor_rawg, name)
+                hltb_futures[i] = executor.submit(
+                    self._rate_limited, hltb_rate_limiter, self._fetch_howlongtobeat, name
+                )
+                app_id = comp_data.get('app_id')
+                if app_id:
+                    sales_futures[i] = executor.submit(self._fetch_competitor_sales, str(app_id))
+                    steamspy_futures[i] = executor.submit(self._fetch_competitor_steamspy, str(app_id))
+
+            # Assemble in input order
+            competitors = []
+            for i, comp_name in enumerate(competitor_names):
+                print(f"  [{i + 1}/{len(competitor_names)}] {comp_name}...")
+
+                if search_errors[i] is not None:
+                    print(f"    ❌ Error: {search_errors[i]}")
+                    continue
+
+                comp_data = search_results[i]
+                if not comp_data:
                     print("    ❌ Not found")
+                    continue
 
-            except Exception as e:
-                print(f"    ❌ Error: {e}")
+                if sales_futures[i] is not None:
+                    comp_data['sales_data'] = sales_futures[i].result()
+                    comp_data['steamspy'] = steamspy_futures[i].result()
+
+                if use_rawg:
+                    comp_data['rawg'] = rawg_futures[i].result()
 
-            # Rate limiting
-            time.sleep(1)
+                comp_data['playtime'] = hltb_futures[i].result()
+
+                competitors.append(comp_data)
+                print("    ✅ Loaded with enhanced data")
 
         return competitors
 
+    @staticmethod
+    def _rate_limited(limiter: RateLimiter, func, *args):
+        """Call func once the shared limiter allows it"""
+        limiter.acquire()
+        return func(*args)
+
+    def _fetch_competitor_sales(self, app_id: str) -> Dict[str, Any]:
+        """SteamDB sales data for a competitor ({} on failure)"""
+        try:
+            return self._rate_limited(steamdb_rate_limiter, self.steamdb_scraper.get_sales_data, app_id)
+        except Exception:
+            return {}
+
+    def _fetch_competitor_steamspy(self, app_id: str) -> Dict[str, Any]:
+        """SteamSpy data for a competitor ({'found': False} on failure)"""
+        try:
+            steamspy_client = self.api_clients['steamspy']
+            return self._rate_limited(steamspy_rate_limiter, steamspy_client.get_game_data, app_id)
+        except Exception:
+            return {'found': False}
+
+    def _fetch_competitor_rawg(self, comp_name: str) -> Dict[str, Any]:
+        """RAWG data (Metacritic) for a competitor ({'found': False} on failure)"""
+        try:
+            rawg_client = self.api_clients['rawg']
+            rawg_data = self._rate_limited(rawg_api_rate_limiter, rawg_client.search_game, comp_name)
+            return rawg_data if rawg_data else {'found': False}
+        except Exception:
+            return {'found': False}
+
     def _external_research(
         self,
         game_data: Dict[str, Any],
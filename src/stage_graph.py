@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Stage Graph - Dependency-aware concurrent execution of named pipeline stages
+
+Multi-pass report generation is a set of stages where most passes only need
+the draft and the input data, not each other. Declaring each stage with its
+explicit inputs lets independent stages run concurrently while real
+dependencies (e.g. ensemble needs benchmark + scenario) stay ordered, so wall
+time approaches the critical path instead of the sum of all passes.
+
+input_fingerprint() content-addresses a stage's inputs, so callers can keep
+outputs whose inputs are unchanged and only re-run the stale stages.
+"""
+
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class Stage:
+    """A named pipeline stage"""
+    name: str
+    func: Callable[..., Any]  # Called with one keyword argument per input
+    inputs: List[str] = field(default_factory=list)  # Context keys or other stage names
+
+
+@dataclass
+class StageTiming:
+    """Wall-clock timing of one stage run"""
+    name: str
+    started: float   # Seconds since the graph started
+    finished: float  # Seconds since the graph started
+
+    @property
+    def duration(self) -> float:
+        return self.finished - self.started
+
+
+class StageGraph:
+    """
+    DAG of named stages executed on a bounded thread pool
+
+    Usage:
+        graph = StageGraph([
+            Stage('draft', make_draft, ['game_data']),
+            Stage('audit', audit, ['draft', 'game_data']),
+            Stage('benchmark', benchmark, ['game_data']),
+        ])
+        results, timings = graph.run({'game_data': game_data}, max_workers=4)
+    """
+
+    def __init__(self, stages: List[Stage]):
+        """
+        Initialize graph
+
+        Args:
+            stages: Stages in declaration order (used as tie-break for scheduling)
+
+        Raises:
+            ValueError: If stage names are duplicated
+        """
+        names = [stage.name for stage in stages]
+        duplicates = {name for name in names if names.count(name) > 1}
+        if duplicates:
+            raise ValueError(f"Duplicate stage names: {sorted(duplicates)}")
+
+        self.stages = {stage.name: stage for stage in stages}
+
+    def dependents(self, name: str) -> List[str]:
+        """
+        Get every stage downstream of a stage (direct and transitive)
+
+        Args:
+            name: Stage name
+
+        Returns:
+            Downstream stage names in declaration order
+        """
+        downstream = set()
+        frontier = [name]
+        while frontier:
+            current = frontier.pop()
+            for stage in self.stages.values():
+                if current in stage.inputs and stage.name not in downstream:
+                    downstream.add(stage.name)
+                    frontier.append(stage.name)
+        return [stage_name for stage_name in self.stages if stage_name in downstream]
+
+    def run(
+        self,
+        context: Dict[str, Any],
+        max_workers: int = 4,
+        stages: Optional[List[str]] = None,
+        on_stage_done: Optional[Callable[[str, Any], None]] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, StageTiming]]:
+        """
+        Execute stages as soon as their inputs are available
+
+        Args:
+            context: Base inputs, plus any already-computed stage outputs
+            max_workers: Maximum stages running at once
+            stages: Only run these stages (None = every stage not already in context)
+            on_stage_done: Optional callback(stage_name, output), called on the
+                calling thread as each stage finishes (e.g. to persist outputs)
+
+        Returns:
+            Tuple of (results, timings): results holds the context plus every
+            stage output keyed by stage name; timings holds a StageTiming per
+            executed stage
+
+        Raises:
+            ValueError: If a stage's inputs can never be satisfied
+        """
+        results = dict(context)
+        if stages is None:
+            pending = {name: stage for name, stage in self.stages.items() if name not in results}
+        else:
+            pending = {name: self.stages[name] for name in stages}
+            for name in stages:
+                results.pop(name, None)
+
+        timings: Dict[str, StageTiming] = {}
+        graph_start = time.perf_counter()
+
+        def _execute(stage: Stage) -> Tuple[Any, StageTiming]:
+            started = time.perf_counter() - graph_start
+            output = stage.func(**{key: results[key] for key in stage.inputs})
+            finished = time.perf_counter() - graph_start
+            return output, StageTiming(stage.name, started, finished)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running = {}
+            while pending or running:
+                ready = [
+                    stage for stage in pending.values()
+                    if all(key in results for key in stage.inputs)
+                ]
+                for stage in ready:
+                    del pending[stage.name]
+                    running[executor.submit(_execute, stage)] = stage.name
+
+                if not running:
+                    missing = {
+                        name: [key for key in stage.inputs if key not in results]
+                        for name, stage in pending.items()
+                    }
+                    raise ValueError(f"Unsatisfiable stage inputs: {missing}")
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    output, timing = future.result()
+                    results[name] = output
+                    timings[name] = timing
+                    if on_stage_done is not None:
+                        on_stage_done(name, output)
+
+        total = time.perf_counter() - graph_start
+        serial = sum(timing.duration for timing in timings.values())
+        logger.info(
+            f"Stage graph: {len(timings)} stages in {total:.1f}s wall "
+            f"({serial:.1f}s if run sequentially)"
+        )
+
+        return results, timings
+
+
+def format_timings(timings: Dict[str, StageTiming]) -> Dict[str, float]:
+    """
+    Flatten timings to {stage_name: seconds} for reports and JSON
+
+    Args:
+        timings: Timings from StageGraph.run
+
+    Returns:
+        Stage durations in seconds, rounded to milliseconds, in start order
+    """
+    ordered = sorted(timings.values(), key=lambda timing: timing.started)
+    return {timing.name: round(timing.duration, 3) for timing in ordered}
+
+
+def input_fingerprint(value: Any) -> str:
+    """
+    Content-address a stage input (or a dict of inputs)
+
+    Dict key order does not matter (unless keys mix types); values JSON
+    cannot encode are hashed by str(), so objects without a stable repr never
+    match a previous run.
+
+    Args:
+        value: Input value
+
+    Returns:
+        SHA-256 hex digest of the canonical JSON encoding
+    """
+    try:
+        canonical = json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    except TypeError:  # Mixed key types can't be sorted: keep insertion order
+        canonical = json.dumps(value, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
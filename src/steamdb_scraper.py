@@ -4,6 +4,7 @@ import time
 from src.alternative_data_sources import AlternativeDataSource
 from src.cache_manager import get_cache
 from src.logger import get_logger
+from src.review_trends import language_scale, review_trend
 
 cache = get_cache()
 logger = get_logger(__name__)
@@ -11,7 +12,8 @@ logger = get_logger(__name__)
 class SteamDBScraper:
     """Scraper for Steam sales and revenue data"""
 
-    def __init__(self):
+    def __init__(self, review_store=None):
+        self.review_store = review_store  # None = shared ReviewStore
         self.steamspy_api_base = "https://steamspy.com/api.php"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -331,14 +333,23 @@ class SteamDBScraper:
         - velocity_score = recent_reviews / total_reviews
         - Higher score = growing momentum
         - Lower score = declining/established game
+
+        When the local review store covers the last 30 days, the recent count
+        comes from its daily rollup (scaled from the synced language to all
+        languages) instead of a Steam API call.
         """
         sales_data = self.get_sales_data(app_id)
-
-        # Get recent review data from Steam API
-        recent_data = self._get_recent_reviews(app_id)
-
         total_reviews = sales_data.get('reviews_total', 0)
-        recent_reviews = recent_data.get('recent_reviews', 0)
+
+        trend = self._get_review_trend(app_id)
+        if trend and trend['complete']:
+            recent_reviews = round(trend['recent_reviews'] * language_scale(trend, total_reviews))
+            velocity_source = 'review_store'
+        else:
+            # Get recent review data from Steam API
+            recent_data = self._get_recent_reviews(app_id)
+            recent_reviews = recent_data.get('recent_reviews', 0)
+            velocity_source = 'steam_api'
 
         # FIX: Validate that recent_reviews cannot exceed total_reviews
         # This can happen due to API inconsistencies or timing differences
@@ -368,9 +379,21 @@ class SteamDBScraper:
             'recent_reviews': recent_reviews,
             'velocity_score': velocity_score,
             'velocity_percentage': f"{velocity_score * 100:.2f}%",
-            'velocity_status': velocity_status
+            'velocity_status': velocity_status,
+            'velocity_source': velocity_source,
+            'review_trend': trend
         }
 
+    def _get_review_trend(self, app_id: Any) -> Optional[Dict[str, Any]]:
+        """30-day review trend from the local review store (None if not stored)"""
+        if app_id == 'unknown' or app_id == 'fallback' or str(app_id).startswith('fallback'):
+            return None
+        try:
+            return review_trend(app_id, window_days=30, store=self.review_store)
+        except Exception as e:
+            logger.warning(f"Review trend unavailable for {app_id}: {e}")
+            return None
+
     def _get_recent_reviews(self, app_id: Any) -> Dict[str, int]:
         """
         Get recent review count from Steam API
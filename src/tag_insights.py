@@ -7,6 +7,8 @@ Identifies high-value tags to add and low-value tags to remove.
 
 from typing import Dict, Any, List, Tuple
 
+from src.tag_vocabulary import get_tag_vocabulary
+
 
 class TagInsightsAnalyzer:
     """Analyzes tags and provides impression estimates"""
@@ -65,7 +67,12 @@ class TagInsightsAnalyzer:
 
     def __init__(self):
         """Initialize the tag insights analyzer"""
-        pass
+        # Key traffic data by shared vocabulary ID so 'Rogue-like', 'roguelike'
+        # and 'Roguelike' all resolve to the same entry
+        self.vocabulary = get_tag_vocabulary()
+        self._traffic_by_id = dict(zip(
+            self.vocabulary.intern_many(self.TAG_TRAFFIC), self.TAG_TRAFFIC.values()
+        ))
 
     def analyze_tags(
         self,
@@ -119,7 +126,12 @@ class TagInsightsAnalyzer:
         all_tags_str = f"{tags_str}, {genres_str}"
         tags = [t.strip().lower() for t in all_tags_str.split(',') if t.strip()]
 
-        return list(set(tags))  # Remove duplicates
+        # Remove duplicates (including alias spellings of the same tag). The
+        # game's tags are interned here so later lookups can match them
+        unique = {}
+        for tag, tag_id in zip(tags, self.vocabulary.intern_many(tags)):
+            unique.setdefault(tag_id, tag)
+        return list(unique.values())
 
     def _analyze_current_tags(
         self,
@@ -130,7 +142,7 @@ class TagInsightsAnalyzer:
         analysis = []
 
         for tag in current_tags:
-            tag_data = self.TAG_TRAFFIC.get(tag)
+            tag_data = self._traffic_by_id.get(self.vocabulary.lookup(tag))
 
             if tag_data:
                 # Estimate your visibility in this tag (based on engagement)
@@ -180,6 +192,7 @@ class TagInsightsAnalyzer:
         genres = game_data.get('genres', '').lower()
         tags = game_data.get('tags', '').lower()
         combined = f"{genres} {tags}"
+        current_ids = self.vocabulary.ids(current_tags)
 
         suggestions = []
 
@@ -199,7 +212,7 @@ class TagInsightsAnalyzer:
         for genre_key, rec_tags in recommendations.items():
             if genre_key in combined:
                 for rec_tag in rec_tags:
-                    if rec_tag not in current_tags and rec_tag in self.TAG_TRAFFIC:
+                    if self.vocabulary.lookup(rec_tag) not in current_ids and rec_tag in self.TAG_TRAFFIC:
                         tag_data = self.TAG_TRAFFIC[rec_tag]
 
                         # Estimate impact if added (assume 0.2% visibility for new tag)
@@ -216,7 +229,8 @@ class TagInsightsAnalyzer:
                         })
 
         # Always recommend singleplayer or multiplayer if not present
-        if 'singleplayer' not in current_tags and 'multiplayer' not in current_tags:
+        player_count_ids = self.vocabulary.ids(['singleplayer', 'multiplayer'])
+        if not (player_count_ids & current_ids):
             tag = 'singleplayer'  # Assume singleplayer by default
             tag_data = self.TAG_TRAFFIC[tag]
             estimated_impressions = int(tag_data['traffic'] * 0.002)
@@ -233,7 +247,7 @@ class TagInsightsAnalyzer:
 
         # Always recommend art style tag if not present
         art_tags = ['pixel art', '2d', '3d', 'hand-drawn', 'low-poly']
-        has_art_tag = any(tag in current_tags for tag in art_tags)
+        has_art_tag = bool(self.vocabulary.ids(art_tags) & current_ids)
 
         if not has_art_tag and 'pixel' in combined:
             tag = 'pixel art'
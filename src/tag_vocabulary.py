@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Tag Vocabulary - Shared integer identity for Steam tags and genres
+
+Tags and genres arrive from Steam, SteamSpy, store-page scraping and intake
+forms with inconsistent spelling ("Rogue-like", "roguelike", "Single-player",
+"Singleplayer"). The vocabulary interns every name to a small integer so all
+analyzers agree on what counts as the same tag, and set operations can run
+on integer bitmasks instead of string sets.
+
+The vocabulary is persisted next to the API cache so IDs stay stable across
+runs. Names are added where tag lists enter the pipeline (intern_many);
+matching and scoring only look names up (ids/mask), so unknown tags get no
+bit and hot paths never take the write lock. New names are written to disk
+in batches.
+"""
+
+import atexit
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Union
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_VOCABULARY_PATH = Path(".cache") / "catalog" / "tag_vocabulary.json"
+
+# New names are persisted once this many are pending (and at exit)
+TAG_VOCABULARY_SAVE_BATCH = int(os.getenv('TAG_VOCABULARY_SAVE_BATCH', '50'))
+
+# Spellings that don't collapse to the same key by punctuation/case alone.
+# Keys and values are normalized keys (see TagVocabulary.normalize).
+TAG_ALIASES = {
+    'deckbuilding': 'deckbuilder',
+    'deckbuilders': 'deckbuilder',
+    'roleplaying': 'rpg',
+    'roleplayinggame': 'rpg',
+    'sciencefiction': 'scifi',
+    'firstpersonshooter': 'fps',
+    'shmup': 'shootemup',
+    'towerdefence': 'towerdefense',
+    'citybuilding': 'citybuilder',
+    'colonysimulation': 'colonysim',
+    'proceduralgenerated': 'proceduralgeneration',
+    'procgen': 'proceduralgeneration',
+    'massivelymultiplayer': 'mmo',
+    'cooperative': 'coop',
+}
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+TagName = Union[str, Dict[str, Any]]
+
+
+class TagVocabulary:
+    """
+    Interned, persisted mapping of tag/genre names to integer IDs
+
+    Features:
+    - Case, punctuation and alias-insensitive identity
+    - Stable IDs persisted as JSON, written in batches
+    - Read-only bitmask helpers for fast overlap counts
+    - Thread-safe (competitor fetching runs on worker threads)
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Initialize vocabulary
+
+        Args:
+            path: JSON file used for persistence (None = in-memory only)
+        """
+        self.path = Path(path) if path else None
+        self._names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._unsaved = 0
+        self._lock = threading.Lock()
+
+        if self.path and self.path.exists():
+            self._load()
+
+    @staticmethod
+    def normalize(name: TagName) -> str:
+        """
+        Reduce a tag/genre name to its identity key
+
+        Accepts plain strings or Steam's {'description': 'Action'} dicts.
+
+        Args:
+            name: Raw tag or genre name
+
+        Returns:
+            Normalized key ('' if the name is empty)
+        """
+        if isinstance(name, dict):
+            name = name.get('description', '')
+        key = _NON_ALNUM.sub('', str(name).lower())
+        return TAG_ALIASES.get(key, key)
+
+    def _load(self):
+        """Load persisted vocabulary from disk"""
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            self._names = list(data['names'])
+            self._ids = {key: int(tag_id) for key, tag_id in data['ids'].items()}
+        except (json.JSONDecodeError, KeyError, OSError, ValueError) as e:
+            logger.warning(f"Tag vocabulary at {self.path} unreadable, starting fresh: {e}")
+            self._names = []
+            self._ids = {}
+
+    def save(self):
+        """Persist names added since the last save (no-op for in-memory vocabularies)"""
+        if not self.path:
+            return
+        with self._lock:
+            if self._unsaved:
+                self._save_locked()
+
+    def _save_locked(self):
+        self._unsaved = 0
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({'names': self._names, 'ids': self._ids}, f, indent=2)
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.error(f"Tag vocabulary write error: {e}")
+
+    def _intern_locked(self, name: TagName) -> Optional[int]:
+        key = self.normalize(name)
+        if not key:
+            return None
+        tag_id = self._ids.get(key)
+        if tag_id is None:
+            tag_id = len(self._names)
+            display = name.get('description', '') if isinstance(name, dict) else str(name)
+            self._names.append(display.strip())
+            self._ids[key] = tag_id
+        return tag_id
+
+    def intern(self, name: TagName) -> Optional[int]:
+        """
+        Get the ID for a name, adding it to the vocabulary if new
+
+        Args:
+            name: Tag or genre name
+
+        Returns:
+            Integer ID, or None for empty names
+        """
+        return self.intern_many([name])[0]
+
+    def intern_many(self, names: Iterable[TagName]) -> List[Optional[int]]:
+        """
+        Intern several names, adding new ones to the vocabulary
+
+        New names are persisted once TAG_VOCABULARY_SAVE_BATCH are pending
+        (see save).
+
+        Args:
+            names: Tag or genre names
+
+        Returns:
+            IDs in input order (None for empty names)
+        """
+        with self._lock:
+            size_before = len(self._names)
+            ids = [self._intern_locked(name) for name in names]
+            self._unsaved += len(self._names) - size_before
+            if self.path and self._unsaved >= TAG_VOCABULARY_SAVE_BATCH:
+                self._save_locked()
+        return ids
+
+    def lookup(self, name: TagName) -> Optional[int]:
+        """
+        Get the ID for a name without adding it
+
+        Args:
+            name: Tag or genre name
+
+        Returns:
+            Integer ID, or None if unknown
+        """
+        return self._ids.get(self.normalize(name))
+
+    def name(self, tag_id: int) -> str:
+        """
+        Get the display name for an ID (first spelling seen)
+
+        Args:
+            tag_id: Integer ID
+
+        Returns:
+            Display name
+        """
+        return self._names[tag_id]
+
+    def ids(self, names: Iterable[TagName]) -> FrozenSet[int]:
+        """
+        Look up names as a set of IDs (unknown names are left out)
+
+        Args:
+            names: Tag or genre names
+
+        Returns:
+            Frozen set of integer IDs
+        """
+        looked_up = (self.lookup(name) for name in names)
+        return frozenset(tag_id for tag_id in looked_up if tag_id is not None)
+
+    def mask(self, names: Iterable[TagName]) -> int:
+        """
+        Look up names as a bitmask (bit N = ID N; unknown names get no bit)
+
+        Args:
+            names: Tag or genre names
+
+        Returns:
+            Integer bitmask
+        """
+        bits = 0
+        for tag_id in self.ids(names):
+            bits |= 1 << tag_id
+        return bits
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+def count_bits(mask: int) -> int:
+    """
+    Count set bits in a tag bitmask (size of the tag set)
+
+    Args:
+        mask: Bitmask from TagVocabulary.mask
+
+    Returns:
+        Number of tags in the mask
+    """
+    return bin(mask).count('1')
+
+
+# Global vocabulary instance
+_global_vocabulary = None
+
+
+def get_tag_vocabulary() -> TagVocabulary:
+    """
+    Get global tag vocabulary (singleton pattern)
+
+    Returns:
+        Global TagVocabulary instance
+    """
+    global _global_vocabulary
+    if _global_vocabulary is None:
+        _global_vocabulary = TagVocabulary(DEFAULT_VOCABULARY_PATH)
+        atexit.register(_global_vocabulary.save)
+    return _global_vocabulary
+
+
+def set_tag_vocabulary(vocabulary: Optional[TagVocabulary]):
+    """
+    Replace the global tag vocabulary (e.g. with a temporary one in tests)
+
+    Args:
+        vocabulary: Vocabulary to use (None = default persisted vocabulary on next use)
+    """
+    global _global_vocabulary
+    _global_vocabulary = vocabulary
@@ -10,8 +10,9 @@ Predicts Steam algorithm behavior and discovery queue placement based on:
 Classifies games into visibility tiers (1-4) and provides actionable path to improvement.
 """
 
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import math
+from src.review_trends import language_scale, review_trend
 
 
 class VisibilityForecastAnalyzer:
@@ -33,9 +34,18 @@ class VisibilityForecastAnalyzer:
         'tier_4': {'main': 50, 'genre': 50, 'featured': 0},
     }
 
-    def __init__(self):
+    # Daily review velocity tiers (all languages), used when the review store
+    # covers the last 30 days: ~1 review per 500 wishlists puts 20+/day in tier 1
+    REVIEW_VELOCITY_TIERS = [
+        (20, 90),   # Tier 1 level
+        (5, 75),    # Tier 2 level
+        (1, 55),    # Tier 3 level
+        (0.3, 45),  # Lower Tier 3
+    ]
+
+    def __init__(self, review_store=None):
         """Initialize the visibility forecast analyzer"""
-        pass
+        self.review_store = review_store  # None = shared ReviewStore
 
     def analyze_visibility(
         self,
@@ -55,7 +65,8 @@ class VisibilityForecastAnalyzer:
             Complete visibility forecast with tier, predictions, and path to improvement
         """
         # Calculate component scores
-        wishlist_velocity_score = self._calculate_wishlist_velocity_score(sales_data)
+        review_velocity = self._get_review_velocity(game_data, sales_data)
+        wishlist_velocity_score = self._calculate_wishlist_velocity_score(sales_data, review_velocity)
         tag_effectiveness_score = self._calculate_tag_effectiveness_score(game_data, sales_data)
         engagement_score = self._calculate_engagement_score(sales_data)
         quality_score = self._calculate_quality_score(game_data, sales_data, capsule_analysis)
@@ -96,18 +107,52 @@ class VisibilityForecastAnalyzer:
                 'engagement': round(engagement_score, 1),
                 'quality': round(quality_score, 1)
             },
+            'review_velocity': review_velocity,
             'discovery_predictions': discovery_predictions,
             'feature_eligibility': feature_eligibility,
             'improvement_path': path_to_improvement
         }
 
-    def _calculate_wishlist_velocity_score(self, sales_data: Dict[str, Any]) -> float:
+    def _get_review_velocity(self, game_data: Dict[str, Any], sales_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Measured review velocity from the review store's daily rollup
+
+        Returns:
+            Dictionary with reviews_per_day (all languages), trend,
+            velocity_change and positive_delta, or None when the store doesn't
+            cover the last 30 days
+        """
+        app_id = game_data.get('app_id')
+        if not app_id:
+            return None
+        try:
+            trend = review_trend(app_id, window_days=30, store=self.review_store)
+        except Exception:
+            return None
+        if not trend or not trend['complete']:
+            return None
+
+        scale = language_scale(trend, sales_data.get('reviews_total', 0))
+        return {
+            'reviews_per_day': round(trend['reviews_per_day'] * scale, 2),
+            'trend': trend['trend'],
+            'velocity_change': trend['velocity_change'],
+            'positive_delta': trend['positive_delta'],
+            'trend_breaks': trend['trend_breaks'],
+        }
+
+    def _calculate_wishlist_velocity_score(
+        self,
+        sales_data: Dict[str, Any],
+        review_velocity: Dict[str, Any] = None
+    ) -> float:
         """
         Calculate wishlist velocity score (0-100)
 
         Uses review velocity as proxy:
-        - Review count and review score as signals
-        - Estimated from review count patterns
+        - Measured reviews/day from the review store when available
+        - Otherwise estimated from review count patterns
+        - Review score as quality signal
         """
         reviews_total = sales_data.get('reviews_total', 0)
         review_score = sales_data.get('review_score', 75)
@@ -125,8 +170,12 @@ class VisibilityForecastAnalyzer:
         # Top 30%: 5-20 wishlists/day
         # Bottom 70%: <5 wishlists/day
 
+        if review_velocity is not None:
+            # Measured daily review velocity
+            per_day = review_velocity['reviews_per_day']
+            base_score = next((score for minimum, score in self.REVIEW_VELOCITY_TIERS if per_day >= minimum), 30)
         # For pre-launch or early launch, use review count as proxy
-        if reviews_total >= 2000:
+        elif reviews_total >= 2000:
             # Tier 1 level
             base_score = 90
         elif reviews_total >= 500:
@@ -0,0 +1,122 @@
+"""
+Test Audit Stage Graph
+
+Validates the StageGraph executor and that AIGenerator runs its audit passes
+concurrently while respecting real dependencies. LLM passes are replaced
+with timed fakes.
+"""
+
+import os
+import sys
+import tempfile
+import time
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.stage_graph import Stage, StageGraph
+from src.ai_generator import AIGenerator
+from src.report_run_store import ReportRunStore
+
+PASS_DELAY = 0.3
+
+
+def test_stage_graph_ordering():
+    """Dependent stages wait; independent stages overlap"""
+
+    print("=" * 80)
+    print("TEST 1: StageGraph Ordering")
+    print("=" * 80)
+
+    def slow(value):
+        time.sleep(PASS_DELAY)
+        return value
+
+    graph = StageGraph([
+        Stage('a', lambda x: slow(x + 1), ['x']),
+        Stage('b', lambda x: slow(x * 10), ['x']),
+        Stage('c', lambda a, b: a + b, ['a', 'b']),
+    ])
+    results, timings = graph.run({'x': 1}, max_workers=4)
+
+    assert results['c'] == 12
+    assert timings['c'].started >= max(timings['a'].finished, timings['b'].finished)
+    assert timings['b'].started < timings['a'].finished
+    assert graph.dependents('a') == ['c']
+
+    # Re-run a single stage from stored outputs
+    results, timings = graph.run({'x': 1, 'a': 5, 'b': 10}, stages=['c'])
+    assert results['c'] == 15 and list(timings) == ['c']
+
+    try:
+        StageGraph([Stage('d', lambda missing: missing, ['missing'])]).run({})
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+    print("✅ Dependencies respected, independent stages overlapped")
+    print()
+
+
+def test_audit_passes_run_concurrently():
+    """generate_report_with_audit wall time tracks the critical path"""
+
+    print("=" * 80)
+    print("TEST 2: AIGenerator Audit Graph")
+    print("=" * 80)
+
+    generator = AIGenerator(api_key='test-key')
+    calls = []
+
+    def fake_pass(name, result):
+        def run(*args, **kwargs):
+            calls.append(name)
+            time.sleep(PASS_DELAY)
+            return result() if callable(result) else result
+        return run
+
+    generator._generate_initial_draft = fake_pass('draft', '# Draft Report\n\nBody')
+    generator._warm_review_prefix = lambda shared_context, draft_report: calls.append('warmup')
+    generator._audit_report = fake_pass('audit', lambda: {'needs_correction': False})
+    for name in ['_verify_facts', '_check_consistency', '_validate_competitors',
+                 '_run_specialized_audits', '_validate_recommendations',
+                 '_analyze_benchmarks', '_generate_scenarios']:
+        setattr(generator, name, fake_pass(name, {'pass': name}))
+
+    def ensemble(game_data, sales_data, competitor_data, benchmark_analysis, scenario_analysis):
+        assert benchmark_analysis == {'pass': '_analyze_benchmarks'}
+        assert scenario_analysis == {'pass': '_generate_scenarios'}
+        time.sleep(PASS_DELAY)
+        return {'ensemble_mode': 'claude_only'}
+
+    generator._run_ensemble_analysis = ensemble
+    generator._generate_enhanced_report = lambda *args: '# Final Report\n\nBody'
+    generator._enforce_specificity = lambda report, game_data, sales_data: report
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generator.run_store = ReportRunStore(tmp)
+        start = time.time()
+        report, audit_results = generator.generate_report_with_audit(
+            {'name': 'Test Game', 'app_id': 1},
+            {'estimated_revenue': '$10,000', 'reviews_total': 100, 'review_score': 90},
+            []
+        )
+        elapsed = time.time() - start
+
+    assert report.startswith('# Final Report')
+    assert audit_results['needs_correction'] is False
+    assert audit_results['fact_check'] == {'pass': '_verify_facts'}
+    assert audit_results['ensemble_analysis'] == {'ensemble_mode': 'claude_only'}
+    assert len(audit_results['stage_timings']) == 10
+    # Prefix warmed after the draft, before the passes that review it fan out
+    review_passes = ['audit', '_verify_facts', '_check_consistency', '_run_specialized_audits',
+                     '_validate_recommendations']
+    assert calls.index('draft') < calls.index('warmup') < min(calls.index(name) for name in review_passes)
+    # Sequential: 10 passes; critical path: draft -> audit-passes (2 waves at 4 workers)
+    assert elapsed < 10 * PASS_DELAY * 0.7
+
+    print(f"✅ 10 passes in {elapsed:.2f}s (sequential ~{10 * PASS_DELAY:.1f}s)")
+    print()
+
+
+if __name__ == "__main__":
+    test_stage_graph_ordering()
+    test_audit_passes_run_concurrently()
@@ -0,0 +1,107 @@
+"""
+Test Bulk appdetails Fetcher
+
+Validates filtered per-app appdetails requests, caching, and that apps
+Steam has no data for are skipped. HTTP is replaced with a fake Steam
+endpoint.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src import game_search as game_search_module
+from src.cache_manager import CacheManager
+from src.game_search import GameSearch, APPDETAILS_FILTERS
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode()
+        self._payload = payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise Exception(f"HTTP {self.status_code}")
+
+    def json(self):
+        return self._payload
+
+
+def _fake_steam(calls, unknown=()):
+    def fake_get(url, params=None, headers=None, timeout=None):
+        calls.append(params)
+        app_id = str(params['appids'])
+        if int(app_id) in unknown:
+            return FakeResponse({app_id: {'success': False}})
+        return FakeResponse({app_id: {'success': True, 'data': {
+            'name': f'Game {app_id}',
+            'genres': [{'description': 'Action'}],
+            'categories': [{'description': 'Single-player'}],
+            'price_overview': {'final': 1499, 'final_formatted': '$14.99'},
+            'release_date': {'date': 'Mar 1, 2024'},
+            'platforms': {'windows': True},
+        }}})
+    return fake_get
+
+
+def _run_bulk(app_ids, unknown=()):
+    calls = []
+    with tempfile.TemporaryDirectory() as tmp:
+        with patch.object(game_search_module, 'cache', CacheManager(cache_dir=tmp)), \
+             patch.object(game_search_module.requests, 'get', _fake_steam(calls, unknown)), \
+             patch.object(GameSearch, 'get_steamspy_data', lambda self, app_id: {'tags': ['Roguelike']}):
+            search = GameSearch()
+            results = search.get_game_details_bulk(app_ids)
+            cached = search.get_game_details_bulk(app_ids)
+    return search, results, cached, calls
+
+
+def test_filtered_fetch():
+    """One filtered request per uncached ID; repeats are served from cache"""
+
+    print("=" * 80)
+    print("TEST 1: Filtered appdetails")
+    print("=" * 80)
+
+    app_ids = list(range(100, 110))
+    search, results, cached, calls = _run_bulk(app_ids)
+
+    assert [r['app_id'] for r in results] == app_ids
+    assert results[0]['price_raw'] == 14.99
+    assert results[0]['tags'] == ['Roguelike']
+    assert sorted(c['appids'] for c in calls) == app_ids
+    assert all(c['filters'] == APPDETAILS_FILTERS for c in calls)
+    assert 'basic' in APPDETAILS_FILTERS.split(',') and 'name' not in APPDETAILS_FILTERS.split(',')
+    assert cached == results
+    assert search.appdetails_stats['calls'] == len(app_ids)
+
+    print(f"✅ {len(app_ids)} games in {len(calls)} filtered requests, none repeated")
+    print()
+
+
+def test_missing_apps_skipped():
+    """Apps without appdetails data are left out and not cached"""
+
+    print("=" * 80)
+    print("TEST 2: Missing Apps Skipped")
+    print("=" * 80)
+
+    app_ids = list(range(200, 205))
+    search, results, cached, calls = _run_bulk(app_ids, unknown={202})
+
+    assert [r['app_id'] for r in results] == [200, 201, 203, 204]
+    assert cached == results
+    assert len(calls) == len(app_ids) + 1  # Only the missing app is asked for again
+
+    print(f"✅ {len(results)} of {len(app_ids)} games returned")
+    print()
+
+
+if __name__ == "__main__":
+    test_filtered_fetch()
+    test_missing_apps_skipped()
@@ -0,0 +1,136 @@
+"""
+Test Incremental Competitor Refresh
+
+Validates that repeat audits reuse stored competitors, re-fetch only stale
+ones, score only newly catalogued candidates and report a diff. Network
+calls are replaced with canned game details.
+"""
+
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.game_search import GameSearch
+from src.competitor_catalog import CandidateCatalog, CompetitorStore
+from src.tag_vocabulary import TagVocabulary, set_tag_vocabulary
+
+
+VOCABULARY_DIR = tempfile.TemporaryDirectory()
+set_tag_vocabulary(TagVocabulary(os.path.join(VOCABULARY_DIR.name, 'tag_vocabulary.json')))
+
+
+def _game(app_id, name, price=14.99, reviews=500):
+    return {
+        'app_id': app_id,
+        'name': name,
+        'genres': ['Action', 'Indie'],
+        'tags': ['Roguelike', 'Pixel Art', 'Action'],
+        'price_raw': price,
+        'release_date': '2024',
+        'categories': ['Single-player'],
+        'review_count': reviews,
+    }
+
+
+def _make_search(tmp, details, listings):
+    search = GameSearch()
+    search.candidate_catalog = CandidateCatalog(tmp)
+    search.competitor_store = CompetitorStore(tmp)
+    search.fetch_log = []
+
+    def get_game_details(app_id):
+        search.fetch_log.append(app_id)
+        return dict(details[app_id])
+
+    def list_candidates(request, value, limit):
+        app_ids = listings.get(request, [])[:limit]
+        search.candidate_catalog.record(f"{request}:{value}", app_ids)
+        return app_ids
+
+    def find_by(request):
+        return lambda value, limit: [get_game_details(i) for i in list_candidates(request, value, limit)]
+
+    search.get_game_details = get_game_details
+    search.get_game_details_bulk = lambda app_ids: [get_game_details(i) for i in app_ids]
+    search._list_candidates = list_candidates
+    search._find_by_tag = find_by('tag')
+    search._find_by_genre = find_by('genre')
+    search._find_by_broad_category = lambda game_data, limit: []
+    return search
+
+
+def test_refresh_reuses_fresh_competitors():
+    """Second run fetches nothing when stored data is fresh"""
+
+    print("=" * 80)
+    print("TEST 1: Fresh Snapshot Reuse")
+    print("=" * 80)
+
+    target = _game(1, 'Target Game')
+    details = {i: _game(i, f'Competitor {i}') for i in range(10, 15)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        search = _make_search(tmp, details, {'tag': [10, 11, 12], 'genre': [13, 14]})
+
+        first = search.refresh_competitors(target, max_competitors=5)
+        assert first['stats']['full_search']
+        assert len(first['diff']['added']) == 5
+
+        search.fetch_log.clear()
+        second = search.refresh_competitors(target, max_competitors=5)
+        assert not second['stats']['full_search']
+        assert search.fetch_log == []
+        assert second['stats']['reused'] == 5
+        assert [c['app_id'] for c in second['competitors']] == [c['app_id'] for c in first['competitors']]
+        assert second['diff']['added'] == [] and second['diff']['removed'] == []
+
+    print("✅ No competitor re-fetched while snapshot is fresh")
+    print()
+
+
+def test_refresh_stale_and_new_candidates():
+    """Stale competitors are re-fetched and only new catalog entries are scored"""
+
+    print("=" * 80)
+    print("TEST 2: Stale Re-fetch + New Candidates")
+    print("=" * 80)
+
+    target = _game(1, 'Target Game')
+    details = {i: _game(i, f'Competitor {i}') for i in range(10, 16)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        listings = {'tag': [10, 11, 12], 'genre': [13]}
+        search = _make_search(tmp, details, listings)
+        search.refresh_competitors(target, max_competitors=6)
+
+        # Age one competitor's snapshot past the TTL and change its price
+        snapshot = search.competitor_store.load(1)
+        snapshot['competitors'][0]['fetched_at'] = 0
+        stale_id = snapshot['competitors'][0]['app_id']
+        search.competitor_store.save(
+            1,
+            [c['data'] for c in snapshot['competitors']],
+            {c['app_id']: c['score'] for c in snapshot['competitors']},
+            {c['app_id']: c['fetched_at'] for c in snapshot['competitors']}
+        )
+        details[stale_id]['price_raw'] = 19.99
+
+        # A new game appears in the tag listing
+        listings['tag'].append(15)
+
+        search.fetch_log.clear()
+        result = search.refresh_competitors(target, max_competitors=6)
+
+        assert sorted(search.fetch_log) == sorted([stale_id, 15])
+        assert [a['app_id'] for a in result['diff']['added']] == [15]
+        changed = {c['app_id']: c['changes'] for c in result['diff']['changed']}
+        assert changed[stale_id]['price_raw'] == {'before': 14.99, 'after': 19.99}
+
+    print("✅ Only stale competitor and new candidate were fetched")
+    print()
+
+
+if __name__ == "__main__":
+    test_refresh_reuses_fresh_competitors()
+    test_refresh_stale_and_new_candidates()
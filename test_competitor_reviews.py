@@ -0,0 +1,156 @@
+"""
+Test Batched Competitor Review Ingestion
+
+Validates that ReviewStore.ingest pulls a bounded number of recent reviews for
+many apps concurrently, that count_matches counts several FTS expressions
+in one grouped query, and that ReviewVulnerabilityAnalyzer measures competitor
+complaint themes from ingested review text. Uses a fake appreviews endpoint;
+no network calls.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.review_store import ReviewStore, fts_any
+from src.review_vulnerability import ReviewVulnerabilityAnalyzer
+
+NOW = int(time.time())
+COMPLAINTS = {
+    101: "The game crashes constantly and my save file got corrupted twice.",
+    102: "Way overpriced for what it is, I asked for a refund after an hour.",
+    103: "Gets repetitive fast, the same three rooms over and over, pure grind.",
+}
+
+
+class CompetitorSteam:
+    """Serves 500 reviews per app (1 in 4 negative) with network latency per page"""
+
+    def __init__(self, latency=0.05):
+        self.latency = latency
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None):
+        app_id = int(url.rstrip('/').split('/')[-1])
+        with self._lock:
+            self.requests.append((app_id, params['cursor']))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+
+        reviews = [
+            {
+                'recommendationid': f"{app_id}-{n}", 'language': 'english',
+                'review': COMPLAINTS[app_id] + f" ({n})" if n % 4 == 0 else f"Great game, review {app_id}-{n}.",
+                'voted_up': n % 4 != 0, 'votes_up': 0, 'timestamp_created': NOW - n * 60,
+                'author': {'steamid': str(n), 'playtime_at_review': 120},
+            }
+            for n in range(500)
+        ]
+        if params['cursor'] != '*':
+            reviews = [r for r in reviews if r['timestamp_created'] < int(params['cursor'])]
+        page = reviews[:100]
+        data = {
+            'success': 1, 'reviews': page,
+            'cursor': str(page[-1]['timestamp_created']) if page else params['cursor'],
+            'query_summary': {'total_reviews': 500},
+        }
+        return type('Response', (), {'raise_for_status': lambda self: None, 'json': lambda self: data})()
+
+
+def test_batched_ingest():
+    """All competitors page at once, each bounded to a few pages"""
+
+    print("=" * 80)
+    print("TEST 1: Batched Ingest")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        steam = CompetitorSteam()
+        store = ReviewStore(tmp, session=steam)
+
+        start = time.time()
+        added = store.ingest([101, 102, 103, 101, None], max_pages=2)
+        elapsed = time.time() - start
+
+        assert added == {'101': 200, '102': 200, '103': 200}
+        assert len(steam.requests) == 6  # Bounded: 2 pages per app, duplicates joined
+        assert steam.max_in_flight > 1 and elapsed < 6 * steam.latency
+        assert store.count(102, voted_up=False) == 50
+
+        # Fresh stores are not re-fetched
+        assert store.ingest([101, 102, 103]) == {'101': 0, '102': 0, '103': 0}
+        assert len(steam.requests) == 6
+
+    print(f"✅ 600 reviews for 3 competitors in {elapsed:.2f}s "
+          f"({steam.max_in_flight} pages in flight)")
+    print()
+
+
+def test_grouped_theme_counts():
+    """One grouped FTS query counts every theme for a competitor"""
+
+    print("=" * 80)
+    print("TEST 2: Grouped Theme Counts")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ReviewStore(tmp, session=CompetitorSteam(latency=0))
+        store.ingest([101, 102], max_pages=2)
+        themes = {
+            'bugs': fts_any(['crash', 'save file']),
+            'price': fts_any(['overpriced', 'refund']),
+            'empty': '',
+        }
+        counts = store.count_matches(101, themes, voted_up=False)
+        assert counts == {'bugs': 50, 'price': 0, 'empty': 0}
+        assert store.count_matches(102, themes, voted_up=False)['price'] == 50
+        assert store.count_matches(102, themes, voted_up=True)['price'] == 0
+        assert store.count_matches(999, themes) == {'bugs': 0, 'price': 0, 'empty': 0}
+
+    print(f"✅ Theme counts from one query per competitor: {counts}")
+    print()
+
+
+def test_vulnerability_from_ingested_reviews():
+    """Competitor themes come from ingested negative reviews"""
+
+    print("=" * 80)
+    print("TEST 3: Vulnerability From Ingested Competitor Reviews")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        steam = CompetitorSteam(latency=0)
+        store = ReviewStore(tmp, session=steam)
+        analyzer = ReviewVulnerabilityAnalyzer(review_store=store)
+        themes = analyzer._analyze_competitor_reviews([
+            {'app_id': app_id, 'review_score': 90, 'genres': '', 'tags': '', 'price': '$9.99'}
+            for app_id in COMPLAINTS
+        ] + [{'name': 'No app id', 'review_score': 40, 'genres': '', 'tags': '', 'price': '$9.99'}])
+
+    common = themes['common_themes']
+    assert themes['competitors_with_review_text'] == 3
+    assert themes['review_texts_analyzed'] == 3 * 50  # Bounded: 2 pages, 1 in 4 negative
+    assert themes['total_negative_reviews_analyzed'] == 4
+    assert common['bugs_crashes']['count'] == 50 + 1  # Text matches + the heuristic competitor
+    assert common['pricing']['count'] == 50 + 1
+    assert common['repetitive']['count'] == 50
+    assert common['repetitive']['percentage'] == 25.0
+
+    print(f"✅ {themes['review_texts_analyzed']} competitor negatives classified; "
+          f"themes: {sorted(common)}")
+    print()
+
+
+if __name__ == "__main__":
+    test_batched_ingest()
+    test_grouped_theme_counts()
+    test_vulnerability_from_ingested_reviews()
@@ -0,0 +1,140 @@
+"""
+Test Report Component Registry
+
+Validates that ReportOrchestrator builds each tier's components from
+COMPONENT_REGISTRY, runs independent components concurrently with
+per-component timings, and computes shared derived inputs (comparable games,
+tier actions) once. Uses mock data; no API calls are made.
+"""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.report_orchestrator import COMPONENT_REGISTRY, ReportOrchestrator, create_mock_data
+
+
+class FakeComparables:
+    """Counts lookups and returns two comparable games"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def find_comparable_games(self, **kwargs):
+        self.calls += 1
+        time.sleep(0.05)
+        return [
+            SimpleNamespace(name=f"Comp {n}", overall_score=60 + n, review_count=1000, review_percentage=80,
+                            revenue_display="$100K", price=14.99)
+            for n in range(2)
+        ]
+
+
+def make_orchestrator():
+    orchestrator = ReportOrchestrator(claude_api_key=None)
+    orchestrator.negative_analyzer = None
+    orchestrator.comparable_analyzer = FakeComparables()
+    return orchestrator
+
+
+def test_tier_eligibility():
+    """Growth components only for tiers 3-4, review analysis only for struggling tiers"""
+
+    print("=" * 80)
+    print("TEST 1: Tier Eligibility")
+    print("=" * 80)
+
+    orchestrator = make_orchestrator()
+
+    solid = orchestrator._generate_all_components(create_mock_data({'review_pct': 88}), tier=4, score=85)
+    assert solid.market_expansion and solid.dlc_analysis and solid.store_optimization
+    assert solid.negative_review_analysis is None and solid.salvageability_assessment is None
+
+    struggling = orchestrator._generate_all_components(create_mock_data({'review_pct': 62}), tier=2, score=48)
+    assert struggling.negative_review_analysis.startswith("*Claude API not configured")
+    assert struggling.salvageability_assessment == "*Salvageability assessment unavailable*"
+    assert struggling.market_expansion is None
+
+    # Tier 2 with good reviews: no negative review analysis
+    mixed = orchestrator._generate_all_components(create_mock_data({'review_pct': 85}), tier=2, score=60)
+    assert mixed.negative_review_analysis is None
+
+    names = {spec.name for spec in COMPONENT_REGISTRY}
+    assert {'base_score', 'top_actions', 'executive_summary', 'methodology'} <= names
+
+    print(f"✅ {len(COMPONENT_REGISTRY)} registry entries; tier rules applied")
+    print()
+
+
+def test_components_run_concurrently():
+    """Slow I/O components overlap; every component is timed"""
+
+    print("=" * 80)
+    print("TEST 2: Concurrent Components")
+    print("=" * 80)
+
+    orchestrator = make_orchestrator()
+    original_community = orchestrator._generate_community_reach
+
+    def slow_community(game_data):
+        time.sleep(0.3)  # Network-bound component
+        return original_community(game_data)
+
+    def slow_negative(game_data):
+        time.sleep(0.3)
+        return "## Negative Reviews\n\nCrashes dominate."
+
+    orchestrator._generate_community_reach = slow_community
+    orchestrator._generate_negative_review_analysis = slow_negative
+
+    start = time.time()
+    components = orchestrator._generate_all_components(create_mock_data({'review_pct': 62}), tier=2, score=48)
+    elapsed = time.time() - start
+
+    timings = orchestrator.component_timings
+    assert elapsed < 0.55, f"Components took {elapsed:.2f}s"
+    assert timings['community_reach'] >= 0.3 and timings['negative_review_analysis'] >= 0.3
+    assert {'executive_summary', 'comparable_games', 'salvageability_assessment'} <= set(timings)
+    assert components.negative_review_analysis.startswith("## Negative Reviews")
+
+    print(f"✅ {len(timings)} components in {elapsed:.2f}s wall "
+          f"({sum(timings.values()):.2f}s summed)")
+    print()
+
+
+def test_derived_inputs_memoized():
+    """Comparable games are fetched once per report; top actions are shared"""
+
+    print("=" * 80)
+    print("TEST 3: Memoized Derived Inputs")
+    print("=" * 80)
+
+    orchestrator = make_orchestrator()
+    game_data = create_mock_data({'review_pct': 88})
+
+    # Price analysis asks first (validated metrics are the same values, typed)
+    orchestrator._find_comparable_games(
+        game_data['app_id'], game_data['genres'], float(game_data['price']),
+        game_data['release_date'], int(game_data['owners'])
+    )
+    calls = []
+    original_actions = orchestrator._get_report_actions
+    orchestrator._get_report_actions = lambda game_data, tier: calls.append(tier) or original_actions(game_data, tier)
+
+    components = orchestrator._generate_all_components(game_data, tier=3, score=70)
+
+    assert orchestrator.comparable_analyzer.calls == 1
+    assert "Comp 1" in components.comparable_games
+    assert calls == [3]  # Quick start and action plan share one action list
+    assert "Micro-Influencer Campaign" in components.quick_start
+
+    print("✅ One comparable-game lookup and one action list served every component")
+    print()
+
+
+if __name__ == "__main__":
+    test_tier_eligibility()
+    test_components_run_concurrently()
+    test_derived_inputs_memoized()
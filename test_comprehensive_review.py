@@ -3,13 +3,18 @@
 Comprehensive System Review - Test all components and output quality
 """
 import sys
+import tempfile
 sys.path.insert(0, '/home/user/Publitz-Automated-Audits')
 
 from src.report_orchestrator import ReportOrchestrator
+from src.review_store import ReviewStore
 from datetime import datetime, timedelta
 import json
 
 
+REVIEW_STORE_DIR = tempfile.TemporaryDirectory()
+
+
 def test_realistic_indie_game():
     """Test with realistic indie game data"""
     print("\n" + "="*80)
@@ -17,7 +22,7 @@ def test_realistic_indie_game():
     print("Testing realistic indie game scenario")
     print("="*80 + "\n")
 
-    orchestrator = ReportOrchestrator()
+    orchestrator = ReportOrchestrator(review_store=ReviewStore(REVIEW_STORE_DIR.name))
 
     # Realistic struggling indie game
     game_data = {
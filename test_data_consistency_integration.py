@@ -11,12 +11,17 @@ Verifies that:
 
 import sys
 import os
+import tempfile
 sys.path.insert(0, os.path.abspath('.'))
 
 from src.report_orchestrator import ReportOrchestrator
+from src.review_store import ReviewStore
 from src.data_consistency import GameMetrics, pre_flight_check
 
 
+REVIEW_STORE_DIR = tempfile.TemporaryDirectory()
+
+
 def test_valid_data():
     """Test with valid Retrace the Light data"""
     print("\n" + "="*80)
@@ -62,7 +67,7 @@ def test_valid_data():
 
     # Generate report
     print("GENERATING REPORT...")
-    orchestrator = ReportOrchestrator()
+    orchestrator = ReportOrchestrator(review_store=ReviewStore(REVIEW_STORE_DIR.name))
     report = orchestrator.generate_complete_report(game_data)
 
     metadata = report['metadata']
@@ -126,7 +131,7 @@ def test_invalid_data_reviews_exceed_owners():
 
     # Try to generate report
     print("ATTEMPTING REPORT GENERATION...")
-    orchestrator = ReportOrchestrator()
+    orchestrator = ReportOrchestrator(review_store=ReviewStore(REVIEW_STORE_DIR.name))
     report = orchestrator.generate_complete_report(game_data)
 
     metadata = report['metadata']
@@ -192,7 +197,7 @@ def test_invalid_data_negative_revenue():
         return False
 
     # Try to generate report
-    orchestrator = ReportOrchestrator()
+    orchestrator = ReportOrchestrator(review_store=ReviewStore(REVIEW_STORE_DIR.name))
     report = orchestrator.generate_complete_report(game_data)
 
     metadata = report['metadata']
@@ -249,7 +254,7 @@ def test_warning_case_low_review_rate():
         return False
 
     # Generate report should succeed
-    orchestrator = ReportOrchestrator()
+    orchestrator = ReportOrchestrator(review_store=ReviewStore(REVIEW_STORE_DIR.name))
     report = orchestrator.generate_complete_report(game_data)
 
     metadata = report['metadata']
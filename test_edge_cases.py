@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 """Edge case testing for bug detection"""
 import sys
+import tempfile
 sys.path.insert(0, '/home/user/Publitz-Automated-Audits')
 from src.community_analyzer import analyze_community_reach
 from src.report_orchestrator import ReportOrchestrator
+from src.review_store import ReviewStore
 from datetime import datetime, timedelta
 
+REVIEW_STORE_DIR = tempfile.TemporaryDirectory()
+
+
 def test_empty_genres():
     print("\n" + "="*80)
     print("TEST: Empty Genres")
@@ -45,7 +50,7 @@ def test_free_game():
     print("\n" + "="*80)
     print("TEST: Free Game (price = 0)")
     print("="*80)
-    orchestrator = ReportOrchestrator()
+    orchestrator = ReportOrchestrator(review_store=ReviewStore(REVIEW_STORE_DIR.name))
     game_data = {
         'app_id': '999999', 'name': 'Free Game', 'price': 0.00,
         'review_score': 80, 'review_count': 500, 'owners': 10000,
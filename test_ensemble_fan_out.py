@@ -0,0 +1,185 @@
+"""
+Test Ensemble Fan-out
+
+Validates that _run_ensemble_analysis queries Claude, GPT-4 and Gemini
+concurrently, proceeds once the quorum has answered without waiting for the
+slowest model, records late responders, keeps waiting past failed providers,
+and gives up on providers that exceed the timeout. Provider clients are fakes
+with configurable delays.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.llm_gateway import LLMGateway, LLMCacheStats
+from src.llm_telemetry import LLMCallLog
+from src.ai_generator import AIGenerator
+from src.report_run_store import ReportRunStore
+
+ANSWER = {
+    "primary_strength": "Tight combat loop",
+    "primary_weakness": "Weak store page",
+    "highest_impact_recommendation": "Reshoot capsule art",
+    "biggest_risk": "Content drought",
+    "market_position": "Mid-tier roguelike",
+    "confidence_score": 70,
+}
+
+
+def _slow(seconds, fail=False):
+    def respond():
+        time.sleep(seconds)
+        if fail:
+            raise RuntimeError("provider unavailable")
+        return json.dumps(ANSWER)
+    return respond
+
+
+def _generator(tmp, claude, gpt, gemini):
+    generator = AIGenerator(api_key='test-key', run_store=ReportRunStore(tmp))
+
+    def claude_create(**kwargs):
+        text = claude()
+        return SimpleNamespace(
+            content=[SimpleNamespace(type='text', text=text)], stop_reason='end_turn',
+            model=kwargs['model'], usage=SimpleNamespace(input_tokens=10, output_tokens=10)
+        )
+
+    generator.llm = LLMGateway(SimpleNamespace(messages=SimpleNamespace(create=claude_create)),
+                               cache_dir=tmp, stats=LLMCacheStats(),
+                               call_log=LLMCallLog(os.path.join(tmp, 'llm_calls.jsonl')))
+    generator.openai_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+        create=lambda **kwargs: SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=f"```json\n{gpt()}\n```"))]
+        )
+    )))
+    generator.google_client = SimpleNamespace(
+        generate_content=lambda prompt, generation_config: SimpleNamespace(text=gemini())
+    )
+    generator.ensemble_available = True
+    return generator
+
+
+def _run(generator):
+    return generator._run_ensemble_analysis(
+        game_data={'name': 'Test Game', 'price': '$14.99', 'genres': ['Action']},
+        sales_data={'estimated_revenue': '$10,000', 'reviews_total': 100, 'review_score': 90},
+        competitor_data=[],
+        benchmark_analysis={},
+        scenario_analysis={}
+    )
+
+
+def test_quorum_skips_slowest_provider():
+    """Consensus proceeds after 2 of 3 answers; the slow model is recorded late"""
+
+    print("=" * 80)
+    print("TEST 1: Quorum Reached Before Slowest Provider")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = _generator(tmp, claude=_slow(0.1), gpt=_slow(0.1), gemini=_slow(1.0))
+        start = time.perf_counter()
+        result = _run(generator)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.8, f"Waited for slowest provider ({elapsed:.2f}s)"
+        assert sorted(result['models_used']) == ['claude', 'gpt4']
+        assert result['quorum'] == {'required': 2, 'reached': True}
+        assert result['late_responders'] == ['gemini']
+        assert result['analysis_quality'] == 'high'
+
+        time.sleep(1.2)
+        assert result['late_responses'] == {}  # The stage output is a snapshot...
+        assert generator.late_ensemble_responses['gemini'] == ANSWER  # ...late answers go to the hook
+
+    print(f"✅ Ensemble finished in {elapsed:.2f}s; Gemini recorded late")
+    print()
+
+
+def test_failed_provider_does_not_count_toward_quorum():
+    """A failed answer keeps the fan-out waiting for the next provider"""
+
+    print("=" * 80)
+    print("TEST 2: Failures Don't Count Toward Quorum")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = _generator(tmp, claude=_slow(0.05), gpt=_slow(0.05, fail=True), gemini=_slow(0.3))
+        result = _run(generator)
+
+        assert sorted(result['models_used']) == ['claude', 'gemini']
+        assert 'GPT-4 analysis failed' in result['model_responses']['gpt4']['error']
+        assert result['late_responders'] == []
+        assert result['quorum']['reached']
+
+    print("✅ Waited for Gemini after GPT-4 failed")
+    print()
+
+
+def test_timeout_bounds_latency():
+    """Providers slower than the timeout are abandoned"""
+
+    print("=" * 80)
+    print("TEST 3: Per-Provider Timeout")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = _generator(tmp, claude=_slow(0.05), gpt=_slow(1.0), gemini=_slow(1.0))
+        start = time.perf_counter()
+        late = {}
+        responses, fan_out = generator._fan_out_ensemble("prompt", timeout=0.3, on_late_response=late.__setitem__)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.8
+        assert list(responses) == ['claude']
+        assert sorted(fan_out['late_responders']) == ['gemini', 'gpt4']
+        assert fan_out['quorum'] == {'required': 2, 'reached': False}
+        assert 'claude' in fan_out['provider_latency_seconds']
+
+        time.sleep(1.0)  # Let the abandoned providers finish before the fakes go away
+        assert sorted(late) == ['gemini', 'gpt4']
+        assert fan_out['late_responses'] == {}
+
+    print(f"✅ Gave up on slow providers after {elapsed:.2f}s")
+    print()
+
+
+def test_late_claude_answer_stays_in_its_run():
+    """A Claude answer arriving after the next run started is logged under the old run"""
+
+    print("=" * 80)
+    print("TEST 4: Late Claude Answer Keeps Its Run")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = _generator(tmp, claude=_slow(0.5), gpt=_slow(0.05), gemini=_slow(0.05))
+        stats = generator.llm.stats
+        first_run = stats.run_id
+        result = _run(generator)
+        assert result['late_responders'] == ['claude']
+
+        stats.reset()  # The next report starts before Claude answers
+        time.sleep(0.8)
+
+        with open(os.path.join(tmp, 'llm_calls.jsonl')) as f:
+            records = [json.loads(line) for line in f]
+        claude_records = [r for r in records if r['stage'] == 'ensemble_claude']
+        assert [r['run_id'] for r in claude_records] == [first_run]
+        assert not stats.calls and stats.misses == 0
+        assert generator.late_ensemble_responses['claude'] == ANSWER
+
+    print("✅ Late Claude call logged under the run that started the fan-out")
+    print()
+
+
+if __name__ == "__main__":
+    test_quorum_skips_slowest_provider()
+    test_failed_provider_does_not_count_toward_quorum()
+    test_timeout_bounds_latency()
+    test_late_claude_answer_stays_in_its_run()
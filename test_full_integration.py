@@ -5,12 +5,17 @@ Tests all new systems: price analysis, generic detection, community reach
 """
 
 import sys
+import tempfile
 sys.path.insert(0, '/home/user/Publitz-Automated-Audits')
 
 from src.report_orchestrator import ReportOrchestrator
+from src.review_store import ReviewStore
 from datetime import datetime, timedelta
 
 
+REVIEW_STORE_DIR = tempfile.TemporaryDirectory()
+
+
 def test_full_integration():
     """Test full report generation with all new features"""
     print("\n" + "="*80)
@@ -18,7 +23,7 @@ def test_full_integration():
     print("Testing: Price Analysis + Generic Detection + Community Reach")
     print("="*80 + "\n")
 
-    orchestrator = ReportOrchestrator()
+    orchestrator = ReportOrchestrator(review_store=ReviewStore(REVIEW_STORE_DIR.name))
 
     # Create a roguelike game (should get specific community recommendations)
     game_data = {
@@ -0,0 +1,221 @@
+"""
+Test Incremental Report Rebuilds
+
+Validates that ReportBuilder.rebuild re-fingerprints each section's input
+slice and only re-analyzes sections whose inputs changed (reusing cached
+markdown for the rest), and that ReportOrchestrator only regenerates the
+components whose game_data fields or upstream components changed. Uses mock
+data; no API calls are made.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.api_verifier import APIStatus
+from src.report_builder import SECTION_NAMES, ReportBuilder
+from src.report_orchestrator import ReportOrchestrator, create_mock_data
+from src.stage_graph import input_fingerprint
+from src.tag_vocabulary import TagVocabulary, set_tag_vocabulary
+
+VOCABULARY_DIR = tempfile.TemporaryDirectory()
+set_tag_vocabulary(TagVocabulary(os.path.join(VOCABULARY_DIR.name, 'tag_vocabulary.json')))
+
+GAME_DATA = {'name': 'Test Game', 'app_id': 123, 'price': '$14.99', 'genres': 'Roguelike', 'tags': 'roguelike'}
+SALES_DATA = {'reviews_total': 800, 'review_score': 84, 'owners_avg': 40000}
+SALES_SECTIONS = ['Market Viability', 'Conversion Funnel', 'Visibility Forecast', 'Growth Strategy', 'Tag Insights',
+                  'Review Vulnerability & Risk Assessment', 'Pricing', 'A/B Testing Recommendations',
+                  'Custom Tracking Dashboard']
+PRICE_SECTIONS = ['Market Viability', 'Conversion Funnel', 'Review Vulnerability & Risk Assessment',
+                  'A/B Testing Recommendations', 'Regional Pricing Optimization']
+
+
+def count_analyses(builder):
+    """Wrap every built section's analyze() with a call counter"""
+    calls = {}
+    for section in builder.sections:
+        def counted(section=section, analyze=section.analyze):
+            calls[section.section_name] = calls.get(section.section_name, 0) + 1
+            return analyze()
+        section.analyze = counted
+    return calls
+
+
+def test_sales_refresh_reuses_sections():
+    """Refreshed sales data re-analyzes only the sections that take it"""
+
+    print("=" * 80)
+    print("TEST 1: Sales Refresh")
+    print("=" * 80)
+
+    assert input_fingerprint({'a': 1, 'b': [2]}) == input_fingerprint({'b': [2], 'a': 1})
+    assert input_fingerprint({'a': 1}) != input_fingerprint({'a': 2})
+
+    builder = ReportBuilder(GAME_DATA, SALES_DATA, [], "Post-Launch")
+    start = time.time()
+    builder.build()
+    full = time.time() - start
+    unchanged = {section.section_name: section.get_markdown() for section in builder.sections}
+
+    calls = count_analyses(builder)  # Replaced sections are fresh objects and not counted
+    start = time.time()
+    report = builder.rebuild(sales_data=dict(SALES_DATA, review_score=62))
+    incremental = time.time() - start
+
+    assert builder.recomputed_sections == SALES_SECTIONS
+    assert set(builder.reused_sections) == set(SECTION_NAMES) - set(SALES_SECTIONS)
+    assert calls == {}  # Reused sections were not re-analyzed...
+    for name in builder.reused_sections:
+        assert builder.get_section(name).get_markdown() is unchanged[name]  # ...nor re-rendered
+    assert builder.get_section('Pricing').analyzed and "Pricing" in report
+    assert builder.get_structured_data()['reused_sections'] == builder.reused_sections
+    assert incremental < full
+
+    print(f"✅ {len(builder.recomputed_sections)} sections recomputed, {len(builder.reused_sections)} reused "
+          f"({incremental:.3f}s vs {full:.3f}s full build)")
+    print()
+
+
+def test_edits_in_place():
+    """In-place edits are detected; a no-op rebuild reuses everything"""
+
+    print("=" * 80)
+    print("TEST 2: In-Place Edits")
+    print("=" * 80)
+
+    builder = ReportBuilder(dict(GAME_DATA), dict(SALES_DATA), [], "Pre-Launch")
+    builder.build()
+    summary = builder.executive_summary
+
+    builder.rebuild()
+    assert builder.recomputed_sections == [] and builder.executive_summary is summary
+
+    builder.rebuild(report_type="Post-Launch")
+    assert builder.recomputed_sections == ['Marketing']
+    assert builder.executive_summary is not summary  # Summary covers the changed section
+
+    builder.game_data['price'] = '$19.99'  # Intake-form edit
+    builder.rebuild(sections=['Pricing', 'Marketing'])
+    assert builder.recomputed_sections == PRICE_SECTIONS  # Only the sections that read price
+
+    print("✅ No-op, report-type and game-data edits detected")
+    print()
+
+
+class FakeComparables:
+    """Counts lookups and returns two comparable games"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def find_comparable_games(self, **kwargs):
+        self.calls += 1
+        return [
+            SimpleNamespace(name=f"Comp {n}", overall_score=60 + n, review_count=1000, review_percentage=80,
+                            revenue_display="$100K", price=14.99)
+            for n in range(2)
+        ]
+
+
+class FakeReviews:
+    """Review store whose sync state the test controls"""
+
+    def __init__(self):
+        self.state = {'newest_timestamp': 1700000000, 'total_reviews': 240, 'last_sync': 1700000100}
+
+    def sync(self, app_id, language='english'):
+        return 0
+
+    def sync_state(self, app_id, language='english'):
+        return dict(self.state)
+
+
+def _component_orchestrator():
+    """Orchestrator with stubbed comparables, review store and negative review analysis"""
+    orchestrator = ReportOrchestrator(claude_api_key=None, review_store=FakeReviews())
+    orchestrator.comparable_analyzer = FakeComparables()
+    orchestrator.negative_calls = []
+
+    def slow_negative(game_data):
+        orchestrator.negative_calls.append(game_data['app_id'])
+        orchestrator.api_verifier.record_success("Claude API", "Messages endpoint (complaint categorization)")
+        time.sleep(0.3)  # LLM-bound component
+        return "## Negative Reviews\n\nCrashes dominate."
+
+    orchestrator._generate_negative_review_analysis = slow_negative
+    return orchestrator
+
+
+def test_component_reuse():
+    """A price edit regenerates only the components that read price"""
+
+    print("=" * 80)
+    print("TEST 3: Orchestrator Component Reuse")
+    print("=" * 80)
+
+    orchestrator = _component_orchestrator()
+    game_data = create_mock_data({'review_pct': 62})
+
+    start = time.time()
+    orchestrator._generate_all_components(game_data, tier=2, score=48)
+    full = time.time() - start
+    assert orchestrator.reused_components == []
+    first_calls = [(c.api_name, c.endpoint, c.status) for c in orchestrator.api_verifier.calls]
+
+    orchestrator.api_verifier.reset()  # As at the start of each report
+    start = time.time()
+    components = orchestrator._generate_all_components(dict(game_data, price=game_data['price'] + 5), tier=2, score=48)
+    incremental = time.time() - start
+
+    regenerated = set(orchestrator.component_timings)
+    assert regenerated == {'base_score', 'top_actions', 'quick_start', 'key_metrics_dashboard', 'comparable_games',
+                           'revenue_performance', 'action_plan_30_day', 'community_reach'}
+    assert {'negative_review_analysis', 'salvageability_assessment', 'executive_summary',
+            'market_positioning', 'methodology'} <= set(orchestrator.reused_components)
+    assert orchestrator.negative_calls == [game_data['app_id']]
+    assert components.negative_review_analysis.startswith("## Negative Reviews")
+    assert incremental < full / 2
+
+    # Reused components report the API calls they made when generated
+    rebuilt_calls = [(c.api_name, c.endpoint, c.status) for c in orchestrator.api_verifier.calls]
+    assert sorted(rebuilt_calls) == sorted(first_calls)
+    assert ('Claude API', 'Messages endpoint (complaint categorization)', APIStatus.SUCCESS) in rebuilt_calls
+
+    print(f"✅ {len(regenerated)} components regenerated, {len(orchestrator.reused_components)} reused "
+          f"({incremental:.2f}s vs {full:.2f}s)")
+    print()
+
+
+def test_review_sync_invalidates():
+    """New reviews in the store regenerate the review-backed components"""
+
+    print("=" * 80)
+    print("TEST 4: Review Sync Invalidation")
+    print("=" * 80)
+
+    orchestrator = _component_orchestrator()
+    game_data = create_mock_data({'review_pct': 62})
+    orchestrator._generate_all_components(game_data, tier=2, score=48)
+
+    orchestrator.review_store.state['last_sync'] += 3600  # Re-synced, nothing new
+    orchestrator._generate_all_components(game_data, tier=2, score=48)
+    assert 'negative_review_analysis' in orchestrator.reused_components
+    assert len(orchestrator.negative_calls) == 1
+
+    orchestrator.review_store.state.update(newest_timestamp=1700050000, total_reviews=255)
+    orchestrator._generate_all_components(game_data, tier=2, score=48)
+    assert set(orchestrator.component_timings) == {'negative_review_analysis', 'salvageability_assessment'}
+    assert len(orchestrator.negative_calls) == 2
+
+    print("✅ Only new reviews regenerate negative review analysis and salvageability")
+    print()
+
+
+if __name__ == "__main__":
+    test_sales_refresh_reuses_sections()
+    test_edits_in_place()
+    test_component_reuse()
+    test_review_sync_invalidates()
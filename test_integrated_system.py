@@ -4,19 +4,24 @@ Test integrated report orchestrator with price analysis and validation systems
 """
 
 import sys
+import tempfile
 sys.path.insert(0, '/home/user/Publitz-Automated-Audits')
 
 from src.report_orchestrator import ReportOrchestrator
+from src.review_store import ReviewStore
 from datetime import datetime, timedelta
 
 
+REVIEW_STORE_DIR = tempfile.TemporaryDirectory()
+
+
 def test_catastrophic_pricing():
     """Test report generation with catastrophic pricing ($0.99)"""
     print("\n" + "="*80)
     print("TEST: Catastrophic Pricing Detection")
     print("="*80 + "\n")
 
-    orchestrator = ReportOrchestrator()
+    orchestrator = ReportOrchestrator(review_store=ReviewStore(REVIEW_STORE_DIR.name))
 
     # Game with $0.99 price (catastrophic)
     game_data = {
@@ -89,7 +94,7 @@ def test_normal_pricing():
     print("TEST: Normal Pricing (No Warnings)")
     print("="*80 + "\n")
 
-    orchestrator = ReportOrchestrator()
+    orchestrator = ReportOrchestrator(review_store=ReviewStore(REVIEW_STORE_DIR.name))
 
     # Game with normal price
     game_data = {
@@ -153,7 +158,7 @@ def test_data_consistency_validation():
     print("TEST: Data Consistency Validation")
     print("="*80 + "\n")
 
-    orchestrator = ReportOrchestrator()
+    orchestrator = ReportOrchestrator(review_store=ReviewStore(REVIEW_STORE_DIR.name))
 
     # Game with inconsistent data (more reviews than owners - impossible)
     game_data = {
@@ -0,0 +1,109 @@
+"""
+Test Lazy Report Sections
+
+Validates that ReportBuilder constructs sections without analyzing them,
+that each analyzer runs once on first access to its score or markdown (and
+the markdown is cached), and that callers can build, score and render a
+subset of sections by name. No API calls are made.
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.report_builder import SECTION_NAMES, ReportBuilder
+
+GAME_DATA = {'name': 'Test Game', 'app_id': 123, 'price': '$14.99', 'genres': 'Roguelike', 'tags': 'roguelike'}
+SALES_DATA = {'reviews_total': 800, 'review_score': 84, 'owners_avg': 40000}
+
+
+def count_analyses(builder):
+    """Wrap every built section's analyze() with a call counter"""
+    calls = {}
+    for section in builder.sections:
+        def counted(section=section, analyze=section.analyze):
+            calls[section.section_name] = calls.get(section.section_name, 0) + 1
+            return analyze()
+        section.analyze = counted
+    return calls
+
+
+def test_sections_built_without_analysis():
+    """Score-only run for two sections skips every other analyzer"""
+
+    print("=" * 80)
+    print("TEST 1: Score-Only Subset")
+    print("=" * 80)
+
+    builder = ReportBuilder(GAME_DATA, SALES_DATA, [], "Post-Launch")
+    builder.build_sections()
+    assert [section.section_name for section in builder.sections] == SECTION_NAMES
+    assert not any(section.analyzed for section in builder.sections)
+
+    calls = count_analyses(builder)
+    data = builder.get_structured_data(sections=['Pricing', 'Marketing'])
+
+    assert calls == {'Pricing': 1, 'Marketing': 1}
+    assert [section['name'] for section in data['sections']] == ['Pricing', 'Marketing']
+    assert data['overall_score'] == int((75 * 0.20 + 60 * 0.25) / 0.45)
+
+    print(f"✅ 2 of {len(SECTION_NAMES)} analyzers ran for a score-only run")
+    print()
+
+
+def test_analysis_and_markdown_cached():
+    """analyze() and generate_markdown() run once however often they are read"""
+
+    print("=" * 80)
+    print("TEST 2: Cached Analysis and Markdown")
+    print("=" * 80)
+
+    builder = ReportBuilder(GAME_DATA, SALES_DATA, [], "Post-Launch")
+    section = builder.get_section('Pricing')
+    calls = count_analyses(builder)
+    renders = []
+    generate = section.generate_markdown
+    section.generate_markdown = lambda: renders.append(1) or generate()
+
+    assert section.get_score() == 75
+    first = section.get_markdown()
+    assert section.get_markdown() is first and section.get_score() == 75
+    assert calls == {'Pricing': 1} and len(renders) == 1
+    assert [s.section_name for s in builder.sections] == ['Pricing']  # Nothing else built
+
+    print("✅ One analysis and one render served four reads")
+    print()
+
+
+def test_partial_build():
+    """A partial report renders only the requested sections, in report order"""
+
+    print("=" * 80)
+    print("TEST 3: Partial Build")
+    print("=" * 80)
+
+    builder = ReportBuilder(GAME_DATA, SALES_DATA, [], "Pre-Launch")
+    report = builder.build(sections=['Marketing', 'Pricing'])
+
+    assert [section.section_name for section in builder.sections] == ['Pricing', 'Marketing']
+    assert "Pricing" in report and "Marketing" in report
+    assert "Store Page" not in report.split("## Data Sources")[0]
+
+    # Asking for more adds the missing sections in report order
+    builder.build_sections(['Store Page'])
+    assert [section.section_name for section in builder.sections] == ['Store Page', 'Pricing', 'Marketing']
+
+    try:
+        builder.build_sections(['Horoscope'])
+        assert False, "Unknown section accepted"
+    except ValueError as e:
+        assert 'Horoscope' in str(e)
+
+    print(f"✅ Partial report with {len(builder.sections)} sections ({len(report)} chars)")
+    print()
+
+
+if __name__ == "__main__":
+    test_sections_built_without_analysis()
+    test_analysis_and_markdown_cached()
+    test_partial_build()
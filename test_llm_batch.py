@@ -0,0 +1,240 @@
+"""
+Test LLM Batch Mode
+
+Validates that the batch dispatcher collects requests from concurrent report
+threads into shared batches, resolves each caller with its own response,
+surfaces per-request failures, that gateways route through the active
+batch at half price while cache hits skip it, and that a failed client in a
+CLI batch run raises instead of exiting while output lines carry the client
+name. Uses LocalBatchBackend with a
+fake Anthropic client.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.exceptions import AIGenerationError
+from src.llm_batch import BatchDispatcher, LocalBatchBackend, batch_mode, run_batched_jobs
+from src.llm_gateway import LLMGateway, LLMCacheStats, estimate_cost
+from src.llm_telemetry import LLMCallLog
+from src.ai_generator import AIGenerator
+from src.report_run_store import ReportRunStore
+
+MODEL = 'claude-sonnet-4-5-20250929'
+FAST = {'collect_seconds': 0.1, 'poll_seconds': 0.01}
+
+
+class EchoMessages:
+    """Fake messages API that echoes the last prompt block"""
+
+    def __init__(self, text=None):
+        self.calls = []
+        self.text = text
+        self._lock = threading.Lock()
+
+    def create(self, **kwargs):
+        with self._lock:
+            self.calls.append(kwargs)
+        content = kwargs['messages'][0]['content']
+        prompt = content if isinstance(content, str) else content[-1]['text']
+        if prompt == 'fail':
+            raise ValueError("invalid request")
+        return SimpleNamespace(
+            content=[SimpleNamespace(type='text', text=self.text or f"echo: {prompt}")],
+            stop_reason='end_turn',
+            model=kwargs['model'],
+            usage=SimpleNamespace(input_tokens=1000, output_tokens=500)
+        )
+
+
+def _request(prompt):
+    return {'model': MODEL, 'max_tokens': 100, 'messages': [{'role': 'user', 'content': prompt}]}
+
+
+def test_dispatcher_shares_batches_across_threads():
+    """Concurrent submissions land in one batch and each gets its own answer"""
+
+    print("=" * 80)
+    print("TEST 1: Shared Batches")
+    print("=" * 80)
+
+    backend = LocalBatchBackend(SimpleNamespace(messages=EchoMessages()))
+    dispatcher = BatchDispatcher(backend, **FAST)
+    answers = {}
+
+    def report(n):
+        future = dispatcher.submit('draft_report', _request(f"report {n}"))
+        answers[n] = future.result(timeout=5).content[0].text
+
+    threads = [threading.Thread(target=report, args=(n,)) for n in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    dispatcher.close()
+
+    assert answers == {n: f"echo: report {n}" for n in range(6)}
+    assert len(backend.submitted) == 1
+    assert len(backend.submitted[0]) == 6
+    assert all(custom_id.startswith('draft_report-') for custom_id in backend.submitted[0])
+
+    print(f"✅ 6 requests from 6 threads resolved from {len(backend.submitted)} batch")
+    print()
+
+
+def test_batch_size_and_failures():
+    """Batches are split at max_batch_size and a failed request fails only its caller"""
+
+    print("=" * 80)
+    print("TEST 2: Batch Size and Failures")
+    print("=" * 80)
+
+    backend = LocalBatchBackend(SimpleNamespace(messages=EchoMessages()))
+    dispatcher = BatchDispatcher(backend, max_batch_size=2, **FAST)
+    futures = [dispatcher.submit('audit', _request(prompt)) for prompt in ['a', 'fail', 'b']]
+
+    assert futures[0].result(timeout=5).content[0].text == 'echo: a'
+    assert futures[2].result(timeout=5).content[0].text == 'echo: b'
+    try:
+        futures[1].result(timeout=5)
+        assert False, "Expected AIGenerationError for the failed request"
+    except AIGenerationError as e:
+        assert 'invalid request' in str(e)
+
+    dispatcher.close()
+    assert [len(batch) for batch in backend.submitted] == [2, 1]
+
+    print("✅ Batches split at max size; failure isolated to one request")
+    print()
+
+
+def test_gateway_routes_through_active_batch():
+    """Gateway calls queue into the active batch at half price; cache hits skip it"""
+
+    print("=" * 80)
+    print("TEST 3: Gateway Batch Mode")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        messages = EchoMessages()
+        client = SimpleNamespace(messages=messages)
+        backend = LocalBatchBackend(client)
+        llm = LLMGateway(client, cache_dir=tmp, stats=LLMCacheStats(),
+                         call_log=LLMCallLog(os.path.join(tmp, 'llm_calls.jsonl')))
+
+        with batch_mode(backend, **FAST):
+            response = llm.create('review_sentiment', **_request('classify'))
+            cached = llm.create('review_sentiment', **_request('classify'))
+            streamed = ''.join(llm.stream('post_launch_report', **_request('write')))
+
+        assert response.content[0].text == 'echo: classify'
+        assert cached.content[0].text == 'echo: classify'
+        assert streamed == 'echo: write'
+        assert sum(len(batch) for batch in backend.submitted) == 2
+        assert len(messages.calls) == 2
+
+        stats = llm.stats.as_dict()
+        assert stats['hits'] == 1
+        assert stats['cost_spent_usd'] == round(estimate_cost(MODEL, 1000, 500) * 2 * 0.5, 4)
+
+        # Outside batch mode calls go straight to the API again
+        llm.create('audit', **_request('direct'))
+        assert sum(len(batch) for batch in backend.submitted) == 2
+
+    print(f"✅ Batched calls billed at ${stats['cost_spent_usd']} (50% of interactive)")
+    print()
+
+
+def test_reports_resume_from_shared_batches():
+    """Two full report pipelines run in batch mode and share batches"""
+
+    print("=" * 80)
+    print("TEST 4: Multi-Report Batch Run")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        client = SimpleNamespace(messages=EchoMessages(text='{}'))
+        backend = LocalBatchBackend(client)
+
+        def job(name):
+            generator = AIGenerator(api_key='test-key', run_store=ReportRunStore(tmp))
+            generator.llm = LLMGateway(client, cache_dir=tmp, stats=LLMCacheStats(),
+                                       call_log=LLMCallLog(os.path.join(tmp, 'llm_calls.jsonl')))
+            report, audit_results = generator.generate_report_with_audit(
+                {'name': name, 'app_id': 1, 'price': '$14.99', 'genres': ['Action'], 'tags': ['Roguelike']},
+                {'estimated_revenue': '$10,000', 'reviews_total': 100, 'review_score': 90, 'owners_avg': 1000},
+                [],
+                phase2_data={'sentiment': {'sentiment_data': {'sample_size': {'positive': 50, 'negative': 50}}}}
+            )
+            return audit_results['llm_cache']
+
+        results = run_batched_jobs({name: (lambda name=name: job(name)) for name in ['Game A', 'Game B']},
+                                   backend, **FAST)
+
+    assert all(not isinstance(result, BaseException) for result in results.values()), results
+    batch_sizes = [len(batch) for batch in backend.submitted]
+    assert sum(batch_sizes) == len(client.messages.calls)
+    # Both reports' drafts were collected into the same first batch
+    assert batch_sizes[0] >= 2
+    assert len(batch_sizes) < len(client.messages.calls)
+
+    print(f"✅ {len(client.messages.calls)} requests from 2 reports in {len(batch_sizes)} batches")
+    print()
+
+
+def test_batch_cli_failures_and_output():
+    """A failing client raises AuditGenerationError; each line names its client"""
+
+    print("=" * 80)
+    print("TEST 5: Batch CLI Failures and Output")
+    print("=" * 80)
+
+    import generate_audit
+    from config import Config
+
+    with tempfile.TemporaryDirectory() as tmp:
+        saved = Config.INPUT_DIR, Config.OUTPUT_DIR
+        Config.INPUT_DIR, Config.OUTPUT_DIR = Path(tmp), Path(tmp)
+        try:
+            results = run_batched_jobs({'missing-client': lambda: generate_audit.generate_audit('missing-client')},
+                                       LocalBatchBackend(SimpleNamespace(messages=EchoMessages())), **FAST)
+        finally:
+            Config.INPUT_DIR, Config.OUTPUT_DIR = saved
+    assert isinstance(results['missing-client'], generate_audit.AuditGenerationError)
+
+    written = []
+    output = generate_audit.ClientPrefixedOutput(SimpleNamespace(write=written.append, flush=lambda: None))
+
+    def job(name):
+        output.set_client(name)
+        output.write(f"start {name}\nhalf ")
+        output.write("line")
+        output.end_client()
+
+    threads = [threading.Thread(target=job, args=(name,)) for name in ['client-a', 'client-b']]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    output.write("main thread\n")
+
+    lines = ''.join(written).splitlines()
+    assert sorted(lines[:-1]) == ['[client-a] half line', '[client-a] start client-a',
+                                  '[client-b] half line', '[client-b] start client-b']
+    assert lines[-1] == 'main thread'
+
+    print("✅ Failed client reported as an exception; output lines prefixed per client")
+    print()
+
+
+if __name__ == "__main__":
+    test_dispatcher_shares_batches_across_threads()
+    test_batch_size_and_failures()
+    test_gateway_routes_through_active_batch()
+    test_reports_resume_from_shared_batches()
+    test_batch_cli_failures_and_output()
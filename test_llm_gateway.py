@@ -0,0 +1,239 @@
+"""
+Test LLM Gateway
+
+Validates the content-addressed response cache: identical requests are served
+from disk, any change to model/system/messages/temperature/max_tokens misses,
+stochastic passes can opt out, and hits are counted with cost saved. Also
+checks that the report passes send the shared context as an identical cached
+prompt prefix. The Anthropic client is replaced with a counting fake.
+"""
+
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.llm_gateway import LLMGateway, LLMCacheStats, estimate_cost, request_key, with_cached_prefix
+from src.llm_telemetry import LLMCallLog
+from src import ai_generator
+from src.ai_generator import AIGenerator
+from src.report_run_store import ReportRunStore
+
+
+class FakeMessages:
+    def __init__(self, stop_reason='end_turn', text=None):
+        self.calls = []
+        self.stop_reason = stop_reason
+        self.text = text
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        cached = sum(
+            len(block['text']) for block in kwargs['messages'][0]['content']
+            if isinstance(block, dict) and 'cache_control' in block
+        ) if isinstance(kwargs['messages'][0]['content'], list) else 0
+        return SimpleNamespace(
+            content=[SimpleNamespace(type='text', text=self.text or f"response {len(self.calls)}")],
+            stop_reason=self.stop_reason,
+            model=kwargs['model'],
+            usage=SimpleNamespace(input_tokens=1000, output_tokens=500, cache_read_input_tokens=cached)
+        )
+
+
+def _gateway(tmp, stop_reason='end_turn'):
+    client = SimpleNamespace(messages=FakeMessages(stop_reason))
+    gateway = LLMGateway(client, cache_dir=tmp, stats=LLMCacheStats(),
+                         call_log=LLMCallLog(os.path.join(tmp, 'llm_calls.jsonl')), enabled=True)
+    return gateway, client.messages
+
+
+def _request(**overrides):
+    request = {
+        'model': 'claude-sonnet-4-5-20250929',
+        'max_tokens': 2000,
+        'temperature': 0.3,
+        'messages': [{'role': 'user', 'content': 'Audit this report'}],
+    }
+    request.update(overrides)
+    return request
+
+
+def test_identical_request_hits_cache():
+    """Second identical call is served from disk with the same text"""
+
+    print("=" * 80)
+    print("TEST 1: Identical Request Cache Hit")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        llm, messages = _gateway(tmp)
+        first = llm.create('audit', **_request())
+        second = llm.create('audit', **_request())
+
+        assert len(messages.calls) == 1
+        assert second.content[0].text == first.content[0].text
+        assert hasattr(second.content[0], 'text')
+        assert second.stop_reason == 'end_turn'
+
+        # A fresh gateway on the same directory (next run) also hits
+        rerun, rerun_messages = _gateway(tmp)
+        rerun.create('audit', **_request())
+        assert rerun_messages.calls == []
+
+        stats = llm.stats.as_dict()
+        assert stats['hits'] == 1 and stats['misses'] == 1
+        assert stats['tokens_saved'] == 1500
+        assert stats['cost_saved_usd'] == round(estimate_cost('claude-sonnet-4-5', 1000, 500), 4)
+        audit = stats['by_stage']['audit']
+        assert (audit['hits'], audit['misses'], audit['bypassed']) == (1, 1, 0)
+
+    print(f"✅ Cache hit saved ${stats['cost_saved_usd']}")
+    print()
+
+
+def test_key_covers_request_parameters():
+    """Changing any keyed parameter produces a different key"""
+
+    print("=" * 80)
+    print("TEST 2: Key Parameters")
+    print("=" * 80)
+
+    base = request_key('m', [{'role': 'user', 'content': 'x'}], 100, 0.3, None)
+    assert base == request_key('m', [{'content': 'x', 'role': 'user'}], 100, 0.3, None)
+    assert base != request_key('m2', [{'role': 'user', 'content': 'x'}], 100, 0.3, None)
+    assert base != request_key('m', [{'role': 'user', 'content': 'y'}], 100, 0.3, None)
+    assert base != request_key('m', [{'role': 'user', 'content': 'x'}], 200, 0.3, None)
+    assert base != request_key('m', [{'role': 'user', 'content': 'x'}], 100, 0.7, None)
+    assert base != request_key('m', [{'role': 'user', 'content': 'x'}], 100, 0.3, 'system')
+    assert base == request_key('m', [{'role': 'user', 'content': 'x'}], 100, 0.3, None, {})
+    assert base != request_key('m', [{'role': 'user', 'content': 'x'}], 100, 0.3, None, {'stop_sequences': ['}']})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        llm, messages = _gateway(tmp)
+        llm.create('audit', **_request())
+        llm.create('audit', **_request(temperature=0.5))
+        llm.create('audit', **_request(system='You are an auditor'))
+        llm.create('audit', **_request(stop_sequences=['\n\n']))
+        llm.create('audit', **_request(metadata={'user_id': 'audit-42'}))
+        assert len(messages.calls) == 5
+
+    print("✅ model/system/messages/temperature/max_tokens and forwarded parameters all change the key")
+    print()
+
+
+def test_opt_out_expiry_and_truncation():
+    """cache=False, expired entries and truncated responses go to the API"""
+
+    print("=" * 80)
+    print("TEST 3: Opt-out, TTL and Truncation")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        llm, messages = _gateway(tmp)
+        llm.create('ensemble_claude', cache=False, **_request())
+        llm.create('ensemble_claude', cache=False, **_request())
+        assert len(messages.calls) == 2
+        assert llm.stats.as_dict()['bypassed'] == 2
+
+        llm.create('audit', **_request())
+        llm.create('audit', ttl_hours=0, **_request())
+        assert len(messages.calls) == 4
+
+    with tempfile.TemporaryDirectory() as tmp:
+        llm, messages = _gateway(tmp, stop_reason='max_tokens')
+        llm.create('enhanced_report', **_request())
+        llm.create('enhanced_report', **_request())
+        assert len(messages.calls) == 2
+
+    print("✅ Stochastic, expired and truncated calls were not served from cache")
+    print()
+
+
+def test_prefix_blocks_marked_for_prompt_caching():
+    """prefix= segments come first, each with a cache_control breakpoint"""
+
+    print("=" * 80)
+    print("TEST 4: Prompt Prefix Blocks")
+    print("=" * 80)
+
+    messages = [{'role': 'user', 'content': 'Check the draft'}]
+    prefixed = with_cached_prefix(['CONTEXT', 'DRAFT'], messages)
+
+    blocks = prefixed[0]['content']
+    assert [block['text'] for block in blocks] == ['CONTEXT', 'DRAFT', 'Check the draft']
+    assert [('cache_control' in block) for block in blocks] == [True, True, False]
+    assert messages[0]['content'] == 'Check the draft'
+
+    try:
+        with_cached_prefix(['a', 'b', 'c', 'd', 'e'], messages)
+        assert False, "Expected ValueError for too many breakpoints"
+    except ValueError:
+        pass
+
+    with tempfile.TemporaryDirectory() as tmp:
+        llm, fake = _gateway(tmp)
+        llm.create('audit', prefix=['CONTEXT'], **_request())
+        stats = llm.stats.as_dict()['prompt_cache']
+        assert fake.calls[0]['messages'][0]['content'][0]['text'] == 'CONTEXT'
+        assert stats['cached_input_tokens'] == len('CONTEXT')
+        assert stats['uncached_input_tokens'] == 1000
+
+    print("✅ Shared context sent first and counted as cached input")
+    print()
+
+
+def test_report_passes_share_context_prefix():
+    """Draft, audit and enhanced passes send a byte-identical leading block, warmed before the fan-out"""
+
+    print("=" * 80)
+    print("TEST 5: Report Passes Share One Prefix")
+    print("=" * 80)
+
+    # Force the fact/consistency LLM passes (the local claim check would resolve them)
+    local_validation = ai_generator.LOCAL_CLAIM_VALIDATION
+    ai_generator.LOCAL_CLAIM_VALIDATION = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = AIGenerator(api_key='test-key', run_store=ReportRunStore(tmp))
+        fake = FakeMessages(text='{}')
+        generator.llm = LLMGateway(SimpleNamespace(messages=fake), cache_dir=tmp, stats=LLMCacheStats(),
+                                   call_log=LLMCallLog(os.path.join(tmp, 'llm_calls.jsonl')))
+
+        try:
+            _, audit_results = generator.generate_report_with_audit(
+                {'name': 'Test Game', 'app_id': 1, 'price': '$14.99', 'genres': ['Action'], 'tags': ['Roguelike']},
+                {'estimated_revenue': '$10,000', 'reviews_total': 100, 'review_score': 90, 'owners_avg': 1000},
+                [{'name': 'Competitor', 'app_id': 2}],
+                phase2_data={'sentiment': {'sentiment_data': {'sample_size': {'positive': 50, 'negative': 50}}}}
+            )
+        finally:
+            ai_generator.LOCAL_CLAIM_VALIDATION = local_validation
+
+        prefixed = [
+            call['messages'][0]['content'] for call in fake.calls
+            if isinstance(call['messages'][0]['content'], list)
+        ]
+        leading = {blocks[0]['text'] for blocks in prefixed}
+
+        assert len(prefixed) == 8
+        assert len(leading) == 1
+        assert leading.pop().startswith('**REPORT CONTEXT')
+        reviews = [blocks for blocks in prefixed if len(blocks) == 3]  # Context + draft + instructions
+        assert len(reviews) == 6
+        assert reviews[0][2]['text'] == 'Reply with just OK.'  # Warm-up writes the prefix first
+        assert 'prefix_warmup' in audit_results['llm_calls']['by_stage']
+        assert audit_results['llm_cache']['prompt_cache']['cached_input_tokens'] > 0
+        assert audit_results['llm_calls']['calls'] == len(fake.calls)
+        assert 'draft_report' in audit_results['llm_calls']['by_stage']
+
+    print(f"✅ {len(prefixed)} passes reuse the same cached context prefix")
+    print()
+
+
+if __name__ == "__main__":
+    test_identical_request_hits_cache()
+    test_key_covers_request_parameters()
+    test_opt_out_expiry_and_truncation()
+    test_prefix_blocks_marked_for_prompt_caching()
+    test_report_passes_share_context_prefix()
@@ -0,0 +1,173 @@
+"""
+Test LLM Telemetry
+
+Validates that every gateway call (fresh, cached, streamed) emits a call
+record with stage, model, tokens, time to first token, latency and retries,
+that records are written to the run-level JSONL log, and that per-stage
+p50/p95 summaries are computed across runs. Uses fake Anthropic clients.
+"""
+
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.llm_gateway import LLMGateway, LLMCacheStats, llm_run
+from src.llm_telemetry import LLMCallLog, LLMCallRecord, percentile, summarize_records
+
+MODEL = 'claude-sonnet-4-5-20250929'
+
+
+def _message(text='ok'):
+    return SimpleNamespace(
+        content=[SimpleNamespace(type='text', text=text)],
+        stop_reason='end_turn',
+        model=MODEL,
+        usage=SimpleNamespace(input_tokens=800, output_tokens=200, cache_read_input_tokens=300)
+    )
+
+
+class RawMessages:
+    """Fake messages API exposing with_raw_response like the SDK"""
+
+    def __init__(self):
+        self.with_raw_response = SimpleNamespace(create=self._raw_create)
+
+    def _raw_create(self, **kwargs):
+        return SimpleNamespace(parse=lambda: _message(), retries_taken=2)
+
+    def stream(self, **kwargs):
+        class Manager:
+            text_stream = iter(['Hello ', 'world'])
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def get_final_message(self):
+                return _message('Hello world')
+        return Manager()
+
+
+def _request(prompt='Audit this'):
+    return {'model': MODEL, 'max_tokens': 500, 'messages': [{'role': 'user', 'content': prompt}]}
+
+
+def test_every_call_emits_a_record():
+    """Fresh, cached and streamed calls all produce call records"""
+
+    print("=" * 80)
+    print("TEST 1: Call Records")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = LLMCallLog(os.path.join(tmp, 'calls.jsonl'))
+        llm = LLMGateway(SimpleNamespace(messages=RawMessages()), cache_dir=tmp,
+                         stats=LLMCacheStats(), call_log=log)
+
+        llm.create('audit', **_request())
+        llm.create('audit', **_request())
+        ''.join(llm.stream('enhanced_report', **_request('Write')))
+
+        fresh, hit, streamed = llm.stats.calls
+        assert (fresh.stage, fresh.model, fresh.retries) == ('audit', MODEL, 2)
+        assert (fresh.input_tokens, fresh.output_tokens, fresh.cache_read_tokens) == (800, 200, 300)
+        assert fresh.first_token_seconds == fresh.latency_seconds
+        assert fresh.cost_usd > 0
+        assert hit.response_cached and hit.input_tokens == 0 and hit.cost_usd == 0
+        assert streamed.stage == 'enhanced_report' and streamed.first_token_seconds is not None
+        assert streamed.retries is None
+
+        logged = log.read()
+        assert [record['stage'] for record in logged] == ['audit', 'audit', 'enhanced_report']
+        assert {record['run_id'] for record in logged} == {llm.stats.run_id}
+
+        summary = llm.stats.call_summary()
+        assert summary['calls'] == 3
+        assert summary['by_stage']['audit']['calls'] == 2
+        assert summary['by_stage']['audit']['cached_responses'] == 1
+        assert summary['by_stage']['audit']['retries'] == 2
+        assert len(summary['records']) == 3
+
+    print(f"✅ {summary['calls']} calls recorded, ${summary['cost_usd']} total")
+    print()
+
+
+def test_percentiles_across_runs():
+    """Per-stage p50/p95 latency is computed across runs from the JSONL log"""
+
+    print("=" * 80)
+    print("TEST 2: p50/p95 Across Runs")
+    print("=" * 80)
+
+    assert percentile([], 50) is None
+    assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 50) == 3.0
+    assert abs(percentile([float(n) for n in range(1, 101)], 95) - 95.05) < 1e-9
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = LLMCallLog(os.path.join(tmp, 'calls.jsonl'))
+        for run in range(10):
+            log.write(LLMCallRecord(run_id=f"run{run}", stage='draft_report', model=MODEL,
+                                    latency_seconds=10.0 + run, first_token_seconds=1.0))
+            log.write(LLMCallRecord(run_id=f"run{run}", stage='audit', model=MODEL, latency_seconds=2.0))
+
+        summary = summarize_records(log.read())
+        assert list(summary) == ['draft_report', 'audit']  # Slowest stage first
+        assert summary['draft_report']['latency_p50'] == 14.5
+        assert summary['draft_report']['latency_p95'] == 18.55
+        assert summary['draft_report']['first_token_p50'] == 1.0
+
+        recent = log.read(last_runs=3, stage='draft_report')
+        assert [record['run_id'] for record in recent] == ['run7', 'run8', 'run9']
+
+    print("✅ Stage percentiles computed from the run log")
+    print()
+
+
+def test_each_report_is_a_run():
+    """Report entry points start their own run; nested entry points join it"""
+
+    print("=" * 80)
+    print("TEST 3: One Run per Report")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = LLMCallLog(os.path.join(tmp, 'calls.jsonl'))
+
+        class Analyzer:
+            def __init__(self):
+                self.llm = LLMGateway(SimpleNamespace(messages=RawMessages()), cache_dir=tmp,
+                                      stats=LLMCacheStats(), call_log=log)
+
+            @llm_run
+            def analyze(self, prompt):
+                self.llm.create('audit', **_request(prompt))
+
+            @llm_run
+            def report(self, prompt):
+                self.analyze(prompt)
+                self.llm.create('draft_report', **_request(prompt))
+
+        analyzer = Analyzer()
+        analyzer.report('First game')
+        first = analyzer.llm.stats.run_id
+        analyzer.report('Second game')
+
+        runs = [(record['run_id'], record['stage']) for record in log.read()]
+        assert runs == [(first, 'audit'), (first, 'draft_report'),
+                        (analyzer.llm.stats.run_id, 'audit'), (analyzer.llm.stats.run_id, 'draft_report')]
+        assert analyzer.llm.stats.run_id != first
+        assert analyzer.llm.stats.call_summary()['calls'] == 2  # Counters restart per report
+        assert len(log.read(last_runs=1)) == 2
+
+    print("✅ Two reports logged as two runs; the nested analyzer joined its report's run")
+    print()
+
+
+if __name__ == "__main__":
+    test_every_call_emits_a_record()
+    test_percentiles_across_runs()
+    test_each_report_is_a_run()
@@ -0,0 +1,106 @@
+"""
+Test Parallel Competitor Enrichment
+
+Validates that SimpleDataCollector._fetch_competitors runs sources and
+competitors concurrently while keeping output order and content identical
+to the sequential flow. All sources are replaced with slow fakes.
+"""
+
+import os
+import sys
+import time
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.simple_data_collector import SimpleDataCollector
+
+SOURCE_DELAY = 0.2
+
+
+class FakeSteamSpy:
+    def get_game_data(self, app_id):
+        time.sleep(SOURCE_DELAY)
+        return {'found': True, 'owners': f'owners-{app_id}'}
+
+
+class FakeRAWG:
+    def __init__(self):
+        self.searched = []
+
+    def search_game(self, name):
+        self.searched.append(name)
+        time.sleep(SOURCE_DELAY)
+        return {'metacritic': len(name)} if name != 'Obscure Game' else None
+
+
+def _make_collector():
+    collector = SimpleDataCollector()
+    collector.api_clients = {'steamspy': FakeSteamSpy(), 'rawg': FakeRAWG()}
+
+    def search_game(name):
+        time.sleep(SOURCE_DELAY)
+        if name == 'Missing Game':
+            return None
+        if name == 'Broken Game':
+            raise RuntimeError('search failed')
+        return {'name': name, 'app_id': 1000 + len(name)}
+
+    def get_sales_data(app_id):
+        time.sleep(SOURCE_DELAY)
+        if app_id == '1012':
+            raise RuntimeError('scrape failed')
+        return {'app_id': app_id, 'revenue': 1}
+
+    def fetch_hltb(name):
+        collector.hltb_searched.append(name)
+        time.sleep(SOURCE_DELAY)
+        return {'found': True, 'main_story': len(name)}
+
+    collector.game_search.search_game = search_game
+    collector.steamdb_scraper.get_sales_data = get_sales_data
+    collector._fetch_howlongtobeat = fetch_hltb
+    collector.hltb_searched = []
+    return collector
+
+
+def test_parallel_output_matches_sequential():
+    """Order, content and failure handling match the sequential contract"""
+
+    print("=" * 80)
+    print("TEST 1: Parallel Competitor Enrichment")
+    print("=" * 80)
+
+    names = ['Hades', 'Missing Game', 'Dead Cells', 'Broken Game', 'Obscure Game', 'Slay the Spire']
+    collector = _make_collector()
+
+    start = time.time()
+    competitors = collector._fetch_competitors(names)
+    elapsed = time.time() - start
+
+    assert [c['name'] for c in competitors] == ['Hades', 'Dead Cells', 'Obscure Game', 'Slay the Spire']
+
+    hades = competitors[0]
+    assert hades['sales_data'] == {'app_id': '1005', 'revenue': 1}
+    assert hades['steamspy'] == {'found': True, 'owners': 'owners-1005'}
+    assert hades['rawg'] == {'metacritic': 5}
+    assert hades['playtime'] == {'found': True, 'main_story': 5}
+
+    # 'Obscure Game' (12 chars) -> app 1012: sales scrape fails, RAWG not found
+    obscure = competitors[2]
+    assert obscure['sales_data'] == {}
+    assert obscure['rawg'] == {'found': False}
+
+    # Steam search misses and errors get no RAWG/HLTB lookups
+    found = ['Dead Cells', 'Hades', 'Obscure Game', 'Slay the Spire']
+    assert sorted(collector.api_clients['rawg'].searched) == found
+    assert sorted(collector.hltb_searched) == found
+
+    # Sequential would be ~5 sources x 6 competitors x delay (+1s sleep each)
+    sequential_estimate = len(names) * (5 * SOURCE_DELAY + 1)
+    assert elapsed < sequential_estimate / 4
+
+    print(f"✅ {len(names)} competitors in {elapsed:.2f}s (sequential ~{sequential_estimate:.0f}s)")
+    print()
+
+
+if __name__ == "__main__":
+    test_parallel_output_matches_sequential()
@@ -7,9 +7,14 @@ the report orchestrator and automatically applied to all reports.
 """
 
 import sys
+import tempfile
 sys.path.insert(0, '.')
 
 from src.report_orchestrator import ReportOrchestrator
+from src.review_store import ReviewStore
+
+
+REVIEW_STORE_DIR = tempfile.TemporaryDirectory()
 
 
 def test_integration():
@@ -21,7 +26,7 @@ def test_integration():
     print("="*80 + "\n")
 
     # Create orchestrator
-    orchestrator = ReportOrchestrator(hourly_rate=50.0)
+    orchestrator = ReportOrchestrator(hourly_rate=50.0, review_store=ReviewStore(REVIEW_STORE_DIR.name))
 
     # Test with Retrace the Light data (should trigger reality check)
     game_data = {
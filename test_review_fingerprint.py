@@ -0,0 +1,106 @@
+"""
+Test Stable Review Sample Fingerprints
+
+Validates that review sample fingerprints are identical across processes
+(unlike hash(), which is salted per process) and independent of review order,
+and that sentiment and complaint analyses are served from cache for the same
+sample in a different order. No API calls are made.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src import negative_review_analyzer, review_sentiment_analyzer
+from src.cache_manager import CacheManager
+from src.negative_review_analyzer import NegativeReviewAnalyzer
+from src.review_sentiment_analyzer import ReviewSentimentAnalyzer
+from src.review_store import review_sample_fingerprint
+
+SAMPLE = {
+    'positive': ["Great combat and a lovely soundtrack.", "Best roguelike I've played this year."],
+    'negative': ["Crashes on launch.", "Too short   for the price."],
+}
+
+
+def test_fingerprint_stable_and_order_independent():
+    """Same sample -> same fingerprint, in any order and any process"""
+
+    print("=" * 80)
+    print("TEST 1: Stable Fingerprint")
+    print("=" * 80)
+
+    fingerprint = review_sample_fingerprint(SAMPLE)
+    reordered = {
+        'negative': ["Too short for the price.", "Crashes on launch."],  # Whitespace normalized
+        'positive': list(reversed(SAMPLE['positive'])),
+    }
+    assert review_sample_fingerprint(reordered) == fingerprint
+
+    swapped = {'positive': SAMPLE['negative'], 'negative': SAMPLE['positive']}
+    assert review_sample_fingerprint(swapped) != fingerprint
+
+    script = (
+        "import sys; sys.path.insert(0, '.');"
+        "from src.review_store import review_sample_fingerprint;"
+        f"print(review_sample_fingerprint({SAMPLE!r}))"
+    )
+    root = os.path.dirname(os.path.abspath(__file__))
+    for seed in ('1', '2'):
+        output = subprocess.run(
+            [sys.executable, '-c', script], cwd=root, capture_output=True, text=True,
+            env={**os.environ, 'PYTHONHASHSEED': seed}
+        ).stdout.strip().splitlines()[-1]
+        assert output == fingerprint
+
+    # Stored reviews are identified by recommendation_id
+    assert review_sample_fingerprint([{'recommendation_id': '1', 'text': 'a'}]) == \
+        review_sample_fingerprint([{'recommendation_id': '1', 'text': 'edited'}])
+
+    print(f"✅ Fingerprint {fingerprint[:12]} identical across orderings and processes")
+    print()
+
+
+def test_analyses_reused_for_same_sample():
+    """Sentiment and complaint analyses hit the cache for a reordered sample"""
+
+    print("=" * 80)
+    print("TEST 2: Cached Analyses Reused")
+    print("=" * 80)
+
+    original_sentiment_cache = review_sentiment_analyzer.cache
+    original_complaint_cache = negative_review_analyzer.cache
+    with tempfile.TemporaryDirectory() as tmp:
+        review_sentiment_analyzer.cache = negative_review_analyzer.cache = CacheManager(tmp)
+        try:
+            sentiment = {'positive_themes': {}, 'negative_themes': {}, 'confidence': 'high'}
+            review_sentiment_analyzer.cache.set(
+                'sentiment_analysis', f"sentiment_{review_sample_fingerprint(SAMPLE)}", sentiment
+            )
+            analyzer = ReviewSentimentAnalyzer(anthropic_api_key='test-key', review_store=object())
+            reordered = {key: list(reversed(values)) for key, values in SAMPLE.items()}
+            assert analyzer.analyze_review_sentiment(reordered) == sentiment
+
+            reviews = [
+                {'recommendation_id': str(n), 'text': f"Review {n}", 'playtime_forever': 60, 'votes_helpful': n}
+                for n in range(5)
+            ]
+            categorization = {'summary': 'Crashes dominate', 'critical_issues': {'percentage': 60}}
+            negative_review_analyzer.cache.set(
+                'complaint_analysis', f"Test Game_{review_sample_fingerprint(reviews)}", categorization
+            )
+            negative = NegativeReviewAnalyzer('test-key', review_store=object())
+            assert negative.categorize_complaints(list(reversed(reviews)), 'Test Game') == categorization
+        finally:
+            review_sentiment_analyzer.cache = original_sentiment_cache
+            negative_review_analyzer.cache = original_complaint_cache
+
+    print("✅ Both analyses served from cache without an LLM call")
+    print()
+
+
+if __name__ == "__main__":
+    test_fingerprint_stable_and_order_independent()
+    test_analyses_reused_for_same_sample()
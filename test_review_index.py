@@ -0,0 +1,138 @@
+"""
+Test Review Text + Metadata Index
+
+Validates full-text search (stemmed, phrases) combined with voted_up,
+playtime, language, time window and helpful-vote filters over the local
+review store, query latency on a 100k-review game, and that
+ReviewVulnerabilityAnalyzer uses stored competitor review text.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from contextlib import closing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.review_store import ReviewStore, fts_any, review_row
+from src.review_vulnerability import ReviewVulnerabilityAnalyzer
+
+NOW = int(time.time())
+TEXTS = [
+    "Game crashes every time I reach the second boss, unplayable.",
+    "Constant stuttering and low fps on a good PC.",
+    "Too short, finished in three hours and there is nothing else to do.",
+    "Lost my save file after the last patch.",
+    "Fun for a while but it gets repetitive and boring.",
+]
+
+
+def make_review(n, voted_up=False, days_ago=1, playtime_minutes=300, language='english', votes_up=0):
+    return {
+        'recommendationid': str(n),
+        'language': language,
+        'review': TEXTS[n % len(TEXTS)],
+        'voted_up': voted_up,
+        'votes_up': votes_up,
+        'timestamp_created': NOW - days_ago * 86400 - n,
+        'author': {'steamid': str(n), 'playtime_at_review': playtime_minutes},
+    }
+
+
+def load(store, app_id, reviews):
+    with closing(store.connect(app_id)) as conn:
+        store._insert(conn, [review_row(review) for review in reviews])
+        conn.commit()
+
+
+def test_text_and_metadata_filters():
+    """'negative reviews mentioning crash with >2h playtime, last 90 days'"""
+
+    print("=" * 80)
+    print("TEST 1: Text + Metadata Query")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ReviewStore(tmp)
+        load(store, 1, [
+            make_review(0),                           # crash, 5h, yesterday -> match
+            make_review(5, playtime_minutes=60),      # crash, 1h -> too little playtime
+            make_review(10, days_ago=200),            # crash, too old
+            make_review(15, voted_up=True),           # crash, positive
+            make_review(20, language='german'),       # crash, other language
+            make_review(3, votes_up=12),              # save file
+            make_review(1),                           # fps, not crash
+        ])
+
+        rows = store.reviews(1, voted_up=False, match=fts_any(['crash']), min_playtime_hours=2,
+                             since_days=90, language='english')
+        assert [row['recommendation_id'] for row in rows] == ['0']  # "crashes" stems to "crash"
+
+        assert store.count(1, voted_up=False, match=fts_any(['crash'])) == 4
+        assert store.count(1, match=fts_any(['save file']), min_votes_up=10) == 1
+        assert store.count(1, match=fts_any(['crash', 'fps'])) == 6
+
+        # Updated text is re-indexed
+        load(store, 1, [dict(make_review(1), review="Actually it crashed too.")])
+        assert store.count(1, match=fts_any(['crash'])) == 6
+
+    print("✅ Stemmed text search combined with metadata filters")
+    print()
+
+
+def test_query_latency_on_large_corpus():
+    """Filtered text queries over 100k reviews return in milliseconds"""
+
+    print("=" * 80)
+    print("TEST 2: 100k-Review Query Latency")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ReviewStore(tmp)
+        load(store, 2, [
+            make_review(n, voted_up=n % 3 != 0, days_ago=n % 400, playtime_minutes=n % 900)
+            for n in range(100_000)
+        ])
+
+        start = time.perf_counter()
+        count = store.count(2, voted_up=False, match=fts_any(['crash']), min_playtime_hours=2, since_days=90)
+        sample = store.reviews(2, voted_up=False, match=fts_any(['repetitive']), order='helpful', limit=50)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert count > 0 and len(sample) == 50
+        assert elapsed_ms < 500, f"Queries took {elapsed_ms:.0f}ms"
+
+    print(f"✅ Two filtered queries over 100k reviews in {elapsed_ms:.0f}ms")
+    print()
+
+
+def test_vulnerability_uses_stored_review_text():
+    """Competitors with stored reviews are analyzed from their text"""
+
+    print("=" * 80)
+    print("TEST 3: Vulnerability Themes From Review Text")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ReviewStore(tmp)
+        load(store, 3, [make_review(n) for n in range(0, 100, 5)])  # 20 reviews, all about crashing
+
+        analyzer = ReviewVulnerabilityAnalyzer(review_store=store, ingest_reviews=False)
+        themes = analyzer._analyze_competitor_reviews([
+            {'app_id': 3, 'review_score': 92, 'genres': '', 'tags': '', 'price': '$9.99'},
+            {'app_id': 4, 'review_score': 95, 'genres': '', 'tags': '', 'price': '$9.99'},  # No text, high score
+        ])
+
+        assert themes['competitors_with_review_text'] == 1
+        assert themes['review_texts_analyzed'] == 20
+        assert themes['common_themes']['bugs_crashes']['percentage'] == 100.0
+        assert 'pricing' not in themes['common_themes']
+
+    print("✅ Themes measured from stored negative reviews")
+    print()
+
+
+if __name__ == "__main__":
+    test_text_and_metadata_filters()
+    test_query_latency_on_large_corpus()
+    test_vulnerability_uses_stored_review_text()
@@ -0,0 +1,139 @@
+"""
+Test Representative Review Sampling
+
+Validates SimHash near-duplicate removal, that cluster-stratified samples
+cover rare topics a "first N reviews" sample misses, and that
+NegativeReviewAnalyzer samples stored reviews this way. No API calls are made.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from contextlib import closing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.negative_review_analyzer import NegativeReviewAnalyzer
+from src.review_sampler import dedupe_reviews, sample_reviews, simhash
+from src.review_store import ReviewStore, review_row
+
+NOW = int(time.time())
+CRASH = "The game keeps crashing to desktop every time I load my save after the latest patch, support never answered"
+TOPICS = {
+    'crash': [
+        CRASH,
+        "Constant stuttering and fps drops in the city hub even on low settings with a decent graphics card",
+        "Black screen on launch for me, verified files and reinstalled drivers, still nothing works at all",
+    ],
+    'price': ["Thirty dollars for four hours of content is too much, wait until it goes on a deep sale"],
+    'story': ["The writing falls apart in act two and the ending makes no sense given everything set up before"],
+}
+
+
+def make_pool():
+    """400 crash reviews (mostly copy-paste), 20 price, 10 story"""
+    pool = []
+    for n in range(400):
+        text = TOPICS['crash'][n % 3] if n % 5 else f"{CRASH} ({n} hours wasted)"
+        pool.append({'recommendation_id': f"c{n}", 'review': text, 'votes_up': n % 11, 'playtime_at_review': 120})
+    for topic, count in (('price', 20), ('story', 10)):
+        for n in range(count):
+            pool.append({'recommendation_id': f"{topic}{n}", 'review': f"{TOPICS[topic][0]} #{n}",
+                         'votes_up': 1, 'playtime_at_review': 300})
+    return pool
+
+
+def test_near_duplicates_removed():
+    """Copy-paste and one-word edits collapse to the most helpful copy"""
+
+    print("=" * 80)
+    print("TEST 1: SimHash Dedupe")
+    print("=" * 80)
+
+    edited = CRASH.replace("latest", "newest")
+    assert bin(simhash(CRASH) ^ simhash(edited)).count('1') <= 10
+    assert bin(simhash(CRASH) ^ simhash(TOPICS['story'][0])).count('1') > 10
+
+    reviews = [
+        {'recommendation_id': '1', 'review': CRASH, 'votes_up': 2},
+        {'recommendation_id': '2', 'review': edited, 'votes_up': 40},
+        {'recommendation_id': '3', 'review': CRASH, 'votes_up': 0},
+        {'recommendation_id': '4', 'review': TOPICS['story'][0], 'votes_up': 1},
+    ]
+    kept = dedupe_reviews(reviews)
+    assert [review['recommendation_id'] for review in kept] == ['2', '4']
+
+    print("✅ 4 reviews -> 2 distinct, most helpful copy kept")
+    print()
+
+
+def test_sample_covers_rare_topics():
+    """A 12-review sample includes price and story, without duplicates"""
+
+    print("=" * 80)
+    print("TEST 2: Cluster-Stratified Sample")
+    print("=" * 80)
+
+    pool = make_pool()
+    first_n = pool[:12]
+    sample = sample_reviews(pool, 12)
+
+    def topics(reviews):
+        return {topic for review in reviews for topic, texts in TOPICS.items()
+                if any(review['review'].startswith(text[:40]) for text in texts)}
+
+    assert topics(first_n) == {'crash'}
+    assert topics(sample) == {'crash', 'price', 'story'}
+    assert len(sample) <= 12
+    assert len(dedupe_reviews(sample)) == len(sample)
+
+    # Same pool, same sample
+    assert [r['recommendation_id'] for r in sample_reviews(pool, 12)] == [r['recommendation_id'] for r in sample]
+
+    print(f"✅ {len(sample)} reviews covering {sorted(topics(sample))}")
+    print()
+
+
+def test_negative_reviews_sampled_from_store():
+    """fetch_negative_reviews returns a deduped, stratified sample"""
+
+    print("=" * 80)
+    print("TEST 3: Negative Review Sampling")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ReviewStore(tmp)
+        rows = [
+            review_row({
+                'recommendationid': review['recommendation_id'], 'language': 'english',
+                'review': review['review'], 'voted_up': False, 'votes_up': review['votes_up'],
+                'timestamp_created': NOW - 86400,
+                'author': {'steamid': '1', 'playtime_at_review': review['playtime_at_review']},
+            })
+            for review in make_pool()
+        ]
+        with closing(store.connect(5)) as conn:
+            store._insert(conn, rows)
+            conn.execute(
+                "INSERT INTO sync_state (language, newest_timestamp, backfill_cursor, last_sync, total_reviews) "
+                "VALUES ('english', ?, NULL, ?, ?)", (NOW, time.time(), len(rows))
+            )
+            conn.commit()
+
+        analyzer = NegativeReviewAnalyzer('test-key', review_store=store)
+        reviews = analyzer.fetch_negative_reviews(5, count=10)
+
+    texts = [review['text'] for review in reviews]
+    assert len(reviews) <= 10
+    assert any(text.startswith(TOPICS['price'][0][:40]) for text in texts)
+    assert any(text.startswith(TOPICS['story'][0][:40]) for text in texts)
+    assert len(set(texts)) == len(texts)
+
+    print(f"✅ {len(reviews)} distinct negative reviews spanning every complaint cluster")
+    print()
+
+
+if __name__ == "__main__":
+    test_near_duplicates_removed()
+    test_sample_covers_rare_topics()
+    test_negative_reviews_sampled_from_store()
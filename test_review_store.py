@@ -0,0 +1,223 @@
+"""
+Test Local Review Store
+
+Validates that reviews are stored with full metadata keyed on
+recommendation_id, that repeat syncs only page until the newest stored review
+(then backfill), and that both review analyzers sample from the store instead
+of re-paging Steam. Uses a fake appreviews endpoint; no network calls.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from contextlib import closing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.review_store import ReviewStore
+from src.review_trends import review_trend
+from src.review_sentiment_analyzer import ReviewSentimentAnalyzer
+from src.negative_review_analyzer import NegativeReviewAnalyzer
+
+
+VOCABULARY = (
+    "combat story music bosses crafting puzzles map inventory camera controls dialogue ending pacing "
+    "graphics soundtrack multiplayer servers matchmaking progression loot skills enemies weapons armor "
+    "quests villages dungeons stealth climbing driving fishing farming trading economy factions romance "
+    "humor voice acting textures lighting framerate loading saves checkpoints tutorial difficulty grinding "
+    "achievements modding editor sandbox exploration secrets"
+).split()
+
+
+def make_review(n, voted_up=True, votes_up=0):
+    return {
+        'recommendationid': str(n),
+        'language': 'english',
+        'review': ' '.join(random.Random(n).sample(VOCABULARY, 12)) + '.',  # Distinct, 50+ chars
+        'voted_up': voted_up,
+        'votes_up': votes_up,
+        'votes_funny': 0,
+        'timestamp_created': 1_700_000_000 + n * 60,
+        'author': {'steamid': f"7656{n}", 'playtime_forever': n * 10, 'playtime_at_review': n * 5},
+    }
+
+
+class FakeSteam:
+    """Serves reviews newest-first in pages; the cursor is the last timestamp served"""
+
+    def __init__(self, reviews, page_size=100):
+        self.reviews = reviews
+        self.page_size = page_size
+        self.requests = []
+
+    def add(self, reviews):
+        self.reviews = reviews + self.reviews
+
+    def get(self, url, params=None, timeout=None):
+        self.requests.append(dict(params))
+        ordered = sorted(self.reviews, key=lambda r: r['timestamp_created'], reverse=True)
+        if params['cursor'] != '*':
+            ordered = [r for r in ordered if r['timestamp_created'] < int(params['cursor'])]
+        page = ordered[:self.page_size]
+        data = {
+            'success': 1,
+            'reviews': page,
+            'cursor': str(page[-1]['timestamp_created']) if page else params['cursor'],
+            'query_summary': {'total_reviews': len(self.reviews)},
+        }
+        return type('Response', (), {'raise_for_status': lambda self: None, 'json': lambda self: data})()
+
+
+def test_incremental_sync():
+    """Second sync fetches only the new reviews, then backfills"""
+
+    print("=" * 80)
+    print("TEST 1: Incremental Sync")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        steam = FakeSteam([make_review(n, voted_up=n % 4 != 0) for n in range(1, 501)])
+        store = ReviewStore(tmp, session=steam, max_pages=3, sync_interval_hours=0)
+
+        assert store.sync(730) == 300  # Page budget: newest 300
+        assert store.sync_state(730)['backfill_cursor'] == str(make_review(201)['timestamp_created'])
+        assert store.count(730) == 300
+
+        steam.add([make_review(n) for n in range(501, 551)])
+        requests_before = len(steam.requests)
+        added = store.sync(730)
+        new_cursors = [params['cursor'] for params in steam.requests[requests_before:]]
+
+        # One page reached stored history; the other two continued the backfill (concurrently)
+        backfill = [str(make_review(201)['timestamp_created']), str(make_review(101)['timestamp_created'])]
+        assert sorted(new_cursors) == sorted(['*'] + backfill)
+        assert [cursor for cursor in new_cursors if cursor != '*'] == backfill
+        assert added == 50 + 200
+        assert store.count(730) == 550
+        assert store.sync(730, force=True) == 0
+        assert store.sync_state(730)['backfill_cursor'] is None  # History complete
+
+        row = store.reviews(730, limit=1)[0]
+        assert row['recommendation_id'] == '550' and row['playtime_forever'] == 5500
+        assert all(params['review_type'] == 'all' for params in steam.requests)
+
+    print(f"✅ {len(steam.requests)} pages total; repeat sync fetched only new reviews")
+    print()
+
+
+def test_analyzers_sample_from_store():
+    """Sentiment and negative-review analyzers share one synced store"""
+
+    print("=" * 80)
+    print("TEST 2: Analyzers Sample Locally")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        reviews = [make_review(n, voted_up=n % 2 == 0, votes_up=n % 7) for n in range(1, 201)]
+        steam = FakeSteam(reviews)
+        store = ReviewStore(tmp, session=steam)
+
+        sentiment = ReviewSentimentAnalyzer(anthropic_api_key='test-key', review_store=store)
+        samples = sentiment.fetch_steam_reviews(4242, sample_size=40)
+        assert len(samples['positive']) == 20 and len(samples['negative']) == 20
+        synced_pages = len(steam.requests)
+
+        negative = NegativeReviewAnalyzer('test-key', review_store=store)
+        negatives = negative.fetch_negative_reviews(4242, count=10)
+        assert len(negatives) == 10
+        assert negatives[0]['votes_helpful'] == 6  # Most helpful first
+        assert {'text', 'votes_helpful', 'timestamp', 'playtime_at_review'} <= set(negatives[0])
+
+        assert len(steam.requests) == synced_pages  # The sentiment sync served both analyzers
+
+    print(f"✅ Both analyzers served from {len(steam.requests)} Steam pages")
+    print()
+
+
+def test_concurrent_shared_ingest():
+    """Backfill pages overlap new-review pages; one prefetch serves every analyzer"""
+
+    print("=" * 80)
+    print("TEST 3: Concurrent Shared Ingest")
+    print("=" * 80)
+
+    class SlowSteam(FakeSteam):
+        def get(self, url, params=None, timeout=None):
+            time.sleep(0.1)  # Network latency per page
+            return super().get(url, params, timeout)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        steam = SlowSteam([make_review(n) for n in range(1, 401)])
+        store = ReviewStore(tmp, session=steam, max_pages=2, sync_interval_hours=0)
+        store.sync(99)  # Newest 200, backfill cursor kept
+
+        steam.add([make_review(n) for n in range(401, 651)])  # 3 pages of new reviews
+        store.max_pages = 6
+        requests_before, start = len(steam.requests), time.time()
+        assert store.sync(99) == 250 + 200
+        elapsed, pages = time.time() - start, len(steam.requests) - requests_before
+        assert pages >= 5 and elapsed < 0.1 * pages - 0.1  # Faster than paging one chain after the other
+        assert store.count(99) == 650
+
+        # Concurrent prefetches share one sync; analyzers then read the store
+        store.sync_interval_hours = 1
+        steam.add([make_review(n) for n in range(651, 661)])
+        store.max_pages = 1
+        with closing(store.connect(99)) as conn:
+            conn.execute('UPDATE sync_state SET last_sync = 0')
+            conn.commit()
+        requests_before = len(steam.requests)
+        first, second = store.prefetch(99), store.prefetch(99)
+        assert first is second
+        sentiment = ReviewSentimentAnalyzer(anthropic_api_key='test-key', review_store=store)
+        sentiment.fetch_steam_reviews(99, sample_size=20)
+        NegativeReviewAnalyzer('test-key', review_store=store).fetch_negative_reviews(99, count=10)
+        assert first.result() == 10
+        assert len(steam.requests) - requests_before == 1
+
+    print(f"✅ {pages} pages in {elapsed:.2f}s; one prefetch page served both analyzers")
+    print()
+
+
+def test_budget_gap_is_closed():
+    """New reviews beyond the page budget are fetched later, not skipped"""
+
+    print("=" * 80)
+    print("TEST 4: Page Budget Gap")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        steam = FakeSteam([make_review(n) for n in range(1, 201)])
+        store = ReviewStore(tmp, session=steam, max_pages=4, sync_interval_hours=0)
+        store.sync(620)  # Full history
+        known_newest = store.sync_state(620)['newest_timestamp']
+
+        steam.add([make_review(n) for n in range(201, 2201)])
+        assert store.sync(620) == 400
+        state = store.sync_state(620)
+        assert state['newest_timestamp'] == known_newest  # Mark kept below the gap
+        assert state['gap_cursor'] == str(make_review(1801)['timestamp_created'])
+        coverage = store.coverage(620)
+        assert coverage['gap_open'] and coverage['since'] == make_review(1801)['timestamp_created']
+        assert review_trend(620, store=store)['complete'] is False
+
+        steam.add([make_review(n) for n in range(2201, 2251)])  # Arrive while the gap is open
+        syncs = 1
+        while store.sync_state(620)['gap_cursor']:
+            store.sync(620)
+            syncs += 1
+        assert store.sync(620) >= 0 and store.count(620) == 2250
+        state = store.sync_state(620)
+        assert state['newest_timestamp'] == make_review(2250)['timestamp_created']
+        assert not store.coverage(620)['gap_open'] and store.coverage(620)['since'] == 0
+
+    print(f"✅ 2050 new reviews stored over {syncs + 1} syncs of 4 pages; no gap left")
+    print()
+
+
+if __name__ == "__main__":
+    test_incremental_sync()
+    test_analyzers_sample_from_store()
+    test_concurrent_shared_ingest()
+    test_budget_gap_is_closed()
@@ -0,0 +1,180 @@
+"""
+Test Local Review Theme Classifier
+
+Validates keyword/TF-IDF theme counts over a whole review corpus, that
+ReviewSentimentAnalyzer reports statistics over every stored review rather
+than the sample, and that complaint categorization sends Claude only the
+quote candidates ranked within the sample while keeping the local counts.
+No API calls are made.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import closing
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src import negative_review_analyzer, review_sentiment_analyzer
+from src.cache_manager import CacheManager
+from src.negative_review_analyzer import NegativeReviewAnalyzer
+from src.review_sentiment_analyzer import ReviewSentimentAnalyzer
+from src.review_store import ReviewStore, review_row
+from src.review_themes import COMPLAINT_CATEGORIES, NEGATIVE_THEMES, ReviewThemeClassifier
+
+NOW = int(time.time())
+NEGATIVE_TEXTS = [
+    "The game crashes every time I open the map, completely unplayable on my PC.",
+    "Way too expensive for four hours of content, wait for it to be on sale.",
+    "Boring and repetitive after the first hour, the core loop never changes.",
+    "Funny premise but the menus are clunky and the tutorial explains nothing.",
+]
+POSITIVE_TEXTS = [
+    "Gorgeous art style and a soundtrack I keep listening to outside the game.",
+    "The combat is fast and satisfying, every boss fight feels fair.",
+]
+
+
+def load(store, app_id, count):
+    """count reviews: 3/4 negative (cycling NEGATIVE_TEXTS), 1/4 positive"""
+    reviews, seen = [], {True: 0, False: 0}
+    for n in range(count):
+        voted_up = n % 4 == 3
+        texts = POSITIVE_TEXTS if voted_up else NEGATIVE_TEXTS
+        text = texts[seen[voted_up] % len(texts)]
+        seen[voted_up] += 1
+        reviews.append({
+            'recommendationid': str(n), 'language': 'english', 'review': text,
+            'voted_up': voted_up, 'votes_up': n % 7, 'timestamp_created': NOW - n,
+            'author': {'steamid': str(n), 'playtime_forever': 120, 'playtime_at_review': 120},
+        })
+    with closing(store.connect(app_id)) as conn:
+        store._insert(conn, [review_row(review) for review in reviews])
+        conn.commit()
+
+
+class FakeLLM:
+    """Records prompts and answers complaint categorization with fixed JSON"""
+
+    def __init__(self):
+        self.prompts = []
+
+    def create(self, stage, **kwargs):
+        self.prompts.append(kwargs['messages'][0]['content'])
+        answer = {
+            'critical_issues': {'severity': 'critical', 'fixability': 'fixable', 'percentage': 99,
+                                'quotes': ["crashes every time I open the map"]},
+            'summary': 'Crashes and pricing dominate',
+        }
+        return SimpleNamespace(content=[SimpleNamespace(text=json.dumps(answer))])
+
+
+def test_classifier_counts_and_candidates():
+    """Theme counts cover the corpus; prefixes match word endings only"""
+
+    print("=" * 80)
+    print("TEST 1: Keyword/TF-IDF Classifier")
+    print("=" * 80)
+
+    texts = NEGATIVE_TEXTS * 25 + ["Bugs everywhere, it crashed twice and froze once."]
+    stats = ReviewThemeClassifier(NEGATIVE_THEMES).classify(texts)
+
+    assert stats['technical_issues']['count'] == 26
+    assert stats['technical_issues']['percentage'] == round(100 * 26 / 101, 1)
+    assert stats['price_sensitivity']['count'] == 25
+    # The review dense in rare technical terms ranks first
+    assert stats['technical_issues']['candidates'][0].startswith("Bugs everywhere")
+
+    # Candidates can come from a sample while counts still cover the corpus
+    sampled = ReviewThemeClassifier(NEGATIVE_THEMES).classify(texts, candidates_from=NEGATIVE_TEXTS[:1])
+    assert sampled['technical_issues']['count'] == 26
+    assert sampled['technical_issues']['candidates'] == [NEGATIVE_TEXTS[0]]
+    assert sampled['price_sensitivity']['count'] == 25 and sampled['price_sensitivity']['candidates'] == []
+
+    hits = ReviewThemeClassifier(COMPLAINT_CATEGORIES).matches(NEGATIVE_TEXTS[3])
+    assert set(hits) == {'polish_issues'}  # "Funny" is not "fun", "menus" matches "menu*"
+
+    print(f"✅ {len(texts)} reviews classified, top technical quote ranked by TF-IDF")
+    print()
+
+
+def test_sentiment_uses_full_corpus():
+    """Percentages come from every stored review, not the 4-review sample"""
+
+    print("=" * 80)
+    print("TEST 2: Sentiment Over Full Corpus")
+    print("=" * 80)
+
+    original_cache = review_sentiment_analyzer.cache
+    with tempfile.TemporaryDirectory() as tmp:
+        review_sentiment_analyzer.cache = CacheManager(os.path.join(tmp, 'cache'))
+        try:
+            store = ReviewStore(os.path.join(tmp, 'reviews'))
+            load(store, 7, 400)
+            analyzer = ReviewSentimentAnalyzer(review_store=store)
+            analyzer.api_key = None  # Local statistics and locally ranked quotes only
+
+            sample = {'positive': POSITIVE_TEXTS[:1], 'negative': NEGATIVE_TEXTS[:1]}
+            data = analyzer.analyze_review_sentiment(sample, app_id=7)
+        finally:
+            review_sentiment_analyzer.cache = original_cache
+
+    assert data['sample_size'] == {'positive': 100, 'negative': 300}
+    assert data['positive_themes']['art_audio']['count'] == 50
+    assert data['positive_themes']['art_audio']['percentage'] == 50.0
+    assert data['negative_themes']['technical_issues']['percentage'] == 25.0
+    assert data['negative_themes']['technical_issues']['example_quotes']
+    assert data['confidence'] == 'high'
+    assert 'Classified all 400 stored reviews' in analyzer.generate_sentiment_markdown(data)
+
+    print("✅ Theme percentages computed over 400 stored reviews")
+    print()
+
+
+def test_complaints_send_only_candidates():
+    """Claude sees a few candidates per category from the sample; counts stay local"""
+
+    print("=" * 80)
+    print("TEST 3: Complaint Categorization Workload")
+    print("=" * 80)
+
+    original_cache = negative_review_analyzer.cache
+    with tempfile.TemporaryDirectory() as tmp:
+        negative_review_analyzer.cache = CacheManager(os.path.join(tmp, 'cache'))
+        try:
+            store = ReviewStore(os.path.join(tmp, 'reviews'))
+            load(store, 9, 4000)
+            analyzer = NegativeReviewAnalyzer('test-key', review_store=store)
+            analyzer.llm = FakeLLM()
+
+            sample = [
+                {'recommendation_id': str(n), 'text': NEGATIVE_TEXTS[n], 'playtime_forever': 120, 'votes_helpful': 0}
+                for n in (0, 3)  # Crash and clunky-menus reviews
+            ]
+            categorization = analyzer.categorize_complaints(sample, 'Test Game', app_id=9)
+        finally:
+            negative_review_analyzer.cache = original_cache
+
+    assert categorization['reviews_classified'] == 3000
+    assert categorization['critical_issues']['count'] == 750
+    assert categorization['critical_issues']['percentage'] == 25.0  # Local, not the model's 99
+    assert categorization['critical_issues']['severity'] == 'critical'
+    assert categorization['expectation_mismatches']['count'] == 750
+    assert categorization['polish_issues']['quotes']  # Filled from local candidates
+
+    prompt = analyzer.llm.prompts[0]
+    assert len(analyzer.llm.prompts) == 1
+    assert len(prompt) < 8000
+    assert "3000 negative reviews" in prompt
+    assert "crashes every time" in prompt and "Way too expensive" not in prompt  # Quotes only from the sample
+
+    print(f"✅ 3000 reviews classified locally, {len(prompt)}-char prompt")
+    print()
+
+
+if __name__ == "__main__":
+    test_classifier_counts_and_candidates()
+    test_sentiment_uses_full_corpus()
+    test_complaints_send_only_candidates()
@@ -0,0 +1,181 @@
+"""
+Test Daily Review Rollup and Trends
+
+Validates that the review store keeps a per-day rollup (count, positive ratio,
+median playtime, language mix) in step with inserts, that review_trend()
+derives velocity, recent-vs-overall deltas and trend breaks from it, and that
+SteamDBScraper, GameAnalyzer and VisibilityForecastAnalyzer use it instead of
+summary estimates. No network calls are made.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from contextlib import closing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.game_analyzer import GameAnalyzer
+from src.review_store import ReviewStore, review_row
+from src.review_trends import review_trend
+from src.steamdb_scraper import SteamDBScraper
+from src.visibility_forecast import VisibilityForecastAnalyzer
+
+DAY = 86400
+NOW = int(time.time()) // DAY * DAY  # Midnight UTC: reviews land on whole days
+
+
+def make_review(n, days_ago, voted_up=True, language='english', playtime=600):
+    return review_row({
+        'recommendationid': str(n), 'language': language,
+        'review': f"Review {n} with enough text to be stored and rolled up.",
+        'voted_up': voted_up, 'votes_up': 0, 'votes_funny': 0,
+        'timestamp_created': NOW - days_ago * DAY + 3600,
+        'author': {'steamid': str(n), 'playtime_forever': playtime, 'playtime_at_review': playtime},
+    })
+
+
+def load(store, app_id, reviews, total_reviews):
+    with closing(store.connect(app_id)) as conn:
+        store._insert(conn, reviews)
+        conn.execute(
+            "INSERT OR REPLACE INTO sync_state (language, newest_timestamp, backfill_cursor, last_sync, total_reviews) "
+            "VALUES ('english', ?, NULL, ?, ?)", (NOW, time.time(), total_reviews)
+        )
+        conn.commit()
+
+
+def history():
+    """2 reviews/day for days 30-119 (all positive), 6/day in the last 30 days (half positive)"""
+    reviews, n = [], 0
+    for days_ago in range(1, 120):
+        per_day = 6 if days_ago <= 30 else 2
+        for k in range(per_day):
+            voted_up = days_ago > 30 or k % 2 == 0
+            reviews.append(make_review(n, days_ago, voted_up=voted_up, playtime=60 * (k + 1)))
+            n += 1
+    return reviews
+
+
+def test_daily_rollup():
+    """Rollup rows match the inserted reviews and update on upsert"""
+
+    print("=" * 80)
+    print("TEST 1: Daily Rollup")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ReviewStore(tmp)
+        day = time.strftime('%Y-%m-%d', time.gmtime(NOW - 3 * DAY))
+        reviews = [
+            make_review(1, 3, voted_up=True, playtime=60),
+            make_review(2, 3, voted_up=False, playtime=180),
+            make_review(3, 3, voted_up=True, playtime=600, language='german'),
+        ]
+        load(store, 11, reviews, 3)
+
+        rows = store.daily(11)
+        assert [row['day'] for row in rows] == [day]
+        assert rows[0]['reviews'] == 3 and rows[0]['positive'] == 2
+        assert rows[0]['median_playtime'] == 180
+        assert rows[0]['languages'] == {'english': 2, 'german': 1}
+
+        # Re-inserting a review with a changed vote recomputes its day
+        with closing(store.connect(11)) as conn:
+            store._insert(conn, [make_review(2, 3, voted_up=True, playtime=180)])
+            conn.commit()
+        assert store.daily(11)[0]['positive'] == 3
+        assert store.daily(11, since_timestamp=NOW - 2 * DAY) == []
+
+        # Only the days an insert touches are recomputed, not the span between them
+        with closing(store.connect(11)) as conn:
+            conn.execute("UPDATE review_daily SET reviews = -1 WHERE day = ?", (day,))
+            store._insert(conn, [make_review(4, 60), make_review(5, 1)])
+            conn.commit()
+        rows = store.daily(11)
+        assert [row['reviews'] for row in rows] == [1, -1, 1]
+
+    print(f"✅ {day}: 3 reviews, median 3h, language mix tracked; upsert refreshed only touched days")
+    print()
+
+
+def test_velocity_and_breaks():
+    """Velocity, recent-vs-overall deltas and the launch-week spike"""
+
+    print("=" * 80)
+    print("TEST 2: Velocity and Trend Breaks")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ReviewStore(tmp)
+        reviews = history()
+        load(store, 12, reviews, len(reviews))
+        trend = review_trend(12, window_days=30, store=store)
+
+        assert trend['complete']
+        assert trend['recent_reviews'] == 180 and trend['reviews_per_day'] == 6.0
+        assert trend['previous_reviews_per_day'] == 2.0
+        assert trend['trend'] == 'increasing' and trend['velocity_change'] == 2.0
+        assert trend['recent_positive_pct'] == 50.0
+        assert trend['positive_delta'] < -15  # Recent reviews are more negative than all-time
+        assert trend['recent_languages'] == {'english': 180}
+        assert trend['stored_reviews'] == len(reviews)
+        assert any(row['direction'] == 'spike' for row in trend['trend_breaks'])
+
+        # Windows outside stored history are flagged incomplete
+        with closing(store.connect(12)) as conn:
+            conn.execute("UPDATE sync_state SET backfill_cursor = 'x'")
+            conn.commit()
+        assert not review_trend(12, window_days=200, store=store)['complete']
+        assert review_trend(99, store=store) is None
+
+    print(f"✅ {trend['reviews_per_day']}/day vs {trend['previous_reviews_per_day']}/day, "
+          f"{len(trend['trend_breaks'])} trend break(s)")
+    print()
+
+
+def test_consumers_use_rollup():
+    """Scraper, GameAnalyzer and visibility forecast read velocity from the store"""
+
+    print("=" * 80)
+    print("TEST 3: Consumers Use Rollup")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ReviewStore(tmp)
+        reviews = history()
+        load(store, 13, reviews, len(reviews))
+        sales_data = {'reviews_total': 2 * len(reviews), 'review_score_raw': 80, 'review_score': 80,
+                      'owners_avg': 50000, 'reviews_positive': 0, 'reviews_negative': 0}
+
+        scraper = SteamDBScraper(review_store=store)
+        scraper.get_sales_data = lambda app_id: sales_data
+        scraper._get_recent_reviews = lambda app_id: (_ for _ in ()).throw(AssertionError("API called"))
+        stats = scraper.get_review_stats(13)
+        assert stats['velocity_source'] == 'review_store'
+        assert stats['recent_reviews'] == 360  # English is half of all reviews
+        assert stats['review_trend']['trend'] == 'increasing'
+
+        analysis = GameAnalyzer(review_store=store).analyze_success_level({'app_id': 13}, sales_data)
+        assert analysis['recent_reviews'] == 360
+        assert analysis['velocity_score'] == 360 / (2 * len(reviews))
+        assert analysis['velocity_status'] == "High momentum - actively growing"
+        assert 'Review Trend: increasing' in analysis['context_for_ai']
+
+        forecast = VisibilityForecastAnalyzer(review_store=store)
+        visibility = forecast.analyze_visibility({'app_id': 13, 'tags': []}, sales_data)
+        assert visibility['review_velocity']['reviews_per_day'] == 12.0
+        assert visibility['component_scores']['wishlist_velocity'] == round(75 * 1.05, 1)
+
+        unknown = forecast.analyze_visibility({'app_id': 14, 'tags': []}, sales_data)
+        assert unknown['review_velocity'] is None  # Not stored: review-count proxy
+
+    print(f"✅ {stats['recent_reviews']} recent reviews and "
+          f"{visibility['review_velocity']['reviews_per_day']}/day from the rollup, no API call")
+    print()
+
+
+if __name__ == "__main__":
+    test_daily_rollup()
+    test_velocity_and_breaks()
+    test_consumers_use_rollup()
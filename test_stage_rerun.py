@@ -0,0 +1,157 @@
+"""
+Test Partial Stage Re-run
+
+Validates that generate_report_with_audit persists its inputs and every stage
+output, and that rerun_report_stage re-executes only the named stage plus its
+downstream dependents while reusing everything else from the saved run. All
+passes are replaced with counting fakes; no API calls are made.
+"""
+
+import os
+import sys
+import tempfile
+from collections import Counter
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.ai_generator import AIGenerator
+from src.report_run_store import ReportRunStore
+from src.tier_strategic_frameworks import TIER_3_SOLID
+
+GAME = {'name': 'Test Game', 'app_id': 1}
+SALES = {'estimated_revenue': '$10,000', 'reviews_total': 100, 'review_score': 90}
+
+PASSES = {
+    '_verify_facts': 'fact_check',
+    '_check_consistency': 'consistency_check',
+    '_validate_competitors': 'competitor_validation',
+    '_run_specialized_audits': 'specialized_audits',
+    '_validate_recommendations': 'recommendation_validation',
+    '_analyze_benchmarks': 'benchmark_analysis',
+    '_generate_scenarios': 'scenario_analysis',
+    '_run_ensemble_analysis': 'ensemble_analysis',
+}
+
+
+def _generator(tmp, calls, version=1):
+    generator = AIGenerator(api_key='test-key')
+    generator.run_store = ReportRunStore(tmp)
+
+    def counted(name, result):
+        def run(*args, **kwargs):
+            calls[name] += 1
+            return result(*args, **kwargs)
+        return run
+
+    generator._generate_initial_draft = counted(
+        'draft_report', lambda **kwargs: f"# Draft ({kwargs['tier_framework'].tier_name})")
+    generator._audit_report = counted('audit', lambda **kwargs: {'needs_correction': False})
+    for method, stage in PASSES.items():
+        setattr(generator, method, counted(stage, lambda stage=stage, **kwargs: {'pass': stage}))
+    generator._generate_enhanced_report = counted(
+        'enhanced_report', lambda *args: "# Test Game Audit\n\n## 1. Summary\n\nImprove marketing presence.")
+    generator._enforce_specificity = counted(
+        'specificity', lambda report, game_data, sales_data: report.replace(
+            'Improve marketing presence.', f"Run a Reddit campaign (v{version})."))
+    return generator
+
+
+def test_run_is_persisted():
+    """Inputs, graph stage outputs and final passes are saved per run"""
+
+    print("=" * 80)
+    print("TEST 1: Stage Outputs Persisted")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        calls = Counter()
+        report, audit_results = _generator(tmp, calls).generate_report_with_audit(
+            GAME, SALES, [], tier_framework=TIER_3_SOLID
+        )
+
+        saved = ReportRunStore(tmp).load_run(audit_results['run_id'])
+        assert saved['inputs']['game_data'] == GAME
+        assert saved['inputs']['tier_framework'] == TIER_3_SOLID  # Dataclass rebuilt
+        assert set(saved['stages']) == {
+            'draft_report', 'audit', *PASSES.values(), 'enhanced_report', 'final_report'
+        }
+        assert saved['stages']['final_report'] == report
+        assert ReportRunStore(tmp).latest_run_id() == audit_results['run_id']
+
+    print(f"✅ {len(saved['stages'])} stage outputs saved for run {audit_results['run_id']}")
+    print()
+
+
+def test_rerun_specificity_only():
+    """Re-running specificity reuses the saved enhanced report"""
+
+    print("=" * 80)
+    print("TEST 2: Re-run Final Pass")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        first_calls = Counter()
+        _, audit_results = _generator(tmp, first_calls).generate_report_with_audit(
+            GAME, SALES, [], tier_framework=TIER_3_SOLID
+        )
+
+        calls = Counter()
+        report, rerun_results = _generator(tmp, calls, version=2).rerun_report_stage(
+            audit_results['run_id'], 'specificity'
+        )
+
+        assert calls == Counter({'specificity': 1})
+        assert 'Run a Reddit campaign (v2).' in report
+        assert rerun_results['rerun']['reran'] == ['specificity']
+        assert rerun_results['fact_check'] == {'pass': 'fact_check'}
+
+        saved = ReportRunStore(tmp).load_run(rerun_results['run_id'])
+        assert saved['meta']['rerun_of'] == audit_results['run_id']
+        assert saved['stages']['final_report'] == report
+
+    print("✅ One pass re-run; draft, audits and enhanced report reused")
+    print()
+
+
+def test_rerun_graph_stage_and_dependents():
+    """Re-running an audit stage re-runs its dependents and the final passes only"""
+
+    print("=" * 80)
+    print("TEST 3: Re-run Stage + Dependents")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _, audit_results = _generator(tmp, Counter()).generate_report_with_audit(
+            GAME, SALES, [], tier_framework=TIER_3_SOLID
+        )
+
+        calls = Counter()
+        _, rerun_results = _generator(tmp, calls).rerun_report_stage(
+            audit_results['run_id'], 'benchmark_analysis'
+        )
+        assert calls == Counter({
+            'benchmark_analysis': 1, 'ensemble_analysis': 1, 'enhanced_report': 1, 'specificity': 1
+        })
+        assert rerun_results['rerun']['reran'] == [
+            'benchmark_analysis', 'ensemble_analysis', 'enhanced_report', 'specificity'
+        ]
+
+        # Draft re-run cascades to every pass that reviews the draft
+        calls = Counter()
+        _generator(tmp, calls).rerun_report_stage(audit_results['run_id'], 'draft_report')
+        assert calls['draft_report'] == 1 and calls['fact_check'] == 1
+        assert calls['benchmark_analysis'] == 0 and calls['competitor_validation'] == 0
+
+        try:
+            _generator(tmp, Counter()).rerun_report_stage(audit_results['run_id'], 'no_such_stage')
+            assert False, "Expected ValueError for unknown stage"
+        except ValueError:
+            pass
+
+    print("✅ Only the stage, its dependents and the final passes re-ran")
+    print()
+
+
+if __name__ == "__main__":
+    test_run_is_persisted()
+    test_rerun_specificity_only()
+    test_rerun_graph_stage_and_dependents()
@@ -0,0 +1,188 @@
+"""
+Test Streaming Report Generation
+
+Validates incremental markdown section splitting, LLMGateway.stream (fresh
+and cached), and that generate_report_with_audit emits post-processed
+sections before the enhanced report has finished streaming while producing
+the same final report as the non-streaming path.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.section_stream import MarkdownSectionSplitter, iter_markdown_sections
+from src.llm_gateway import LLMGateway, LLMCacheStats
+from src.llm_telemetry import LLMCallLog
+import src.ai_generator as ai_generator_module
+from src.ai_generator import AIGenerator
+from src.report_run_store import ReportRunStore
+
+REPORT = (
+    "# Test Game Audit\n\nIntro paragraph.\n\n"
+    "## 1. Executive Summary\n\nDoing well.\n\n### Detail\n\nMore.\n\n"
+    "## 2. Pricing\n\n```markdown\n# not a heading\n```\n\nImprove marketing presence.\n\n"
+    "## 3. Recommendations\n\nShip the update."
+)
+
+
+def test_splitter_emits_completed_sections():
+    """Sections are emitted when the next heading starts and join losslessly"""
+
+    print("=" * 80)
+    print("TEST 1: Incremental Section Splitting")
+    print("=" * 80)
+
+    splitter = MarkdownSectionSplitter()
+    emitted_at = []
+    sections = []
+    for position, char in enumerate(REPORT):
+        for section in splitter.feed(char):
+            sections.append(section)
+            emitted_at.append(position)
+    sections.extend(splitter.close())
+
+    assert ''.join(sections) == REPORT
+    assert [section.split('\n')[0] for section in sections] == [
+        '# Test Game Audit', '## 1. Executive Summary', '## 2. Pricing', '## 3. Recommendations'
+    ]
+    # First section is available long before the stream ends
+    assert emitted_at[0] < len(REPORT) // 3
+    assert list(iter_markdown_sections([REPORT[:10], REPORT[10:]])) == sections
+
+    print(f"✅ {len(sections)} sections, first after {emitted_at[0]} of {len(REPORT)} chars")
+    print()
+
+
+class FakeStreamManager:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    @property
+    def text_stream(self):
+        return iter(self.chunks)
+
+    def get_final_message(self):
+        return SimpleNamespace(
+            content=[SimpleNamespace(type='text', text=''.join(self.chunks))],
+            stop_reason='end_turn',
+            model='claude-sonnet-4-5-20250929',
+            usage=SimpleNamespace(input_tokens=100, output_tokens=50)
+        )
+
+
+def test_gateway_stream_and_cache_replay():
+    """Streamed text is cached and replayed on an identical request"""
+
+    print("=" * 80)
+    print("TEST 2: Gateway Streaming")
+    print("=" * 80)
+
+    calls = []
+
+    def stream(**request):
+        calls.append(request)
+        return FakeStreamManager([REPORT[i:i + 40] for i in range(0, len(REPORT), 40)])
+
+    client = SimpleNamespace(messages=SimpleNamespace(stream=stream))
+    request = {
+        'model': 'claude-sonnet-4-5-20250929',
+        'max_tokens': 1000,
+        'messages': [{'role': 'user', 'content': 'Write the report'}],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        llm = LLMGateway(client, cache_dir=tmp, stats=LLMCacheStats(),
+                         call_log=LLMCallLog(os.path.join(tmp, 'llm_calls.jsonl')))
+
+        first = llm.stream('post_launch_report', **request)
+        assert ''.join(first) == REPORT
+        assert first.response.stop_reason == 'end_turn'
+        assert first.first_token_seconds is not None
+
+        second = llm.stream('post_launch_report', **request)
+        assert list(iter_markdown_sections(second)) == list(iter_markdown_sections([REPORT]))
+        assert len(calls) == 1
+        assert llm.stats.as_dict()['hits'] == 1
+
+    print("✅ Stream cached and replayed without a second API call")
+    print()
+
+
+def _generator(run_dir):
+    generator = AIGenerator(api_key='test-key', run_store=ReportRunStore(run_dir))
+    generator._generate_initial_draft = lambda **kwargs: '# Draft'
+    generator._audit_report = lambda **kwargs: {'needs_correction': False}
+    for name in ['_verify_facts', '_check_consistency', '_validate_competitors',
+                 '_run_specialized_audits', '_validate_recommendations',
+                 '_analyze_benchmarks', '_generate_scenarios', '_run_ensemble_analysis']:
+        setattr(generator, name, lambda **kwargs: {})
+    generator._enforce_specificity = lambda report, game_data, sales_data: report.replace(
+        'Improve marketing presence.', 'Run a 30-day Reddit campaign at $500/month.'
+    )
+    return generator
+
+
+def test_streamed_report_matches_blocking_report():
+    """on_section receives final sections early; the result matches the blocking path"""
+
+    print("=" * 80)
+    print("TEST 3: Streamed Post-Processing")
+    print("=" * 80)
+
+    args = (
+        {'name': 'Test Game', 'app_id': 1},
+        {'estimated_revenue': '$10,000', 'reviews_total': 100, 'review_score': 90},
+        []
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        blocking = _generator(os.path.join(tmp, 'blocking'))
+        blocking._generate_enhanced_report = lambda *a: REPORT + "\n\n## 4. Appendix\n\nNotes."
+        expected, _ = blocking.generate_report_with_audit(*args)
+
+        events = []
+
+        def stream_enhanced(*a):
+            for section in iter_markdown_sections([REPORT + "\n\n## 4. Appendix\n\nNotes."]):
+                events.append('generated')
+                yield section
+                time.sleep(0.05)
+
+        streaming = _generator(os.path.join(tmp, 'streaming'))
+        streaming._stream_enhanced_report = stream_enhanced
+        original_window = ai_generator_module.SPECIFICITY_WINDOW_CHARS
+        ai_generator_module.SPECIFICITY_WINDOW_CHARS = 150
+        try:
+            final_report, audit_results = streaming.generate_report_with_audit(
+                *args, on_section=lambda section: events.append(section)
+            )
+        finally:
+            ai_generator_module.SPECIFICITY_WINDOW_CHARS = original_window
+
+        emitted = [event for event in events if event != 'generated']
+        assert final_report == expected
+        assert ''.join(emitted) == final_report
+        assert 'Run a 30-day Reddit campaign' in final_report
+        assert emitted[0].startswith('# Test Game Audit')
+        # Final sections reached the UI before generation finished
+        assert events.index(emitted[0]) < len(events) - 1 - events[::-1].index('generated')
+        assert 'llm_cache' in audit_results
+
+    print(f"✅ {len(emitted)} sections emitted incrementally; final report identical")
+    print()
+
+
+if __name__ == "__main__":
+    test_splitter_emits_completed_sections()
+    test_gateway_stream_and_cache_replay()
+    test_streamed_report_matches_blocking_report()
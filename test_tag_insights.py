@@ -6,9 +6,15 @@ Validates the tag insights analyzer with different tag scenarios.
 
 import os
 import sys
+import tempfile
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.tag_insights import TagInsightsAnalyzer
+from src.tag_vocabulary import TagVocabulary, set_tag_vocabulary
+
+
+VOCABULARY_DIR = tempfile.TemporaryDirectory()
+set_tag_vocabulary(TagVocabulary(os.path.join(VOCABULARY_DIR.name, 'tag_vocabulary.json')))
 
 
 def test_well_optimized_tags():
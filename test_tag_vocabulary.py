@@ -0,0 +1,134 @@
+"""
+Test Tag Vocabulary
+
+Validates shared tag/genre identity, alias handling, persistence and the
+analyzers that compare tags through the vocabulary.
+"""
+
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tag_vocabulary import TagVocabulary, count_bits, set_tag_vocabulary
+from src.tag_insights import TagInsightsAnalyzer
+from src.generic_detection import detect_generic_subreddits, detect_generic_tags
+
+
+VOCABULARY_DIR = tempfile.TemporaryDirectory()
+set_tag_vocabulary(TagVocabulary(os.path.join(VOCABULARY_DIR.name, 'tag_vocabulary.json')))
+
+
+def test_aliases_share_identity():
+    """Spelling variants resolve to one ID"""
+
+    print("=" * 80)
+    print("TEST 1: Alias Normalization")
+    print("=" * 80)
+
+    vocab = TagVocabulary()
+    roguelike = vocab.intern('Roguelike')
+
+    assert vocab.intern('rogue-like') == roguelike
+    assert vocab.intern('Rogue Like') == roguelike
+    assert vocab.intern({'description': 'ROGUELIKE'}) == roguelike
+    assert vocab.intern('Single-player') == vocab.intern('Singleplayer')
+    assert vocab.intern('Deckbuilding') == vocab.intern('Deckbuilder')
+    assert vocab.intern('') is None
+    assert vocab.name(roguelike) == 'Roguelike'
+
+    print(f"✅ {len(vocab)} distinct tags after interning 9 spellings")
+    print()
+
+
+def test_bitmask_overlap():
+    """Bitmask intersection matches set intersection"""
+
+    print("=" * 80)
+    print("TEST 2: Bitmask Overlap")
+    print("=" * 80)
+
+    vocab = TagVocabulary()
+    vocab.intern_many(['Action', 'Roguelike', 'Pixel Art', 'Indie'])
+    a = vocab.mask(['Action', 'Roguelike', 'Pixel Art', 'Indie'])
+    b = vocab.mask(['action', 'Rogue-like', 'Strategy'])
+
+    assert count_bits(a) == 4
+    assert count_bits(a & b) == 2
+    assert count_bits(b) == 2  # Lookups don't add 'Strategy'
+    assert len(vocab) == 4
+    assert vocab.mask([]) == 0
+
+    print(f"✅ Overlap count: {count_bits(a & b)}")
+    print()
+
+
+def test_persistence():
+    """IDs survive reload from disk; new names are written in batches"""
+
+    print("=" * 80)
+    print("TEST 3: Persistence")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'catalog', 'tag_vocabulary.json')
+        first = TagVocabulary(path)
+        ids = first.intern_many(['Metroidvania', 'Souls-like', 'Pixel Art'])
+        assert not os.path.exists(path)  # Below the save batch
+        first.save()
+
+        second = TagVocabulary(path)
+        assert second.intern_many(['metroidvania', 'soulslike', 'pixel-art']) == ids
+        assert len(second) == 3
+
+    print("✅ Vocabulary reloaded with stable IDs")
+    print()
+
+
+def test_analyzers_use_vocabulary():
+    """Tag insights and generic detection treat aliases as the same tag"""
+
+    print("=" * 80)
+    print("TEST 4: Analyzer Integration")
+    print("=" * 80)
+
+    analyzer = TagInsightsAnalyzer()
+    result = analyzer.analyze_tags(
+        {'tags': 'Rogue-like, Roguelike, Single-Player', 'genres': ''},
+        {'reviews_total': 200}
+    )
+    tiers = {t['tag']: t['tier'] for t in result['current_analysis']}
+
+    assert result['tag_count'] == 2
+    assert tiers['rogue-like'] == 'major'
+    assert all(s['tag'] != 'singleplayer' for s in result['suggested_additions'])
+
+    detection = detect_generic_tags(['action', 'INDIE', 'Single-player', 'Metroidvania'])
+    assert detection.generic_count == 3
+    assert detection.specific_examples == ['Metroidvania']
+
+    print("✅ TagInsightsAnalyzer and detect_generic_tags share tag identity")
+    print()
+
+
+def test_subreddit_detection():
+    """Subreddit detection (no vocabulary) still reports specific communities"""
+
+    print("=" * 80)
+    print("TEST 5: Subreddit Detection")
+    print("=" * 80)
+
+    detection = detect_generic_subreddits(['r/gaming', 'pcgaming', 'r/Roguelikes', 'r/metroidvania', 'r/roguelikes'])
+    assert detection.generic_count == 2 and detection.total_count == 4
+    assert detection.specific_examples == ['r/roguelikes', 'r/metroidvania']
+
+    print(f"✅ Specific subreddits: {detection.specific_examples}")
+    print()
+
+
+if __name__ == "__main__":
+    test_aliases_share_identity()
+    test_bitmask_overlap()
+    test_persistence()
+    test_analyzers_use_vocabulary()
+    test_subreddit_detection()
@@ -8,9 +8,14 @@ Verifies that hard caps are enforced correctly.
 
 import sys
 import os
+import tempfile
 sys.path.insert(0, os.path.abspath('.'))
 
 from src.report_orchestrator import ReportOrchestrator
+from src.review_store import ReviewStore
+
+
+REVIEW_STORE_DIR = tempfile.TemporaryDirectory()
 
 
 def test_retrace_the_light_validation():
@@ -54,7 +59,7 @@ def test_retrace_the_light_validation():
     print("GENERATING REPORT...")
     print()
 
-    orchestrator = ReportOrchestrator()
+    orchestrator = ReportOrchestrator(review_store=ReviewStore(REVIEW_STORE_DIR.name))
     report = orchestrator.generate_complete_report(game_data)
 
     metadata = report['metadata']